@@ -1,9 +1,6 @@
 from decimal import Decimal
 from typing import List
 
-import numpy as np
-from sklearn.linear_model import LinearRegression
-
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PriceType, TradeType
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers import ControllerBase, ControllerConfigBase
@@ -11,6 +8,7 @@ from hummingbot.strategy_v2.executors.data_types import ConnectorPair, PositionS
 from hummingbot.strategy_v2.executors.order_executor.data_types import ExecutionStrategy, OrderExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.utils.rolling_regression import RollingOLS, align_by_timestamp
 
 
 class StatArbConfig(ControllerConfigBase):
@@ -24,6 +22,8 @@ class StatArbConfig(ControllerConfigBase):
     connector_pair_hedge: ConnectorPair = ConnectorPair(connector_name="binance_perpetual", trading_pair="POPCAT-USDT")
     interval: str = "1m"
     lookback_period: int = 300
+    # Weight factor of each candle relative to the next one in the hedge regression (1 for equal weights)
+    regression_decay: float = 1.0
     entry_threshold: Decimal = Decimal("2.0")
     take_profit: Decimal = Decimal("0.0008")
     tp_global: Decimal = Decimal("0.01")
@@ -87,6 +87,10 @@ class StatArb(ControllerBase):
             "pair_pnl": Decimal("0"),
             "signal": 0  # 0: no signal, 1: long dominant/short hedge, -1: short dominant/long hedge
         }
+        # Regression of the hedge prices on the dominant prices over the lookback period (the first candle of the period
+        # is the base of the returns), updated with each new candle
+        self.spread_model = RollingOLS(window_size=self.config.lookback_period - 1, decay=self.config.regression_decay)
+        self._spread_model_timestamp = None
 
         # Setup candles config if not already set
         if len(self.config.candles_config) == 0:
@@ -362,63 +366,59 @@ class StatArb(ControllerBase):
             self.logger().warning("Not enough candle data available for statistical analysis")
             return
 
-        # Extract close prices
-        dominant_prices = dominant_df['close'].values
-        hedge_prices = hedge_df['close'].values
-
-        # Ensure we have enough data and both series have the same length
-        min_length = min(len(dominant_prices), len(hedge_prices))
-        if min_length < self.config.lookback_period:
+        # Use the close prices of the candles available for both assets
+        timestamps, dominant_prices, hedge_prices = align_by_timestamp(
+            dominant_df["timestamp"].values, dominant_df["close"].values.astype(float),
+            hedge_df["timestamp"].values, hedge_df["close"].values.astype(float))
+        if len(timestamps) < self.config.lookback_period:
             self.logger().warning(
-                f"Not enough data points for analysis. Required: {self.config.lookback_period}, Available: {min_length}")
+                f"Not enough data points for analysis. Required: {self.config.lookback_period}, "
+                f"Available: {len(timestamps)}")
             return
+        self.update_spread_model(timestamps, dominant_prices, hedge_prices)
 
-        # Use the most recent data points
-        dominant_prices = dominant_prices[-self.config.lookback_period:]
-        hedge_prices = hedge_prices[-self.config.lookback_period:]
-
-        # Convert to numpy arrays
-        dominant_prices_np = np.array(dominant_prices, dtype=float)
-        hedge_prices_np = np.array(hedge_prices, dtype=float)
-
-        # Calculate percentage returns
-        dominant_pct_change = np.diff(dominant_prices_np) / dominant_prices_np[:-1]
-        hedge_pct_change = np.diff(hedge_prices_np) / hedge_prices_np[:-1]
-
-        # Convert to cumulative returns
-        dominant_cum_returns = np.cumprod(dominant_pct_change + 1)
-        hedge_cum_returns = np.cumprod(hedge_pct_change + 1)
-
-        # Normalize to start at 1
-        dominant_cum_returns = dominant_cum_returns / dominant_cum_returns[0] if len(dominant_cum_returns) > 0 else np.array([1.0])
-        hedge_cum_returns = hedge_cum_returns / hedge_cum_returns[0] if len(hedge_cum_returns) > 0 else np.array([1.0])
-
-        # Perform linear regression
-        dominant_cum_returns_reshaped = dominant_cum_returns.reshape(-1, 1)
-        reg = LinearRegression().fit(dominant_cum_returns_reshaped, hedge_cum_returns)
-        alpha = reg.intercept_
-        beta = reg.coef_[0]
+        # The regression of the cumulative returns (prices relative to the first of the window) is the one of the
+        # prices, rescaled
+        dominant_base, hedge_base = self.spread_model.first_sample
+        alpha = self.spread_model.alpha / hedge_base
+        beta = self.spread_model.beta * dominant_base / hedge_base
         self.processed_data.update({
             "alpha": alpha,
             "beta": beta,
         })
 
         # Calculate spread as percentage difference from predicted value
-        y_pred = alpha + beta * dominant_cum_returns
-        spread_pct = (hedge_cum_returns - y_pred) / y_pred * 100
+        dominant_price, hedge_price = self.spread_model.last_sample
+        y_pred = self.spread_model.predict(dominant_price)
+        current_spread = (hedge_price - y_pred) / y_pred * 100
 
-        # Calculate z-score
-        mean_spread = np.mean(spread_pct)
-        std_spread = np.std(spread_pct)
-        if std_spread == 0:
+        # Calculate z-score of the regression residual
+        if not self.spread_model.residual_std > 0:
             self.logger().warning("Standard deviation of spread is zero, cannot calculate z-score")
             return
-
-        current_spread = spread_pct[-1]
-        current_z_score = (current_spread - mean_spread) / std_spread
+        current_z_score = self.spread_model.z_score(dominant_price, hedge_price)
 
         return current_spread, current_z_score
 
+    def update_spread_model(self, timestamps, dominant_prices, hedge_prices):
+        """
+        Feeds the spread regression with the candles newer than the last one used, and updates the last one (it
+        changes until the candle closes). The regression is rebuilt from the lookback period when the candles do not
+        follow the ones already used.
+        """
+        window_size = self.spread_model.window_size
+        last_timestamp = self._spread_model_timestamp
+        if last_timestamp is None or last_timestamp not in timestamps[-window_size:]:
+            self.spread_model.reset()
+            start = len(timestamps) - window_size
+        else:
+            start = int(timestamps.searchsorted(last_timestamp))
+            self.spread_model.update_last(dominant_prices[start], hedge_prices[start])
+            start += 1
+        for index in range(start, len(timestamps)):
+            self.spread_model.update(dominant_prices[index], hedge_prices[index])
+        self._spread_model_timestamp = timestamps[-1]
+
     def get_pairs_prices(self):
         current_dominant_price = self.market_data_provider.get_price_by_type(
             connector_name=self.config.connector_pair_dominant.connector_name,
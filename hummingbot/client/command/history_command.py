@@ -1,17 +1,20 @@
 import asyncio
 import threading
 import time
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+from sqlalchemy.orm import Session
 
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_rollup import TradeFillRollup, TradesSummary
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -40,16 +43,39 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trading_core.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
+            trades_by_market = self._get_trades_by_market_from_rollups(int(start_time * 1e3), session=session)
+            if not trades_by_market:
                 self.notify("\n  No past trades to report.")
                 return
             if verbose:
                 self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self._report_performance(start_time, trades_by_market, precision))
+
+    def _get_trades_by_market_from_rollups(
+            self,  # type: HummingbotApplication
+            start_timestamp: int,
+            session: Session) -> Dict[Tuple[str, str], Union[TradesSummary, List[TradeFill]]]:
+        """
+        Summarizes the trades by market and trading pair from the trade fill rollups. The fills are only loaded for
+        the markets with position fills, whose PnL requires pairing the fills opening and closing positions.
+        """
+        summaries = TradeFillRollup.get_trades_summaries(
+            session, start_timestamp=start_timestamp, config_file_path=self.strategy_file_name)
+        trades_by_market: Dict[Tuple[str, str], Union[TradesSummary, List[TradeFill]]] = {}
+        for (market, symbol), summary in summaries.items():
+            if summary.num_position_fills > 0:
+                trades_by_market[(market, symbol)] = (session
+                                                      .query(TradeFill)
+                                                      .filter(TradeFill.config_file_path.like(
+                                                              f"%{self.strategy_file_name}%"),
+                                                              TradeFill.market == market,
+                                                              TradeFill.symbol == symbol,
+                                                              TradeFill.timestamp >= start_timestamp)
+                                                      .order_by(TradeFill.timestamp.asc())
+                                                      .all())
+            else:
+                trades_by_market[(market, symbol)] = summary
+        return trades_by_market
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -68,12 +94,21 @@ class HistoryCommand:
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        trades_by_market: Dict[Tuple[str, str], List[TradeFill]] = defaultdict(list)
+        for trade in trades:
+            trades_by_market[(trade.market, trade.symbol)].append(trade)
+        return await self._report_performance(start_time, trades_by_market, precision, display_report)
+
+    async def _report_performance(
+            self,  # type: HummingbotApplication
+            start_time: float,
+            trades_by_market: Dict[Tuple[str, str], Union[TradesSummary, List[TradeFill]]],
+            precision: Optional[int] = None,
+            display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), cur_trades in trades_by_market.items():
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.trading_core.get_current_balances(market), network_timeout)
@@ -82,7 +117,10 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if isinstance(cur_trades, TradesSummary):
+                perf = await PerformanceMetrics.create_from_summary(symbol, cur_trades, cur_balances)
+            else:
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import ChainMap, defaultdict
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Set
 
 from cachetools import TTLCache
 
@@ -29,6 +30,29 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersByExchangeOrderIdView(Mapping):
+    """
+    Read-only mapping from exchange order id to the orders of a group of tracker collections, backed by the tracker
+    exchange order id index (lookups do not scan the orders).
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", orders: Mapping[str, InFlightOrder]):
+        self._tracker = tracker
+        self._orders = orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker._order_by_exchange_order_id(exchange_order_id)
+        if order is None or self._orders.get(order.client_order_id) is not order:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([order.exchange_order_id for order in self._orders.values() if order.exchange_order_id is not None])
+
+    def __len__(self) -> int:
+        return sum(1 for order in self._orders.values() if order.exchange_order_id is not None)
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -62,61 +86,131 @@ class ClientOrderTracker:
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+        # Secondary indexes, updated on the order state transitions
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Set[str] = set()
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+
+        self._init_views()
+
+    def _init_views(self):
+        # Read-only live views of the collections, created once. Lookups (`get`, `in`) go straight to the underlying
+        # dictionaries, but the views follow every change: iterating over one while orders are added, removed or
+        # change collection raises, `len` of the combined views is O(n) and `copy` of a combined view returns a
+        # `ChainMap` sharing the collections. Use the snapshot properties to iterate or copy.
+        self._active_orders_view = MappingProxyType(self._in_flight_orders)
+        self._cached_orders_view = MappingProxyType(self._cached_orders)
+        self._lost_orders_view = MappingProxyType(self._lost_orders)
+        self._all_orders_view = MappingProxyType(ChainMap(self._cached_orders, self._in_flight_orders))
+        self._all_fillable_orders_view = MappingProxyType(
+            ChainMap(self._lost_orders, self._cached_orders, self._in_flight_orders))
+        self._all_updatable_orders_view = MappingProxyType(ChainMap(self._lost_orders, self._in_flight_orders))
+        self._all_fillable_orders_by_exchange_order_id_view = OrdersByExchangeOrderIdView(
+            tracker=self, orders=self._all_fillable_orders_view)
+        self._all_updatable_orders_by_exchange_order_id_view = OrdersByExchangeOrderIdView(
+            tracker=self, orders=self._all_updatable_orders_view)
+
     @property
-    def active_orders(self) -> Dict[str, InFlightOrder]:
+    def active_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns orders that are actively tracked
+        Returns orders that are actively tracked (read-only live view)
         """
-        return self._in_flight_orders
+        return self._active_orders_view
 
     @property
     def cached_orders(self) -> Dict[str, InFlightOrder]:
         """
         Returns orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return dict(self._cached_orders)
+
+    @property
+    def cached_orders_view(self) -> Mapping[str, InFlightOrder]:
+        """
+        Read-only live view of `cached_orders`, for lookups without copying the orders.
+        """
+        return self._cached_orders_view
 
     @property
     def all_orders(self) -> Dict[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return {**self._in_flight_orders, **self._cached_orders}
+
+    @property
+    def all_orders_view(self) -> Mapping[str, InFlightOrder]:
+        """
+        Read-only live view of `all_orders`, for lookups without copying the orders.
+        """
+        return self._all_orders_view
 
     @property
     def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return {**self._in_flight_orders, **self._cached_orders, **self._lost_orders}
+
+    @property
+    def all_fillable_orders_view(self) -> Mapping[str, InFlightOrder]:
+        """
+        Read-only live view of `all_fillable_orders`, for lookups without copying the orders.
+        """
+        return self._all_fillable_orders_view
 
     @property
     def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
+        return {
             order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
+            for order in chain(self._in_flight_orders.values(), self._cached_orders.values(), self._lost_orders.values())
         }
-        return orders_map
+
+    @property
+    def all_fillable_orders_by_exchange_order_id_view(self) -> Mapping[str, InFlightOrder]:
+        """
+        Read-only live view of `all_fillable_orders_by_exchange_order_id`, backed by the exchange order ID index.
+        """
+        return self._all_fillable_orders_by_exchange_order_id_view
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return {**self._in_flight_orders, **self._lost_orders}
+
+    @property
+    def all_updatable_orders_view(self) -> Mapping[str, InFlightOrder]:
+        """
+        Read-only live view of `all_updatable_orders`, for lookups without copying the orders.
+        """
+        return self._all_updatable_orders_view
 
     @property
     def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
+        return {
+            order.exchange_order_id: order for order in chain(self._in_flight_orders.values(), self._lost_orders.values())
         }
-        return orders_map
+
+    @property
+    def all_updatable_orders_by_exchange_order_id_view(self) -> Mapping[str, InFlightOrder]:
+        """
+        Read-only live view of `all_updatable_orders_by_exchange_order_id`, backed by the exchange order ID index.
+        """
+        return self._all_updatable_orders_by_exchange_order_id_view
+
+    def active_orders_for_trading_pair(self, trading_pair: str) -> List[InFlightOrder]:
+        """
+        Returns the active orders of the trading pair, without iterating over the orders of the other pairs
+        """
+        return list(self._active_orders_by_trading_pair.get(trading_pair, {}).values())
 
     @property
     def current_timestamp(self) -> int:
@@ -130,7 +224,14 @@ class ClientOrderTracker:
         """
         Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return dict(self._lost_orders)
+
+    @property
+    def lost_orders_view(self) -> Mapping[str, InFlightOrder]:
+        """
+        Read-only live view of `lost_orders`, for lookups without copying the orders.
+        """
+        return self._lost_orders_view
 
     @property
     def lost_order_count_limit(self) -> int:
@@ -142,13 +243,18 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._index_exchange_order_id(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
+            self._cached_orders[client_order_id] = order
             del self._in_flight_orders[client_order_id]
+            self._remove_from_trading_pair_index(order)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
+            self._prune_exchange_order_id_index()
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -162,6 +268,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_exchange_order_id(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,28 +279,24 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._all_orders_view.get(client_order_id) if client_order_id is not None else None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and self._all_orders_view.get(found_order.client_order_id) is not found_order:
+                found_order = None
 
         return found_order
 
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._lost_orders.get(client_order_id) if client_order_id is not None else None
 
-        if client_order_id in self._lost_orders:
-            found_order = self._lost_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and self._lost_orders.get(found_order.client_order_id) is not found_order:
+                found_order = None
 
         return found_order
 
@@ -203,7 +306,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._all_fillable_orders_view.get(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -249,6 +352,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._index_exchange_order_id(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -290,6 +394,8 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            if tracked_order.client_order_id in self._orders_without_exchange_order_id:
+                self._index_exchange_order_id(tracked_order)
             if updated:
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -304,6 +410,44 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            self._orders_without_exchange_order_id.discard(order.client_order_id)
+        else:
+            # The exchange order id is usually assigned later, and not always through an order update
+            self._orders_without_exchange_order_id.add(order.client_order_id)
+
+    def _order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None and len(self._orders_without_exchange_order_id) > 0:
+            # Only the orders that did not have an exchange order id yet when last indexed need to be checked
+            for client_order_id in list(self._orders_without_exchange_order_id):
+                pending_order = self._all_fillable_orders_view.get(client_order_id)
+                if pending_order is None:
+                    self._orders_without_exchange_order_id.discard(client_order_id)
+                elif pending_order.exchange_order_id is not None:
+                    self._index_exchange_order_id(pending_order)
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        return order
+
+    def _remove_from_trading_pair_index(self, order: InFlightOrder):
+        pair_orders = self._active_orders_by_trading_pair.get(order.trading_pair)
+        if pair_orders is not None:
+            pair_orders.pop(order.client_order_id, None)
+            if len(pair_orders) == 0:
+                del self._active_orders_by_trading_pair[order.trading_pair]
+
+    def _prune_exchange_order_id_index(self):
+        # Cached orders expire silently, so the index is rebuilt when it has grown well beyond the tracked orders
+        tracked_count = len(self._in_flight_orders) + len(self._lost_orders) + self.MAX_CACHE_SIZE
+        if len(self._orders_by_exchange_order_id) > 2 * tracked_count:
+            self._orders_by_exchange_order_id = {
+                order.exchange_order_id: order
+                for order in self._all_fillable_orders_view.values()
+                if order.exchange_order_id is not None
+            }
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -720,11 +720,11 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
         Example Trade:
         """
         exchange_order_id = str(trade.get("order_id", ""))
-        tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id_view.get(exchange_order_id)
 
         if tracked_order is None:
             all_orders = self._order_tracker.all_fillable_orders
-            for k, v in all_orders.items():
+            for k, v in list(all_orders.items()):
                 await v.get_exchange_order_id()
             _cli_tracked_orders = [o for o in all_orders.values() if exchange_order_id == o.exchange_order_id]
             if not _cli_tracked_orders:
@@ -769,7 +769,7 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
         Example Order:
         """
         client_order_id = str(order_msg.get("label", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -577,7 +577,7 @@ class InjectiveV2PerpetualDerivative(PerpetualDerivativePyBase):
         tracked_orders_to_cancel = []
 
         for order in orders_to_cancel:
-            tracked_order = self._order_tracker.all_updatable_orders.get(order.client_order_id)
+            tracked_order = self._order_tracker.all_updatable_orders_view.get(order.client_order_id)
             if tracked_order is not None:
                 tracked_orders_to_cancel.append(tracked_order)
             else:
@@ -704,7 +704,7 @@ class InjectiveV2PerpetualDerivative(PerpetualDerivativePyBase):
                     self._order_tracker.process_trade_update(trade_update)
                 elif channel == "order":
                     order_update = event_data
-                    tracked_order = self._order_tracker.all_updatable_orders.get(order_update.client_order_id)
+                    tracked_order = self._order_tracker.all_updatable_orders_view.get(order_update.client_order_id)
                     if tracked_order is not None:
                         is_partial_fill = order_update.new_state == OrderState.FILLED and not tracked_order.is_filled
                         if not is_partial_fill:
@@ -29,6 +29,8 @@ from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFa
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    # The account-wide openOrders request weights as much as 20 single order requests
+    ACCOUNT_WIDE_ORDER_STATUS_MIN_ORDERS = 20
 
     web_utils = web_utils
 
@@ -46,7 +48,7 @@ class BinanceExchange(ExchangePyBase):
         self._domain = domain
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
-        self._last_trades_poll_binance_timestamp = 1.0
+        self._last_trades_poll_binance_timestamps: Dict[str, float] = {}
         super().__init__(balance_asset_limit, rate_limits_share_pct)
 
     @staticmethod
@@ -305,7 +307,7 @@ class BinanceExchange(ExchangePyBase):
                         client_order_id = event_message.get("C")
 
                     if execution_type == "TRADE":
-                        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+                        tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
                         if tracked_order is not None:
                             fee = TradeFeeBase.new_spot_fee(
                                 fee_schema=self.trade_fee_schema(),
@@ -326,7 +328,7 @@ class BinanceExchange(ExchangePyBase):
                             )
                             self._order_tracker.process_trade_update(trade_update)
 
-                    tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                     if tracked_order is not None:
                         order_update = OrderUpdate(
                             trading_pair=tracked_order.trading_pair,
@@ -359,29 +361,39 @@ class BinanceExchange(ExchangePyBase):
         NOTE: It is not required to copy this functionality in other connectors.
         This is separated from _update_order_status which only updates the order status without producing filled
         events, since Binance's get order endpoint does not return trade IDs.
-        The minimum poll interval for order status is 10 seconds.
+        Trading pairs with active orders (or recent order activity) are polled every 10 seconds, or on every polling
+        cycle when the user stream is not healthy. The rest of the trading pairs are polled on the long interval by
+        the reconciliation scheduler, a few of them per cycle.
         """
-        small_interval_last_tick = self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL
-        small_interval_current_tick = self.current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL
-        long_interval_last_tick = self._last_poll_timestamp / self.LONG_POLL_INTERVAL
-        long_interval_current_tick = self.current_timestamp / self.LONG_POLL_INTERVAL
-
-        if (long_interval_current_tick > long_interval_last_tick
-                or (self.in_flight_orders and small_interval_current_tick > small_interval_last_tick)):
-            query_time = int(self._last_trades_poll_binance_timestamp * 1e3)
-            self._last_trades_poll_binance_timestamp = self._time_synchronizer.time()
+        current_timestamp = self.current_timestamp
+        active_interval = (
+            self.UPDATE_ORDER_STATUS_MIN_INTERVAL
+            if self._is_user_stream_healthy(timestamp=current_timestamp)
+            else 0
+        )
+        trading_pairs = self._reconciliation_scheduler.trading_pairs_to_poll(
+            trading_pairs=self.trading_pairs,
+            active_trading_pairs=[order.trading_pair for order in self._order_tracker.all_updatable_orders.values()],
+            timestamp=current_timestamp,
+            active_interval=active_interval,
+            idle_interval=self.LONG_POLL_INTERVAL,
+        )
+
+        if trading_pairs:
             order_by_exchange_id_map = {}
             for order in self._order_tracker.all_fillable_orders.values():
                 order_by_exchange_id_map[order.exchange_order_id] = order
 
             tasks = []
-            trading_pairs = self.trading_pairs
+            query_timestamps = []
             for trading_pair in trading_pairs:
                 params = {
                     "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
                 }
-                if self._last_poll_timestamp > 0:
-                    params["startTime"] = query_time
+                last_trades_poll_timestamp = self._last_trades_poll_binance_timestamps.get(trading_pair)
+                if last_trades_poll_timestamp is not None:
+                    params["startTime"] = int(last_trades_poll_timestamp * 1e3)
+                query_timestamps.append(self._time_synchronizer.time())
                 tasks.append(self._api_get(
                     path_url=CONSTANTS.MY_TRADES_PATH_URL,
                     params=params,
@@ -390,7 +402,7 @@ class BinanceExchange(ExchangePyBase):
             self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
             results = await safe_gather(*tasks, return_exceptions=True)
 
-            for trades, trading_pair in zip(results, trading_pairs):
+            for trades, trading_pair, query_timestamp in zip(results, trading_pairs, query_timestamps):
 
                 if isinstance(trades, Exception):
                     self.logger().network(
@@ -398,6 +410,8 @@ class BinanceExchange(ExchangePyBase):
                         app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
                     )
                     continue
+                self._last_trades_poll_binance_timestamps[trading_pair] = query_timestamp
+                self._reconciliation_scheduler.mark_polled(trading_pairs=[trading_pair], timestamp=current_timestamp)
                 for trade in trades:
                     exchange_order_id = str(trade["orderId"])
                     if exchange_order_id in order_by_exchange_id_map:
@@ -508,6 +522,26 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_open_orders_status(self) -> List[OrderUpdate]:
+        open_orders = await self._api_get(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            is_auth_required=True)
+
+        order_updates = []
+        for order_data in open_orders:
+            tracked_order = self._order_tracker.all_updatable_orders_view.get(order_data["clientOrderId"])
+            if tracked_order is None:
+                continue
+            order_updates.append(OrderUpdate(
+                client_order_id=tracked_order.client_order_id,
+                exchange_order_id=str(order_data["orderId"]),
+                trading_pair=tracked_order.trading_pair,
+                update_timestamp=order_data["updateTime"] * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+            ))
+
+        return order_updates
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
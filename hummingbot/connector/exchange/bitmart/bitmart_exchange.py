@@ -380,8 +380,8 @@ class BitmartExchange(ExchangePyBase):
                     for each_event in execution_data:
                         try:
                             client_order_id: Optional[str] = each_event.get("client_order_id")
-                            fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-                            updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                            fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
+                            updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
                             new_state = CONSTANTS.ORDER_STATE[each_event["order_state"]]
                             # This is a workaround to account for a MARKET BUY order reporting the state as "partially cancelled"
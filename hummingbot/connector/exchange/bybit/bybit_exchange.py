@@ -319,7 +319,7 @@ class BybitExchange(ExchangePyBase):
         """
 
         client_order_id = str(trade_msg["orderLinkId"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
 
         if fillable_order is not None:
             trade_update = self._parse_trade_update(trade_msg=trade_msg, tracked_order=fillable_order)
@@ -346,7 +346,7 @@ class BybitExchange(ExchangePyBase):
                     for order in data:
                         client_order_id = order.get("orderLinkId")
                         exchange_order_id = order.get("orderId")
-                        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                         if updatable_order is not None:
                             new_state = CONSTANTS.ORDER_STATE[order["orderStatus"]]
                             order_update = OrderUpdate(
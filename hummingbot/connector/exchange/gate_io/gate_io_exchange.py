@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -17,6 +17,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -174,6 +175,14 @@ class GateIoExchange(ExchangePyBase):
                     f"Error parsing the trading pair rule {rule}. Skipping.", exc_info=True)
         return result
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.BATCH_ORDERS_MAX_SIZE
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.CANCEL_BATCH_ORDERS_MAX_SIZE
+
     async def _place_order(self,
                            order_id: str,
                            trading_pair: str,
@@ -182,6 +191,72 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+
+        # RESTRequest does not support json, and if we pass a dict
+        # the underlying aiohttp will encode it to params
+        data = data
+        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
+        order_result = await self._api_post(
+            path_url=endpoint,
+            data=data,
+            is_auth_required=True,
+            limit_id=endpoint,
+        )
+        if order_result.get("status") in {"cancelled"}:
+            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+        exchange_order_id = str(order_result["id"])
+        return exchange_order_id, self.current_timestamp
+
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        # Each order of the batch counts as one request in the order placement rate limit
+        results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDERS_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDERS_PATH_URL,
+            weight_multiplier=len(orders),
+        )
+        results_by_id = {result.get("text"): result for result in results}
+
+        orders_results = []
+        for order in orders:
+            result = results_by_id.get(order.client_order_id)
+            if result is None:
+                orders_results.append(IOError({"label": "UNKNOWN", "message": "Order not in the batch response."}))
+            elif not result.get("succeeded", False):
+                orders_results.append(IOError({"label": result.get("label"), "message": result.get("message")}))
+            elif result.get("status") in {"cancelled"}:
+                orders_results.append(IOError({"label": "ORDER_REJECTED", "message": "Order rejected."}))
+            else:
+                orders_results.append((str(result["id"]), self.current_timestamp))
+        return orders_results
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
         order_type_str = order_type.name.lower().split("_")[0]
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         # When type is market, it refers to different currency according to side
@@ -215,21 +290,7 @@ class GateIoExchange(ExchangePyBase):
                 data.update({
                     "amount": f"{price * amount:f}",
                 })
-
-        # RESTRequest does not support json, and if we pass a dict
-        # the underlying aiohttp will encode it to params
-        data = data
-        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
-        order_result = await self._api_post(
-            path_url=endpoint,
-            data=data,
-            is_auth_required=True,
-            limit_id=endpoint,
-        )
-        if order_result.get("status") in {"cancelled"}:
-            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
-        exchange_order_id = str(order_result["id"])
-        return exchange_order_id, self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -250,6 +311,42 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        exchange_order_ids = await safe_gather(
+            *[order.get_exchange_order_id() for order in orders], return_exceptions=True)
+        data = []
+        for order, exchange_order_id in zip(orders, exchange_order_ids):
+            if not isinstance(exchange_order_id, Exception):
+                data.append({
+                    "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                    "id": exchange_order_id,
+                })
+
+        results_by_id = {}
+        if len(data) > 0:
+            results = await self._api_post(
+                path_url=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL,
+                data=data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL,
+                weight_multiplier=len(data),
+            )
+            results_by_id = {str(result.get("id")): result for result in results}
+
+        cancel_results = []
+        for exchange_order_id in exchange_order_ids:
+            if isinstance(exchange_order_id, Exception):
+                cancel_results.append(exchange_order_id)
+                continue
+            result = results_by_id.get(exchange_order_id)
+            if result is None:
+                cancel_results.append(IOError({"label": "UNKNOWN", "message": "Order not in the batch response."}))
+            elif not result.get("succeeded", False):
+                cancel_results.append(IOError({"label": result.get("label"), "message": result.get("message")}))
+            else:
+                cancel_results.append(True)
+        return cancel_results
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
@@ -432,7 +529,7 @@ class GateIoExchange(ExchangePyBase):
         https://www.gate.io/docs/apiv4/en/#list-orders
         """
         client_order_id = str(order_msg.get("text", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -475,7 +572,7 @@ class GateIoExchange(ExchangePyBase):
         https://www.gate.io/docs/apiv4/en/#retrieve-market-trades
         """
         client_order_id = client_order_id or str(trade["text"])
-        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
         if tracked_order is None:
             self.logger().debug(f"Ignoring trade message with id {client_order_id}: not in in_flight_orders.")
         else:
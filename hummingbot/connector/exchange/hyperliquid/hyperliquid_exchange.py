@@ -484,7 +484,7 @@ class HyperliquidExchange(ExchangePyBase):
         event if the total executed amount equals to the specified order amount.
         Example Trade:
         """
-        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
 
         if tracked_order is not None:
             trading_pair_base_coin = tracked_order.trading_pair
@@ -519,7 +519,7 @@ class HyperliquidExchange(ExchangePyBase):
         Example Order:
         """
         client_order_id = str(order_msg["order"].get("cloid", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -501,7 +501,7 @@ class KrakenExchange(ExchangePyBase):
             trade["trade_id"] = trade_id
             exchange_order_id = trade.get("ordertxid")
             client_order_id = str(trade.get("userref", ""))
-            tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
 
             if not tracked_order:
                 self.logger().debug(f"Ignoring trade message with id {exchange_order_id}: not in in_flight_orders.")
@@ -526,7 +526,7 @@ class KrakenExchange(ExchangePyBase):
         for message in update:
             for exchange_order_id, order_msg in message.items():
                 client_order_id = str(order_msg.get("userref", ""))
-                tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                tracked_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
                 if not tracked_order:
                     self.logger().debug(
                         f"Ignoring order message with id {order_msg}: not in in_flight_orders.")
@@ -1,7 +1,13 @@
 import time
 from typing import Dict, List, Optional
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    depth_levels_to_array,
+)
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -42,6 +48,14 @@ class KucoinOrderBookMessage(OrderBookMessage):
             for price, amount, *trash in self.content.get("bids", [])
         ]
 
+    @property
+    def asks_array(self) -> np.ndarray:
+        return depth_levels_to_array(self.content.get("asks", []), self.update_id)
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return depth_levels_to_array(self.content.get("bids", []), self.update_id)
+
     @property
     def has_update_id(self) -> bool:
         return True
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 import hummingbot.connector.exchange.ndax.ndax_constants as CONSTANTS
 from hummingbot.connector.exchange.ndax.ndax_order_book_message import NdaxOrderBookMessage
-from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book import OrderBook, OrderBookDiffWindow
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.logger import HummingbotLogger
 
@@ -96,3 +96,7 @@ class NdaxOrderBook(OrderBook):
     @classmethod
     def restore_from_snapshot_and_diffs(cls, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         raise NotImplementedError(CONSTANTS.EXCHANGE_NAME + " order book needs to retain individual order data.")
+
+    @classmethod
+    def restore_from_snapshot_and_diff_window(cls, snapshot: OrderBookMessage, diff_window: OrderBookDiffWindow):
+        raise NotImplementedError(CONSTANTS.EXCHANGE_NAME + " order book needs to retain individual order data.")
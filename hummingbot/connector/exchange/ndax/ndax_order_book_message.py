@@ -3,7 +3,13 @@
 from collections import namedtuple
 from typing import Dict, List, Optional
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    order_book_rows_to_array,
+)
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 NdaxOrderBookEntry = namedtuple("NdaxOrderBookEntry", "mdUpdateId accountId actionDateTime actionType lastTradePrice orderId price productPairCode quantity side")
@@ -71,6 +77,15 @@ class NdaxOrderBookMessage(OrderBookMessage):
         bids.sort(key=lambda row: (row.price, row.update_id))
         return bids
 
+    @property
+    def asks_array(self) -> np.ndarray:
+        # Entries carry their own update ids and actions, so they go through the row conversion
+        return order_book_rows_to_array(self.asks)
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return order_book_rows_to_array(self.bids)
+
     def _order_book_row_for_entry(self, entry: NdaxOrderBookEntry) -> OrderBookRow:
         price = float(entry.price)
         amount = float(entry.quantity) if entry.actionType != self._DELETE_ACTION_TYPE else 0.0
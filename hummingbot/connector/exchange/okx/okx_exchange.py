@@ -406,8 +406,8 @@ class OkxExchange(ExchangePyBase):
                         order_status = CONSTANTS.ORDER_STATE[data["state"]]
                         client_order_id = data["clOrdId"]
                         trade_id = data["tradeId"]
-                        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-                        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        fillable_order = self._order_tracker.all_fillable_orders_view.get(client_order_id)
+                        updatable_order = self._order_tracker.all_updatable_orders_view.get(client_order_id)
 
                         if (fillable_order is not None
                                 and order_status in [OrderState.PARTIALLY_FILLED, OrderState.FILLED]
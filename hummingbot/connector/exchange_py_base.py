@@ -4,22 +4,24 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.reconciliation_scheduler import ReconciliationScheduler
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -42,6 +44,9 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Minimum number of tracked orders from which the order status update starts with an account-wide open orders
+    # request (see `_request_open_orders_status`). 0 disables it.
+    ACCOUNT_WIDE_ORDER_STATUS_MIN_ORDERS = 0
 
     def __init__(self,
                  balance_asset_limit: Optional[Dict[str, Dict[str, Decimal]]] = None,
@@ -65,6 +70,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
+        self._reconciliation_scheduler = ReconciliationScheduler(throttler=self._throttler)
 
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
@@ -160,6 +166,30 @@ class ExchangePyBase(ExchangeBase, ABC):
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
 
+    @property
+    def reconciliation_scheduler(self) -> ReconciliationScheduler:
+        """
+        The scheduler of the REST reconciliation done by the status polling loop. It also reports the rate limit weight
+        spent by each polling cycle.
+        """
+        return self._reconciliation_scheduler
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        The maximum number of orders placed by a single request to the exchange batch endpoint (see
+        `_place_batch_orders`). 0 if the connector has no batch endpoint, the orders are then placed one by one.
+        """
+        return 0
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        The maximum number of orders cancelled by a single request to the exchange batch endpoint (see
+        `_place_batch_cancel`). 0 if the connector has no batch endpoint, the orders are then cancelled one by one.
+        """
+        return 0
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
@@ -319,6 +349,31 @@ class ExchangePyBase(ExchangeBase, ABC):
             **kwargs))
         return order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Creates a promise to create all the orders. The orders are sent in as few requests as the exchange batch
+        endpoint allows (see `batch_order_create_max_size`), or as pipelined single requests otherwise. Each order
+        goes through the usual tracking states and events, independently of the other orders of the batch.
+
+        :param orders_to_create: the LimitOrder or MarketOrder objects representing the orders to create. The order
+            ids can be blank.
+
+        :return: the orders to create, with the ids assigned by the connector (the client ids)
+        """
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
+            )
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -356,6 +411,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel all the orders, in as few requests as the exchange batch endpoint allows (see
+        `batch_order_cancel_max_size`), or as pipelined single requests otherwise.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -406,6 +470,32 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = await self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is not None:
+            await self._place_order_and_process_update_or_fail(order=order, **kwargs)
+
+    async def _start_tracking_and_validate_order(self,
+                                                 trade_type: TradeType,
+                                                 order_id: str,
+                                                 trading_pair: str,
+                                                 amount: Decimal,
+                                                 order_type: OrderType,
+                                                 price: Optional[Decimal] = None,
+                                                 **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking the order and checks it against the trading rules. Orders that can not be created are marked
+        as failed.
+
+        :return: the tracked order, or None if the order is not valid
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -422,6 +512,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             amount=quantized_amount,
             **kwargs,
         )
+        self._reconciliation_scheduler.record_activity(trading_pair=trading_pair, timestamp=self.current_timestamp)
         order = self._order_tracker.active_orders[order_id]
         if not price or price.is_nan() or price == s_decimal_0:
             current_price: Decimal = self.get_price(trading_pair, False)
@@ -434,21 +525,25 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._update_order_after_failure(
                 order_id=order_id, trading_pair=trading_pair,
                 exception=ValueError(f"{order_type} is not in the list of supported order types"))
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self._update_order_after_failure(
                 order_id=order_id, trading_pair=trading_pair,
                 exception=ValueError(f"Order amount {amount} is lower than minimum order size {trading_rule.min_order_size} "
                                      f"for the pair {trading_pair}. The order will not be created."))
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self._update_order_after_failure(
                 order_id=order_id, trading_pair=trading_pair,
                 exception=ValueError(f"Order notional {notional_size} is lower than minimum notional size {trading_rule.min_notional_size}"
                                      f" for the pair {trading_pair}. The order will not be created."))
-            return
+            return None
+
+        return order
+
+    async def _place_order_and_process_update_or_fail(self, order: InFlightOrder, **kwargs):
         try:
             await self._place_order_and_process_update(order=order, **kwargs,)
 
@@ -456,12 +551,12 @@ class ExchangePyBase(ExchangeBase, ABC):
             raise
         except Exception as ex:
             self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
                 exception=ex,
                 **kwargs,
             )
@@ -547,18 +642,7 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._update_order_after_cancelation_success(order=order)
         return cancelled
 
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
@@ -575,6 +659,182 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        """
+        Starts tracking and validates each order of the batch, then sends the valid ones to the exchange
+
+        :param orders_to_create: the orders to create, with their client ids already assigned
+        """
+        inflight_orders_to_create = []
+        for order in orders_to_create:
+            valid_order = await self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order.order_type(),
+                price=order.price,
+                **self._batch_order_kwargs(order=order),
+            )
+            if valid_order is not None:
+                inflight_orders_to_create.append(valid_order)
+        if len(inflight_orders_to_create) > 0:
+            await self._execute_batch_inflight_order_create(inflight_orders_to_create=inflight_orders_to_create)
+
+    async def _execute_batch_inflight_order_create(self, inflight_orders_to_create: List[InFlightOrder]):
+        """
+        Sends the tracked orders in chunks of `batch_order_create_max_size` orders when the connector implements a
+        native batch endpoint, or as concurrent single requests otherwise
+        """
+        max_size = self.batch_order_create_max_size
+        if max_size > 0:
+            tasks = [
+                self._place_batch_order_create_and_process_update(orders=inflight_orders_to_create[i:i + max_size])
+                for i in range(0, len(inflight_orders_to_create), max_size)
+            ]
+        else:
+            tasks = [
+                self._place_order_and_process_update_or_fail(order=order, **self._batch_order_kwargs(order=order))
+                for order in inflight_orders_to_create
+            ]
+        await safe_gather(*tasks, return_exceptions=True)
+
+    async def _place_batch_order_create_and_process_update(self, orders: List[InFlightOrder]):
+        try:
+            results = await self._place_batch_orders(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().network(f"Error submitting a batch of {len(orders)} orders to {self.name_cap}.", exc_info=True)
+            results = [ex] * len(orders)
+
+        if len(results) != len(orders):
+            self.logger().error(
+                f"{self.name_cap} returned {len(results)} results for a batch of {len(orders)} orders. "
+                f"The orders without a result are considered failed.")
+
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=result,
+                    **self._batch_order_kwargs(order=order),
+                )
+            else:
+                exchange_order_id, update_timestamp = result
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+        for order in orders[len(results):]:
+            self._update_order_after_failure(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                exception=IOError(f"No result for order {order.client_order_id} in the batch create response."),
+            )
+
+    def _batch_order_kwargs(self, order: Union[InFlightOrder, LimitOrder, MarketOrder]) -> Dict[str, Any]:
+        return {} if order.position == PositionAction.NIL else {"position_action": order.position}
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        """
+        Requests the exchange to cancel the orders
+
+        :param orders_to_cancel: the orders to cancel
+
+        :return: a CancellationResult for each of the orders
+        """
+        results = []
+        tracked_orders_to_cancel = []
+
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        if len(tracked_orders_to_cancel) > 0:
+            results.extend(await self._execute_batch_order_cancel(orders_to_cancel=tracked_orders_to_cancel))
+
+        return results
+
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancellationResult]:
+        max_size = self.batch_order_cancel_max_size
+        if max_size > 0:
+            chunks = await safe_gather(
+                *[self._place_batch_cancel_and_process_update(orders=orders_to_cancel[i:i + max_size])
+                  for i in range(0, len(orders_to_cancel), max_size)]
+            )
+            cancelled_ids = [order_id for chunk in chunks for order_id in chunk]
+        else:
+            cancelled_ids = await safe_gather(
+                *[self._execute_order_cancel(order=order) for order in orders_to_cancel]
+            )
+        return [
+            CancellationResult(order_id=order.client_order_id, success=cancelled_id is not None)
+            for order, cancelled_id in zip(orders_to_cancel, cancelled_ids)
+        ]
+
+    async def _place_batch_cancel_and_process_update(self, orders: List[InFlightOrder]) -> List[Optional[str]]:
+        """
+        :return: for each order, the client id of the order if it was cancelled, None otherwise
+        """
+        try:
+            results = await self._place_batch_cancel(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().error(
+                f"Failed to cancel orders {', '.join([o.client_order_id for o in orders])}", exc_info=True)
+            results = [ex] * len(orders)
+
+        cancelled_ids = []
+        for order, result in zip(orders, results):
+            cancelled_id = None
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger().warning(
+                    f"Failed to cancel the order {order.client_order_id} because it does not have an exchange order id yet"
+                )
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            elif isinstance(result, Exception):
+                if self._is_order_not_found_during_cancelation_error(cancelation_exception=result):
+                    self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                    await self._order_tracker.process_order_not_found(order.client_order_id)
+                else:
+                    self.logger().error(f"Failed to cancel order {order.client_order_id}: {result}")
+            elif result:
+                self._update_order_after_cancelation_success(order=order)
+                cancelled_id = order.client_order_id
+            cancelled_ids.append(cancelled_id)
+        # Orders without a result in the response are not cancelled; keep one entry per order so the chunks stay aligned
+        cancelled_ids.extend([None] * (len(orders) - len(cancelled_ids)))
+        return cancelled_ids
+
+    def _update_order_after_cancelation_success(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -648,6 +908,26 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Places the orders with a single request to the exchange batch endpoint. Only called when
+        `batch_order_create_max_size` is positive, with at most that many orders.
+
+        :return: for each order (in the same order), the exchange order id and the update timestamp, or the exception
+            describing why the exchange rejected that order
+        """
+        raise NotImplementedError
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with a single request to the exchange batch endpoint. Only called when
+        `batch_order_cancel_max_size` is positive, with at most that many orders.
+
+        :return: for each order (in the same order), True if it was cancelled, or the exception describing why the
+            cancelation failed
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -779,10 +1059,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with self._reconciliation_scheduler.cycle():
+                    await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -898,6 +1179,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             return_err: bool = False,
             limit_id: Optional[str] = None,
             headers: Optional[Dict[str, Any]] = None,
+            weight_multiplier: int = 1,
             **kwargs,
     ) -> Dict[str, Any]:
 
@@ -907,6 +1189,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         url = overwrite_url or await self._api_request_url(path_url=path_url, is_auth_required=is_auth_required)
 
         for _ in range(2):
+            self._reconciliation_scheduler.record_request(
+                limit_id=limit_id if limit_id else path_url, weight_multiplier=weight_multiplier)
             try:
                 request_result = await rest_assistant.execute_request(
                     url=url,
@@ -917,6 +1201,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                     return_err=return_err,
                     throttler_limit_id=limit_id if limit_id else path_url,
                     headers=headers,
+                    throttler_weight_multiplier=weight_multiplier,
                 )
 
                 return request_result
@@ -1005,11 +1290,47 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await error_handler(order, request_error)
 
     async def _update_orders(self):
-        orders_to_update = self.in_flight_orders.copy()
+        orders_to_update = list(self.in_flight_orders.values())
+        if 0 < self.ACCOUNT_WIDE_ORDER_STATUS_MIN_ORDERS <= len(orders_to_update):
+            orders_to_update = await self._update_orders_from_open_orders_status(orders=orders_to_update)
         await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_active_order
+            orders=orders_to_update, error_handler=self._handle_update_error_for_active_order
         )
 
+    async def _update_orders_from_open_orders_status(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Updates the orders still open in the exchange with a single account-wide request.
+
+        :return: the orders not reported as open, which have to be requested individually
+        """
+        try:
+            order_updates = await self._request_open_orders_status()
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the open orders status. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+
+        order_update_by_client_id = {order_update.client_order_id: order_update for order_update in order_updates}
+        remaining_orders = []
+        for order in orders:
+            order_update = order_update_by_client_id.get(order.client_order_id)
+            if order_update is None:
+                remaining_orders.append(order)
+            else:
+                self._order_tracker.process_order_update(order_update)
+        return remaining_orders
+
+    async def _request_open_orders_status(self) -> List[OrderUpdate]:
+        """
+        Requests the status of all the open orders of the account, for all trading pairs, in one request.
+        Only required for connectors enabling `ACCOUNT_WIDE_ORDER_STATUS_MIN_ORDERS`.
+        """
+        raise NotImplementedError
+
     async def _update_lost_orders(self):
         orders_to_update = self._order_tracker.lost_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1025,7 +1346,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         await self._update_lost_orders()
 
     async def _cancel_lost_orders(self):
-        for _, lost_order in self._order_tracker.lost_orders.items():
+        for lost_order in list(self._order_tracker.lost_orders.values()):
             await self._execute_order_cancel(order=lost_order)
 
     # Methods tied to specific API data formats
@@ -1091,12 +1412,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         exchange_info = await self._api_get(path_url=self.trading_pairs_request_path)
         return exchange_info
 
-    def _get_poll_interval(self, timestamp: float) -> float:
+    def _is_user_stream_healthy(self, timestamp: float) -> bool:
         last_user_stream_message_time = (
             0 if self._user_stream_tracker is None else self._user_stream_tracker.last_recv_time
         )
-        last_recv_diff = timestamp - last_user_stream_message_time
+        return timestamp - last_user_stream_message_time <= self.TICK_INTERVAL_LIMIT
+
+    def _get_poll_interval(self, timestamp: float) -> float:
         poll_interval = (
-            self.SHORT_POLL_INTERVAL if last_recv_diff > self.TICK_INTERVAL_LIMIT else self.LONG_POLL_INTERVAL
+            self.LONG_POLL_INTERVAL if self._is_user_stream_healthy(timestamp=timestamp) else self.SHORT_POLL_INTERVAL
         )
         return poll_interval
@@ -23,6 +23,7 @@ class GatewayOrderTracker(ClientOrderTracker):
         super().__init__(connector=connector, lost_order_count_limit=lost_order_count_limit)
         # For some DEXes it is important to process orders in the same order they were created
         self._lost_orders: Dict[str, GatewayInFlightOrder] = OrderedDict()
+        self._init_views()
 
     @property
     def all_fillable_orders_by_hash(self) -> Dict[str, GatewayInFlightOrder]:
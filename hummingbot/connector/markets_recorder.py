@@ -47,6 +47,7 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_rollup import TradeFillRollup
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
@@ -461,6 +462,7 @@ class MarketsRecorder:
                 )
                 session.add(order_status)
                 session.add(trade_fill_record)
+                TradeFillRollup.add_trade_fill(session, trade_fill_record)
                 self.save_market_states(self._config_file_path, market, session=session)
 
                 market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
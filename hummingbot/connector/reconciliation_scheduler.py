@@ -0,0 +1,126 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional
+
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+
+_current_cycle_weights: ContextVar[Optional[Dict[str, int]]] = ContextVar("_current_cycle_weights", default=None)
+
+
+class ReconciliationScheduler:
+    """
+    Schedules the REST reconciliation (fills and order status polling) performed by the connector status polling loop.
+
+    Trading pairs with active orders, or with order activity in the last `recent_activity_window` seconds, are
+    reconciled at the `active_interval` given for the cycle. The remaining (idle) pairs are only reconciled every
+    `idle_interval` seconds, oldest first and at most `max_idle_pairs_per_cycle` of them per cycle, so a connector
+    configured with many trading pairs does not spend its request weight polling markets it does not trade.
+
+    The scheduler also accounts the rate limit weight spent by the requests issued while a polling cycle is running
+    (see `cycle`), per rate limit id.
+    """
+
+    def __init__(self,
+                 throttler: AsyncThrottlerBase,
+                 recent_activity_window: float = 60.0,
+                 max_idle_pairs_per_cycle: int = 5):
+        self._throttler = throttler
+        self._recent_activity_window = recent_activity_window
+        self._max_idle_pairs_per_cycle = max_idle_pairs_per_cycle
+        self._last_activity_timestamps: Dict[str, float] = {}
+        self._last_poll_timestamps: Dict[str, float] = {}
+        self._last_cycle_weights: Dict[str, int] = {}
+        self._total_weights: Dict[str, int] = defaultdict(int)
+        self._cycles_count = 0
+
+    @property
+    def last_cycle_weights(self) -> Dict[str, int]:
+        """
+        The weight spent on each rate limit (the limits of the endpoints requested and their linked pools) during the
+        last completed polling cycle.
+        """
+        return dict(self._last_cycle_weights)
+
+    @property
+    def total_weights(self) -> Dict[str, int]:
+        return dict(self._total_weights)
+
+    @property
+    def cycles_count(self) -> int:
+        return self._cycles_count
+
+    def record_activity(self, trading_pair: str, timestamp: float):
+        """
+        Registers order activity (e.g. a new order) on the trading pair, making it a priority pair for the
+        `recent_activity_window` next seconds.
+        """
+        self._last_activity_timestamps[trading_pair] = timestamp
+
+    def has_recent_activity(self, trading_pair: str, timestamp: float) -> bool:
+        last_activity = self._last_activity_timestamps.get(trading_pair)
+        return last_activity is not None and timestamp - last_activity <= self._recent_activity_window
+
+    def last_poll_timestamp(self, trading_pair: str) -> Optional[float]:
+        return self._last_poll_timestamps.get(trading_pair)
+
+    def mark_polled(self, trading_pairs: Iterable[str], timestamp: float):
+        for trading_pair in trading_pairs:
+            self._last_poll_timestamps[trading_pair] = timestamp
+
+    def trading_pairs_to_poll(self,
+                              trading_pairs: Iterable[str],
+                              active_trading_pairs: Iterable[str],
+                              timestamp: float,
+                              active_interval: float,
+                              idle_interval: float) -> List[str]:
+        """
+        Selects the trading pairs to reconcile in the current cycle.
+
+        :param trading_pairs: All the trading pairs of the connector.
+        :param active_trading_pairs: The trading pairs with orders being tracked.
+        :param timestamp: The current timestamp.
+        :param active_interval: The minimum time between two polls of a pair with active orders or recent activity
+        (0 to poll them on every cycle).
+        :param idle_interval: The minimum time between two polls of the other pairs.
+        :return: The priority pairs due for polling followed by the idle pairs due, oldest first.
+        """
+        active_trading_pairs = set(active_trading_pairs)
+        priority_pairs = []
+        idle_pairs = []
+        for trading_pair in trading_pairs:
+            last_poll = self._last_poll_timestamps.get(trading_pair)
+            if trading_pair in active_trading_pairs or self.has_recent_activity(trading_pair, timestamp):
+                if last_poll is None or timestamp - last_poll >= active_interval:
+                    priority_pairs.append(trading_pair)
+            elif last_poll is None or timestamp - last_poll >= idle_interval:
+                idle_pairs.append(trading_pair)
+
+        idle_pairs.sort(key=lambda pair: self._last_poll_timestamps.get(pair, float("-inf")))
+        return priority_pairs + idle_pairs[:self._max_idle_pairs_per_cycle]
+
+    @contextmanager
+    def cycle(self):
+        """
+        Context of a polling cycle. The weight of the requests registered with `record_request` inside the context
+        (including the ones issued from tasks created inside it) is reported in `last_cycle_weights` when it exits.
+        """
+        cycle_weights: Dict[str, int] = defaultdict(int)
+        token = _current_cycle_weights.set(cycle_weights)
+        try:
+            yield cycle_weights
+        finally:
+            _current_cycle_weights.reset(token)
+            self._last_cycle_weights = dict(cycle_weights)
+            self._cycles_count += 1
+
+    def record_request(self, limit_id: str, weight_multiplier: int = 1):
+        cycle_weights = _current_cycle_weights.get()
+        if cycle_weights is None:
+            return
+        rate_limit, related_limits = self._throttler.get_related_limits(limit_id=limit_id)
+        weights = [] if rate_limit is None else [(rate_limit, rate_limit.weight)]
+        weights.extend(related_limits)
+        for limit, weight in weights:
+            cycle_weights[limit.limit_id] += weight * weight_multiplier
+            self._total_weights[limit.limit_id] += weight * weight_multiplier
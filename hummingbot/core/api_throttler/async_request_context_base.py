@@ -34,6 +34,7 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 weight_multiplier: int = 1,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +43,8 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param weight_multiplier: Factor applied to the weights of all the limits, for requests that count as several
+        calls (e.g. batch orders counted per order)
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +52,7 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._weight_multiplier: int = weight_multiplier
 
     def flush(self):
         """
@@ -79,10 +83,11 @@ class AsyncRequestContextBase(ABC):
 
             # Log the acquired rate limit into the tasks log
             new_logs = [
-                TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight)
+                TaskLog(timestamp=now, rate_limit=self._rate_limit,
+                        weight=self._rate_limit.weight * self._weight_multiplier)
             ] + [
                 # Log its related limits into the tasks log as individual tasks
-                TaskLog(timestamp=now, rate_limit=limit, weight=weight)
+                TaskLog(timestamp=now, rate_limit=limit, weight=weight * self._weight_multiplier)
                 for limit, weight in self._related_limits
             ]
             self._task_logs.extend(new_logs)
@@ -26,6 +26,7 @@ class AsyncRequestContext(AsyncRequestContextBase):
         if self._rate_limit is not None:
             list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
                                                             self._rate_limit.weight)] + self._related_limits
+            list_of_limits = [(limit, weight * self._weight_multiplier) for limit, weight in list_of_limits]
             limit_id_to_task_log_map = collections.defaultdict(list)
             for task in self._task_logs:
                 limit_id_to_task_log_map[task.rate_limit.limit_id].append(task)
@@ -63,11 +64,12 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, weight_multiplier: int = 1) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param weight_multiplier: the number of calls the request counts for (e.g. the number of orders in a batch)
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -78,4 +80,5 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            weight_multiplier=weight_multiplier,
         )
@@ -86,5 +86,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, weight_multiplier: int = 1) -> AsyncRequestContextBase:
         raise NotImplementedError
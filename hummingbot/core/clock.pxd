@@ -1,12 +1,37 @@
 # distutils: language=c++
 
+cdef class IteratorTickStats:
+    cdef:
+        public bint low_priority
+        public long ticks
+        public long overruns
+        public long deferred
+        public double total_duration
+        public double max_duration
+        public double last_duration
+        long _consecutive_deferrals
+        list _histogram
+
+    cdef c_record(self, double duration)
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
         double _tick_size
+        double _tick_budget
         double _start_time
         double _end_time
         list _child_iterators
         list _current_context
         double _current_tick
         bint _started
+        dict _iterator_stats
+        int _max_deferred_ticks
+        long _overrun_ticks
+        long _skipped_ticks
+        object _replay_timestamps
+        Py_ssize_t _replay_index
+
+    cdef IteratorTickStats c_get_iterator_stats(self, object iterator)
+    cdef c_tick_iterators(self, list iterators, double deadline)
@@ -3,7 +3,9 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -12,6 +14,48 @@ from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
+# Upper bounds (in seconds) of the buckets of the iterators tick duration histograms, the last bucket is unbounded
+TICK_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+cdef class IteratorTickStats:
+    """
+    Tick durations (in seconds) of a clock child iterator in real time mode.
+    """
+
+    def __init__(self, low_priority: bool = False):
+        self.low_priority = low_priority
+        self.ticks = 0
+        self.overruns = 0
+        self.deferred = 0
+        self.total_duration = 0
+        self.max_duration = 0
+        self.last_duration = 0
+        self._consecutive_deferrals = 0
+        self._histogram = [0] * (len(TICK_LATENCY_BUCKETS) + 1)
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.ticks if self.ticks > 0 else 0.0
+
+    @property
+    def latency_histogram(self) -> List[Tuple[float, int]]:
+        """
+        :return: The number of ticks per duration bucket, as (bucket upper bound in seconds, count)
+        """
+        return list(zip(TICK_LATENCY_BUCKETS + (float("inf"),), self._histogram))
+
+    cdef c_record(self, double duration):
+        cdef Py_ssize_t bucket = 0
+        while bucket < len(TICK_LATENCY_BUCKETS) and duration > TICK_LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        self._histogram[bucket] += 1
+        self.ticks += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
 
 cdef class Clock:
     @classmethod
@@ -21,21 +65,43 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 tick_budget: Optional[float] = None,
+                 max_deferred_ticks: int = 5,
+                 replay_timestamps: Optional[Sequence[float]] = None):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param tick_budget: (real time mode only) time available to the child iterators to process a tick, the tick
+        size if not provided. The low priority iterators are deferred once it is exhausted.
+        :param max_deferred_ticks: (real time mode only) maximum number of consecutive ticks a low priority iterator
+        can be deferred
+        :param replay_timestamps: (back testing mode only) recorded timestamps (e.g. of the market data) to tick at
+        instead of every tick size
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
+        self._tick_budget = tick_budget if tick_budget is not None else tick_size
+        self._max_deferred_ticks = max_deferred_ticks
         self._start_time = start_time if clock_mode is ClockMode.BACKTEST else (time.time() // tick_size) * tick_size
         self._end_time = end_time
         self._current_tick = self._start_time
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._iterator_stats = {}
+        self._overrun_ticks = 0
+        self._skipped_ticks = 0
+        self._replay_timestamps = None
+        self._replay_index = 0
+        if replay_timestamps is not None:
+            self.set_replay_timestamps(replay_timestamps)
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -53,10 +119,53 @@ cdef class Clock:
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
 
+    @property
+    def tick_budget(self) -> float:
+        return self._tick_budget
+
     @property
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def iterator_stats(self) -> Dict[TimeIterator, IteratorTickStats]:
+        return self._iterator_stats
+
+    @property
+    def overrun_ticks(self) -> int:
+        """
+        Number of real time ticks whose processing took longer than the tick budget.
+        """
+        return self._overrun_ticks
+
+    @property
+    def skipped_ticks(self) -> int:
+        """
+        Number of real time ticks skipped because the processing of the previous tick ran past them.
+        """
+        return self._skipped_ticks
+
+    @property
+    def replay_timestamps(self) -> Optional[np.ndarray]:
+        return self._replay_timestamps
+
+    def set_replay_timestamps(self, timestamps: Sequence[float]):
+        """
+        Makes the back testing clock tick at the recorded timestamps after the current one instead of every tick size.
+        """
+        self._replay_timestamps = np.unique(np.asarray(timestamps, dtype=np.float64))
+        self._replay_index = np.searchsorted(self._replay_timestamps, self._current_tick, side="right")
+
+    def get_iterator_stats(self, iterator: TimeIterator) -> IteratorTickStats:
+        return self.c_get_iterator_stats(iterator)
+
+    cdef IteratorTickStats c_get_iterator_stats(self, object iterator):
+        cdef IteratorTickStats stats = self._iterator_stats.get(iterator)
+        if stats is None:
+            stats = IteratorTickStats()
+            self._iterator_stats[iterator] = stats
+        return stats
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -69,7 +178,13 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, low_priority: bool = False):
+        """
+        :param iterator: the iterator to tick
+        :param low_priority: (real time mode only) whether the iterator ticks are deferred when the tick budget is
+        exhausted
+        """
+        self.c_get_iterator_stats(iterator).low_priority = low_priority
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
@@ -81,6 +196,51 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._iterator_stats.pop(iterator, None)
+
+    cdef c_tick_iterators(self, list iterators, double deadline):
+        """
+        Ticks the iterators in real time mode, measuring the duration of each tick. The low priority iterators are
+        deferred to the next tick once the deadline (time.perf_counter() based) is reached.
+        """
+        cdef:
+            TimeIterator child_iterator
+            IteratorTickStats stats
+            IteratorTickStats slowest_stats = None
+            double start
+            double end = time.perf_counter()
+            bint overrun = False
+            object slowest_iterator = None
+
+        for ci in iterators:
+            child_iterator = ci
+            stats = self.c_get_iterator_stats(ci)
+            start = end
+            if stats.low_priority and start >= deadline and stats._consecutive_deferrals < self._max_deferred_ticks:
+                stats.deferred += 1
+                stats._consecutive_deferrals += 1
+                continue
+            stats._consecutive_deferrals = 0
+            try:
+                child_iterator.c_tick(self._current_tick)
+            except StopIteration:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            end = time.perf_counter()
+            stats.c_record(end - start)
+            if end > deadline and not overrun:
+                # The iterator whose tick crossed the deadline
+                stats.overruns += 1
+                overrun = True
+            if slowest_stats is None or stats.last_duration > slowest_stats.last_duration:
+                slowest_stats = stats
+                slowest_iterator = ci
+
+        if overrun:
+            self._overrun_ticks += 1
+            self.logger().debug(f"Clock tick at {self._current_tick} exceeded the tick budget of {self._tick_budget}s. "
+                                f"Slowest iterator: {slowest_iterator} ({slowest_stats.last_duration:.4f}s).")
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +250,7 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            long skipped_ticks
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -109,26 +270,45 @@ cdef class Clock:
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                skipped_ticks = <long>round((next_tick_time - self._current_tick) / self._tick_size) - 1
+                if skipped_ticks > 0:
+                    self._skipped_ticks += skipped_ticks
+                    self.logger().warning(f"The processing of the clock tick at {self._current_tick} overran "
+                                          f"{skipped_ticks} tick(s). Slowest iterators: {self.slowest_iterators()}")
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                try:
+                    self.c_tick_iterators(
+                        self._current_context,
+                        time.perf_counter() + next_tick_time + self._tick_budget - time.time()
+                    )
+                except StopIteration:
+                    self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                    return
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    def slowest_iterators(self, count: int = 3) -> List[Tuple[TimeIterator, float]]:
+        """
+        :return: The iterators with the longest last tick, with the duration of their last tick in seconds
+        """
+        durations = [(iterator, (<IteratorTickStats>stats).last_duration)
+                     for iterator, stats in self._iterator_stats.items()]
+        return sorted(durations, key=lambda item: item[1], reverse=True)[:count]
+
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        """
+        Ticks the clock every tick size until the timestamp, or at each replay timestamp until the timestamp if replay
+        timestamps are set.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double[:] replay_timestamps
+            Py_ssize_t replay_count
 
         if not self._started:
             for ci in self._child_iterators:
@@ -136,9 +316,22 @@ cdef class Clock:
                 child_iterator.c_start(self, self._start_time)
             self._started = True
 
+        if self._replay_timestamps is not None:
+            replay_timestamps = self._replay_timestamps
+            replay_count = replay_timestamps.shape[0]
+
         try:
-            while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+            while True:
+                if self._replay_timestamps is not None:
+                    # Written so that a NaN timestamp replays all the timestamps
+                    if self._replay_index >= replay_count or replay_timestamps[self._replay_index] > timestamp:
+                        break
+                    self._current_tick = replay_timestamps[self._replay_index]
+                    self._replay_index += 1
+                elif self._current_tick >= timestamp:
+                    break
+                else:
+                    self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
@@ -9,6 +9,20 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef class OrderBookDiffWindow:
+    cdef:
+        size_t _max_diffs
+        vector[OrderBookEntry] _entries
+        vector[int64_t] _update_ids
+        vector[size_t] _offsets
+        vector[size_t] _bid_counts
+        vector[size_t] _ask_counts
+        size_t _first_diff
+
+    cdef c_append(self, int64_t update_id, const double[:, :] bids_array, const double[:, :] asks_array)
+    cdef c_compact(self)
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,16 +34,33 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef list _price_subscriptions
+    cdef bint _depth_cache_enabled
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_base_volumes
+    cdef vector[double] _bid_depth_quote_volumes
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_base_volumes
+    cdef vector[double] _ask_depth_quote_volumes
+    cdef int64_t _version
+    cdef int64_t _top_snapshots_version
+    cdef dict _top_snapshots
+    cdef vector[OrderBookEntry] _bids_buffer
+    cdef vector[OrderBookEntry] _asks_buffer
 
-    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
-    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
-    cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
-    cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_notify_price_subscriptions(self)
+    cdef c_reset_depth_cache(self)
+    cdef c_truncate_depth_cache(self, bint is_buy, double price)
+    cdef c_extend_depth_cache(self, bint is_buy, double base_volume, double quote_volume, double price)
+    cdef np.ndarray c_top_entries(self, bint is_buy, Py_ssize_t depth)
+    cdef c_apply_numpy_diffs(self, const double[:, :] bids_array, const double[:, :] asks_array)
+    cdef c_apply_numpy_diffs_with_update_id(self, const double[:, :] bids_array, const double[:, :] asks_array,
+                                            int64_t update_id)
+    cdef c_apply_numpy_snapshot(self, const double[:, :] bids_array, const double[:, :] asks_array)
+    cdef c_replay_diff_window(self, OrderBookDiffWindow diff_window, int64_t after_update_id)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
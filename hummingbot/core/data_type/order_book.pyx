@@ -1,6 +1,7 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 import bisect
+import itertools
 import logging
 import time
 from typing import (
@@ -18,9 +19,12 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
+from libc.math cimport INFINITY
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_price_subscription import OrderBookPriceSubscription
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
@@ -36,6 +40,157 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline size_t first_level_reaching(vector[double] *cumulative_volumes, double volume):
+    """
+    Binary search of the first level whose cumulative volume reaches the volume (the number of levels if none).
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(cumulative_volumes).size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if deref(cumulative_volumes)[middle] >= volume:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline size_t first_level_beyond(vector[double] *prices, double price, bint is_buy, bint inclusive):
+    """
+    Binary search of the first level priced beyond the price (above it for asks, below it for bids), or at the price
+    too if inclusive. Returns the number of levels if none.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(prices).size()
+        size_t middle
+        double level_price
+        bint beyond
+    while low < high:
+        middle = (low + high) // 2
+        level_price = deref(prices)[middle]
+        if is_buy:
+            beyond = level_price > price or (inclusive and level_price == price)
+        else:
+            beyond = level_price < price or (inclusive and level_price == price)
+        if beyond:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline int64_t fill_entries(vector[OrderBookEntry] *entries, const double[:, :] levels, int64_t last_update_id):
+    """
+    Appends the [price, amount, update_id] rows of the typed buffer to the entries, without a Python object per row.
+    Returns the largest of the rows update IDs and the last update ID.
+    """
+    cdef:
+        int64_t row_update_id
+        Py_ssize_t i
+    for i in range(levels.shape[0]):
+        row_update_id = <int64_t>levels[i, 2]
+        deref(entries).push_back(OrderBookEntry(levels[i, 0], levels[i, 1], row_update_id))
+        last_update_id = max(last_update_id, row_update_id)
+    return last_update_id
+
+
+cdef inline void fill_entries_with_update_id(vector[OrderBookEntry] *entries, const double[:, :] levels,
+                                             int64_t update_id):
+    """
+    Appends the [price, amount] rows of the typed buffer to the entries with the update ID of their message, since
+    the float64 update ID column is not exact above 2**53 (e.g. nanosecond timestamps).
+    """
+    cdef Py_ssize_t i
+    for i in range(levels.shape[0]):
+        deref(entries).push_back(OrderBookEntry(levels[i, 0], levels[i, 1], update_id))
+
+
+cdef class OrderBookDiffWindow:
+    """
+    The last diffs applied to an order book, kept as packed C++ entries instead of diff messages, to be replayed over a
+    more recent snapshot (see `OrderBook.restore_from_snapshot_and_diff_window`).
+
+    The entries of the evicted diffs are only dropped once the window has been fully renewed, so appending a diff
+    does not move the retained entries.
+    """
+
+    def __init__(self, max_diffs: int = 32):
+        if max_diffs < 1:
+            raise ValueError("The diff window must keep at least 1 diff.")
+        self._max_diffs = max_diffs
+        self._first_diff = 0
+
+    def __len__(self) -> int:
+        return self._update_ids.size() - self._first_diff
+
+    @property
+    def max_diffs(self) -> int:
+        return self._max_diffs
+
+    @property
+    def update_ids(self) -> List[int]:
+        return [self._update_ids[i] for i in range(self._first_diff, self._update_ids.size())]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory allocated for the entries and the diffs bookkeeping.
+        """
+        return (self._entries.capacity() * sizeof(OrderBookEntry) +
+                self._update_ids.capacity() * sizeof(int64_t) +
+                (self._offsets.capacity() + self._bid_counts.capacity() + self._ask_counts.capacity()) * sizeof(size_t))
+
+    def append(self, update_id: int, bids_array: np.ndarray, asks_array: np.ndarray):
+        """
+        Adds a diff in the format of `OrderBook.apply_numpy_diffs`, evicting the oldest one if the window is full. The
+        entries take the diff update ID, not the update ID column of the arrays.
+        """
+        self.c_append(update_id, bids_array, asks_array)
+
+    def append_message(self, message: OrderBookMessage):
+        self.c_append(message.update_id, message.bids_array, message.asks_array)
+
+    def clear(self):
+        self._entries.clear()
+        self._update_ids.clear()
+        self._offsets.clear()
+        self._bid_counts.clear()
+        self._ask_counts.clear()
+        self._first_diff = 0
+
+    cdef c_append(self, int64_t update_id, const double[:, :] bids_array, const double[:, :] asks_array):
+        if self._update_ids.size() - self._first_diff >= self._max_diffs:
+            self._first_diff += 1
+            if self._first_diff >= self._max_diffs:
+                self.c_compact()
+        self._offsets.push_back(self._entries.size())
+        fill_entries_with_update_id(&self._entries, bids_array, update_id)
+        fill_entries_with_update_id(&self._entries, asks_array, update_id)
+        self._update_ids.push_back(update_id)
+        self._bid_counts.push_back(bids_array.shape[0])
+        self._ask_counts.push_back(asks_array.shape[0])
+
+    cdef c_compact(self):
+        """
+        Drops the entries of the evicted diffs, moving the retained ones to the start of the vectors.
+        """
+        cdef:
+            size_t first_entry = (self._offsets[self._first_diff] if self._first_diff < self._offsets.size()
+                                  else self._entries.size())
+            size_t i
+        self._entries.erase(self._entries.begin(), self._entries.begin() + first_entry)
+        self._update_ids.erase(self._update_ids.begin(), self._update_ids.begin() + self._first_diff)
+        self._offsets.erase(self._offsets.begin(), self._offsets.begin() + self._first_diff)
+        self._bid_counts.erase(self._bid_counts.begin(), self._bid_counts.begin() + self._first_diff)
+        self._ask_counts.erase(self._ask_counts.begin(), self._ask_counts.begin() + self._first_diff)
+        for i in range(self._offsets.size()):
+            self._offsets[i] -= first_entry
+        self._first_diff = 0
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -55,8 +210,16 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
-
-    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._price_subscriptions = []
+        # The cumulative volumes are only valid when the depth queries walk the native books
+        self._depth_cache_enabled = (type(self).bid_entries is OrderBook.bid_entries and
+                                     type(self).ask_entries is OrderBook.ask_entries)
+        # Incremented on each change of the books, the top snapshots are regenerated on the first read after a change
+        self._version = 0
+        self._top_snapshots_version = -1
+        self._top_snapshots = {}
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
         cdef:
             set[OrderBookEntry].iterator bid_book_end = self._bid_book.end()
             set[OrderBookEntry].iterator ask_book_end = self._ask_book.end()
@@ -65,6 +228,10 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double highest_bid_update = -INFINITY
+            double lowest_ask_update = INFINITY
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -73,16 +240,25 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            highest_bid_update = max(highest_bid_update, bid.getPrice())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            lowest_ask_update = min(lowest_ask_update, ask.getPrice())
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
+        # Only the cumulative volumes from the first updated level onwards are invalidated. The overlap truncation
+        # removes top levels, invalidating the whole side.
+        self.c_truncate_depth_cache(False, INFINITY if self._bid_book.size() != bid_book_size else highest_bid_update)
+        self.c_truncate_depth_cache(True, -INFINITY if self._ask_book.size() != ask_book_size else lowest_ask_update)
+
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
         ask_iterator = self._ask_book.begin()
@@ -95,8 +271,12 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
 
-    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        if self._price_subscriptions:
+            self.c_notify_price_subscriptions()
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
@@ -108,6 +288,7 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self.c_reset_depth_cache()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -135,6 +316,138 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+
+        if self._price_subscriptions:
+            self.c_notify_price_subscriptions()
+
+    cdef c_notify_price_subscriptions(self):
+        cdef:
+            double bid
+            double ask
+        for subscription in list(self._price_subscriptions):
+            if subscription.vwap_volume > 0:
+                bid = self.c_get_vwap_for_volume(False, subscription.vwap_volume).result_price
+                ask = self.c_get_vwap_for_volume(True, subscription.vwap_volume).result_price
+            else:
+                bid = self._best_bid
+                ask = self._best_ask
+            if subscription.update(bid, ask):
+                try:
+                    subscription.callback(subscription)
+                except Exception:
+                    self.logger().error("Unexpected error notifying order book price subscription.", exc_info=True)
+
+    cdef c_reset_depth_cache(self):
+        self._bid_depth_prices.clear()
+        self._bid_depth_base_volumes.clear()
+        self._bid_depth_quote_volumes.clear()
+        self._ask_depth_prices.clear()
+        self._ask_depth_base_volumes.clear()
+        self._ask_depth_quote_volumes.clear()
+
+    cdef c_truncate_depth_cache(self, bint is_buy, double price):
+        """
+        Discards the cumulative volumes of the levels at or beyond the price (above it for asks, below it for bids).
+        """
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            size_t depth = first_level_beyond(prices, price, is_buy, True)
+        if depth < deref(prices).size():
+            deref(prices).resize(depth)
+            if is_buy:
+                self._ask_depth_base_volumes.resize(depth)
+                self._ask_depth_quote_volumes.resize(depth)
+            else:
+                self._bid_depth_base_volumes.resize(depth)
+                self._bid_depth_quote_volumes.resize(depth)
+
+    cdef c_extend_depth_cache(self, bint is_buy, double base_volume, double quote_volume, double price):
+        """
+        Extends the cumulative volumes of a side from the top until they reach the base volume or the quote volume, or
+        include a level beyond the price (NaN for no price limit), or the side ends.
+        """
+        cdef:
+            vector[double] *prices
+            vector[double] *base_volumes
+            vector[double] *quote_volumes
+            set[OrderBookEntry] *book
+            set[OrderBookEntry].iterator it
+            OrderBookEntry entry
+            double cumulative_base = 0
+            double cumulative_quote = 0
+            double last_price
+
+        if is_buy:
+            prices = ref(self._ask_depth_prices)
+            base_volumes = ref(self._ask_depth_base_volumes)
+            quote_volumes = ref(self._ask_depth_quote_volumes)
+            book = ref(self._ask_book)
+        else:
+            prices = ref(self._bid_depth_prices)
+            base_volumes = ref(self._bid_depth_base_volumes)
+            quote_volumes = ref(self._bid_depth_quote_volumes)
+            book = ref(self._bid_book)
+
+        if deref(prices).size() > 0:
+            cumulative_base = deref(base_volumes).back()
+            cumulative_quote = deref(quote_volumes).back()
+            last_price = deref(prices).back()
+            if (cumulative_base >= base_volume or cumulative_quote >= quote_volume or
+                    (last_price > price if is_buy else last_price < price)):
+                return
+            # Continue after the last cached level (asks ascending, bids descending)
+            if is_buy:
+                it = deref(book).upper_bound(OrderBookEntry(last_price, 0, 0))
+            else:
+                it = deref(book).lower_bound(OrderBookEntry(last_price, 0, 0))
+        else:
+            it = deref(book).begin() if is_buy else deref(book).end()
+
+        while True:
+            if is_buy:
+                if it == deref(book).end():
+                    break
+                entry = deref(it)
+                inc(it)
+            else:
+                if it == deref(book).begin():
+                    break
+                dec(it)
+                entry = deref(it)
+            cumulative_base += entry.getAmount()
+            cumulative_quote += entry.getAmount() * entry.getPrice()
+            deref(prices).push_back(entry.getPrice())
+            deref(base_volumes).push_back(cumulative_base)
+            deref(quote_volumes).push_back(cumulative_quote)
+            if (cumulative_base >= base_volume or cumulative_quote >= quote_volume or
+                    (entry.getPrice() > price if is_buy else entry.getPrice() < price)):
+                break
+
+    def add_price_subscription(self,
+                               callback,
+                               threshold_pct: float = 0.0,
+                               vwap_volume: float = 0.0) -> OrderBookPriceSubscription:
+        """
+        Registers a callback invoked right after a snapshot or diff moved the best bid/ask (or the VWAP for
+        `vwap_volume`) by more than `threshold_pct`. The check only runs while there are subscriptions.
+
+        :return: The subscription, to be passed to `remove_price_subscription`.
+        """
+        subscription = OrderBookPriceSubscription(callback, threshold_pct, vwap_volume)
+        self.attach_price_subscription(subscription)
+        return subscription
+
+    def attach_price_subscription(self, subscription: OrderBookPriceSubscription):
+        self._price_subscriptions.append(subscription)
+
+    def remove_price_subscription(self, subscription: OrderBookPriceSubscription):
+        if subscription in self._price_subscriptions:
+            self._price_subscriptions.remove(subscription)
+
+    @property
+    def price_subscriptions(self) -> List[OrderBookPriceSubscription]:
+        return list(self._price_subscriptions)
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -169,33 +482,104 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        Changes each time a snapshot or diffs are applied to the book.
+        """
+        return self._version
+
+    @property
+    def snapshot_cache_enabled(self) -> bool:
+        """
+        False for the books whose entries are not the native books (e.g. adjusted with simulated trades), for which the
+        version does not track all the changes and the top snapshots are not cached.
+        """
+        return self._depth_cache_enabled
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.top_snapshot()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64", copy=True)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64", copy=True)
         return bids_df, asks_df
 
-    def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
+    def top_snapshot(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the top levels of the book as read-only arrays of [price, amount, update_id] rows, bids by descending
+        price and asks by ascending price. The arrays of each depth are shared by all the readers until the book
+        changes.
+        :param depth: The number of levels of each side, all the levels if not provided
+        """
+        cdef Py_ssize_t depth_key = -1 if depth is None else depth
+        if not self._depth_cache_enabled:
+            return (self._entries_array(self.bid_entries(), depth_key),
+                    self._entries_array(self.ask_entries(), depth_key))
+        if self._top_snapshots_version != self._version:
+            self._top_snapshots.clear()
+            self._top_snapshots_version = self._version
+        snapshot = self._top_snapshots.get(depth_key)
+        if snapshot is None:
+            snapshot = (self.c_top_entries(False, depth_key), self.c_top_entries(True, depth_key))
+            self._top_snapshots[depth_key] = snapshot
+        return snapshot
+
+    cdef np.ndarray c_top_entries(self, bint is_buy, Py_ssize_t depth):
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            Py_ssize_t count = deref(book).size()
+            set[OrderBookEntry].iterator ask_iterator
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            OrderBookEntry entry
+            Py_ssize_t i
+            np.ndarray[np.float64_t, ndim=2] entries
+
+        if 0 <= depth < count:
+            count = depth
+        entries = np.empty((count, 3), dtype=np.float64)
+        if is_buy:
+            ask_iterator = deref(book).begin()
+        else:
+            bid_iterator = deref(book).rbegin()
+        for i in range(count):
+            if is_buy:
+                entry = deref(ask_iterator)
+                inc(ask_iterator)
+            else:
+                entry = deref(bid_iterator)
+                inc(bid_iterator)
+            entries[i, 0] = entry.getPrice()
+            entries[i, 1] = entry.getAmount()
+            entries[i, 2] = entry.getUpdateId()
+        entries.setflags(write=False)
+        return entries
+
+    @staticmethod
+    def _entries_array(entries: Iterator[OrderBookRow], depth: int) -> np.ndarray:
+        rows = list(entries if depth < 0 else itertools.islice(entries, depth))
+        array = np.array(rows, dtype=np.float64).reshape(len(rows), 3)
+        array.setflags(write=False)
+        return array
+
+    # The entries of the applied diffs and snapshots are converted into the _bids_buffer and _asks_buffer vectors,
+    # which keep their capacity from one call to the next.
+    def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
+        self._bids_buffer.clear()
+        self._asks_buffer.clear()
         for row in bids:
-            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            self._bids_buffer.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         for row in asks:
-            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+            self._asks_buffer.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        self.c_apply_diffs(self._bids_buffer, self._asks_buffer, update_id)
 
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
-        cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
+        self._bids_buffer.clear()
+        self._asks_buffer.clear()
         for row in bids:
-            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            self._bids_buffer.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         for row in asks:
-            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+            self._asks_buffer.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        self.c_apply_snapshot(self._bids_buffer, self._asks_buffer, update_id)
 
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
@@ -208,32 +592,38 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        :param update_id: The update ID of the diff message, used as the update ID of the rows and as last diff ID
+        instead of the update ID column, which is not exact above 2**53.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        if update_id is None:
+            self.c_apply_numpy_diffs(bids_array, asks_array)
+        else:
+            self.c_apply_numpy_diffs_with_update_id(bids_array, asks_array, update_id)
 
-    cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+    cdef c_apply_numpy_diffs(self, const double[:, :] bids_array, const double[:, :] asks_array):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
         """
-        cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        cdef int64_t last_update_id
+        self._bids_buffer.clear()
+        self._asks_buffer.clear()
+        last_update_id = fill_entries(&self._bids_buffer, bids_array, 0)
+        last_update_id = fill_entries(&self._asks_buffer, asks_array, last_update_id)
+        self.c_apply_diffs(self._bids_buffer, self._asks_buffer, last_update_id)
+
+    cdef c_apply_numpy_diffs_with_update_id(self, const double[:, :] bids_array, const double[:, :] asks_array,
+                                            int64_t update_id):
+        self._bids_buffer.clear()
+        self._asks_buffer.clear()
+        fill_entries_with_update_id(&self._bids_buffer, bids_array, update_id)
+        fill_entries_with_update_id(&self._asks_buffer, asks_array, update_id)
+        self.c_apply_diffs(self._bids_buffer, self._asks_buffer, update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
         """
@@ -242,25 +632,17 @@ cdef class OrderBook(PubSub):
         """
         self.c_apply_numpy_snapshot(bids_array, asks_array)
 
-    cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+    cdef c_apply_numpy_snapshot(self, const double[:, :] bids_array, const double[:, :] asks_array):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
         """
-        cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        cdef int64_t last_update_id
+        self._bids_buffer.clear()
+        self._asks_buffer.clear()
+        last_update_id = fill_entries(&self._bids_buffer, bids_array, 0)
+        last_update_id = fill_entries(&self._asks_buffer, asks_array, last_update_id)
+        self.c_apply_snapshot(self._bids_buffer, self._asks_buffer, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -322,8 +704,18 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+            size_t level
+
+        if self._depth_cache_enabled:
+            self.c_extend_depth_cache(is_buy, volume, INFINITY, NaN)
+            level = first_level_reaching(base_volumes, volume)
+            if level < deref(base_volumes).size():
+                cumulative_volume = deref(base_volumes)[level]
+                result_price = self._ask_depth_prices[level] if is_buy else self._bid_depth_prices[level]
+            elif deref(base_volumes).size() > 0:
+                cumulative_volume = deref(base_volumes).back()
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount
                 if cumulative_volume >= volume:
@@ -343,7 +735,26 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
+            double incremental_amount
+            vector[double] *base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+            vector[double] *quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+            size_t level
+
+        if self._depth_cache_enabled:
+            self.c_extend_depth_cache(is_buy, volume, INFINITY, NaN)
+            level = first_level_reaching(base_volumes, volume)
+            if level < deref(base_volumes).size():
+                if level > 0:
+                    total_cost = deref(quote_volumes)[level - 1]
+                    total_volume = deref(base_volumes)[level - 1]
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * (self._ask_depth_prices[level] if is_buy
+                                                    else self._bid_depth_prices[level])
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+            elif deref(base_volumes).size() > 0:
+                total_volume = deref(base_volumes).back()
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
                 total_volume += order_book_row.amount
@@ -374,8 +785,18 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+            size_t level
+
+        if self._depth_cache_enabled:
+            self.c_extend_depth_cache(is_buy, INFINITY, quote_volume, NaN)
+            level = first_level_reaching(quote_volumes, quote_volume)
+            if level < deref(quote_volumes).size():
+                cumulative_volume = deref(quote_volumes)[level]
+                result_price = self._ask_depth_prices[level] if is_buy else self._bid_depth_prices[level]
+            elif deref(quote_volumes).size() > 0:
+                cumulative_volume = deref(quote_volumes).back()
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount * order_book_row.price
                 if cumulative_volume >= quote_volume:
@@ -395,8 +816,23 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
+            vector[double] *base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+            vector[double] *quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+            size_t level
+
+        if self._depth_cache_enabled:
+            self.c_extend_depth_cache(is_buy, base_amount, INFINITY, NaN)
+            level = first_level_reaching(base_volumes, base_amount)
+            if level < deref(base_volumes).size():
+                if level > 0:
+                    cumulative_base_amount = deref(base_volumes)[level - 1]
+                    cumulative_volume = deref(quote_volumes)[level - 1]
+                row_amount = base_amount - cumulative_base_amount
+                cumulative_volume += row_amount * (self._ask_depth_prices[level] if is_buy
+                                                   else self._bid_depth_prices[level])
+            elif deref(quote_volumes).size() > 0:
+                cumulative_volume = deref(quote_volumes).back()
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 row_amount = order_book_row.amount
                 if row_amount + cumulative_base_amount >= base_amount:
@@ -421,8 +857,17 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            size_t depth
+
+        if self._depth_cache_enabled:
+            self.c_extend_depth_cache(is_buy, INFINITY, INFINITY, price)
+            depth = first_level_beyond(prices, price, is_buy, False)
+            if depth > 0:
+                cumulative_volume = (self._ask_depth_base_volumes[depth - 1] if is_buy
+                                     else self._bid_depth_base_volumes[depth - 1])
+                result_price = deref(prices)[depth - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -441,8 +886,17 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            size_t depth
+
+        if self._depth_cache_enabled:
+            self.c_extend_depth_cache(is_buy, INFINITY, INFINITY, price)
+            depth = first_level_beyond(prices, price, is_buy, False)
+            if depth > 0:
+                cumulative_volume = (self._ask_depth_quote_volumes[depth - 1] if is_buy
+                                     else self._bid_depth_quote_volumes[depth - 1])
+                result_price = deref(prices)[depth - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -475,9 +929,80 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def query_many(self, is_buy: bool, volumes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Answers the price for volume and the VWAP for volume queries of several volumes at once.
+
+        :param is_buy: True to query the asks, False to query the bids
+        :param volumes: The base volumes to query
+        :return: The prices reached and the VWAPs for the volumes (NaN where the side is not deep enough)
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] volumes_array = np.ascontiguousarray(volumes, dtype=np.float64)
+            Py_ssize_t count = volumes_array.shape[0]
+            np.ndarray[np.float64_t, ndim=1] prices = np.full(count, NaN, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] vwaps = np.full(count, NaN, dtype=np.float64)
+            vector[double] *depth_prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+            vector[double] *quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+            double volume
+            double previous_base
+            double previous_quote
+            size_t level
+            Py_ssize_t i
+
+        if not self._depth_cache_enabled:
+            for i in range(count):
+                prices[i] = self.c_get_price_for_volume(is_buy, volumes_array[i]).result_price
+                vwaps[i] = self.c_get_vwap_for_volume(is_buy, volumes_array[i]).result_price
+            return prices, vwaps
+
+        if count > 0:
+            self.c_extend_depth_cache(is_buy, volumes_array.max(), INFINITY, NaN)
+        for i in range(count):
+            volume = volumes_array[i]
+            level = first_level_reaching(base_volumes, volume)
+            if level < deref(base_volumes).size():
+                previous_base = deref(base_volumes)[level - 1] if level > 0 else 0
+                previous_quote = deref(quote_volumes)[level - 1] if level > 0 else 0
+                prices[i] = deref(depth_prices)[level]
+                vwaps[i] = ((previous_quote + (volume - previous_base) * deref(depth_prices)[level]) /
+                            (previous_base + (volume - previous_base)))
+        return prices, vwaps
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
             self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+    def restore_from_snapshot_and_diff_window(self, snapshot: OrderBookMessage, diff_window: OrderBookDiffWindow):
+        """
+        Applies the snapshot, then replays the diffs of the window with an update ID above the snapshot update ID.
+        """
+        cdef int64_t update_id = snapshot.update_id
+        self._bids_buffer.clear()
+        self._asks_buffer.clear()
+        fill_entries_with_update_id(&self._bids_buffer, snapshot.bids_array, update_id)
+        fill_entries_with_update_id(&self._asks_buffer, snapshot.asks_array, update_id)
+        self.c_apply_snapshot(self._bids_buffer, self._asks_buffer, update_id)
+        self.c_replay_diff_window(diff_window, snapshot.update_id)
+
+    cdef c_replay_diff_window(self, OrderBookDiffWindow diff_window, int64_t after_update_id):
+        cdef:
+            size_t i
+            size_t bids_start
+            size_t asks_start
+            size_t asks_end
+        for i in range(diff_window._first_diff, diff_window._update_ids.size()):
+            if diff_window._update_ids[i] <= after_update_id:
+                continue
+            bids_start = diff_window._offsets[i]
+            asks_start = bids_start + diff_window._bid_counts[i]
+            asks_end = asks_start + diff_window._ask_counts[i]
+            self._bids_buffer.assign(diff_window._entries.begin() + bids_start,
+                                     diff_window._entries.begin() + asks_start)
+            self._asks_buffer.assign(diff_window._entries.begin() + asks_start,
+                                     diff_window._entries.begin() + asks_end)
+            self.c_apply_diffs(self._bids_buffer, self._asks_buffer, diff_window._update_ids[i])
@@ -1,17 +1,57 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from itertools import chain
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
+def depth_levels_to_array(levels: Sequence[Sequence], update_id: int) -> np.ndarray:
+    """
+    Parses the price levels of a depth message (e.g. `[["0.0024", "10"], ...]`, strings or numbers) straight into a
+    float64 array with the [price, amount, update_id] columns expected by `OrderBook.apply_numpy_diffs`, without
+    creating intermediate `OrderBookRow` objects. All the levels of a message must have the same number of fields,
+    only the first two are used.
+    """
+    count = len(levels)
+    array = np.empty((count, 3), dtype=np.float64)
+    if count > 0:
+        if len(levels[0]) == 2:
+            values = np.fromiter(chain.from_iterable(levels), dtype=np.float64, count=2 * count)
+        else:
+            values = np.fromiter((value for level in levels for value in level[:2]), dtype=np.float64, count=2 * count)
+        array[:, :2] = values.reshape(count, 2)
+    array[:, 2] = update_id
+    return array
+
+
+def depth_levels_to_rows(levels: Sequence[Sequence], update_id: int) -> List[OrderBookRow]:
+    """
+    Parses the price levels of a depth message into `OrderBookRow` objects. Only the first two fields of each level
+    are used.
+    """
+    return [OrderBookRow(float(level[0]), float(level[1]), update_id) for level in levels]
+
+
+def order_book_rows_to_array(rows: List[OrderBookRow]) -> np.ndarray:
+    """
+    Converts a list of `OrderBookRow` to the array format of `OrderBook.apply_numpy_diffs`.
+    """
+    return np.array(rows, dtype=np.float64).reshape(len(rows), 3)
+
+
 class OrderBookMessageType(Enum):
     SNAPSHOT = 1
     DIFF = 2
     TRADE = 3
 
 
+_UPDATE_ID_MESSAGE_TYPES = (OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT)
+
+
 @total_ordering
 class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp")):
     type: OrderBookMessageType
@@ -30,7 +70,7 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def update_id(self) -> int:
-        if self.type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
+        if self.type in _UPDATE_ID_MESSAGE_TYPES:
             return self.content["update_id"]
         else:
             return -1
@@ -52,21 +92,33 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    # The parsed rows and arrays are cached on first access, as the trackers and the order books read them several
+    # times per message. The cached objects are shared between the readers and must not be modified.
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        return depth_levels_to_rows(self.content["asks"], self.update_id)
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        return depth_levels_to_rows(self.content["bids"], self.update_id)
+
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        """
+        The asks as a float64 [price, amount, update_id] array (see `depth_levels_to_array`).
+        """
+        return depth_levels_to_array(self.content["asks"], self.update_id)
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bids as a float64 [price, amount, update_id] array (see `depth_levels_to_array`).
+        """
+        return depth_levels_to_array(self.content["bids"], self.update_id)
 
     @property
     def has_update_id(self) -> bool:
-        return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
+        return self.type in _UPDATE_ID_MESSAGE_TYPES
 
     @property
     def has_trade_id(self) -> bool:
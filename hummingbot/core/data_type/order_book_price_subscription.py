@@ -0,0 +1,48 @@
+from typing import Callable
+
+NaN = float("nan")
+
+
+class OrderBookPriceSubscription:
+    """
+    Subscription to the top of an order book. The callback is invoked with the subscription itself whenever the
+    best bid/ask (or the VWAP for `vwap_volume`, when it is set) moved by more than `threshold_pct` relative to the
+    prices seen at the last notification.
+    """
+
+    def __init__(self, callback: Callable[["OrderBookPriceSubscription"], None], threshold_pct: float = 0.0,
+                 vwap_volume: float = 0.0):
+        """
+        :param callback: Called with the subscription when the prices crossed the threshold.
+        :param threshold_pct: The relative price move (e.g. 0.0005 for 5 bps) that triggers a notification; 0 notifies
+        on every change.
+        :param vwap_volume: When positive, the bid/ask tracked are the VWAP to sell/buy this volume instead of the best
+        prices.
+        """
+        self.callback = callback
+        self.threshold_pct = threshold_pct
+        self.vwap_volume = vwap_volume
+        self.bid = NaN
+        self.ask = NaN
+        self.notifications = 0
+
+    def _moved(self, last_price: float, price: float) -> bool:
+        if price != price:
+            return False
+        if last_price != last_price:
+            return True
+        return abs(price - last_price) > self.threshold_pct * abs(last_price) if self.threshold_pct > 0 \
+            else price != last_price
+
+    def update(self, bid: float, ask: float) -> bool:
+        """
+        Compares the new prices with the last notified ones and stores them when the threshold is crossed.
+
+        :return: True if the subscriber should be notified.
+        """
+        if self._moved(self.bid, bid) or self._moved(self.ask, ask):
+            self.bid = bid
+            self.ask = ask
+            self.notifications += 1
+            return True
+        return False
@@ -8,6 +8,7 @@ class OrderBookRow(namedtuple("_OrderBookRow", "price, amount, update_id")):
     """
     Used to apply changes to OrderBook. OrderBook classes uses float internally for better performance over Decimal.
     """
+    __slots__ = ()
     price: float
     amount: float
     update_id: int
@@ -17,6 +18,7 @@ class ClientOrderBookRow(namedtuple("_OrderBookRow", "price, amount, update_id")
     """
     Used in market classes where OrderBook values are converted to Decimal.
     """
+    __slots__ = ()
     price: Decimal
     amount: Decimal
     update_id: int
@@ -3,13 +3,14 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book import OrderBook, OrderBookDiffWindow
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_price_subscription import OrderBookPriceSubscription
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -39,12 +40,14 @@ class OrderBookTracker:
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
-        self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
+        self._past_diffs_windows: Dict[str, OrderBookDiffWindow] = defaultdict(
+            lambda: OrderBookDiffWindow(self.PAST_DIFF_WINDOW_SIZE))
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._price_subscriptions: Dict[str, List[OrderBookPriceSubscription]] = defaultdict(list)
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -75,6 +78,29 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def subscribe_price_updates(self,
+                                trading_pair: str,
+                                callback: Callable[[OrderBookPriceSubscription], None],
+                                threshold_pct: float = 0.0,
+                                vwap_volume: float = 0.0) -> OrderBookPriceSubscription:
+        """
+        Subscribes to top of book moves of a trading pair (see `OrderBook.add_price_subscription`). Subscriptions
+        made before the order book is initialized are attached as soon as it is created.
+
+        :return: The subscription, to be passed to `unsubscribe_price_updates`.
+        """
+        subscription = OrderBookPriceSubscription(callback, threshold_pct, vwap_volume)
+        self._price_subscriptions[trading_pair].append(subscription)
+        if trading_pair in self._order_books:
+            self._order_books[trading_pair].attach_price_subscription(subscription)
+        return subscription
+
+    def unsubscribe_price_updates(self, trading_pair: str, subscription: OrderBookPriceSubscription):
+        if subscription in self._price_subscriptions.get(trading_pair, []):
+            self._price_subscriptions[trading_pair].remove(subscription)
+        if trading_pair in self._order_books:
+            self._order_books[trading_pair].remove_price_subscription(subscription)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -178,6 +204,8 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            for subscription in self._price_subscriptions.get(trading_pair, []):
+                self._order_books[trading_pair].attach_price_subscription(subscription)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -272,8 +300,9 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                    bids_array, asks_array = message.bids_array, message.asks_array
+                    order_book.apply_numpy_diffs(bids_array, asks_array, message.update_id)
+                    past_diffs_window.append(message.update_id, bids_array, asks_array)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -283,8 +312,7 @@ class OrderBookTracker:
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    order_book.restore_from_snapshot_and_diff_window(message, past_diffs_window)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -15,7 +15,7 @@ if typing.TYPE_CHECKING:  # avoid circular import problems
 S_DECIMAL_0 = Decimal(0)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenAmount:
     token: str
     amount: Decimal
@@ -71,10 +71,12 @@ class TradeFeeSchema:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeFeeBase(ABC):
     """
     Contains the necessary information to apply the trade fee to a particular order.
+
+    A fee is created for every fill, so the fee classes and `TokenAmount` are slotted (no instance `__dict__`).
     """
     percent: Decimal = S_DECIMAL_0
     percent_token: Optional[str] = None  # only set when fee charged in third token (the Binance BNB case)
@@ -246,6 +248,7 @@ class TradeFeeBase(ABC):
 
 
 class AddedToCostTradeFee(TradeFeeBase):
+    __slots__ = ()
 
     @classmethod
     def type_descriptor_for_json(cls) -> str:
@@ -287,6 +290,7 @@ class AddedToCostTradeFee(TradeFeeBase):
 
 
 class DeductedFromReturnsTradeFee(TradeFeeBase):
+    __slots__ = ()
 
     @classmethod
     def type_descriptor_for_json(cls) -> str:
@@ -0,0 +1,179 @@
+from collections import deque
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
+
+s_decimal_1 = Decimal("1")
+
+# A conversion path is the list of the prices (trading pair and whether the price is inverted) to chain
+ConversionPath = List[Tuple[str, bool]]
+
+
+class RatePrices(dict):
+    """
+    Dictionary of prices that counts its modifications, so the rate graph built from it knows when to refresh.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+class RateGraph:
+    """
+    Graph of conversion rates between tokens. The prices (direct quotes) are the edges of the graph, usable in both
+    directions. The conversion path of each pair requested is the shortest one (fewest hops) and is cached until the
+    set of prices changes; the rates of the pairs requested are recomputed once per update, so getting a rate is a
+    dictionary lookup.
+
+    The rates match the ones of `find_rate` when it finds one: direct prices first, then inverted prices, then the
+    first two-hop conversion through the prices of the base token. Conversions `find_rate` can not resolve (e.g. more
+    than two hops) are resolved too.
+    """
+
+    def __init__(self):
+        self._prices: Dict[str, Decimal] = {}
+        self._price_timestamps: Dict[str, float] = {}
+        self._adjacency: Dict[str, Dict[str, Tuple[str, bool]]] = {}
+        self._paths: Dict[str, Optional[ConversionPath]] = {}
+        self._rates: Dict[str, Tuple[Optional[Decimal], Optional[float]]] = {}
+
+    @property
+    def cached_pairs(self) -> List[str]:
+        return list(self._paths)
+
+    def update(self, prices: Dict[str, Decimal], price_timestamps: Optional[Dict[str, float]] = None):
+        """
+        Refreshes the graph with the current prices. The conversion paths are only recalculated if the trading pairs
+        with prices changed.
+
+        :param prices: The prices by trading pair.
+        :param price_timestamps: The time each price was updated.
+        """
+        if prices.keys() != self._prices.keys():
+            self._build_adjacency(prices)
+            self._paths = {}
+        self._prices = dict(prices)
+        self._price_timestamps = dict(price_timestamps or {})
+        self._rates = {pair: self._calculate_rate(pair) for pair in self._paths}
+
+    def get_rate(self, pair: str) -> Optional[Decimal]:
+        return self.get_rate_with_timestamp(pair)[0]
+
+    def get_rate_with_timestamp(self, pair: str) -> Tuple[Optional[Decimal], Optional[float]]:
+        """
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return: The conversion rate (None if there is no path between the tokens) and the update time of the oldest
+        price used to calculate it (None if unknown)
+        """
+        result = self._rates.get(pair)
+        if result is None:
+            result = self._calculate_rate(pair)
+            self._rates[pair] = result
+        return result
+
+    def _build_adjacency(self, prices: Dict[str, Decimal]):
+        adjacency: Dict[str, Dict[str, Tuple[str, bool]]] = {}
+        tokens_by_pair = {}
+        for pair in prices:
+            try:
+                tokens_by_pair[pair] = split_hb_trading_pair(pair)
+            except Exception:
+                continue
+        # Direct prices are preferred to inverted ones between the same two tokens
+        for pair, (base, quote) in tokens_by_pair.items():
+            adjacency.setdefault(base, {}).setdefault(quote, (pair, False))
+        for pair, (base, quote) in tokens_by_pair.items():
+            if prices[pair]:
+                adjacency.setdefault(quote, {}).setdefault(base, (pair, True))
+        self._adjacency = adjacency
+
+    def _calculate_rate(self, pair: str) -> Tuple[Optional[Decimal], Optional[float]]:
+        if pair in self._paths:
+            path = self._paths[pair]
+        else:
+            path = self._find_path(pair)
+            self._paths[pair] = path
+        if path is None:
+            return None, None
+
+        rate = s_decimal_1
+        timestamp = None
+        for price_pair, inverted in path:
+            price = self._prices[price_pair]
+            if inverted:
+                if not price:
+                    return None, None
+                rate = rate / price
+            else:
+                rate = rate * price
+            price_timestamp = self._price_timestamps.get(price_pair)
+            if price_timestamp is not None and (timestamp is None or price_timestamp < timestamp):
+                timestamp = price_timestamp
+        return rate, timestamp
+
+    def _find_path(self, pair: str) -> Optional[ConversionPath]:
+        if pair in self._prices:
+            return [(pair, False)]
+        try:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+        except Exception:
+            return None
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return []
+
+        parents: Dict[str, Optional[Tuple[str, Tuple[str, bool]]]] = {base: None}
+        queue = deque([base])
+        while queue:
+            token = queue.popleft()
+            for neighbor, edge in self._adjacency.get(token, {}).items():
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = (token, edge)
+                if neighbor == quote:
+                    path = []
+                    node = neighbor
+                    while parents[node] is not None:
+                        node, node_edge = parents[node]
+                        path.append(node_edge)
+                    path.reverse()
+                    return path
+                queue.append(neighbor)
+        return None
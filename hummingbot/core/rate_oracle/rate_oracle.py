@@ -1,12 +1,14 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.rate_oracle.rate_graph import RateGraph, RatePrices
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 from hummingbot.core.rate_oracle.sources.binance_us_rate_source import BinanceUSRateSource
@@ -46,7 +48,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The stored prices are the edges of a rate graph that resolves (and caches) the rate of any pair connected through
+    them, while find_rate is used on the prices fetched live.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -66,7 +69,12 @@ class RateOracle(NetworkBase):
     def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        self._prices: Dict[str, Decimal] = RatePrices()
+        self._price_timestamps: Dict[str, float] = {}
+        self._rate_graph = RateGraph()
+        self._rate_graph_prices: Optional[RatePrices] = None
+        self._rate_graph_version: Optional[int] = None
+        self._live_prices_request: Optional[asyncio.Future] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -98,6 +106,7 @@ class RateOracle(NetworkBase):
     @source.setter
     def source(self, new_source: RateSourceBase):
         self._source = new_source
+        self._live_prices_request = None
 
     @property
     def quote_token(self) -> str:
@@ -107,7 +116,9 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
-            self._prices = {}
+            self._prices = RatePrices()
+            self._price_timestamps = {}
+            self._live_prices_request = None
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -127,7 +138,7 @@ class RateOracle(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            prices = await self._source.get_prices(quote_token=self._quote_token)
+            prices = await self._get_live_prices()
             if not prices:
                 raise Exception(f"Error fetching new prices from {self._source.name}.")
         except asyncio.CancelledError:
@@ -155,7 +166,7 @@ class RateOracle(NetworkBase):
         :param base_token: The token symbol that we want to price, e.g. BTC
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
+        prices = await self._get_live_prices()
         pair = combine_to_hb_trading_pair(base=base_token, quote=self._quote_token)
         return find_rate(prices, pair)
 
@@ -167,7 +178,17 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._current_rate_graph().get_rate(pair)
+
+    def get_pair_rate_with_timestamp(self, pair: str) -> Tuple[Optional[Decimal], Optional[float]]:
+        """
+        Finds a conversion rate for a given trading pair from the local prices, together with the time its oldest
+        price was updated, so callers can discard stale cross rates.
+
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return A conversion rate (None if not found) and its timestamp (None if unknown)
+        """
+        return self._current_rate_graph().get_rate_with_timestamp(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -192,7 +213,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
+        prices = await self._get_live_prices()
         return find_rate(prices, pair)
 
     def set_price(self, pair: str, price: Decimal):
@@ -200,12 +221,43 @@ class RateOracle(NetworkBase):
         Update keys in self._prices with new prices
         """
         self._prices[pair] = price
+        self._price_timestamps[pair] = time.time()
+
+    def set_prices(self, prices: Dict[str, Decimal]):
+        """
+        Update keys in self._prices with a batch of new prices
+        """
+        self._prices.update(prices)
+        timestamp = time.time()
+        self._price_timestamps.update({pair: timestamp for pair in prices})
+
+    def _current_rate_graph(self) -> RateGraph:
+        """
+        Returns the rate graph, refreshing it first if the prices changed since the last rate request. All the prices
+        updated between two rate requests are applied to the graph at once.
+        """
+        if not isinstance(self._prices, RatePrices):
+            self._prices = RatePrices(self._prices)
+        if self._rate_graph_prices is not self._prices or self._rate_graph_version != self._prices.version:
+            self._rate_graph.update(self._prices, self._price_timestamps)
+            self._rate_graph_prices = self._prices
+            self._rate_graph_version = self._prices.version
+        return self._rate_graph
+
+    async def _get_live_prices(self) -> Dict[str, Decimal]:
+        """
+        Fetches the prices from the source. Concurrent callers share a single request to the source.
+        """
+        if self._live_prices_request is None or self._live_prices_request.done():
+            self._live_prices_request = asyncio.ensure_future(
+                self._source.get_prices(quote_token=self._quote_token))
+        return await asyncio.shield(self._live_prices_request)
 
     async def _fetch_price_loop(self):
         while True:
             try:
-                new_prices = await self._source.get_prices(quote_token=self._quote_token)
-                self._prices.update(new_prices)
+                new_prices = await self._get_live_prices()
+                self.set_prices(new_prices)
 
                 if self._prices:
                     self._ready_event.set()
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 import asyncio
+import itertools
 import logging
-from typing import Callable, Coroutine, NamedTuple, Optional
+import time
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional
 
 from async_timeout import timeout
 
@@ -11,17 +14,79 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
 
+class AsyncCallPriority(IntEnum):
+    """
+    Priority lanes of the scheduled calls. The calls of a key are executed by priority, then in order of scheduling.
+    """
+    HIGH = 0     # e.g. order placement and cancellation
+    NORMAL = 1
+    LOW = 2      # e.g. order status and balance refreshes
+
+
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
-    coroutine: Coroutine
+    coroutine: Awaitable
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    key: str = "default"
+    priority: AsyncCallPriority = AsyncCallPriority.NORMAL
+    deadline: Optional[float] = None
+    scheduled_timestamp: float = 0.0
+
+
+class AsyncCallSchedulerStats:
+    """
+    Counters and queue wait times (in seconds) of the calls scheduled under a key.
+    """
+
+    def __init__(self):
+        self.scheduled: int = 0
+        self.executed: int = 0
+        self.failed: int = 0
+        self.expired: int = 0
+        self.cancelled: int = 0
+        self.total_queue_wait: float = 0.0
+        self.max_queue_wait: float = 0.0
+
+    @property
+    def average_queue_wait(self) -> float:
+        return self.total_queue_wait / self.executed if self.executed > 0 else 0.0
+
+    def record_queue_wait(self, queue_wait: float):
+        self.executed += 1
+        self.total_queue_wait += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+
+
+class AsyncCallSchedulerLane:
+    """
+    The queue of the calls of a key, consumed by up to `max_concurrency` workers.
+    """
+
+    def __init__(self, key: str, max_concurrency: int):
+        self.key: str = key
+        self.max_concurrency: int = max_concurrency
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.worker_tasks: List[asyncio.Task] = []
+        self.stats: AsyncCallSchedulerStats = AsyncCallSchedulerStats()
 
 
 class AsyncCallScheduler:
+    """
+    Executes the scheduled calls (typically network bound) with a bounded concurrency per key (e.g. per connector),
+    so a slow call only delays the calls of its own key beyond the concurrency limit.
+
+    Queued calls are started by priority, and the calls with a deadline that expires while they wait in the queue are
+    failed with a timeout without being started.
+
+    By default the calls of a key are executed one at a time, as they were before the lanes existed; connectors opt in
+    to concurrent calls with `set_max_concurrency`.
+    """
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
+    DEFAULT_KEY = "default"
+
     @classmethod
     def shared_instance(cls):
         if cls._acs_shared_instance is None:
@@ -34,68 +99,89 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
+    def __init__(self, call_interval: float = 0.01, max_concurrency_per_key: int = 1):
+        """
+        :param call_interval: The pause of a worker between two calls.
+        :param max_concurrency_per_key: The default number of calls of the same key executed at the same time.
+        """
+        if max_concurrency_per_key < 1:
+            raise ValueError("The maximum concurrency per key must be at least 1.")
         self._call_interval: float = call_interval
+        self._max_concurrency_per_key: int = max_concurrency_per_key
+        self._lanes: Dict[str, AsyncCallSchedulerLane] = {}
+        self._sequence = itertools.count()
+        self._started: bool = False
         self.reset_event_loop()
 
     @property
     def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+        return self._get_lane(self.DEFAULT_KEY).queue
 
     @property
-    def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+    def started(self) -> bool:
+        return self._started
 
     @property
-    def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+    def stats(self) -> Dict[str, AsyncCallSchedulerStats]:
+        return {key: lane.stats for key, lane in self._lanes.items()}
+
+    def queue_size(self, key: str = DEFAULT_KEY) -> int:
+        return self._lanes[key].queue.qsize() if key in self._lanes else 0
+
+    def set_max_concurrency(self, key: str, max_concurrency: int):
+        """
+        Changes the number of calls of the key executed at the same time (e.g. according to the exchange rate limits).
+        """
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency must be at least 1.")
+        lane = self._get_lane(key)
+        lane.max_concurrency = max_concurrency
+        if self._started:
+            self._adjust_workers(lane)
 
     def reset_event_loop(self):
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     def start(self):
-        if self._coro_scheduler_task is not None:
+        if self._started:
             self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        self._started = True
+        for lane in self._lanes.values():
+            self._adjust_workers(lane)
 
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
+        self._started = False
+        for lane in self._lanes.values():
+            for task in lane.worker_tasks:
+                task.cancel()
+            lane.worker_tasks.clear()
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    def _get_lane(self, key: str) -> AsyncCallSchedulerLane:
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = AsyncCallSchedulerLane(key, self._max_concurrency_per_key)
+            self._lanes[key] = lane
+            if self._started:
+                self._adjust_workers(lane)
+        return lane
+
+    def _adjust_workers(self, lane: AsyncCallSchedulerLane):
+        lane.worker_tasks = [task for task in lane.worker_tasks if not task.done()]
+        while len(lane.worker_tasks) < lane.max_concurrency:
+            lane.worker_tasks.append(safe_ensure_future(self._coro_scheduler(lane, self._call_interval)))
+        while len(lane.worker_tasks) > lane.max_concurrency:
+            lane.worker_tasks.pop().cancel()
+
+    async def _coro_scheduler(self, lane: AsyncCallSchedulerLane, interval: float = 0.01):
         while True:
-            app_warning_msg = "API call error."
+            item: Optional[AsyncCallSchedulerItem] = None
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
+                _, _, item = await lane.queue.get()
+                await self._execute(lane, item)
             except asyncio.CancelledError:
-                try:
-                    fut.cancel()
-                except Exception:
-                    pass
+                if item is not None:
+                    item.future.cancel()
                 raise
-            except asyncio.InvalidStateError:
-                # The future is already cancelled from outside. Ignore.
-                pass
-            except Exception as e:
-                # Add exception information.
-                app_warning_msg += f" [[Got exception: {str(e)}]]"
-                self.logger().debug(app_warning_msg,
-                                    exc_info=True,
-                                    app_warning_msg=app_warning_msg)
-                try:
-                    fut.set_exception(e)
-                except Exception:
-                    pass
 
             try:
                 await asyncio.sleep(interval)
@@ -104,24 +190,94 @@ class AsyncCallScheduler:
             except Exception:
                 self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
+    async def _execute(self, lane: AsyncCallSchedulerLane, item: AsyncCallSchedulerItem):
+        fut = item.future
+        now = time.monotonic()
+        if fut.done():
+            # The caller stopped waiting for the result, the call is not started
+            self._discard(item)
+            lane.stats.cancelled += 1
+            return
+        if item.deadline is not None and now >= item.deadline:
+            self._discard(item)
+            lane.stats.expired += 1
+            fut.set_exception(asyncio.TimeoutError(
+                f"{item.app_warning_msg} [[Deadline expired after waiting {now - item.scheduled_timestamp:.3f}s "
+                f"in the {lane.key} queue]]"))
+            return
+
+        lane.stats.record_queue_wait(now - item.scheduled_timestamp)
+        timeout_seconds = item.timeout_seconds
+        if item.deadline is not None:
+            timeout_seconds = min(timeout_seconds, item.deadline - now)
+        try:
+            async with timeout(timeout_seconds):
+                result = await item.coroutine
+            if not fut.done():
+                fut.set_result(result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            lane.stats.failed += 1
+            # Add exception information.
+            app_warning_msg = item.app_warning_msg + f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg,
+                                exc_info=True,
+                                app_warning_msg=app_warning_msg)
+            if not fut.done():
+                fut.set_exception(e)
+
+    @staticmethod
+    def _discard(item: AsyncCallSchedulerItem):
+        if asyncio.iscoroutine(item.coroutine):
+            item.coroutine.close()
+        elif asyncio.isfuture(item.coroutine):
+            item.coroutine.cancel()
+
     async def schedule_async_call(self,
-                                  coro: Coroutine,
+                                  coro: Awaitable,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  key: str = DEFAULT_KEY,
+                                  priority: AsyncCallPriority = AsyncCallPriority.NORMAL,
+                                  deadline_seconds: Optional[float] = None) -> any:
+        """
+        :param coro: The call to execute.
+        :param timeout_seconds: The maximum execution time of the call.
+        :param app_warning_msg: The message logged if the call fails.
+        :param key: The key sharing the concurrency limit, e.g. the connector name.
+        :param priority: The priority of the call over the other queued calls of the key.
+        :param deadline_seconds: The maximum time from now until the call completes, including the queue wait. The call
+        fails with asyncio.TimeoutError without being started if the deadline expires while it is queued.
+        """
+        now = time.monotonic()
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
+        item = AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                      app_warning_msg=app_warning_msg,
+                                      key=key,
+                                      priority=priority,
+                                      deadline=now + deadline_seconds if deadline_seconds is not None else None,
+                                      scheduled_timestamp=now)
+        lane = self._get_lane(key)
+        lane.stats.scheduled += 1
+        lane.queue.put_nowait((priority, next(self._sequence), item))
+        if not self._started:
             self.start()
         return await fut
 
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         key: str = DEFAULT_KEY,
+                         priority: AsyncCallPriority = AsyncCallPriority.NORMAL,
+                         deadline_seconds: Optional[float] = None) -> any:
+        async def run_in_executor():
+            # The function is submitted to the executor only once the call leaves the queue
+            return await self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args)
+
+        return await self.schedule_async_call(run_in_executor(), timeout_seconds,
+                                              app_warning_msg=app_warning_msg,
+                                              key=key,
+                                              priority=priority,
+                                              deadline_seconds=deadline_seconds)
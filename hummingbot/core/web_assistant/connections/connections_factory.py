@@ -1,7 +1,8 @@
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -28,20 +29,24 @@ class ConnectionsFactory:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    async def get_rest_connection(self) -> RESTConnection:
+    async def get_rest_connection(self, json_codec: Optional[JSONCodec] = None) -> RESTConnection:
         """
         Get a REST connection using a shared aiohttp.ClientSession.
+
+        :param json_codec: The codec decoding the responses (aiohttp's decoder if not provided).
         """
         client = await self._get_shared_client()
-        return RESTConnection(aiohttp_client_session=client)
+        return RESTConnection(aiohttp_client_session=client, json_codec=json_codec)
 
-    async def get_ws_connection(self) -> WSConnection:
+    async def get_ws_connection(self, json_codec: Optional[JSONCodec] = None) -> WSConnection:
         """
         Get a WebSocket connection using either the independent session (if set)
         or the shared client.
+
+        :param json_codec: The codec encoding the JSON requests and decoding the messages (aiohttp's if not provided).
         """
         client = self._ws_independent_session or await self._get_shared_client()
-        return WSConnection(aiohttp_client_session=client)
+        return WSConnection(aiohttp_client_session=client, json_codec=json_codec)
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
         """
@@ -8,6 +8,7 @@ import aiohttp
 import ujson
 
 if TYPE_CHECKING:
+    from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -86,8 +87,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: Optional["JSONCodec"] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec
 
     @property
     def url(self) -> str:
@@ -110,6 +112,9 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
+        if self._json_codec is not None:
+            # The codec decodes the raw body whatever the declared content type
+            return self._json_codec.loads(await self._aiohttp_response.read())
         if self._aiohttp_response.content_type == "text/plain" or self._aiohttp_response.content_type == "text/html":
             # aiohttp does not support decoding of text/plain or text/html content types
             # so we need to read the response as bytes and decode it manually
@@ -0,0 +1,74 @@
+import json
+from typing import Any, Dict, Type, Union
+
+import ujson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+
+class JSONCodec:
+    """Encodes and decodes the JSON payloads of the REST and WebSocket connections.
+
+    The base class uses the standard library `json` module, producing exactly the same payloads as the connections
+    without codec. Connectors opt into a faster implementation by passing another codec to the
+    `WebAssistantsFactory`. Decoding errors are always raised as `ValueError` (or a subclass).
+    """
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class UJSONCodec(JSONCodec):
+    name = "ujson"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """Requires the optional `orjson` package. Note that the encoded payloads are compact (no whitespace)."""
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson package is required to use the orjson codec.")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+
+JSON_CODECS: Dict[str, Type[JSONCodec]] = {
+    JSONCodec.name: JSONCodec,
+    UJSONCodec.name: UJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_json_codec(name: str) -> JSONCodec:
+    """
+    :param name: The name of the codec (`json`, `ujson` or `orjson`).
+    :return: A codec instance.
+    """
+    if name not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec {name}. Available codecs: {', '.join(JSON_CODECS)}.")
+    return JSON_CODECS[name]()
+
+
+def fastest_json_codec() -> JSONCodec:
+    """
+    :return: The fastest codec available in the environment (orjson if installed, ujson otherwise).
+    """
+    return OrjsonCodec() if orjson is not None else UJSONCodec()
@@ -7,13 +7,15 @@ import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
 
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: Optional[JSONCodec] = None):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -66,7 +68,7 @@ class WSConnection:
             msg = await self._read_message()
             msg = await self._process_message(msg)
             if msg is not None:
-                response = self._build_resp(msg)
+                response = self._build_resp(msg, self._json_codec)
                 break
         return response
 
@@ -133,7 +135,10 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        if self._json_codec is not None:
+            await self._connection.send_json(payload, dumps=self._json_codec.dumps)
+        else:
+            await self._connection.send_json(payload)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
@@ -142,9 +147,14 @@ class WSConnection:
         await self._connection.send_bytes(payload)
 
     @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(msg: aiohttp.WSMessage, json_codec: Optional[JSONCodec] = None) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
+        elif json_codec is not None:
+            try:
+                data = json_codec.loads(msg.data)
+            except ValueError:
+                data = msg.data
         else:
             try:
                 data = msg.json()
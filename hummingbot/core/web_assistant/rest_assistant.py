@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Union
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -26,8 +27,10 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
         self._connection = connection
+        self._json_codec = json_codec
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
@@ -44,6 +47,7 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+        throttler_weight_multiplier: int = 1,
     ) -> Union[str, Dict[str, Any]]:
         response = await self.execute_request_and_get_response(
             url=url,
@@ -55,6 +59,7 @@ class RESTAssistant:
             return_err=return_err,
             timeout=timeout,
             headers=headers,
+            throttler_weight_multiplier=throttler_weight_multiplier,
         )
         response_json = await response.json()
         return response_json
@@ -70,6 +75,7 @@ class RESTAssistant:
             return_err: bool = False,
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
+            throttler_weight_multiplier: int = 1,
     ) -> RESTResponse:
 
         headers = headers or {}
@@ -79,7 +85,8 @@ class RESTAssistant:
 
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        if data is not None:
+            data = self._json_codec.dumps(data) if self._json_codec is not None else json.dumps(data)
 
         request = RESTRequest(
             method=method,
@@ -91,7 +98,8 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        async with self._throttler.execute_task(limit_id=throttler_limit_id,
+                                                weight_multiplier=throttler_weight_multiplier):
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -3,6 +3,7 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -19,6 +20,9 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    Connectors can opt into a faster JSON implementation by passing a `JSONCodec` (see `json_codec.py`), used to
+    encode the requests and decode the responses and WebSocket messages of all the assistants created.
+
     todo: integrate AsyncThrottler
     """
 
@@ -31,8 +35,10 @@ class WebAssistantsFactory:
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
         connections_factory: Optional[ConnectionsFactory] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
         self._connections_factory = connections_factory or ConnectionsFactory()
+        self._json_codec = json_codec
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -48,19 +54,24 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def json_codec(self) -> Optional[JSONCodec]:
+        return self._json_codec
+
     async def get_rest_assistant(self) -> RESTAssistant:
-        connection = await self._connections_factory.get_rest_connection()
+        connection = await self._connections_factory.get_rest_connection(json_codec=self._json_codec)
         assistant = RESTAssistant(
             connection=connection,
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            json_codec=self._json_codec,
         )
         return assistant
 
     async def get_ws_assistant(self) -> WSAssistant:
-        connection = await self._connections_factory.get_ws_connection()
+        connection = await self._connections_factory.get_ws_connection(json_codec=self._json_codec)
         assistant = WSAssistant(
             connection, self._ws_pre_processors, self._ws_post_processors, self._auth
         )
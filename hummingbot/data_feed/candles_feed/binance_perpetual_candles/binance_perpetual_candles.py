@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
@@ -9,6 +9,8 @@ from hummingbot.logger import HummingbotLogger
 
 class BinancePerpetualCandles(CandlesBase):
     _logger: Optional[HummingbotLogger] = None
+    ws_multiplexing_supported = True
+    ws_max_streams_per_connection = 200
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -107,6 +109,20 @@ class BinancePerpetualCandles(CandlesBase):
         }
         return payload
 
+    @classmethod
+    def ws_streams_subscription_payload(cls, feeds: List[CandlesBase], subscribe: bool = True) -> dict:
+        return {
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": [f"{feed._ex_trading_pair.lower()}@kline_{feed.interval}" for feed in feeds],
+            "id": 1
+        }
+
+    @classmethod
+    def ws_message_stream_key(cls, data: dict) -> Optional[Tuple[str, str]]:
+        if data is not None and data.get("e") == "kline":
+            return data["s"], data["k"]["i"]
+        return None
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
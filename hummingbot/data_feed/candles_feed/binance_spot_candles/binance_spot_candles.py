@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_spot_candles import constants as CONSTANTS
@@ -9,6 +9,8 @@ from hummingbot.logger import HummingbotLogger
 
 class BinanceSpotCandles(CandlesBase):
     _logger: Optional[HummingbotLogger] = None
+    ws_multiplexing_supported = True
+    ws_max_streams_per_connection = 200
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -93,6 +95,20 @@ class BinanceSpotCandles(CandlesBase):
         }
         return payload
 
+    @classmethod
+    def ws_streams_subscription_payload(cls, feeds: List[CandlesBase], subscribe: bool = True) -> dict:
+        return {
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": [f"{feed._ex_trading_pair.lower()}@kline_{feed.interval}" for feed in feeds],
+            "id": 1
+        }
+
+    @classmethod
+    def ws_message_stream_key(cls, data: dict) -> Optional[Tuple[str, str]]:
+        if data is not None and data.get("e") == "kline":
+            return data["s"], data["k"]["i"]
+        return None
+
     def _parse_websocket_message(self, data: dict):
         candles_row_dict = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
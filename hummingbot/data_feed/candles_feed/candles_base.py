@@ -2,7 +2,7 @@ import asyncio
 import os
 import time
 from collections import deque
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -15,7 +15,10 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
-from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig, HistoricalCandlesReport
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 
 
 class CandlesBase(NetworkBase):
@@ -45,6 +48,13 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    # Maximum number of REST pages requested at the same time when downloading historical candles (the throttler
+    # still enforces the rate limits)
+    historical_candles_max_concurrent_requests = 5
+    # Feeds whose websocket streams can share a connection (see CandlesHub) implement ws_streams_subscription_payload
+    # and ws_message_stream_key
+    ws_multiplexing_supported = False
+    ws_max_streams_per_connection = 50
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
@@ -57,6 +67,8 @@ class CandlesBase(NetworkBase):
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        self._candles_hub: Optional["CandlesHub"] = None
+        self.last_historical_candles_report: Optional[HistoricalCandlesReport] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -66,19 +78,39 @@ class CandlesBase(NetworkBase):
 
     async def start_network(self):
         """
-        This method starts the network and starts a task for listen_for_subscriptions.
+        This method starts the network and starts a task for listen_for_subscriptions, or subscribes the feed to the
+        shared connections of its candles hub.
         """
         await self.stop_network()
         await self.initialize_exchange_data()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._candles_hub is not None:
+            await self._candles_hub.add_feed(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
-        This method stops the network by canceling the _listen_candles_task task.
+        This method stops the network by canceling the _listen_candles_task task, or unsubscribing the feed from its
+        candles hub.
         """
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._candles_hub is not None:
+            await self._candles_hub.remove_feed(self)
+
+    @property
+    def candles_hub(self) -> Optional["CandlesHub"]:
+        return self._candles_hub
+
+    def set_candles_hub(self, candles_hub: Optional["CandlesHub"]):
+        """
+        Makes the feed receive its candles through the shared websocket connections of the hub. It must be set before
+        starting the network.
+        """
+        if candles_hub is not None and not self.ws_multiplexing_supported:
+            raise ValueError(f"{self.__class__.__name__} websocket streams can not be multiplexed.")
+        self._candles_hub = candles_hub
 
     async def initialize_exchange_data(self):
         """
@@ -162,39 +194,42 @@ class CandlesBase(NetworkBase):
         self._candles.extendleft(df.values.tolist())
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
+        """
+        Downloads the candles of the configured time range. The REST page windows are planned up front and fetched
+        concurrently, and the candles are concatenated and validated once at the end. The missing candles are
+        reported (in `last_historical_candles_report` and as a warning), not filled.
+        """
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    # 处理空数据情况
-                    if len(candles) == 0:
-                        # 如果获取的数据为空，记录警告但继续
-                        self.logger().warning(f"No candles fetched for time range {current_start_time} to {current_end_time}")
-                        fetched_candles_df = pd.DataFrame(columns=self.columns)
-                    else:
-                        fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                    candles_df = pd.concat([fetched_candles_df, candles_df])
-                    break
-                # 如果candles为空数组，无法继续处理
-                if len(candles) == 0:
-                    self.logger().warning(f"No candles fetched, breaking loop")
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
-            candles_df = candles_df[(candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
-            return candles_df
+            start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+            end_time = self._round_timestamp_to_interval_multiple(config.end_time)
+            pages = self._plan_historical_candles_pages(start_time=start_time, end_time=end_time)
+
+            download_start = time.perf_counter()
+            fetched_pages = await self._fetch_historical_candles_pages(pages)
+            elapsed = time.perf_counter() - download_start
+
+            candles = self._merge_historical_candles_pages(fetched_pages)
+            candles = candles[(candles[:, 0] <= config.end_time) & (candles[:, 0] >= config.start_time)]
+            gaps = self._find_candles_gaps(candles[:, 0], start_time=max(start_time, config.start_time),
+                                           end_time=end_time)
+            self.last_historical_candles_report = HistoricalCandlesReport(
+                pages=len(pages),
+                candles=len(candles),
+                elapsed_seconds=elapsed,
+                pages_per_second=len(pages) / elapsed if elapsed > 0 else float(len(pages)),
+                gaps=gaps,
+            )
+            self.logger().info(
+                f"Downloaded {len(candles)} {self.interval} candles of {self._trading_pair} in {len(pages)} pages "
+                f"({self.last_historical_candles_report.pages_per_second:.2f} pages/s).")
+            if gaps:
+                missing_candles = sum(int((gap_end - gap_start) / self.interval_in_seconds) + 1
+                                      for gap_start, gap_end in gaps)
+                self.logger().warning(
+                    f"{missing_candles} {self.interval} candles of {self._trading_pair} are missing in {len(gaps)} "
+                    f"gaps of the requested range (first gap: {gaps[0][0]} to {gaps[0][1]}).")
+            return pd.DataFrame(candles, columns=self.columns)
         except ValueError as e:
             self.logger().error(f"Error fetching historical candles: {str(e)}")
             raise e
@@ -202,6 +237,71 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    def _plan_historical_candles_pages(self, start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Splits the time range in the REST page windows needed to download it, newest first.
+
+        :return: the list of (end time, number of intervals before the end time) of each page
+        """
+        page_intervals = max(self.candles_max_result_per_rest_request - 1, 0)
+        pages = []
+        page_end_time = end_time
+        while True:
+            intervals = min(page_intervals, int((page_end_time - start_time) / self.interval_in_seconds))
+            pages.append((page_end_time, max(intervals, 0)))
+            page_end_time -= (intervals + 1) * self.interval_in_seconds
+            if page_end_time < start_time:
+                break
+        return pages
+
+    async def _fetch_historical_candles_pages(self, pages: List[Tuple[int, int]]) -> List[np.ndarray]:
+        semaphore = asyncio.Semaphore(self.historical_candles_max_concurrent_requests)
+
+        async def fetch_page(page_end_time: int, intervals: int) -> np.ndarray:
+            async with semaphore:
+                candles = await self.fetch_candles(end_time=page_end_time, limit=intervals)
+            if len(candles) == 0:
+                self.logger().warning(
+                    f"No candles fetched for time range {page_end_time - intervals * self.interval_in_seconds} "
+                    f"to {page_end_time}")
+            return candles
+
+        # The oldest page goes first: it fails fast if the range goes beyond the history the exchange serves
+        oldest_page = await fetch_page(*pages[-1])
+        tasks = [asyncio.ensure_future(fetch_page(page_end_time, intervals)) for page_end_time, intervals in pages[:-1]]
+        try:
+            return await asyncio.gather(*tasks) + [oldest_page]
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _merge_historical_candles_pages(self, pages: List[np.ndarray]) -> np.ndarray:
+        """
+        Concatenates the candles of the pages, sorted by timestamp and without the candles repeated in two pages.
+        """
+        pages = [page.reshape(-1, len(self.columns)) for page in pages if len(page) > 0]
+        if not pages:
+            return np.empty((0, len(self.columns)))
+        candles = np.concatenate(pages)
+        candles = candles[np.argsort(candles[:, 0], kind="stable")]
+        _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+        return candles[unique_indexes]
+
+    def _find_candles_gaps(self, timestamps: np.ndarray, start_time: float, end_time: float) -> List[Tuple[float, float]]:
+        """
+        Finds the missing candles in the range given the (sorted) timestamps of the candles available.
+
+        :return: the (first missing timestamp, last missing timestamp) of each gap
+        """
+        if len(timestamps) == 0:
+            return [(float(start_time), float(end_time))] if end_time >= start_time else []
+        interval = self.interval_in_seconds
+        bounds = np.concatenate(([start_time - interval], timestamps, [end_time + interval]))
+        steps = np.diff(bounds)
+        return [(float(bounds[i] + interval), float(bounds[i + 1] - interval))
+                for i in np.flatnonzero(steps > interval)]
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -409,6 +509,29 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @property
+    def ws_stream_key(self) -> Tuple[str, str]:
+        """
+        Identifies the websocket stream of the feed in a connection shared with other feeds.
+        """
+        return self._ex_trading_pair, self.interval
+
+    @classmethod
+    def ws_streams_subscription_payload(cls, feeds: List["CandlesBase"], subscribe: bool = True) -> dict:
+        """
+        This method returns the payload to subscribe (or unsubscribe) the streams of several feeds in a single request,
+        when the websocket connection is shared through a CandlesHub.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def ws_message_stream_key(cls, data: dict) -> Optional[Tuple[str, str]]:
+        """
+        This method returns the stream key (exchange trading pair and interval) of a candle websocket message, or None
+        if the message is not a candle.
+        """
+        raise NotImplementedError
+
     async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
         # TODO: Isolate ping pong logic
         async for ws_response in websocket_assistant.iter_messages():
@@ -418,27 +541,34 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
-                    self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                self._process_websocket_candle(parsed_message)
+
+    def _process_websocket_candle(self, parsed_message: dict):
+        """
+        Stores a candle received through the websocket: a new candle is appended, and an update of the last candle
+        replaces it.
+        """
+        candles_row = np.array([parsed_message["timestamp"],
+                                parsed_message["open"],
+                                parsed_message["high"],
+                                parsed_message["low"],
+                                parsed_message["close"],
+                                parsed_message["volume"],
+                                parsed_message["quote_asset_volume"],
+                                parsed_message["n_trades"],
+                                parsed_message["taker_buy_base_volume"],
+                                parsed_message["taker_buy_quote_volume"]]).astype(float)
+        if len(self._candles) == 0:
+            self._candles.append(candles_row)
+            self._ws_candle_available.set()
+            safe_ensure_future(self.fill_historical_candles())
+        else:
+            latest_timestamp = int(self._candles[-1][0])
+            current_timestamp = int(parsed_message["timestamp"])
+            if current_timestamp > latest_timestamp:
+                self._candles.append(candles_row)
+            elif current_timestamp == latest_timestamp:
+                self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
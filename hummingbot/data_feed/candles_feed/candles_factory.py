@@ -12,6 +12,7 @@ from hummingbot.data_feed.candles_feed.btc_markets_spot_candles.btc_markets_spot
 from hummingbot.data_feed.candles_feed.bybit_perpetual_candles.bybit_perpetual_candles import BybitPerpetualCandles
 from hummingbot.data_feed.candles_feed.bybit_spot_candles.bybit_spot_candles import BybitSpotCandles
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.candles_feed.dexalot_spot_candles.dexalot_spot_candles import DexalotSpotCandles
 from hummingbot.data_feed.candles_feed.gate_io_perpetual_candles import GateioPerpetualCandles
@@ -43,6 +44,8 @@ class CandlesFactory:
     """
     The CandlesFactory class creates and returns a Candle object based on the specified configuration.
     It uses a mapping of connector names to their respective candle classes.
+    The candles of the connectors that support it are received through the shared websocket connections of the
+    connector CandlesHub.
     """
 
     _candles_map: Dict[str, Type[CandlesBase]] = {
@@ -80,6 +83,9 @@ class CandlesFactory:
         """
         connector_class = cls._candles_map.get(candles_config.connector)
         if connector_class:
-            return connector_class(candles_config.trading_pair, candles_config.interval, candles_config.max_records)
+            candles = connector_class(candles_config.trading_pair, candles_config.interval, candles_config.max_records)
+            if connector_class.ws_multiplexing_supported:
+                candles.set_candles_hub(CandlesHub.get_hub(connector_class))
+            return candles
         else:
             raise UnsupportedConnectorException(candles_config.connector)
@@ -0,0 +1,232 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+# Feeds are identified in the websocket messages by their exchange trading pair and interval
+StreamKey = Tuple[str, str]
+
+
+class CandlesHubConnection:
+    """
+    A websocket connection shared by several candles feeds of the same exchange. The streams of the feeds are
+    subscribed and unsubscribed while the connection is alive, and every candle received is handed to the feeds of its
+    stream, that store it in their own candles buffer. Feeds of the same trading pair and interval share the stream.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, candles_class: Type["CandlesBase"]):
+        self._candles_class = candles_class
+        self._feeds: Dict[StreamKey, List["CandlesBase"]] = {}
+        self._subscribed_streams = set()
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def feeds(self) -> List["CandlesBase"]:
+        return [feed for stream_feeds in self._feeds.values() for feed in stream_feeds]
+
+    @property
+    def streams(self) -> List[StreamKey]:
+        return list(self._feeds)
+
+    @property
+    def subscribed_streams(self) -> List[StreamKey]:
+        return list(self._subscribed_streams)
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws is not None
+
+    async def add_feed(self, feed: "CandlesBase"):
+        stream_key = feed.ws_stream_key
+        stream_feeds = self._feeds.setdefault(stream_key, [])
+        if feed in stream_feeds:
+            return
+        stream_feeds.append(feed)
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self._listen_for_subscriptions())
+        elif self._ws is not None and stream_key not in self._subscribed_streams:
+            await self._subscribe_streams(self._ws, [feed])
+
+    async def remove_feed(self, feed: "CandlesBase"):
+        stream_key = feed.ws_stream_key
+        stream_feeds = self._feeds.get(stream_key, [])
+        if feed not in stream_feeds:
+            return
+        stream_feeds.remove(feed)
+        if stream_feeds:
+            return
+        del self._feeds[stream_key]
+        if not self._feeds:
+            await self.stop()
+        elif self._ws is not None and stream_key in self._subscribed_streams:
+            await self._unsubscribe_streams(self._ws, [feed])
+
+    async def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        if self._ws is not None:
+            ws, self._ws = self._ws, None
+            await ws.disconnect()
+        self._subscribed_streams.clear()
+
+    async def _listen_for_subscriptions(self):
+        ws: Optional[WSAssistant] = None
+        while self._feeds:
+            try:
+                ws = await self._connected_websocket_assistant()
+                await self._subscribe_pending_streams(ws)
+                self._ws = ws
+                await self._process_websocket_messages(ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The candles hub websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                await self._on_stream_interruption(ws)
+                ws = None
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        # The connection is opened with the settings (URL, throttler, ping timeout) of one of its feeds
+        return await self.feeds[0]._connected_websocket_assistant()
+
+    async def _subscribe_pending_streams(self, ws: WSAssistant):
+        """
+        Subscribes the streams of every feed of the connection, including the feeds added while subscribing.
+        """
+        while True:
+            pending_feeds = [stream_feeds[0] for stream_key, stream_feeds in self._feeds.items()
+                             if stream_key not in self._subscribed_streams]
+            if not pending_feeds:
+                break
+            await self._subscribe_streams(ws, pending_feeds)
+
+    async def _subscribe_streams(self, ws: WSAssistant, feeds: List["CandlesBase"]):
+        payload = self._candles_class.ws_streams_subscription_payload(feeds, subscribe=True)
+        self._subscribed_streams.update(feed.ws_stream_key for feed in feeds)
+        await ws.send(WSJSONRequest(payload=payload))
+        self.logger().info(f"Subscribed to public klines of {len(feeds)} candles streams...")
+
+    async def _unsubscribe_streams(self, ws: WSAssistant, feeds: List["CandlesBase"]):
+        payload = self._candles_class.ws_streams_subscription_payload(feeds, subscribe=False)
+        self._subscribed_streams.difference_update(feed.ws_stream_key for feed in feeds)
+        await ws.send(WSJSONRequest(payload=payload))
+
+    async def _process_websocket_messages(self, ws: WSAssistant):
+        feed = self.feeds[0]
+        ping_timeout = feed._ping_timeout
+        while True:
+            try:
+                await asyncio.wait_for(self._process_websocket_messages_task(ws), timeout=ping_timeout)
+            except asyncio.TimeoutError:
+                if ping_timeout is not None:
+                    await ws.send(request=WSJSONRequest(payload=feed._ping_payload))
+
+    async def _process_websocket_messages_task(self, ws: WSAssistant):
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            stream_key = self._candles_class.ws_message_stream_key(data)
+            if stream_key is None:
+                # Not a candle (subscription results, pings): any of the feeds parses it and replies if needed
+                if not self._feeds:
+                    continue
+                parsed_message = self.feeds[0]._parse_websocket_message(data)
+                if isinstance(parsed_message, WSJSONRequest):
+                    await ws.send(request=parsed_message)
+                continue
+            stream_feeds = self._feeds.get(stream_key)
+            if stream_feeds:
+                parsed_message = stream_feeds[0]._parse_websocket_message(data)
+                if isinstance(parsed_message, dict):
+                    for feed in stream_feeds:
+                        feed._process_websocket_candle(parsed_message)
+
+    async def _on_stream_interruption(self, ws: Optional[WSAssistant]):
+        self._ws = None
+        self._subscribed_streams.clear()
+        ws and await ws.disconnect()
+        for feed in self.feeds:
+            await feed._on_order_stream_interruption()
+
+    @staticmethod
+    async def _sleep(delay):
+        await asyncio.sleep(delay)
+
+
+class CandlesHub:
+    """
+    Multiplexes the candles feeds of one exchange over a few websocket connections, instead of opening a connection
+    per feed. Each connection carries up to `max_streams_per_connection` feeds; feeds are subscribed and unsubscribed
+    on the live connections as they start and stop, and a connection is closed when its last feed stops.
+
+    The hub of each candles class is shared by all the feeds created through the CandlesFactory.
+    """
+    _hubs: Dict[Type["CandlesBase"], "CandlesHub"] = {}
+
+    @classmethod
+    def get_hub(cls, candles_class: Type["CandlesBase"]) -> "CandlesHub":
+        hub = cls._hubs.get(candles_class)
+        if hub is None:
+            hub = CandlesHub(candles_class)
+            cls._hubs[candles_class] = hub
+        return hub
+
+    def __init__(self, candles_class: Type["CandlesBase"], max_streams_per_connection: Optional[int] = None):
+        self._candles_class = candles_class
+        self._max_streams_per_connection = (max_streams_per_connection
+                                            or candles_class.ws_max_streams_per_connection)
+        self._connections: List[CandlesHubConnection] = []
+
+    @property
+    def connections(self) -> List[CandlesHubConnection]:
+        return list(self._connections)
+
+    @property
+    def feeds(self) -> List["CandlesBase"]:
+        return [feed for connection in self._connections for feed in connection.feeds]
+
+    async def add_feed(self, feed: "CandlesBase"):
+        """
+        Starts receiving the candles of the feed, on the connection of its stream if another feed already uses it, or
+        on the first connection with room for a new stream.
+        """
+        connection = next((connection for connection in self._connections
+                           if feed.ws_stream_key in connection._feeds), None)
+        if connection is None:
+            connection = next((connection for connection in self._connections
+                               if len(connection._feeds) < self._max_streams_per_connection), None)
+        if connection is None:
+            connection = CandlesHubConnection(self._candles_class)
+            self._connections.append(connection)
+        await connection.add_feed(feed)
+
+    async def remove_feed(self, feed: "CandlesBase"):
+        """
+        Stops receiving the candles of the feed, closing its connection if no other feed uses it.
+        """
+        for connection in self._connections:
+            if feed in connection._feeds.get(feed.ws_stream_key, []):
+                await connection.remove_feed(feed)
+                if not connection._feeds:
+                    self._connections.remove(connection)
+                break
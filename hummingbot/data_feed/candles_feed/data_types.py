@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 from pydantic import BaseModel
 
 
@@ -22,3 +24,15 @@ class HistoricalCandlesConfig(BaseModel):
     interval: str
     start_time: int
     end_time: int
+
+
+class HistoricalCandlesReport(BaseModel):
+    """
+    Summary of a historical candles download: the REST pages fetched, the candles obtained, the download speed and
+    the gaps (start and end timestamps of the missing candles) found in the requested range.
+    """
+    pages: int
+    candles: int
+    elapsed_seconds: float
+    pages_per_second: float
+    gaps: List[Tuple[float, float]] = []
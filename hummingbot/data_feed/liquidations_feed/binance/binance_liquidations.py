@@ -155,16 +155,16 @@ class BinancePerpetualLiquidations(LiquidationsBase):
             if data.get("e") == "forceOrder":
                 timestamp = int(data["o"]["T"])
                 trading_pair = self._trading_pairs_map.get(data["o"]["s"])
+                if trading_pair is None:
+                    # Symbol listed after the trading pairs were fetched
+                    continue
                 quantity = float(data["o"]["q"])
                 price = float(data["o"]["ap"])
                 side = data["o"]["S"]
                 # SELL-Side means here, that a long position was forcefully liquidated and the other way round
                 liquidation_side = LiquidationSide.LONG if side == "SELL" else LiquidationSide.SHORT
 
-                if trading_pair not in self._liquidations:
-                    self._liquidations[trading_pair] = []
-
-                self._liquidations[trading_pair].append(Liquidation(
+                self._add_liquidation(Liquidation(
                     timestamp=timestamp,
                     trading_pair=trading_pair,
                     quantity=quantity,
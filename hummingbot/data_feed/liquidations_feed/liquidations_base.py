@@ -2,8 +2,9 @@ import asyncio
 import time
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Optional, Set
+from typing import Dict, Optional, Set
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 from pandas import DataFrame
@@ -36,6 +37,150 @@ class Liquidation:
     side: LiquidationSide
 
 
+LIQUIDATION_SIDES = list(LiquidationSide)
+LIQUIDATION_SIDE_CODES = {side: code for code, side in enumerate(LIQUIDATION_SIDES)}
+
+
+class LiquidationsBuffer:
+    """
+    Columnar storage of the liquidations of a trading pair, in arrival (time) order.
+
+    The liquidations kept are the [head, tail) slice of append-only NumPy arrays: old liquidations are evicted by moving
+    the head, and the arrays are only reallocated (without the evicted liquidations) once full. The arrays are never
+    written before the tail, so the frames built on views of the live slice are not modified by later updates.
+
+    A running sum of the notional of each side gives the notional over any window in O(1) once its start is known, and
+    the start of each queried window is kept to only search the liquidations added since the last query.
+    """
+
+    def __init__(self, trading_pair: str, initial_capacity: int = 1024):
+        self._trading_pair = trading_pair
+        self._initial_capacity = initial_capacity
+        self._allocate(initial_capacity)
+
+    def _allocate(self, capacity: int):
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._quantities = np.empty(capacity, dtype=np.float64)
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._sides = np.empty(capacity, dtype=np.int8)
+        # Cumulative notional of each side up to each liquidation (included)
+        self._cumulative_notional = np.empty((capacity, len(LIQUIDATION_SIDES)), dtype=np.float64)
+        self._head = 0
+        self._tail = 0
+        self._window_starts: Dict[int, int] = {}
+
+    def __len__(self):
+        return self._tail - self._head
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def capacity(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[self._head:self._tail]
+
+    @property
+    def quantities(self) -> np.ndarray:
+        return self._quantities[self._head:self._tail]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices[self._head:self._tail]
+
+    @property
+    def side_codes(self) -> np.ndarray:
+        """
+        The sides of the liquidations as indexes of LIQUIDATION_SIDES
+        """
+        return self._sides[self._head:self._tail]
+
+    def append(self, timestamp: int, quantity: float, price: float, side: LiquidationSide):
+        if self._tail == self.capacity:
+            self._reallocate()
+        index = self._tail
+        side_code = LIQUIDATION_SIDE_CODES[side]
+        self._timestamps[index] = timestamp
+        self._quantities[index] = quantity
+        self._prices[index] = price
+        self._sides[index] = side_code
+        if index > 0:
+            self._cumulative_notional[index] = self._cumulative_notional[index - 1]
+        else:
+            self._cumulative_notional[index] = 0
+        self._cumulative_notional[index, side_code] += quantity * price
+        self._tail = index + 1
+
+    def evict(self, max_timestamp: int):
+        """
+        Drops the liquidations up to the timestamp (included).
+        """
+        self._head += int(np.searchsorted(self.timestamps, max_timestamp, side="right"))
+
+    def notional(self, start_timestamp: int, side: Optional[LiquidationSide] = None, window_key: int = None) -> float:
+        """
+        :param start_timestamp: the timestamp (in milliseconds, included) from which the notional is summed
+        :param side: the side of the liquidations summed, both sides if not provided
+        :param window_key: identifies a window whose start only moves forward (e.g. its length) to reuse its last start
+        :return: the notional (quantity * price) of the liquidations since the timestamp
+        """
+        if self._tail == self._head:
+            return 0.0
+        start = self._window_start(start_timestamp, window_key)
+        totals = self._cumulative_notional[self._tail - 1]
+        if start > 0:
+            totals = totals - self._cumulative_notional[start - 1]
+        if side is None:
+            return float(totals.sum())
+        return float(totals[LIQUIDATION_SIDE_CODES[side]])
+
+    def _window_start(self, start_timestamp: int, window_key: Optional[int]) -> int:
+        start = self._window_starts.get(window_key, self._head) if window_key is not None else self._head
+        if start < self._head or (start > self._head and self._timestamps[start - 1] >= start_timestamp):
+            start = self._head
+        start += int(np.searchsorted(self._timestamps[start:self._tail], start_timestamp, side="left"))
+        if window_key is not None:
+            self._window_starts[window_key] = start
+        return start
+
+    def _reallocate(self):
+        live_slice = slice(self._head, self._tail)
+        live_count = self._tail - self._head
+        capacity = self.capacity * 2 if live_count > self.capacity // 2 else self.capacity
+        timestamps = self._timestamps[live_slice]
+        quantities = self._quantities[live_slice]
+        prices = self._prices[live_slice]
+        sides = self._sides[live_slice]
+        cumulative_notional = self._cumulative_notional[live_slice]
+        if self._head > 0:
+            # Rebases the running sums on the first liquidation kept
+            cumulative_notional = cumulative_notional - self._cumulative_notional[self._head - 1]
+        self._allocate(max(capacity, self._initial_capacity))
+        self._timestamps[:live_count] = timestamps
+        self._quantities[:live_count] = quantities
+        self._prices[:live_count] = prices
+        self._sides[:live_count] = sides
+        self._cumulative_notional[:live_count] = cumulative_notional
+        self._tail = live_count
+
+    def frame(self) -> DataFrame:
+        """
+        The liquidations as a DataFrame whose numeric columns are views of the buffer arrays.
+        """
+        count = len(self)
+        return pd.DataFrame({
+            "timestamp": self.timestamps,
+            "trading_pair": pd.Categorical.from_codes(np.zeros(count, dtype=np.int8), categories=[self._trading_pair]),
+            "quantity": self.quantities,
+            "price": self.prices,
+            "side": pd.Categorical.from_codes(self.side_codes, categories=LIQUIDATION_SIDES),
+        }, copy=False)
+
+
 class LiquidationsBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing liquidation data from crypto exchanges. The storage
@@ -49,7 +194,7 @@ class LiquidationsBase(NetworkBase):
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self._max_retention_seconds = max_retention_seconds
         self._trading_pairs = trading_pairs
-        self._liquidations = {}
+        self._liquidations: Dict[str, LiquidationsBuffer] = {}
         self._listen_liquidations_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._subscribed_to_channels = False
@@ -117,46 +262,59 @@ class LiquidationsBase(NetworkBase):
     def _cleanup_old_liquidations(self):
         try:
             current_time_ms = int(time.time() * 1000)
-            if self._liquidations:
-                for trading_pair, liquidations in list(self._liquidations.items()):
-                    self._liquidations[trading_pair] = [
-                        liq for liq in liquidations if
-                        current_time_ms - liq.timestamp < self._max_retention_seconds * 1000
-                    ]
+            for liquidations in self._liquidations.values():
+                liquidations.evict(current_time_ms - self._max_retention_seconds * 1000)
         except Exception:
             self.logger().exception(
                 "Unexpected error occurred when cleaning up outdated liquidations. Retrying in 1 seconds...",
             )
 
+    def _add_liquidation(self, liquidation: Liquidation):
+        liquidations = self._liquidations.get(liquidation.trading_pair)
+        if liquidations is None:
+            liquidations = LiquidationsBuffer(liquidation.trading_pair)
+            self._liquidations[liquidation.trading_pair] = liquidations
+        liquidations.append(liquidation.timestamp, liquidation.quantity, liquidation.price, liquidation.side)
+
     def liquidations_df(self, trading_pair=None) -> DataFrame:
         """
         This method returns the liquidations stored as a Pandas DataFrame.
         If no trading_pair is specified, all liquidations are returned in a single DataFrame.
         If the specified trading_pair has no data, an empty DataFrame is returned.
+        The DataFrame of a single trading pair is built without copying the stored liquidations.
         """
         # Dynamically retrieve column names from the Liquidation dataclass
         column_names = [f.name for f in fields(Liquidation)]
 
-        # Check if a specific trading pair is requested
         if trading_pair:
-            # Retrieve the list of Liquidation objects for the specified trading pair
-            liquidations = self._liquidations.get(trading_pair)
-            # If no liquidations are found for the trading pair, return an empty DataFrame
-            if not liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of dataclass instances to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in liquidations])
+            pairs_liquidations = [self._liquidations.get(trading_pair)]
         else:
-            # No specific trading pair is requested, combine all pairs
-            all_liquidations = []
-            # Iterate over all trading pairs and collect their liquidations
-            for pair_liquidations in self._liquidations.values():
-                all_liquidations.extend(pair_liquidations)
-            # If no liquidations are collected, return an empty DataFrame
-            if not all_liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of all liquidations to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in all_liquidations])
+            pairs_liquidations = list(self._liquidations.values())
+        frames = [liquidations.frame() for liquidations in pairs_liquidations if liquidations]
+        if not frames:
+            return pd.DataFrame(columns=column_names)
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def liquidations_notional(self,
+                              trading_pair: str,
+                              window_seconds: float,
+                              side: Optional[LiquidationSide] = None,
+                              timestamp: Optional[float] = None) -> float:
+        """
+        Returns the notional (quantity * price) liquidated over the last seconds.
+        :param trading_pair: the trading pair of the liquidations
+        :param window_seconds: the length of the window
+        :param side: the side of the liquidations (e.g. LONG for the long positions liquidated), both if not provided
+        :param timestamp: the end of the window (current time if not provided)
+        """
+        liquidations = self._liquidations.get(trading_pair)
+        if liquidations is None:
+            return 0.0
+        end_timestamp = time.time() if timestamp is None else timestamp
+        window_ms = int(window_seconds * 1000)
+        return liquidations.notional(int(end_timestamp * 1000) - window_ms, side, window_key=window_ms)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -4,6 +4,7 @@ import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.config_helpers import (
@@ -15,6 +16,7 @@ from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import GroupedSetDict, LazyDict, PriceType, TradeType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -48,6 +50,8 @@ class MarketDataProvider:
         self._non_trading_connectors = LazyDict[str, ConnectorBase](self._create_non_trading_connector)
         self._rates_required = GroupedSetDict[str, ConnectorPair]()
         self.conn_settings = AllConnectorSettings.get_connector_settings()
+        # (connector, trading pair, depth) -> (order book, order book version, bids and asks frames)
+        self._order_book_snapshots: Dict[Tuple[str, str, Optional[int]], Tuple] = {}
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
@@ -542,17 +546,43 @@ class MarketDataProvider:
         order_book = connector.get_order_book(trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
-    def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def get_order_book_snapshot(self, connector_name, trading_pair,
+                                depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask in
-        DataFrame format.
+        DataFrame format. The DataFrames are shared by all the callers until the order book changes, so they must not
+        be modified.
         :param connector_name: str
         :param trading_pair: str
+        :param depth: The number of levels of each side, all the levels if not provided
         :return: Tuple of bid and ask in DataFrame format.
         """
         connector = self.get_connector_with_fallback(connector_name)
         order_book = connector.get_order_book(trading_pair)
-        return order_book.snapshot
+        key = (connector_name, trading_pair, depth)
+        cached_snapshot = self._order_book_snapshots.get(key)
+        if (cached_snapshot is not None and cached_snapshot[0] is order_book and order_book.snapshot_cache_enabled
+                and cached_snapshot[1] == order_book.version):
+            return cached_snapshot[2]
+        bids_array, asks_array = order_book.top_snapshot(depth)
+        snapshot = (pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, copy=True),
+                    pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, copy=True))
+        self._order_book_snapshots[key] = (order_book, order_book.version, snapshot)
+        return snapshot
+
+    def get_order_book_top_snapshot(self, connector_name: str, trading_pair: str,
+                                    depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieves the top levels of the order book as read-only arrays of [price, amount, update_id] rows, shared by
+        all the callers until the order book changes.
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair for which to retrieve the data.
+        :param depth: The number of levels of each side, all the levels if not provided
+        :return: Tuple of bid (by descending price) and ask (by ascending price) arrays.
+        """
+        connector = self.get_connector_with_fallback(connector_name)
+        order_book = connector.get_order_book(trading_pair)
+        return order_book.top_snapshot(depth)
 
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
@@ -95,6 +95,7 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
+            self.backfill_trade_fill_rollups()
 
     @property
     def engine(self) -> Engine:
@@ -130,3 +131,10 @@ class SQLConnectionManager(TransactionBase):
                             # Cannot use variable local_db_version because reference is not valid
                             # since Migrator changed it
                             self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+
+    def backfill_trade_fill_rollups(self):
+        from hummingbot.model.trade_fill_rollup import TradeFillRollup
+        with self.get_new_session() as session:
+            with session.begin():
+                if TradeFillRollup.backfill(session):
+                    self.logger().info("Built the daily trade fill rollups of the trade fills recorded before them.")
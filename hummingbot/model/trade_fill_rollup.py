@@ -0,0 +1,288 @@
+import math
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text, UniqueConstraint
+from sqlalchemy.orm import Session
+
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import DecimalText
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+DAY_MS = 24 * 60 * 60 * 1000
+ROLLUP_BACKFILL_KEY = "trade_fill_rollup_backfill"
+ROLLUP_BACKFILL_VALUE = "1"
+
+
+class TradesSummary:
+    """
+    Additive summary of the trade fills of a market and trading pair, with the sums required by `PerformanceMetrics`.
+    The volumes follow the `PerformanceMetrics` sign convention (base bought and quote sold are positive).
+    """
+
+    def __init__(self):
+        self.num_trades: int = 0
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.num_position_fills: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        # fees is a dictionary of token and total fee amount paid in that token.
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.first_trade_timestamp: Optional[int] = None
+        self.first_price: Optional[Decimal] = None
+        self.last_trade_timestamp: Optional[int] = None
+        self.last_price: Optional[Decimal] = None
+
+    @property
+    def avg_b_price(self) -> Decimal:
+        return abs(self.b_vol_quote / self.b_vol_base) if self.b_vol_base != s_decimal_0 else s_decimal_0
+
+    @property
+    def avg_s_price(self) -> Decimal:
+        return abs(self.s_vol_quote / self.s_vol_base) if self.s_vol_base != s_decimal_0 else s_decimal_0
+
+    def add_trade(self, trade: TradeFill):
+        amount = Decimal(str(trade.amount))
+        price = Decimal(str(trade.price))
+        trade_type = trade.trade_type.upper()
+        self.num_trades += 1
+        if trade_type == TradeType.BUY.name:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+        elif trade_type == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+        if trade.position is not None and trade.position != PositionAction.NIL.value:
+            self.num_position_fills += 1
+
+        trade_fee = trade.trade_fee
+        if trade_fee.get("percent") is not None:
+            fee_percent = Decimal(str(trade_fee["percent"]))
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote -= amount * price * fee_percent
+            self.fees[trade.quote_asset] += price * amount * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"])
+
+        self._update_first_and_last(trade.timestamp, price, trade.timestamp, price)
+
+    def merge(self, other: "TradesSummary"):
+        self.num_trades += other.num_trades
+        self.num_buys += other.num_buys
+        self.num_sells += other.num_sells
+        self.num_position_fills += other.num_position_fills
+        self.b_vol_base += other.b_vol_base
+        self.b_vol_quote += other.b_vol_quote
+        self.s_vol_base += other.s_vol_base
+        self.s_vol_quote += other.s_vol_quote
+        for token, amount in other.fees.items():
+            self.fees[token] += amount
+        if other.num_trades > 0:
+            self._update_first_and_last(
+                other.first_trade_timestamp, other.first_price, other.last_trade_timestamp, other.last_price)
+
+    def _update_first_and_last(self, first_timestamp: int, first_price: Decimal, last_timestamp: int,
+                               last_price: Decimal):
+        if self.first_trade_timestamp is None or first_timestamp < self.first_trade_timestamp:
+            self.first_trade_timestamp = first_timestamp
+            self.first_price = first_price
+        if self.last_trade_timestamp is None or last_timestamp >= self.last_trade_timestamp:
+            self.last_trade_timestamp = last_timestamp
+            self.last_price = last_price
+
+
+class TradeFillRollup(HummingbotBase):
+    """
+    Daily (UTC) rollup of the trade fills of a config file, market and trading pair. The rollups are updated when the
+    fills are recorded, so the performance of long running bots can be reported without loading all their fills.
+    """
+    __tablename__ = "TradeFillRollup"
+    __table_args__ = (UniqueConstraint("config_file_path", "market", "symbol", "day_start"),
+                      Index("tfr_config_day_start_index",
+                            "config_file_path", "day_start"))
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    day_start = Column(BigInteger, nullable=False)
+    num_trades = Column(Integer, nullable=False, default=0)
+    num_buys = Column(Integer, nullable=False, default=0)
+    num_sells = Column(Integer, nullable=False, default=0)
+    num_position_fills = Column(Integer, nullable=False, default=0)
+    b_vol_base = Column(DecimalText, nullable=False, default=s_decimal_0)
+    b_vol_quote = Column(DecimalText, nullable=False, default=s_decimal_0)
+    s_vol_base = Column(DecimalText, nullable=False, default=s_decimal_0)
+    s_vol_quote = Column(DecimalText, nullable=False, default=s_decimal_0)
+    fees = Column(JSON, nullable=False, default=dict)
+    first_trade_timestamp = Column(BigInteger, nullable=True)
+    first_price = Column(DecimalText, nullable=True)
+    last_trade_timestamp = Column(BigInteger, nullable=True)
+    last_price = Column(DecimalText, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"TradeFillRollup(config_file_path='{self.config_file_path}', market='{self.market}', " \
+               f"symbol='{self.symbol}', day_start={self.day_start}, num_trades={self.num_trades}, " \
+               f"b_vol_base={self.b_vol_base}, b_vol_quote={self.b_vol_quote}, s_vol_base={self.s_vol_base}, " \
+               f"s_vol_quote={self.s_vol_quote}, fees={self.fees})"
+
+    @staticmethod
+    def day_start_for_timestamp(timestamp: int) -> int:
+        return timestamp - timestamp % DAY_MS
+
+    def to_summary(self) -> TradesSummary:
+        summary = TradesSummary()
+        summary.num_trades = self.num_trades
+        summary.num_buys = self.num_buys
+        summary.num_sells = self.num_sells
+        summary.num_position_fills = self.num_position_fills
+        summary.b_vol_base = self.b_vol_base
+        summary.b_vol_quote = self.b_vol_quote
+        summary.s_vol_base = self.s_vol_base
+        summary.s_vol_quote = self.s_vol_quote
+        for token, amount in self.fees.items():
+            summary.fees[token] = Decimal(amount)
+        summary.first_trade_timestamp = self.first_trade_timestamp
+        summary.first_price = self.first_price
+        summary.last_trade_timestamp = self.last_trade_timestamp
+        summary.last_price = self.last_price
+        return summary
+
+    def _set_summary(self, summary: TradesSummary):
+        self.num_trades = summary.num_trades
+        self.num_buys = summary.num_buys
+        self.num_sells = summary.num_sells
+        self.num_position_fills = summary.num_position_fills
+        self.b_vol_base = summary.b_vol_base
+        self.b_vol_quote = summary.b_vol_quote
+        self.s_vol_base = summary.s_vol_base
+        self.s_vol_quote = summary.s_vol_quote
+        self.fees = {token: str(amount) for token, amount in summary.fees.items()}
+        self.first_trade_timestamp = summary.first_trade_timestamp
+        self.first_price = summary.first_price
+        self.last_trade_timestamp = summary.last_trade_timestamp
+        self.last_price = summary.last_price
+
+    @classmethod
+    def _get_or_create(cls, sql_session: Session, config_file_path: str, market: str, symbol: str,
+                       day_start: int) -> "TradeFillRollup":
+        rollup = (sql_session
+                  .query(cls)
+                  .filter(cls.config_file_path == config_file_path,
+                          cls.market == market,
+                          cls.symbol == symbol,
+                          cls.day_start == day_start)
+                  .one_or_none())
+        if rollup is None:
+            rollup = TradeFillRollup(config_file_path=config_file_path,
+                                     market=market,
+                                     symbol=symbol,
+                                     day_start=day_start)
+            rollup._set_summary(TradesSummary())
+            sql_session.add(rollup)
+        return rollup
+
+    @classmethod
+    def add_trade_fill(cls, sql_session: Session, trade_fill: TradeFill):
+        """
+        Adds a new trade fill to the rollup of its day. Must be called in the same transaction that stores the fill.
+        """
+        rollup = cls._get_or_create(sql_session=sql_session,
+                                    config_file_path=trade_fill.config_file_path,
+                                    market=trade_fill.market,
+                                    symbol=trade_fill.symbol,
+                                    day_start=cls.day_start_for_timestamp(trade_fill.timestamp))
+        summary = rollup.to_summary()
+        summary.add_trade(trade_fill)
+        rollup._set_summary(summary)
+
+    @classmethod
+    def rebuild(cls, sql_session: Session):
+        """
+        Rebuilds all the rollups from the trade fills stored. The fills are streamed, so only the daily summaries are
+        kept in memory.
+        """
+        summaries: Dict[Tuple[str, str, str, int], TradesSummary] = defaultdict(TradesSummary)
+        trades: Iterable[TradeFill] = (sql_session
+                                       .query(TradeFill)
+                                       .order_by(TradeFill.timestamp.asc())
+                                       .yield_per(1000))
+        for trade in trades:
+            key = (trade.config_file_path, trade.market, trade.symbol, cls.day_start_for_timestamp(trade.timestamp))
+            summaries[key].add_trade(trade)
+
+        sql_session.query(cls).delete()
+        for (config_file_path, market, symbol, day_start), summary in summaries.items():
+            rollup = TradeFillRollup(config_file_path=config_file_path,
+                                     market=market,
+                                     symbol=symbol,
+                                     day_start=day_start)
+            rollup._set_summary(summary)
+            sql_session.add(rollup)
+
+    @classmethod
+    def backfill(cls, sql_session: Session) -> bool:
+        """
+        Builds the rollups of the trade fills recorded before the rollups existed. Runs once per database (a metadata
+        entry records it), the rollups are then kept up to date by `add_trade_fill`. Must be called in a transaction.
+
+        :return: True if the rollups were built.
+        """
+        if sql_session.get(Metadata, ROLLUP_BACKFILL_KEY) is not None:
+            return False
+        cls.rebuild(sql_session)
+        sql_session.add(Metadata(key=ROLLUP_BACKFILL_KEY, value=ROLLUP_BACKFILL_VALUE))
+        return True
+
+    @classmethod
+    def _query(cls, sql_session: Session, config_file_path: str, start_day: int) -> List["TradeFillRollup"]:
+        return (sql_session
+                .query(cls)
+                .filter(cls.config_file_path.like(f"%{config_file_path}%"), cls.day_start >= start_day)
+                .order_by(cls.day_start.asc())
+                .all())
+
+    @classmethod
+    def get_trades_summaries(cls,
+                             sql_session: Session,
+                             start_timestamp: int,
+                             config_file_path: str) -> Dict[Tuple[str, str], TradesSummary]:
+        """
+        Summarizes the trade fills since `start_timestamp` (in milliseconds) by market and trading pair, from the
+        rollups of the complete days, the fills of the first (partial) day and the fills after the last rolled-up day.
+        It only reads: the rollups are built once by `backfill` and then updated when the fills are recorded.
+        """
+        first_full_day = math.ceil(start_timestamp / DAY_MS) * DAY_MS
+        fills_query = sql_session.query(TradeFill).filter(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+
+        summaries: Dict[Tuple[str, str], TradesSummary] = defaultdict(TradesSummary)
+        head_trades: Iterable[TradeFill] = (fills_query
+                                            .filter(TradeFill.timestamp >= start_timestamp,
+                                                    TradeFill.timestamp < first_full_day)
+                                            .order_by(TradeFill.timestamp.asc())
+                                            .all())
+        for trade in head_trades:
+            summaries[(trade.market, trade.symbol)].add_trade(trade)
+        tail_start = first_full_day
+        for rollup in cls._query(sql_session, config_file_path, first_full_day):
+            summaries[(rollup.market, rollup.symbol)].merge(rollup.to_summary())
+            tail_start = rollup.day_start + DAY_MS
+        tail_trades: Iterable[TradeFill] = (fills_query
+                                            .filter(TradeFill.timestamp >= tail_start)
+                                            .order_by(TradeFill.timestamp.asc())
+                                            .all())
+        for trade in tail_trades:
+            summaries[(trade.market, trade.symbol)].add_trade(trade)
+
+        return dict(summaries)
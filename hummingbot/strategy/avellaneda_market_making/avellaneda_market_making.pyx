@@ -44,6 +44,12 @@ from hummingbot.strategy.hanging_orders_tracker import (
     CreatedPairOfOrders,
     HangingOrdersTracker,
 )
+from hummingbot.strategy.market_making_pricing cimport (
+    c_avellaneda_optimal_quotes,
+    c_budget_constrained_amounts,
+    c_to_decimal,
+    c_to_decimal_round_down,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 from hummingbot.strategy.order_tracker cimport OrderTracker
@@ -713,28 +719,32 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef c_calculate_reservation_price_and_optimal_spread(self):
         cdef:
             ExchangeBase market = self._market_info.market
+            double reservation_price
+            double optimal_spread
+            double optimal_bid
+            double optimal_ask
 
         # Current mid price
         price = self.get_price()
 
         # The amount of stocks owned - q - has to be in relative units, not absolute, because changing the portfolio size shouldn't change the reservation price
         # The reservation price should concern itself only with the strategy performance, i.e. amount of stocks relative to the target
-        inventory = Decimal(str(self.c_calculate_inventory()))
+        inventory = float(self.c_calculate_inventory())
         if inventory == 0:
             return
 
-        q_target = Decimal(str(self.c_calculate_target_inventory()))
-        q = (market.get_balance(self.base_asset) - q_target) / (inventory)
+        q_target = float(self.c_calculate_target_inventory())
+        q = (float(market.get_balance(self.base_asset)) - q_target) / inventory
         # Volatility has to be in absolute values (prices) because in calculation of reservation price it's not multiplied by the current price, therefore
         # it can't be a percentage. The result of the multiplication has to be an absolute price value because it's being subtracted from the current price
-        vol = self.get_volatility()
+        vol = self._avg_vol.current_value
 
         # order book liquidity - kappa and alpha have to represent absolute values because the second member of the optimal spread equation has to be an absolute price
         # and from the reservation price calculation we know that gamma's unit is not absolute price
-        if all((self.gamma, self._kappa)) and self._alpha != 0 and self._kappa > 0 and vol != 0:
+        if all((self.gamma, self._kappa)) and self._alpha != 0 and self._kappa > 0 and vol != 0 and not isnan(vol):
             if self._execution_state.time_left is not None and self._execution_state.closing_time is not None:
                 # Avellaneda-Stoikov for a fixed timespan
-                time_left_fraction = Decimal(str(self._execution_state.time_left / self._execution_state.closing_time))
+                time_left_fraction = self._execution_state.time_left / self._execution_state.closing_time
             else:
                 # Avellaneda-Stoikov for an infinite timespan
                 # The equations in the paper for this contain a few mistakes
@@ -752,18 +762,14 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             # current mid price
             # This leads to normalization of the risk_factor and will guaranetee consistent behavior on all price ranges of the asset, and across assets
 
-            self._reservation_price = price - (q * self.gamma * vol * time_left_fraction)
-
-            self._optimal_spread = self.gamma * vol * time_left_fraction
-            self._optimal_spread += 2 * Decimal(1 + self.gamma / self._kappa).ln() / self.gamma
-
-            min_spread = price / 100 * Decimal(str(self._config_map.min_spread))
-
-            max_limit_bid = price - min_spread / 2
-            min_limit_ask = price + min_spread / 2
-
-            self._optimal_ask = max(self._reservation_price + self._optimal_spread / 2, min_limit_ask)
-            self._optimal_bid = min(self._reservation_price - self._optimal_spread / 2, max_limit_bid)
+            # The prices are calculated in double precision and only converted to Decimal for the strategy state
+            reservation_price, optimal_spread, optimal_bid, optimal_ask = c_avellaneda_optimal_quotes(
+                float(price), q, float(self.gamma), float(self._kappa), vol, time_left_fraction,
+                float(self._config_map.min_spread))
+            self._reservation_price = c_to_decimal(reservation_price)
+            self._optimal_spread = c_to_decimal(optimal_spread)
+            self._optimal_bid = c_to_decimal(optimal_bid)
+            self._optimal_ask = c_to_decimal(optimal_ask)
 
             # This is not what the algorithm will use as proposed bid and ask. This is just the raw output.
             # Optimal bid and optimal ask prices will be used
@@ -880,14 +886,13 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             ExchangeBase market = self._market_info.market
             list buys = []
             list sells = []
-        bid_level_spreads, ask_level_spreads = self._get_level_spreads()
         size = market.c_quantize_order_amount(self.trading_pair, self._config_map.order_amount)
         if size > 0:
+            # The optimal prices and spread are already Decimal: the levels are offset without float conversions
+            level_step = ((self._optimal_spread / 2) / 100) * self.level_distances
             for level in range(self.order_levels):
-                bid_price = market.c_quantize_order_price(self.trading_pair,
-                                                          self._optimal_bid - Decimal(str(bid_level_spreads[level])))
-                ask_price = market.c_quantize_order_price(self.trading_pair,
-                                                          self._optimal_ask + Decimal(str(ask_level_spreads[level])))
+                bid_price = market.c_quantize_order_price(self.trading_pair, self._optimal_bid - level * level_step)
+                ask_price = market.c_quantize_order_price(self.trading_pair, self._optimal_ask + level * level_step)
 
                 buys.append(PriceSize(bid_price, size))
                 sells.append(PriceSize(ask_price, size))
@@ -983,42 +988,35 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef c_apply_budget_constraint(self, object proposal):
         cdef:
             ExchangeBase market = self._market_info.market
-            object quote_size
-            object base_size
-            object adjusted_amount
+            list unit_costs = []
+            list adjusted_amounts
 
         base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
 
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
                                        buy.size, buy.price)
-            quote_size = buy.size * buy.price * (Decimal(1) + buy_fee.percent)
-
-            # Adjust buy order size to use remaining balance if less than the order amount
-            if quote_balance < quote_size:
-                adjusted_amount = quote_balance / (buy.price * (Decimal("1") + buy_fee.percent))
-                adjusted_amount = market.c_quantize_order_amount(self.trading_pair, adjusted_amount)
-                buy.size = adjusted_amount
-                quote_balance = s_decimal_zero
-            elif quote_balance == s_decimal_zero:
-                buy.size = s_decimal_zero
-            else:
-                quote_balance -= quote_size
+            unit_costs.append(float(buy.price) * (1 + float(buy_fee.percent)))
+
+        # Adjust buy order sizes to use remaining balance if less than the order amount
+        adjusted_amounts = c_budget_constrained_amounts(float(quote_balance),
+                                                        [float(buy.size) for buy in proposal.buys],
+                                                        unit_costs)
+        for buy, adjusted_amount in zip(proposal.buys, adjusted_amounts):
+            if adjusted_amount is not None:
+                buy.size = market.c_quantize_order_amount(self.trading_pair,
+                                                          c_to_decimal_round_down(adjusted_amount))
 
         proposal.buys = [o for o in proposal.buys if o.size > 0]
 
-        for sell in proposal.sells:
-            base_size = sell.size
-
-            # Adjust sell order size to use remaining balance if less than the order amount
-            if base_balance < base_size:
-                adjusted_amount = market.c_quantize_order_amount(self.trading_pair, base_balance)
-                sell.size = adjusted_amount
-                base_balance = s_decimal_zero
-            elif base_balance == s_decimal_zero:
-                sell.size = s_decimal_zero
-            else:
-                base_balance -= base_size
+        # Adjust sell order sizes to use remaining balance if less than the order amount
+        adjusted_amounts = c_budget_constrained_amounts(float(base_balance),
+                                                        [float(sell.size) for sell in proposal.sells],
+                                                        [1.0] * len(proposal.sells))
+        for sell, adjusted_amount in zip(proposal.sells, adjusted_amounts):
+            if adjusted_amount is not None:
+                sell.size = market.c_quantize_order_amount(self.trading_pair,
+                                                           c_to_decimal_round_down(adjusted_amount))
 
         proposal.sells = [o for o in proposal.sells if o.size > 0]
 
@@ -0,0 +1,14 @@
+# distutils: language=c++
+
+cdef object c_to_decimal(double value)
+cdef object c_to_decimal_round_down(double value)
+cdef (double, double, double, double) c_avellaneda_optimal_quotes(double price,
+                                                                   double q,
+                                                                   double gamma,
+                                                                   double kappa,
+                                                                   double volatility,
+                                                                   double time_left_fraction,
+                                                                   double min_spread_pct)
+cdef list c_spread_level_prices(double reference_price, double spread, double level_spread, int levels, bint is_buy)
+cdef list c_level_amounts(double order_amount, double level_amount, int levels)
+cdef list c_budget_constrained_amounts(double balance, list amounts, list unit_costs)
@@ -0,0 +1,125 @@
+# distutils: language=c++
+"""
+Double precision pricing core of the market making strategies (Avellaneda & Stoikov quotes, order level ladders and
+budget constraint). The strategies convert their inputs to floats once per tick and only convert the results back to
+Decimal when quantizing the order prices and amounts.
+"""
+from decimal import ROUND_DOWN, Context, Decimal
+
+from libc.math cimport isnan, log1p
+
+# Relative tolerance of the balance comparisons, so a balance equal to the cost of an order (in decimal) is not seen as
+# insufficient because of the binary representation of the amounts
+cdef double BUDGET_TOLERANCE = 1e-12
+
+# Converts to 15 significant digits rounding toward zero, for the amounts that must not exceed the balance they come
+# from
+cdef object ROUND_DOWN_CONTEXT = Context(prec=15, rounding=ROUND_DOWN)
+
+
+def to_decimal(value: float) -> Decimal:
+    return c_to_decimal(value)
+
+
+def to_decimal_round_down(value: float) -> Decimal:
+    return c_to_decimal_round_down(value)
+
+
+def avellaneda_optimal_quotes(price: float, q: float, gamma: float, kappa: float, volatility: float,
+                              time_left_fraction: float, min_spread_pct: float):
+    """
+    :return: The reservation price, the optimal spread, and the optimal bid and ask prices
+    """
+    return c_avellaneda_optimal_quotes(price, q, gamma, kappa, volatility, time_left_fraction, min_spread_pct)
+
+
+def spread_level_prices(reference_price: float, spread: float, level_spread: float, levels: int, is_buy: bool):
+    return c_spread_level_prices(reference_price, spread, level_spread, levels, is_buy)
+
+
+def level_amounts(order_amount: float, level_amount: float, levels: int):
+    return c_level_amounts(order_amount, level_amount, levels)
+
+
+def budget_constrained_amounts(balance: float, amounts: list, unit_costs: list):
+    return c_budget_constrained_amounts(balance, amounts, unit_costs)
+
+
+cdef object c_to_decimal(double value):
+    """
+    Converts a float to Decimal rounded to 15 significant digits, the precision of a double, so e.g. 98.99999999999999
+    (100 * 0.99) gives Decimal("99") as in decimal arithmetic.
+    """
+    if isnan(value):
+        return Decimal("NaN")
+    return Decimal(format(value, ".15g"))
+
+
+cdef object c_to_decimal_round_down(double value):
+    """
+    Converts a float to Decimal truncated (toward zero) to 15 significant digits from its exact value. Used for the
+    amounts derived from a balance, which c_to_decimal could round above the balance (0.1999999999999999 gives 0.2).
+    """
+    if isnan(value):
+        return Decimal("NaN")
+    return ROUND_DOWN_CONTEXT.create_decimal_from_float(value)
+
+
+cdef (double, double, double, double) c_avellaneda_optimal_quotes(double price,
+                                                                   double q,
+                                                                   double gamma,
+                                                                   double kappa,
+                                                                   double volatility,
+                                                                   double time_left_fraction,
+                                                                   double min_spread_pct):
+    cdef:
+        double reservation_price = price - (q * gamma * volatility * time_left_fraction)
+        double optimal_spread = gamma * volatility * time_left_fraction + 2 * log1p(gamma / kappa) / gamma
+        double min_spread = price / 100 * min_spread_pct
+        double optimal_ask = max(reservation_price + optimal_spread / 2, price + min_spread / 2)
+        double optimal_bid = min(reservation_price - optimal_spread / 2, price - min_spread / 2)
+    return reservation_price, optimal_spread, optimal_bid, optimal_ask
+
+
+cdef list c_spread_level_prices(double reference_price, double spread, double level_spread, int levels, bint is_buy):
+    """
+    Prices of the order levels at a spread (fraction of the reference price) increased by the level spread per level.
+    """
+    cdef:
+        int level
+        double direction = -1.0 if is_buy else 1.0
+    return [reference_price * (1.0 + direction * (spread + level * level_spread)) for level in range(levels)]
+
+
+cdef list c_level_amounts(double order_amount, double level_amount, int levels):
+    cdef int level
+    return [order_amount + level_amount * level for level in range(levels)]
+
+
+cdef list c_budget_constrained_amounts(double balance, list amounts, list unit_costs):
+    """
+    Allocates the balance to the orders in sequence. Each order costs its amount times its unit cost (e.g. price plus
+    fees for buys, 1 for sells).
+
+    :return: For each order None to keep its amount, or the amount reduced to the balance left (0 once the balance is
+    exhausted)
+    """
+    cdef:
+        list result = []
+        double amount
+        double unit_cost
+        double cost
+        Py_ssize_t index
+    for index in range(len(amounts)):
+        amount = amounts[index]
+        unit_cost = unit_costs[index]
+        cost = amount * unit_cost
+        if balance < cost * (1 - BUDGET_TOLERANCE):
+            result.append(balance / unit_cost)
+            balance = 0
+        elif balance <= 0:
+            result.append(0.0)
+        else:
+            result.append(None)
+            balance = max(balance - cost, 0.0)
+    return result
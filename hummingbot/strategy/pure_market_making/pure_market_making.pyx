@@ -17,6 +17,13 @@ from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.asset_price_delegate cimport AssetPriceDelegate
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.hanging_orders_tracker import CreatedPairOfOrders, HangingOrdersTracker
+from hummingbot.strategy.market_making_pricing cimport (
+    c_budget_constrained_amounts,
+    c_level_amounts,
+    c_spread_level_prices,
+    c_to_decimal,
+    c_to_decimal_round_down,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -802,20 +809,23 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
+            # The level prices and sizes are calculated in double precision, and converted to Decimal to be quantized
+            sizes = c_level_amounts(float(self._order_amount), float(self._order_level_amount),
+                                    max(self._buy_levels, self._sell_levels))
             if not buy_reference_price.is_nan():
+                prices = c_spread_level_prices(float(buy_reference_price), float(self._bid_spread),
+                                               float(self._order_level_spread), self._buy_levels, True)
                 for level in range(0, self._buy_levels):
-                    price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                    price = market.c_quantize_order_price(self.trading_pair, c_to_decimal(prices[level]))
+                    size = market.c_quantize_order_amount(self.trading_pair, c_to_decimal(sizes[level]))
                     if size > 0:
                         buys.append(PriceSize(price, size))
             if not sell_reference_price.is_nan():
+                prices = c_spread_level_prices(float(sell_reference_price), float(self._ask_spread),
+                                               float(self._order_level_spread), self._sell_levels, False)
                 for level in range(0, self._sell_levels):
-                    price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
+                    price = market.c_quantize_order_price(self.trading_pair, c_to_decimal(prices[level]))
+                    size = market.c_quantize_order_amount(self.trading_pair, c_to_decimal(sizes[level]))
                     if size > 0:
                         sells.append(PriceSize(price, size))
 
@@ -930,42 +940,35 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_apply_budget_constraint(self, object proposal):
         cdef:
             ExchangeBase market = self._market_info.market
-            object quote_size
-            object base_size
-            object adjusted_amount
+            list unit_costs = []
+            list adjusted_amounts
 
         base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
 
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
                                        buy.size, buy.price)
-            quote_size = buy.size * buy.price * (Decimal(1) + buy_fee.percent)
-
-            # Adjust buy order size to use remaining balance if less than the order amount
-            if quote_balance < quote_size:
-                adjusted_amount = quote_balance / (buy.price * (Decimal("1") + buy_fee.percent))
-                adjusted_amount = market.c_quantize_order_amount(self.trading_pair, adjusted_amount)
-                buy.size = adjusted_amount
-                quote_balance = s_decimal_zero
-            elif quote_balance == s_decimal_zero:
-                buy.size = s_decimal_zero
-            else:
-                quote_balance -= quote_size
+            unit_costs.append(float(buy.price) * (1 + float(buy_fee.percent)))
+
+        # Adjust buy order sizes to use remaining balance if less than the order amount
+        adjusted_amounts = c_budget_constrained_amounts(float(quote_balance),
+                                                        [float(buy.size) for buy in proposal.buys],
+                                                        unit_costs)
+        for buy, adjusted_amount in zip(proposal.buys, adjusted_amounts):
+            if adjusted_amount is not None:
+                buy.size = market.c_quantize_order_amount(self.trading_pair,
+                                                          c_to_decimal_round_down(adjusted_amount))
 
         proposal.buys = [o for o in proposal.buys if o.size > 0]
 
-        for sell in proposal.sells:
-            base_size = sell.size
-
-            # Adjust sell order size to use remaining balance if less than the order amount
-            if base_balance < base_size:
-                adjusted_amount = market.c_quantize_order_amount(self.trading_pair, base_balance)
-                sell.size = adjusted_amount
-                base_balance = s_decimal_zero
-            elif base_balance == s_decimal_zero:
-                sell.size = s_decimal_zero
-            else:
-                base_balance -= base_size
+        # Adjust sell order sizes to use remaining balance if less than the order amount
+        adjusted_amounts = c_budget_constrained_amounts(float(base_balance),
+                                                        [float(sell.size) for sell in proposal.sells],
+                                                        [1.0] * len(proposal.sells))
+        for sell, adjusted_amount in zip(proposal.sells, adjusted_amounts):
+            if adjusted_amount is not None:
+                sell.size = market.c_quantize_order_amount(self.trading_pair,
+                                                           c_to_decimal_round_down(adjusted_amount))
 
         proposal.sells = [o for o in proposal.sells if o.size > 0]
 
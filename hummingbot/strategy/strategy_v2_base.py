@@ -36,6 +36,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.utils.latency_tracker import LatencyTracker
 
 
 class StrategyV2ConfigBase(BaseClientModel):
@@ -191,6 +192,10 @@ class StrategyV2Base(ScriptStrategyBase):
         self.controllers: Dict[str, ControllerBase] = {}
         self.controller_reports: Dict[str, Dict] = {}
 
+        # Time spent per tick and in the controller reports update
+        self.tick_latency = LatencyTracker()
+        self.reports_latency = LatencyTracker()
+
         # Initialize the market data provider and executor orchestrator
         self.market_data_provider = MarketDataProvider(connectors)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
@@ -303,8 +308,9 @@ class StrategyV2Base(ScriptStrategyBase):
         """
         Update the unified controller reports and publish the updates to the active controllers.
         """
+        start = self.reports_latency.start()
         try:
-            # Get all reports in a single call and store them
+            # Get all reports in a single call and store them (only executors that changed are refreshed)
             self.controller_reports = self.executor_orchestrator.get_all_reports()
 
             # Update each controller with its specific data
@@ -315,6 +321,7 @@ class StrategyV2Base(ScriptStrategyBase):
                 controller.executors_update_event.set()
         except Exception as e:
             self.logger().error(f"Error updating controller reports: {e}", exc_info=True)
+        self.reports_latency.stop(start)
 
     @staticmethod
     def is_perpetual(connector: str) -> bool:
@@ -333,12 +340,14 @@ class StrategyV2Base(ScriptStrategyBase):
             self._pub = None
 
     def on_tick(self):
+        start = self.tick_latency.start()
         self.update_executors_info()
         self.update_controllers_configs()
         if self.market_data_provider.ready and not self._is_stop_triggered:
             executor_actions: List[ExecutorAction] = self.determine_executor_actions()
             for action in executor_actions:
                 self.executor_orchestrator.execute_action(action)
+        self.tick_latency.stop(start)
 
     def determine_executor_actions(self) -> List[ExecutorAction]:
         """
@@ -523,4 +532,6 @@ class StrategyV2Base(ScriptStrategyBase):
             performance_df = pd.DataFrame(performance_data)
             lines.append(format_df_for_printout(performance_df, table_format="psql", index=False))
 
+        lines.extend(["", f"  Tick latency: {self.tick_latency.format()}",
+                      f"  Reports latency: {self.reports_latency.format()}"])
         return "\n".join(lines)
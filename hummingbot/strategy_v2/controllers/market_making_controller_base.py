@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from pydantic import Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
@@ -228,6 +228,35 @@ class MarketMakingControllerConfigBase(ControllerConfigBase):
         return markets.add_or_update(self.connector_name, self.trading_pair)
 
 
+class MarketMakingLevelsPlan:
+    """
+    The levels of a market making controller with their spreads and amounts in quote already converted to Decimal, so
+    the price ladder of each tick only applies the reference price and the spread multiplier.
+    """
+
+    def __init__(self, config: MarketMakingControllerConfigBase, key: tuple,
+                 level_id_from_side: Callable[[TradeType, int], str]):
+        self.key = key
+        self.level_ids: List[str] = []
+        self.spreads: List[Decimal] = []
+        # -1 for buy levels (below the reference price) and 1 for sell levels
+        self.side_multipliers: List[Decimal] = []
+        self.amounts_quote: List[Decimal] = []
+        for trade_type, side_multiplier in ((TradeType.BUY, Decimal("-1")), (TradeType.SELL, Decimal("1"))):
+            spreads, amounts_quote = config.get_spreads_and_amounts_in_quote(trade_type)
+            for level, (spread, amount_quote) in enumerate(zip(spreads, amounts_quote)):
+                self.level_ids.append(level_id_from_side(trade_type, level))
+                self.spreads.append(Decimal(spread))
+                self.side_multipliers.append(side_multiplier)
+                self.amounts_quote.append(Decimal(amount_quote))
+        self.level_index: Dict[str, int] = {level_id: index for index, level_id in enumerate(self.level_ids)}
+
+    @staticmethod
+    def key_for_config(config: MarketMakingControllerConfigBase) -> tuple:
+        return (tuple(config.buy_spreads), tuple(config.sell_spreads), tuple(config.buy_amounts_pct or ()),
+                tuple(config.sell_amounts_pct or ()), config.total_amount_quote)
+
+
 class MarketMakingControllerBase(ControllerBase):
     """
     This class represents the base class for a market making controller.
@@ -236,6 +265,9 @@ class MarketMakingControllerBase(ControllerBase):
     def __init__(self, config: MarketMakingControllerConfigBase, *args, **kwargs):
         super().__init__(config, *args, **kwargs)
         self.config = config
+        self._levels_plan: Optional[MarketMakingLevelsPlan] = None
+        self._price_ladder_key: Optional[tuple] = None
+        self._price_ladder: List[Tuple[Decimal, Decimal]] = []
         self.market_data_provider.initialize_rate_sources([ConnectorPair(
             connector_name=config.connector_name, trading_pair=config.trading_pair)])
 
@@ -276,7 +308,7 @@ class MarketMakingControllerBase(ControllerBase):
             executors=self.executors_info,
             filter_func=lambda x: x.is_active or (x.close_type == CloseType.STOP_LOSS and self.market_data_provider.time() - x.close_timestamp < self.config.cooldown_time)
         )
-        working_levels_ids = [executor.custom_info["level_id"] for executor in working_levels]
+        working_levels_ids = {executor.custom_info["level_id"] for executor in working_levels}
         return self.get_not_active_levels_ids(working_levels_ids)
 
     def stop_actions_proposal(self) -> List[ExecutorAction]:
@@ -320,32 +352,67 @@ class MarketMakingControllerBase(ControllerBase):
         """
         raise NotImplementedError
 
+    @property
+    def levels_plan(self) -> MarketMakingLevelsPlan:
+        """
+        The plan of the levels configured, rebuilt only when the spreads or the amounts of the config change.
+        """
+        key = MarketMakingLevelsPlan.key_for_config(self.config)
+        if self._levels_plan is None or self._levels_plan.key != key:
+            self._levels_plan = MarketMakingLevelsPlan(self.config, key, self.get_level_id_from_side)
+        return self._levels_plan
+
     def get_price_and_amount(self, level_id: str) -> Tuple[Decimal, Decimal]:
         """
         Get the spread and amount in quote for a given level id.
         """
-        level = self.get_level_from_level_id(level_id)
-        trade_type = self.get_trade_type_from_level_id(level_id)
-        spreads, amounts_quote = self.config.get_spreads_and_amounts_in_quote(trade_type)
+        plan = self.levels_plan
+        level_index = plan.level_index.get(level_id)
+        if level_index is None:
+            raise IndexError(f"Level {level_id} is not configured.")
+        order_price, amount = self.get_price_ladder(plan)[level_index]
+
+        # 安全检查：防止除以0
+        if order_price == 0:
+            spread_in_pct = plan.spreads[level_index] * Decimal(self.processed_data["spread_multiplier"])
+            raise ValueError(f"Order price is 0 for {level_id}, reference_price={self.get_reference_price()}, "
+                             f"spread_in_pct={spread_in_pct}")
+        return order_price, amount
+
+    def get_reference_price(self) -> Decimal:
+        """
+        Get the reference price of the processed data, or the current mid price when the reference price is 0.
+        """
         reference_price = Decimal(self.processed_data["reference_price"])
-        
         # 安全检查：如果reference_price为0，使用当前市场价格
         if reference_price == 0:
-            from hummingbot.core.data_type.common import PriceType
             reference_price = Decimal(self.market_data_provider.get_price_by_type(
                 self.config.connector_name, self.config.trading_pair, PriceType.MidPrice))
             if reference_price == 0:
                 raise ValueError(f"Reference price is 0 and cannot get market price for {self.config.trading_pair}")
-        
-        spread_in_pct = Decimal(spreads[int(level)]) * Decimal(self.processed_data["spread_multiplier"])
-        side_multiplier = Decimal("-1") if trade_type == TradeType.BUY else Decimal("1")
-        order_price = reference_price * (1 + side_multiplier * spread_in_pct)
-        
-        # 安全检查：防止除以0
-        if order_price == 0:
-            raise ValueError(f"Order price is 0 for {level_id}, reference_price={reference_price}, spread_in_pct={spread_in_pct}")
-        
-        return order_price, Decimal(amounts_quote[int(level)]) / order_price
+        return reference_price
+
+    def get_price_ladder(self, plan: MarketMakingLevelsPlan) -> List[Tuple[Decimal, Decimal]]:
+        """
+        Get the order price and amount of every level of the plan (in the order of its level ids). The ladder is only
+        recalculated when the reference price or the spread multiplier change.
+        """
+        processed_reference_price = Decimal(self.processed_data["reference_price"])
+        spread_multiplier = Decimal(self.processed_data["spread_multiplier"])
+        ladder_key = (plan.key, processed_reference_price, spread_multiplier)
+        if ladder_key == self._price_ladder_key:
+            return self._price_ladder
+
+        reference_price = self.get_reference_price()
+        ladder = []
+        for spread, side_multiplier, amount_quote in zip(plan.spreads, plan.side_multipliers, plan.amounts_quote):
+            order_price = reference_price * (1 + side_multiplier * (spread * spread_multiplier))
+            ladder.append((order_price, amount_quote / order_price if order_price != 0 else Decimal("0")))
+        # A ladder based on the market price (fallback for a missing reference price) is not reused
+        if reference_price == processed_reference_price:
+            self._price_ladder_key = ladder_key
+            self._price_ladder = ladder
+        return ladder
 
     def get_level_id_from_side(self, trade_type: TradeType, level: int) -> str:
         """
@@ -363,11 +430,8 @@ class MarketMakingControllerBase(ControllerBase):
         """
         Get the levels to execute based on the current state of the controller.
         """
-        buy_ids_missing = [self.get_level_id_from_side(TradeType.BUY, level) for level in range(len(self.config.buy_spreads))
-                           if self.get_level_id_from_side(TradeType.BUY, level) not in active_levels_ids]
-        sell_ids_missing = [self.get_level_id_from_side(TradeType.SELL, level) for level in range(len(self.config.sell_spreads))
-                            if self.get_level_id_from_side(TradeType.SELL, level) not in active_levels_ids]
-        return buy_ids_missing + sell_ids_missing
+        active_levels_ids = set(active_levels_ids)
+        return [level_id for level_id in self.levels_plan.level_ids if level_id not in active_levels_ids]
 
     def check_position_rebalance(self) -> Optional[CreateExecutorAction]:
         """
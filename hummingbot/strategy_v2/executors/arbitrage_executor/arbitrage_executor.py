@@ -178,6 +178,13 @@ class ArbitrageExecutor(ExecutorBase):
             else:
                 self.check_order_status()
 
+    def register_price_triggers(self):
+        if self.config.price_trigger_pct is not None:
+            for connector_name, trading_pair in (self.buying_market, self.selling_market):
+                self.subscribe_to_price_updates(connector_name, trading_pair, self.config.price_trigger_pct,
+                                                vwap_amount=self.order_amount,
+                                                min_trigger_interval=self.config.min_trigger_interval)
+
     def early_stop(self, keep_position: bool = False):
         self.close_type = CloseType.EARLY_STOP
         self.stop()
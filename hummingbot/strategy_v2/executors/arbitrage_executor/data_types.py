@@ -11,3 +11,6 @@ class ArbitrageExecutorConfig(ExecutorConfigBase):
     order_amount: Decimal
     min_profitability: Decimal
     gas_conversion_price: Optional[Decimal] = None
+    # Relative order book move that runs the control task immediately (None: only every update interval)
+    price_trigger_pct: Optional[Decimal] = None
+    min_trigger_interval: float = 0.05
@@ -1,11 +1,13 @@
 from decimal import Decimal
-from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
+from hummingbot.core.data_type.order_book_price_subscription import OrderBookPriceSubscription
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
@@ -47,15 +49,22 @@ class ExecutorBase(RunnableBase):
         self._held_position_orders = []  # Keep track of orders that become held positions
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
-
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        # Each subscription with the function removing it from the order book (or from the order book tracker)
+        self._price_subscriptions: List[Tuple[Callable[[OrderBookPriceSubscription], None],
+                                              OrderBookPriceSubscription]] = []
+
+        # Event forwarders for different order events (every forwarded event bumps the state version)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(
+            self._state_changing(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(
+            self._state_changing(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._state_changing(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            self._state_changing(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            self._state_changing(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._state_changing(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(self._state_changing(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -131,6 +140,28 @@ class ExecutorBase(RunnableBase):
         ei.net_pnl_pct = ei.net_pnl_pct if not ei.net_pnl_pct.is_nan() else Decimal("0")
         return ei
 
+    def state_fingerprint(self) -> Tuple:
+        """
+        Returns the status, close type and PnL related values of the executor, so that control task iterations that
+        leave them unchanged do not bump the state version.
+        """
+        values = (self.net_pnl_quote, self.net_pnl_pct, self.cum_fees_quote, self.filled_amount_quote)
+        # NaN never compares equal, so map it to None to keep unchanged NaN values from bumping the version
+        return (self._status, self.close_type) + tuple(value if value == value else None for value in values)
+
+    def _state_changing(self, handler: Callable) -> Callable:
+        """
+        Wraps an order event handler so that every processed event bumps the state version, letting the orchestrator
+        refresh the executor info only for executors that changed.
+
+        :param handler: The event handler.
+        :return: The wrapped handler.
+        """
+        def forward(event_tag: int, market: ConnectorBase, event):
+            self.mark_state_changed()
+            handler(event_tag, market, event)
+        return forward
+
     def get_custom_info(self) -> Dict:
         """
         Returns the custom info of the executor. Returns an empty dictionary by default, and can be reimplemented
@@ -161,6 +192,7 @@ class ExecutorBase(RunnableBase):
         """
         super().start()
         self.register_events()
+        self.register_price_triggers()
 
     def stop(self):
         """
@@ -169,6 +201,7 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        self.unregister_price_triggers()
 
     async def on_start(self):
         """
@@ -259,6 +292,59 @@ class ExecutorBase(RunnableBase):
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
 
+    def register_price_triggers(self):
+        """
+        Subscribes to the order books whose moves should run the control task immediately instead of waiting for the
+        next update interval. Executors supporting it override this method and call `subscribe_to_price_updates`.
+        """
+        pass
+
+    def subscribe_to_price_updates(self, connector_name: str, trading_pair: str, threshold_pct: Decimal,
+                                   vwap_amount: Decimal = Decimal("0"), min_trigger_interval: float = 0.0):
+        """
+        Triggers the control task when the best bid/ask (or the VWAP for `vwap_amount`) of the order book moves by more
+        than `threshold_pct`. Connectors without order book (AMM) are skipped. When the order book of the pair does not
+        exist yet (the connector is starting), the subscription is attached by the order book tracker once the book is
+        created; connectors without order book tracker skip the pair.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair.
+        :param threshold_pct: The relative price move that triggers the control task.
+        :param vwap_amount: When positive, track the VWAP for this amount instead of the best prices.
+        :param min_trigger_interval: The minimum time between two triggered control task runs, in seconds.
+        """
+        if self.is_amm_connector(exchange=connector_name):
+            return
+        connector = self.connectors[connector_name]
+        try:
+            order_book = connector.get_order_book(trading_pair)
+        except ValueError:
+            order_book_tracker = getattr(connector, "order_book_tracker", None)
+            if not isinstance(order_book_tracker, OrderBookTracker):
+                self.logger().warning(f"No order book for {trading_pair} on {connector_name} yet. "
+                                      f"The price updates of {trading_pair} will not trigger the control task.")
+                return
+            subscription = order_book_tracker.subscribe_price_updates(
+                trading_pair, self._on_price_update, float(threshold_pct), float(vwap_amount))
+            self._price_subscriptions.append(
+                (partial(order_book_tracker.unsubscribe_price_updates, trading_pair), subscription))
+        else:
+            subscription = order_book.add_price_subscription(
+                self._on_price_update, float(threshold_pct), float(vwap_amount))
+            self._price_subscriptions.append((order_book.remove_price_subscription, subscription))
+        self.enable_triggers(min_trigger_interval)
+
+    def unregister_price_triggers(self):
+        """
+        Removes the order book subscriptions made with `subscribe_to_price_updates`.
+        """
+        for remove_subscription, subscription in self._price_subscriptions:
+            remove_subscription(subscription)
+        self._price_subscriptions.clear()
+
+    def _on_price_update(self, subscription: OrderBookPriceSubscription):
+        self.trigger_control_task()
+
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
         Adjusts the order candidates based on the budget checker of the specified exchange.
@@ -3,7 +3,7 @@ import logging
 import uuid
 from collections import deque
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import PositionAction, PositionMode, PriceType, TradeType
@@ -38,6 +38,8 @@ class PositionHold:
         self.side = side
         # Store only client order IDs
         self.order_ids = set()
+        # Bumped whenever new orders are added, used to reuse position summaries between ticks
+        self.version = 0
 
         # Pre-calculated metrics
         self.volume_traded_quote = Decimal("0")
@@ -62,6 +64,7 @@ class PositionHold:
 
             # Add the order ID to our set
             self.order_ids.add(order_id)
+            self.version += 1
 
             # Update metrics incrementally
             executed_amount_base = Decimal(str(order.get("executed_amount_base", 0)))
@@ -132,6 +135,114 @@ class PositionHold:
             cum_fees_quote=self.cum_fees_quote)
 
 
+class ControllerReportAggregate:
+    """
+    Report of a controller maintained incrementally between ticks. Executor infos (and their contribution to the
+    performance report) are only rebuilt for executors whose state version changed since the previous update, and
+    position summaries are only recomputed when the position or its mid price changed.
+    """
+
+    def __init__(self):
+        self.executors: List[ExecutorInfo] = []
+        self.positions: List[PositionSummary] = []
+        self.positions_in_markets: List[PositionSummary] = []
+        self.performance: Optional[PerformanceReport] = None
+        self.dirty = True
+        # id(executor) -> (executor, state version, executor info)
+        self._executors: Dict[int, Tuple[object, int, ExecutorInfo]] = {}
+        self._position_summaries: Dict[int, Tuple[int, Decimal, PositionSummary]] = {}
+        self.unrealized_pnl_quote = Decimal("0")
+        self.realized_pnl_quote = Decimal("0")
+        self.volume_traded = Decimal("0")
+        self.close_type_counts: Dict[CloseType, int] = {}
+
+    def _apply_executor(self, executor_info: ExecutorInfo, sign: int):
+        """
+        Add (sign=1) or remove (sign=-1) the contribution of an executor to the aggregated performance.
+        """
+        if not executor_info.is_done:
+            self.unrealized_pnl_quote += sign * executor_info.net_pnl_quote
+        else:
+            self.realized_pnl_quote += sign * executor_info.net_pnl_quote
+            if executor_info.close_type:
+                count = self.close_type_counts.get(executor_info.close_type, 0) + sign
+                if count:
+                    self.close_type_counts[executor_info.close_type] = count
+                else:
+                    self.close_type_counts.pop(executor_info.close_type, None)
+        self.volume_traded += sign * executor_info.filled_amount_quote
+
+    def update_executors(self, executors: List) -> List[ExecutorInfo]:
+        """
+        Refresh the executor infos of the executors that changed since the last update and drop the ones that are no
+        longer active.
+
+        :param executors: The active executors of the controller.
+        :return: The executor infos refreshed in this update.
+        """
+        refreshed = []
+        executors_info = []
+        for executor in executors:
+            if not executor:
+                continue
+            key = id(executor)
+            version = executor.state_version
+            cached = self._executors.get(key)
+            if cached is None or cached[0] is not executor or cached[1] != version:
+                if cached is not None:
+                    self._apply_executor(cached[2], -1)
+                executor_info = executor.executor_info
+                self._apply_executor(executor_info, 1)
+                self._executors[key] = (executor, version, executor_info)
+                refreshed.append(executor_info)
+            else:
+                executor_info = cached[2]
+            executors_info.append(executor_info)
+
+        if len(self._executors) != len(executors_info):
+            active_keys = {id(executor) for executor in executors if executor}
+            for key in [key for key in self._executors if key not in active_keys]:
+                self._apply_executor(self._executors.pop(key)[2], -1)
+            self.dirty = True
+        if refreshed or len(executors_info) != len(self.executors):
+            self.executors = executors_info
+            self.dirty = True
+        return refreshed
+
+    def _position_summary(self, position: PositionHold, mid_price: Decimal, summaries_cache: Dict) -> PositionSummary:
+        key = (id(position), mid_price.is_nan())
+        cached = self._position_summaries.get(key)
+        if cached is not None and cached[0] == position.version and cached[1] == mid_price:
+            summary = cached[2]
+        else:
+            summary = position.get_position_summary(mid_price)
+        summaries_cache[key] = (position.version, mid_price, summary)
+        return summary
+
+    def update_positions(self, positions: List[Tuple[PositionHold, Decimal, bool]]):
+        """
+        Refresh the position summaries, recomputing only the positions whose orders or mid price changed.
+
+        :param positions: (position, mid price, is the market in the strategy markets) for each position held.
+        """
+        summaries_cache = {}
+        summaries = []
+        summaries_in_markets = []
+        for position, mid_price, in_markets in positions:
+            summary = self._position_summary(position, mid_price, summaries_cache)
+            summaries.append(summary)
+            if in_markets:
+                if mid_price.is_nan():
+                    summary = self._position_summary(position, Decimal("0"), summaries_cache)
+                summaries_in_markets.append(summary)
+        if (len(summaries) != len(self.positions) or len(summaries_in_markets) != len(self.positions_in_markets) or
+                any(a is not b for a, b in zip(summaries_in_markets, self.positions_in_markets))):
+            self.dirty = True
+        self._position_summaries = summaries_cache
+        self.positions = summaries
+        self.positions_in_markets = summaries_in_markets
+
+
 class ExecutorOrchestrator:
     """
     Orchestrator for various executors.
@@ -165,6 +276,7 @@ class ExecutorOrchestrator:
         self.positions_held = {}
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
+        self.report_aggregates: Dict[str, ControllerReportAggregate] = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
         self._initialize_cached_performance()
 
@@ -208,6 +320,8 @@ class ExecutorOrchestrator:
         Update the cached performance for a specific controller with an executor's information.
         """
         report = self.cached_performance[controller_id]
+        if controller_id in self.report_aggregates:
+            self.report_aggregates[controller_id].dirty = True
         report.realized_pnl_quote += executor_info.net_pnl_quote
         report.volume_traded += executor_info.filled_amount_quote
         if executor_info.close_type:
@@ -416,6 +530,7 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor ID {executor_id} not found for controller {controller_id}.")
             return
         executor.early_stop(action.keep_position)
+        executor.mark_state_changed()
 
     def _update_positions_from_done_executors(self):
         """
@@ -435,29 +550,33 @@ class ExecutorOrchestrator:
             if not executors_to_process:
                 continue
 
-            positions = self.positions_held.get(controller_id, [])
-
             for executor in executors_to_process:
-                executor_info = executor.executor_info
-                self.executors_ids_position_held.append(executor_info.config.id)
+                self._add_position_from_executor(controller_id, executor.executor_info)
 
-                # Determine position side (handling perpetual markets)
-                position_side = self._determine_position_side(executor_info)
+    def _add_position_from_executor(self, controller_id: str, executor_info: ExecutorInfo):
+        """
+        Add the held position orders of a done executor to the matching position (or a new one).
+        """
+        positions = self.positions_held.setdefault(controller_id, [])
+        self.executors_ids_position_held.append(executor_info.config.id)
 
-                # Find or create position
-                existing_position = self._find_existing_position(positions, executor_info, position_side)
+        # Determine position side (handling perpetual markets)
+        position_side = self._determine_position_side(executor_info)
 
-                if existing_position:
-                    existing_position.add_orders_from_executor(executor_info)
-                else:
-                    # Create new position
-                    position = PositionHold(
-                        executor_info.connector_name,
-                        executor_info.trading_pair,
-                        position_side if position_side else executor_info.config.side
-                    )
-                    position.add_orders_from_executor(executor_info)
-                    positions.append(position)
+        # Find or create position
+        existing_position = self._find_existing_position(positions, executor_info, position_side)
+
+        if existing_position:
+            existing_position.add_orders_from_executor(executor_info)
+        else:
+            # Create new position
+            position = PositionHold(
+                executor_info.connector_name,
+                executor_info.trading_pair,
+                position_side if position_side else executor_info.config.side
+            )
+            position.add_orders_from_executor(executor_info)
+            positions.append(position)
 
     def _determine_position_side(self, executor_info: ExecutorInfo) -> Optional[TradeType]:
         """
@@ -552,28 +671,84 @@ class ExecutorOrchestrator:
         """
         Generate a unified report containing executors, positions, and performance for all controllers.
         Returns a dictionary with controller_id as key and a dict containing all reports as value.
-        """
-        # Update any pending position holds from done executors
-        self._update_positions_from_done_executors()
-
-        # Generate all reports
-        executors_report = self.get_executors_report()
-        positions_report = self.get_positions_report()
 
+        Reports are maintained incrementally: only executors whose state version changed since the previous call are
+        refreshed, and the performance report is only rebuilt when one of its inputs changed.
+        """
         # Get all controller IDs
         all_controller_ids = set(list(self.active_executors.keys()) +
                                  list(self.positions_held.keys()) +
                                  list(self.cached_performance.keys()))
-
-        # Use dict comprehension to compile reports for each controller
-        return {
-            controller_id: {
-                "executors": executors_report.get(controller_id, []),
-                "positions": positions_report.get(controller_id, []),
-                "performance": self.generate_performance_report(controller_id)
+        for controller_id in [controller_id for controller_id in self.report_aggregates
+                              if controller_id not in all_controller_ids]:
+            del self.report_aggregates[controller_id]
+
+        reports = {}
+        for controller_id in all_controller_ids:
+            aggregate = self.report_aggregates.get(controller_id)
+            if aggregate is None:
+                aggregate = self.report_aggregates[controller_id] = ControllerReportAggregate()
+
+            refreshed = aggregate.update_executors(self.active_executors.get(controller_id, []))
+            # Update any pending position holds from executors that finished since the last report
+            for executor_info in refreshed:
+                if (executor_info.is_done and executor_info.close_type == CloseType.POSITION_HOLD and
+                        executor_info.config.id not in self.executors_ids_position_held):
+                    self._add_position_from_executor(controller_id, executor_info)
+
+            aggregate.update_positions([
+                (position,
+                 self.strategy.market_data_provider.get_price_by_type(
+                     position.connector_name, position.trading_pair, PriceType.MidPrice),
+                 self._is_in_strategy_markets(position))
+                for position in self.positions_held.get(controller_id, [])
+            ])
+            if aggregate.dirty or aggregate.performance is None:
+                aggregate.performance = self._build_performance_report(controller_id, aggregate)
+                aggregate.dirty = False
+
+            reports[controller_id] = {
+                "executors": aggregate.executors,
+                "positions": aggregate.positions,
+                "performance": aggregate.performance,
             }
-            for controller_id in all_controller_ids
-        }
+        return reports
+
+    def _is_in_strategy_markets(self, position: PositionHold) -> bool:
+        return (position.connector_name in self.strategy.markets and
+                position.trading_pair in self.strategy.markets.get(position.connector_name, set()))
+
+    def _build_performance_report(self, controller_id: str, aggregate: ControllerReportAggregate) -> PerformanceReport:
+        """
+        Build the performance report of a controller from the cached (stored) performance and its report aggregate.
+        """
+        report = PerformanceReport()
+        cached_report = self.cached_performance.get(controller_id, PerformanceReport())
+
+        report.realized_pnl_quote = cached_report.realized_pnl_quote + aggregate.realized_pnl_quote
+        report.unrealized_pnl_quote = aggregate.unrealized_pnl_quote
+        report.volume_traded = cached_report.volume_traded + aggregate.volume_traded
+        report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
+        for close_type, count in aggregate.close_type_counts.items():
+            report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + count
+
+        for position_summary in aggregate.positions_in_markets:
+            report.realized_pnl_quote += position_summary.realized_pnl_quote - position_summary.cum_fees_quote
+            report.volume_traded += position_summary.volume_traded_quote
+            report.unrealized_pnl_quote += position_summary.unrealized_pnl_quote
+        report.positions_summary = aggregate.positions_in_markets
+        return self._finalize_performance_report(report)
+
+    @staticmethod
+    def _finalize_performance_report(report: PerformanceReport) -> PerformanceReport:
+        """
+        Calculate the global and individual PNL values of a report.
+        """
+        report.global_pnl_quote = report.unrealized_pnl_quote + report.realized_pnl_quote
+        report.global_pnl_pct = (report.global_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
+        report.unrealized_pnl_pct = (report.unrealized_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
+        report.realized_pnl_pct = (report.realized_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
+        return report
 
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
         # Create a new report starting from cached base values
@@ -622,12 +797,4 @@ class ExecutorOrchestrator:
         # Set the positions summary (don't use dynamic attribute)
         report.positions_summary = positions_summary
 
-        # Calculate global PNL values
-        report.global_pnl_quote = report.unrealized_pnl_quote + report.realized_pnl_quote
-        report.global_pnl_pct = (report.global_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
-
-        # Calculate individual PNL percentages
-        report.unrealized_pnl_pct = (report.unrealized_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
-        report.realized_pnl_pct = (report.realized_pnl_quote / report.volume_traded) * 100 if report.volume_traded != 0 else Decimal(0)
-
-        return report
+        return self._finalize_performance_report(report)
@@ -56,4 +56,7 @@ class PositionExecutorConfig(ExecutorConfigBase):
     leverage: int = 1
     activation_bounds: Optional[List[Decimal]] = None
     level_id: Optional[str] = None
+    # Relative order book move that runs the control task immediately (None: only every update interval)
+    price_trigger_pct: Optional[Decimal] = None
+    min_trigger_interval: float = 0.05
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -291,6 +291,18 @@ class PositionExecutor(ExecutorBase):
                                                        PriceType.BestBid))
         return take_profit_price
 
+    def register_price_triggers(self):
+        """
+        Run the control task on top of book moves so that the barriers are evaluated without waiting for the next
+        update interval.
+
+        :return: None
+        """
+        if self.config.price_trigger_pct is not None:
+            self.subscribe_to_price_updates(self.config.connector_name, self.config.trading_pair,
+                                            self.config.price_trigger_pct,
+                                            min_trigger_interval=self.config.min_trigger_interval)
+
     async def control_task(self):
         """
         This method is responsible for controlling the task based on the status of the executor.
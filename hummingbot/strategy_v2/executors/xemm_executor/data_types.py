@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Literal
+from typing import Literal, Optional
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair, ExecutorConfigBase
@@ -14,3 +14,6 @@ class XEMMExecutorConfig(ExecutorConfigBase):
     min_profitability: Decimal
     target_profitability: Decimal
     max_profitability: Decimal
+    # Relative order book move that runs the control task immediately (None: only every update interval)
+    price_trigger_pct: Optional[Decimal] = None
+    min_trigger_interval: float = 0.05
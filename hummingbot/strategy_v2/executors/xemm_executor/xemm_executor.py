@@ -129,6 +129,13 @@ class XEMMExecutor(ExecutorBase):
             self.logger().error("Not enough budget to open position.")
             self.stop()
 
+    def register_price_triggers(self):
+        # The maker price is derived from the taker VWAP for the order amount, so requote as soon as it moves
+        if self.config.price_trigger_pct is not None:
+            self.subscribe_to_price_updates(self.taker_connector, self.taker_trading_pair, self.config.price_trigger_pct,
+                                            vwap_amount=self.config.order_amount,
+                                            min_trigger_interval=self.config.min_trigger_interval)
+
     async def control_task(self):
         if self.status == RunnableStatus.RUNNING:
             await self.update_prices_and_tx_costs()
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from abc import ABC
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -28,7 +29,14 @@ class RunnableBase(ABC):
         """
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
+        self._state_version: int = 0
+        self._last_state_fingerprint = None
         self.terminated = asyncio.Event()
+        self._reactive: bool = False
+        self._min_trigger_interval: float = 0.0
+        self._trigger = asyncio.Event()
+        self._last_control_task_start: float = 0.0
+        self.triggered_runs: int = 0
 
     @property
     def status(self):
@@ -39,6 +47,55 @@ class RunnableBase(ABC):
         """
         return self._status
 
+    @property
+    def state_version(self) -> int:
+        """
+        Monotonic counter bumped whenever the state of the smart component changed (start, stop, explicit
+        `mark_state_changed` calls and control task iterations that changed the state fingerprint). Consumers can
+        compare it with a previously seen value to skip unchanged components.
+
+        :return: The current state version.
+        """
+        return self._state_version
+
+    def mark_state_changed(self):
+        """
+        Signal that the state of the smart component changed outside the control loop.
+        """
+        self._state_version += 1
+
+    def state_fingerprint(self):
+        """
+        Hashable summary of the state consumers care about, compared after every control task iteration to decide
+        whether the state version has to be bumped. Subclasses override it; the base component has none.
+
+        :return: The state fingerprint.
+        """
+        return None
+
+    def _refresh_state_version(self):
+        fingerprint = self.state_fingerprint()
+        if fingerprint != self._last_state_fingerprint:
+            self._last_state_fingerprint = fingerprint
+            self._state_version += 1
+
+    def enable_triggers(self, min_trigger_interval: float = 0.0):
+        """
+        Let `trigger_control_task` wake the control loop before the update interval elapses.
+
+        :param min_trigger_interval: The minimum time between the start of two control task runs caused by triggers,
+        in seconds. Triggers arriving while the control task runs or during this interval are coalesced into one run.
+        """
+        self._reactive = True
+        self._min_trigger_interval = min_trigger_interval
+
+    def trigger_control_task(self):
+        """
+        Request an early run of the control task (e.g. the market moved). Only effective after `enable_triggers`.
+        """
+        if self._reactive and self._status == RunnableStatus.RUNNING:
+            self._trigger.set()
+
     def start(self):
         """
         Start the control loop of the smart component.
@@ -47,6 +104,7 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
+            self._state_version += 1
             safe_ensure_future(self.control_loop())
 
     def stop(self):
@@ -56,7 +114,9 @@ class RunnableBase(ABC):
         """
         if self._status != RunnableStatus.TERMINATED:
             self._status = RunnableStatus.TERMINATED
+            self._state_version += 1
             self.terminated.set()
+            self._trigger.set()
 
     async def control_loop(self):
         """
@@ -65,14 +125,35 @@ class RunnableBase(ABC):
         """
         await self.on_start()
         while not self.terminated.is_set():
+            self._trigger.clear()
+            self._last_control_task_start = time.perf_counter()
             try:
                 await self.control_task()
+                self._refresh_state_version()
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
-                await asyncio.sleep(self.update_interval)
+                if self._reactive:
+                    await self._wait_for_trigger()
+                else:
+                    await asyncio.sleep(self.update_interval)
         self.on_stop()
 
+    async def _wait_for_trigger(self):
+        """
+        Wait for the update interval or until the control task is triggered, respecting the minimum trigger interval.
+        """
+        try:
+            await asyncio.wait_for(self._trigger.wait(), timeout=self.update_interval)
+        except asyncio.TimeoutError:
+            return
+        if self.terminated.is_set():
+            return
+        self.triggered_runs += 1
+        remaining = self._min_trigger_interval - (time.perf_counter() - self._last_control_task_start)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
     def on_stop(self):
         """
         Method to be executed when the control loop is stopped.
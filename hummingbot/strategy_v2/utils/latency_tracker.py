@@ -0,0 +1,72 @@
+import time
+from collections import deque
+from typing import Dict
+
+
+class LatencyTracker:
+    """
+    Rolling statistics of the wall-clock time spent in a recurring section of code, e.g. a strategy tick or the
+    controller reports update.
+    """
+
+    def __init__(self, window_size: int = 300):
+        """
+        :param window_size: The number of most recent samples used for the mean and percentile statistics.
+        """
+        self._samples = deque(maxlen=window_size)
+        self.last = 0.0
+        self.max = 0.0
+        self.count = 0
+
+    def start(self) -> float:
+        """
+        :return: The start time of a measurement, to be passed to `stop`.
+        """
+        return time.perf_counter()
+
+    def stop(self, start: float) -> float:
+        """
+        Record the time elapsed since `start`.
+
+        :return: The elapsed time in seconds.
+        """
+        elapsed = time.perf_counter() - start
+        self.record(elapsed)
+        return elapsed
+
+    def record(self, elapsed: float):
+        self._samples.append(elapsed)
+        self.last = elapsed
+        self.max = max(self.max, elapsed)
+        self.count += 1
+
+    @property
+    def mean(self) -> float:
+        return sum(self._samples) / len(self._samples) if self._samples else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        :param pct: The percentile in [0, 100].
+        :return: The percentile of the recent samples, in seconds.
+        """
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        :return: The statistics in milliseconds.
+        """
+        return {
+            "last_ms": self.last * 1e3,
+            "mean_ms": self.mean * 1e3,
+            "p99_ms": self.percentile(99) * 1e3,
+            "max_ms": self.max * 1e3,
+            "count": self.count,
+        }
+
+    def format(self) -> str:
+        return (f"last {self.last * 1e3:.2f}ms | mean {self.mean * 1e3:.2f}ms | "
+                f"p99 {self.percentile(99) * 1e3:.2f}ms | max {self.max * 1e3:.2f}ms")
@@ -0,0 +1,186 @@
+import math
+from collections import deque
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def align_by_timestamp(timestamps_a: np.ndarray, values_a: np.ndarray,
+                       timestamps_b: np.ndarray, values_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merges two time series on their common timestamps, e.g. the close prices of the candles of two trading pairs,
+    dropping the points missing in either of them.
+
+    :return: The common timestamps (sorted) and the values of each series at those timestamps.
+    """
+    timestamps, index_a, index_b = np.intersect1d(np.asarray(timestamps_a), np.asarray(timestamps_b),
+                                                  assume_unique=True, return_indices=True)
+    return timestamps, np.asarray(values_a)[index_a], np.asarray(values_b)[index_b]
+
+
+class RollingOLS:
+    """
+    Simple linear regression y = alpha + beta * x over a sliding window of samples, updated in O(1) per sample with
+    running (optionally exponentially weighted) sums. The sums are recomputed exactly from the window every
+    `refit_interval` updates so the floating point error of adding and removing samples does not accumulate.
+
+    The residuals of the fit have zero (weighted) mean, so the z-score of a sample is its residual divided by the
+    residual standard deviation, both available from the running sums.
+    """
+
+    def __init__(self, window_size: int, decay: float = 1.0, refit_interval: Optional[int] = None):
+        """
+        :param window_size: The number of most recent samples in the regression.
+        :param decay: The weight factor applied to the samples for each newer sample (1 for equal weights).
+        :param refit_interval: The number of updates between exact refits (the window size if not provided).
+        """
+        if window_size < 2:
+            raise ValueError("The rolling regression window needs at least two samples.")
+        if not 0 < decay <= 1:
+            raise ValueError("The decay must be in (0, 1].")
+        self._window_size = window_size
+        self._decay = decay
+        self._refit_interval = refit_interval or window_size
+        self._oldest_weight = decay ** window_size
+        self._samples = deque(maxlen=window_size)
+        self.reset()
+
+    def reset(self):
+        self._samples.clear()
+        self._updates_since_refit = 0
+        # The sums are taken around a shift (the first sample, then the mean at each refit) to limit the cancellation error of the variances
+        self._shift_x = 0.0
+        self._shift_y = 0.0
+        self._sum_w = 0.0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+        self._sum_yy = 0.0
+
+    @property
+    def window_size(self) -> int:
+        return self._window_size
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    @property
+    def ready(self) -> bool:
+        return len(self._samples) == self._window_size
+
+    @property
+    def first_sample(self) -> Optional[Tuple[float, float]]:
+        return self._samples[0] if self._samples else None
+
+    @property
+    def last_sample(self) -> Optional[Tuple[float, float]]:
+        return self._samples[-1] if self._samples else None
+
+    def update(self, x: float, y: float):
+        """
+        Adds a sample to the window, dropping the oldest one if the window is full.
+        """
+        if not self._samples:
+            self._shift_x, self._shift_y = x, y
+        if self._decay != 1:
+            self._scale_sums(self._decay)
+        if len(self._samples) == self._window_size:
+            old_x, old_y = self._samples[0]
+            self._add_to_sums(old_x, old_y, -self._oldest_weight)
+        self._samples.append((x, y))
+        self._add_to_sums(x, y, 1.0)
+        self._updates_since_refit += 1
+        if self._updates_since_refit >= self._refit_interval:
+            self.refit()
+
+    def update_last(self, x: float, y: float):
+        """
+        Replaces the newest sample, e.g. when the last candle of the window is updated before it closes.
+        """
+        if not self._samples:
+            self.update(x, y)
+            return
+        last_x, last_y = self._samples[-1]
+        self._add_to_sums(last_x, last_y, -1.0)
+        self._samples[-1] = (x, y)
+        self._add_to_sums(x, y, 1.0)
+
+    def refit(self):
+        """
+        Recomputes the sums from the samples in the window.
+        """
+        self._updates_since_refit = 0
+        if not self._samples:
+            return
+        samples = np.array(self._samples, dtype=float)
+        weights = self._decay ** np.arange(len(samples) - 1, -1, -1, dtype=float)
+        self._shift_x, self._shift_y = np.average(samples, axis=0, weights=weights)
+        x = samples[:, 0] - self._shift_x
+        y = samples[:, 1] - self._shift_y
+        self._sum_w = float(weights.sum())
+        self._sum_x = float(weights @ x)
+        self._sum_y = float(weights @ y)
+        self._sum_xx = float(weights @ (x * x))
+        self._sum_xy = float(weights @ (x * y))
+        self._sum_yy = float(weights @ (y * y))
+
+    @property
+    def beta(self) -> float:
+        var_x, cov_xy, _ = self._moments()
+        return cov_xy / var_x if var_x > 0 else math.nan
+
+    @property
+    def alpha(self) -> float:
+        if not self._samples:
+            return math.nan
+        return self._shift_y + self._sum_y / self._sum_w - self.beta * (self._shift_x + self._sum_x / self._sum_w)
+
+    @property
+    def residual_std(self) -> float:
+        """
+        The (weighted) population standard deviation of the residuals of the samples in the window.
+        """
+        var_x, cov_xy, var_y = self._moments()
+        if var_x <= 0:
+            return math.nan
+        return math.sqrt(max(var_y - cov_xy * cov_xy / var_x, 0.0))
+
+    def predict(self, x: float) -> float:
+        return self.alpha + self.beta * x
+
+    def residual(self, x: float, y: float) -> float:
+        return y - self.predict(x)
+
+    def z_score(self, x: float, y: float) -> float:
+        residual_std = self.residual_std
+        return self.residual(x, y) / residual_std if residual_std > 0 else math.nan
+
+    def _moments(self) -> Tuple[float, float, float]:
+        if not self._samples:
+            return 0.0, 0.0, 0.0
+        mean_x = self._sum_x / self._sum_w
+        mean_y = self._sum_y / self._sum_w
+        var_x = self._sum_xx / self._sum_w - mean_x * mean_x
+        cov_xy = self._sum_xy / self._sum_w - mean_x * mean_y
+        var_y = self._sum_yy / self._sum_w - mean_y * mean_y
+        return var_x, cov_xy, var_y
+
+    def _scale_sums(self, factor: float):
+        self._sum_w *= factor
+        self._sum_x *= factor
+        self._sum_y *= factor
+        self._sum_xx *= factor
+        self._sum_xy *= factor
+        self._sum_yy *= factor
+
+    def _add_to_sums(self, x: float, y: float, weight: float):
+        x -= self._shift_x
+        y -= self._shift_y
+        self._sum_w += weight
+        self._sum_x += weight * x
+        self._sum_y += weight * y
+        self._sum_xx += weight * x * x
+        self._sum_xy += weight * x * y
+        self._sum_yy += weight * y * y
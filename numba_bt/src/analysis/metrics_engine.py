@@ -0,0 +1,552 @@
+"""回测指标引擎：单次 Numba 遍历计算净值/回撤/已实现PnL/成交时间/滑点统计
+
+``analyze_performance`` 原先对整份账户日志做 roll、diff、where 等多次全长数组运算，
+订单统计再逐类过滤；账户日志达到千万行时统计耗时超过回测本身。这里把所有账户指标
+压缩到一次遍历中，状态保存在定长数组里，因此既可以一次处理整份日志，也可以在回测
+内核分块输出时增量累积（``StreamingMetrics``）。同一遍历按固定时间桶（分钟/小时/天）
+输出净值 OHLC、回撤、已实现PnL和成交量，供绘图直接使用；``downsample_indices``
+按桶保留极值点，用于大数据量曲线的绘制。
+"""
+from typing import Dict, Any, Optional
+
+import numpy as np
+from numba import njit
+
+
+MINUTE_MS = 60 * 1000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+
+# 账户遍历状态数组下标
+S_ROWS = 0               # 已处理行数
+S_FIRST_TS = 1
+S_LAST_TS = 2
+S_FIRST_EQUITY_NO_FEE = 3
+S_FIRST_EQUITY = 4
+S_LAST_EQUITY_NO_FEE = 5
+S_LAST_EQUITY = 6
+S_PEAK_EQUITY = 7
+S_MIN_DRAWDOWN = 8       # 最小回撤比例（<=0）
+S_PREV_POS = 9
+S_PREV_AVG_COST = 10
+S_PREV_CASH = 11
+S_TRADE_VALUE = 12
+S_MAKER_PNL = 13
+S_MAKER_VOLUME = 14
+S_TAKER_PNL = 15
+S_TAKER_VOLUME = 16
+S_FUNDING_FEE = 17
+S_LAST_POS = 18
+S_LAST_PRICE = 19
+S_LAST_AVG_COST = 20
+S_LAST_TAKER_FEE = 21
+S_LAST_MAKER_FEE = 22
+S_REALIZED_PNL = 23      # 累计虚拟平仓PnL（含所有成交类型）
+S_FUNDING_COUNT = 24
+S_CUR_DAY = 25           # 当前日序号（ts // DAY_MS）
+S_DAY_EQUITY = 26        # 当前日最后净值
+S_PREV_DAY_EQUITY = 27   # 上一个完整日的最后净值
+S_HAS_PREV_DAY = 28
+S_RET_COUNT = 29         # 日收益率 Welford 累积
+S_RET_MEAN = 30
+S_RET_M2 = 31
+S_RET_INVALID = 32       # 出现以0为分母的日收益率
+S_BUCKET_ID = 33         # 当前未完成时间桶序号（-1 表示无）
+N_STATE = 34
+
+# 时间桶输出列
+B_TS = 0                 # 桶起始时间戳(ms)
+B_EQUITY_OPEN = 1
+B_EQUITY_HIGH = 2
+B_EQUITY_LOW = 3
+B_EQUITY_CLOSE = 4
+B_EQUITY_NO_FEE_CLOSE = 5
+B_REALIZED_PNL = 6       # 桶结束时累计已实现PnL
+B_DRAWDOWN = 7           # 桶内最小回撤比例
+B_POSITION = 8
+B_PRICE = 9
+B_MAKER_VOLUME = 10
+B_TAKER_VOLUME = 11
+B_TRADE_COUNT = 12
+B_ROWS = 13
+N_BUCKET_COLS = 14
+
+# 订单统计分组（行）与累积量（列）
+O_ALL = 0
+O_BUY = 1
+O_SELL = 2
+O_COUNT = 0              # 有成交的订单数
+O_LIFECYCLE_SUM = 1
+O_FILL_PCT_SUM = 2
+O_SLIPPAGE_PCT_SUM = 3
+O_SLIPPAGE_VALUE_SUM = 4
+O_FINISH_ALL = 5
+O_FINISH_HIT = 6
+N_ORDER_COLS = 7
+
+
+def new_account_state() -> np.ndarray:
+    """创建账户遍历的初始状态"""
+    state = np.zeros(N_STATE, dtype=np.float64)
+    state[S_BUCKET_ID] = -1.0
+    return state
+
+
+@njit(cache=True)
+def _flush_bucket(open_bucket, bucket_out, n_out):
+    for k in range(open_bucket.shape[0]):
+        bucket_out[n_out, k] = open_bucket[k]
+    return n_out + 1
+
+
+@njit(cache=True)
+def _accounts_pass(accounts, state, bucket_ms, open_bucket, bucket_out):
+    """
+    单次遍历账户日志，更新 state 并输出已完成的时间桶
+
+    逐行语义与原 analyze_performance 一致：
+    - 净值 = cash + pos * price（+ 累计手续费列）
+    - 虚拟平仓PnL：上一行仓位与本行方向相反时 -(price - 上一行均价) * side * qty
+    - 回撤以含手续费净值的历史峰值为基准
+    - 资金费（type=6）= 上一行现金 - 本行现金
+
+    Args:
+        accounts: 账户日志块 [ts, cash, pos, avg_cost, price, qty, side, taker_fee, maker_fee, type]
+        state: 状态数组（跨块保持）
+        bucket_ms: 时间桶宽度(ms)，<=0 表示不输出时间桶
+        open_bucket: 当前未完成的时间桶（跨块保持）
+        bucket_out: 已完成时间桶的输出缓冲区
+
+    Returns:
+        本块写入 bucket_out 的桶数量
+    """
+    n_out = 0
+    use_buckets = bucket_ms > 0
+    for i in range(accounts.shape[0]):
+        ts = accounts[i, 0]
+        cash = accounts[i, 1]
+        pos = accounts[i, 2]
+        avg_cost = accounts[i, 3]
+        price = accounts[i, 4]
+        qty = accounts[i, 5]
+        side = accounts[i, 6]
+        taker_fee = accounts[i, 7]
+        maker_fee = accounts[i, 8]
+        role = accounts[i, 9]
+
+        equity_no_fee = cash + pos * price
+        equity = equity_no_fee + taker_fee + maker_fee
+
+        first_row = state[S_ROWS] == 0
+        if first_row:
+            state[S_FIRST_TS] = ts
+            state[S_FIRST_EQUITY_NO_FEE] = equity_no_fee
+            state[S_FIRST_EQUITY] = equity
+            state[S_PEAK_EQUITY] = equity
+            state[S_PREV_POS] = 0.0
+            state[S_PREV_AVG_COST] = avg_cost
+            state[S_PREV_CASH] = cash
+
+        # 回撤
+        if equity > state[S_PEAK_EQUITY]:
+            state[S_PEAK_EQUITY] = equity
+        peak = state[S_PEAK_EQUITY]
+        drawdown = (equity - peak) / peak if peak != 0 else 0.0
+        if drawdown < state[S_MIN_DRAWDOWN]:
+            state[S_MIN_DRAWDOWN] = drawdown
+
+        # 虚拟平仓PnL
+        trade_value = qty * price
+        close_pnl = 0.0
+        if side != 0 and state[S_PREV_POS] * side < 0:
+            close_pnl = -(price - state[S_PREV_AVG_COST]) * side * qty
+        state[S_REALIZED_PNL] += close_pnl
+        state[S_TRADE_VALUE] += trade_value
+        maker_value = 0.0
+        taker_value = 0.0
+        if role == 2:
+            state[S_MAKER_PNL] += close_pnl
+            state[S_MAKER_VOLUME] += trade_value
+            maker_value = trade_value
+        elif role == 1:
+            state[S_TAKER_PNL] += close_pnl
+            state[S_TAKER_VOLUME] += trade_value
+            taker_value = trade_value
+        elif role == 6:
+            state[S_FUNDING_COUNT] += 1
+            if not first_row:
+                state[S_FUNDING_FEE] += state[S_PREV_CASH] - cash
+
+        # 日度净值与日收益率（Welford，总体标准差）
+        day = np.floor(ts / 86400000.0)
+        if first_row:
+            state[S_CUR_DAY] = day
+        elif day != state[S_CUR_DAY]:
+            if state[S_HAS_PREV_DAY] == 1:
+                prev_equity = state[S_PREV_DAY_EQUITY]
+                if prev_equity == 0:
+                    state[S_RET_INVALID] = 1
+                else:
+                    daily_return = (state[S_DAY_EQUITY] - prev_equity) / prev_equity
+                    state[S_RET_COUNT] += 1
+                    delta = daily_return - state[S_RET_MEAN]
+                    state[S_RET_MEAN] += delta / state[S_RET_COUNT]
+                    state[S_RET_M2] += delta * (daily_return - state[S_RET_MEAN])
+            state[S_PREV_DAY_EQUITY] = state[S_DAY_EQUITY]
+            state[S_HAS_PREV_DAY] = 1
+            state[S_CUR_DAY] = day
+        state[S_DAY_EQUITY] = equity
+
+        # 时间桶
+        if use_buckets:
+            bucket_id = np.floor(ts / bucket_ms)
+            if bucket_id != state[S_BUCKET_ID]:
+                if state[S_BUCKET_ID] >= 0:
+                    n_out = _flush_bucket(open_bucket, bucket_out, n_out)
+                state[S_BUCKET_ID] = bucket_id
+                open_bucket[B_TS] = bucket_id * bucket_ms
+                open_bucket[B_EQUITY_OPEN] = equity
+                open_bucket[B_EQUITY_HIGH] = equity
+                open_bucket[B_EQUITY_LOW] = equity
+                open_bucket[B_DRAWDOWN] = drawdown
+                open_bucket[B_MAKER_VOLUME] = 0.0
+                open_bucket[B_TAKER_VOLUME] = 0.0
+                open_bucket[B_TRADE_COUNT] = 0.0
+                open_bucket[B_ROWS] = 0.0
+            if equity > open_bucket[B_EQUITY_HIGH]:
+                open_bucket[B_EQUITY_HIGH] = equity
+            if equity < open_bucket[B_EQUITY_LOW]:
+                open_bucket[B_EQUITY_LOW] = equity
+            if drawdown < open_bucket[B_DRAWDOWN]:
+                open_bucket[B_DRAWDOWN] = drawdown
+            open_bucket[B_EQUITY_CLOSE] = equity
+            open_bucket[B_EQUITY_NO_FEE_CLOSE] = equity_no_fee
+            open_bucket[B_REALIZED_PNL] = state[S_REALIZED_PNL]
+            open_bucket[B_POSITION] = pos
+            open_bucket[B_PRICE] = price
+            open_bucket[B_MAKER_VOLUME] += maker_value
+            open_bucket[B_TAKER_VOLUME] += taker_value
+            if qty > 0:
+                open_bucket[B_TRADE_COUNT] += 1
+            open_bucket[B_ROWS] += 1
+
+        state[S_PREV_POS] = pos
+        state[S_PREV_AVG_COST] = avg_cost
+        state[S_PREV_CASH] = cash
+        state[S_LAST_TS] = ts
+        state[S_LAST_EQUITY_NO_FEE] = equity_no_fee
+        state[S_LAST_EQUITY] = equity
+        state[S_LAST_POS] = pos
+        state[S_LAST_PRICE] = price
+        state[S_LAST_AVG_COST] = avg_cost
+        state[S_LAST_TAKER_FEE] = taker_fee
+        state[S_LAST_MAKER_FEE] = maker_fee
+        state[S_ROWS] += 1
+    return n_out
+
+
+@njit(cache=True)
+def _orders_pass(orders, sums):
+    """
+    单次遍历订单统计日志，累积全部/买/卖订单的成交时间、成交率和滑点
+
+    Args:
+        orders: 订单日志块 [init_ts, lifecycle, price, side, origin_vol, finish_vol, avg_price, init_price, ...]
+        sums: (3, N_ORDER_COLS) 累积量（跨块保持）
+    """
+    for i in range(orders.shape[0]):
+        finish_volume = orders[i, 5]
+        if finish_volume <= 0:
+            continue
+        lifecycle = orders[i, 1]
+        side = orders[i, 3]
+        origin_volume = orders[i, 4]
+        avg_price = orders[i, 6]
+        init_price = orders[i, 7]
+
+        fill_pct = finish_volume / origin_volume if origin_volume != 0 else 0.0
+        slippage_pct = 0.0
+        if avg_price != 0:
+            slippage_pct = side * (init_price - avg_price) / avg_price
+        slippage_value = slippage_pct * finish_volume * avg_price
+
+        if side == 1:
+            group = O_BUY
+        elif side == -1:
+            group = O_SELL
+        else:
+            group = -1
+        for g in (O_ALL, group):
+            if g < 0:
+                continue
+            sums[g, O_COUNT] += 1
+            sums[g, O_LIFECYCLE_SUM] += lifecycle
+            sums[g, O_FILL_PCT_SUM] += fill_pct
+            sums[g, O_SLIPPAGE_PCT_SUM] += slippage_pct
+            sums[g, O_SLIPPAGE_VALUE_SUM] += slippage_value
+            if fill_pct > 0.9995:
+                sums[g, O_FINISH_ALL] += 1
+            if fill_pct > 0.0005:
+                sums[g, O_FINISH_HIT] += 1
+
+
+@njit(cache=True)
+def _minmax_indices(values, n_buckets, out):
+    """
+    按下标等分为 n_buckets 段，每段保留首、尾、最小值和最大值所在下标（已排序、去重）
+
+    Returns:
+        写入 out 的下标数量
+    """
+    n = values.shape[0]
+    n_out = 0
+    last = -1
+    for b in range(n_buckets):
+        start = b * n // n_buckets
+        end = (b + 1) * n // n_buckets
+        if end <= start:
+            continue
+        min_idx = start
+        max_idx = start
+        for j in range(start + 1, end):
+            v = values[j]
+            if v < values[min_idx]:
+                min_idx = j
+            if v > values[max_idx]:
+                max_idx = j
+        lo = min_idx if min_idx < max_idx else max_idx
+        hi = max_idx if min_idx < max_idx else min_idx
+        for idx in (start, lo, hi, end - 1):
+            if idx > last:
+                out[n_out] = idx
+                n_out += 1
+                last = idx
+    return n_out
+
+
+def downsample_indices(max_points: int, *series: np.ndarray) -> np.ndarray:
+    """
+    绘图降采样：返回需要绘制的行下标
+
+    每个序列按下标等分成若干段，每段保留首尾和极值点，多个序列的下标取并集，
+    因此回撤、价格尖峰等极值在降采样后仍然可见。数据量不超过 max_points 时返回全部下标。
+
+    Args:
+        max_points: 每个序列的目标点数
+        *series: 等长的一维数组
+
+    Returns:
+        升序 int64 下标数组
+    """
+    n = len(series[0]) if series else 0
+    if n <= max_points or max_points <= 0:
+        return np.arange(n, dtype=np.int64)
+    n_buckets = max(max_points // 4, 1)
+    indices = None
+    for values in series:
+        out = np.empty(n_buckets * 4, dtype=np.int64)
+        count = _minmax_indices(np.ascontiguousarray(values, dtype=np.float64), n_buckets, out)
+        indices = out[:count] if indices is None else np.union1d(indices, out[:count])
+    return indices
+
+
+def resample_buckets(buckets: np.ndarray, bucket_ms: float) -> np.ndarray:
+    """
+    把细粒度时间桶（如分钟）合并为更粗的时间桶（如小时、天）
+
+    Args:
+        buckets: ``StreamingMetrics.buckets()`` 输出
+        bucket_ms: 目标桶宽度(ms)，需为原桶宽度的整数倍
+
+    Returns:
+        与输入同列格式的时间桶数组
+    """
+    if buckets.shape[0] == 0:
+        return buckets.copy()
+    group_ids = np.floor(buckets[:, B_TS] / bucket_ms)
+    starts = np.flatnonzero(np.r_[True, group_ids[1:] != group_ids[:-1]])
+    ends = np.r_[starts[1:], buckets.shape[0]] - 1
+
+    result = np.empty((len(starts), N_BUCKET_COLS), dtype=np.float64)
+    result[:, B_TS] = group_ids[starts] * bucket_ms
+    result[:, B_EQUITY_OPEN] = buckets[starts, B_EQUITY_OPEN]
+    result[:, B_EQUITY_HIGH] = np.maximum.reduceat(buckets[:, B_EQUITY_HIGH], starts)
+    result[:, B_EQUITY_LOW] = np.minimum.reduceat(buckets[:, B_EQUITY_LOW], starts)
+    result[:, B_DRAWDOWN] = np.minimum.reduceat(buckets[:, B_DRAWDOWN], starts)
+    for col in (B_EQUITY_CLOSE, B_EQUITY_NO_FEE_CLOSE, B_REALIZED_PNL, B_POSITION, B_PRICE):
+        result[:, col] = buckets[ends, col]
+    for col in (B_MAKER_VOLUME, B_TAKER_VOLUME, B_TRADE_COUNT, B_ROWS):
+        result[:, col] = np.add.reduceat(buckets[:, col], starts)
+    return result
+
+
+class StreamingMetrics:
+    """
+    可增量累积的回测指标
+
+    回测内核分块输出账户/订单日志时，逐块调用 ``update_accounts`` / ``update_orders``，
+    结束后用 ``account_summary`` / ``order_summary`` 读取结果；一次性处理整份日志时
+    只调用一次即可。中位数类订单指标需要原始值，``update_orders`` 会保留有成交订单的
+    成交时间和滑点两列。
+    """
+
+    def __init__(self, bucket_ms: float = MINUTE_MS):
+        """
+        Args:
+            bucket_ms: 时间桶宽度(ms)，<=0 表示不生成时间桶
+        """
+        self.bucket_ms = float(bucket_ms)
+        self.state = new_account_state()
+        self.open_bucket = np.zeros(N_BUCKET_COLS, dtype=np.float64)
+        self.order_sums = np.zeros((3, N_ORDER_COLS), dtype=np.float64)
+        self._bucket_chunks = []
+        self._order_chunks = []
+        self._filled_chunks = []
+
+    def update_accounts(self, accounts: np.ndarray) -> None:
+        """累积一块账户日志（需按时间排序，块之间首尾相接）"""
+        if accounts.shape[0] == 0:
+            return
+        accounts = np.ascontiguousarray(accounts, dtype=np.float64)
+        if self.bucket_ms > 0:
+            first_bucket = np.floor(accounts[0, 0] / self.bucket_ms)
+            last_bucket = np.floor(accounts[-1, 0] / self.bucket_ms)
+            capacity = int(min(accounts.shape[0], last_bucket - first_bucket + 1)) + 1
+        else:
+            capacity = 0
+        bucket_out = np.empty((capacity, N_BUCKET_COLS), dtype=np.float64)
+        n_out = _accounts_pass(accounts, self.state, self.bucket_ms, self.open_bucket, bucket_out)
+        if n_out > 0:
+            self._bucket_chunks.append(bucket_out[:n_out])
+
+    def update_orders(self, orders: np.ndarray) -> None:
+        """累积一块订单统计日志"""
+        if orders.shape[0] == 0:
+            return
+        orders = np.ascontiguousarray(orders, dtype=np.float64)
+        _orders_pass(orders, self.order_sums)
+        filled = orders[orders[:, 5] > 0]
+        self._order_chunks.append(orders[:, [0, 3, 9, 10, 11, 12]])
+        if filled.shape[0] > 0:
+            slippage_pct = np.zeros(filled.shape[0])
+            valid = filled[:, 6] != 0
+            slippage_pct[valid] = filled[valid, 3] * (filled[valid, 7] - filled[valid, 6]) / filled[valid, 6]
+            self._filled_chunks.append(np.column_stack([filled[:, 1], filled[:, 3], slippage_pct]))
+
+    @property
+    def rows(self) -> int:
+        return int(self.state[S_ROWS])
+
+    def buckets(self) -> np.ndarray:
+        """返回全部时间桶（包含当前未完成的桶）"""
+        chunks = list(self._bucket_chunks)
+        if self.bucket_ms > 0 and self.state[S_BUCKET_ID] >= 0:
+            chunks.append(self.open_bucket[np.newaxis, :].copy())
+        if not chunks:
+            return np.empty((0, N_BUCKET_COLS), dtype=np.float64)
+        return np.concatenate(chunks)
+
+    def account_summary(self) -> Dict[str, float]:
+        """账户类指标的标量汇总"""
+        state = self.state
+        # 把当前日作为最后一个日度净值计入日收益率
+        ret_count = state[S_RET_COUNT]
+        ret_mean = state[S_RET_MEAN]
+        ret_m2 = state[S_RET_M2]
+        ret_invalid = state[S_RET_INVALID] == 1
+        if state[S_HAS_PREV_DAY] == 1:
+            prev_equity = state[S_PREV_DAY_EQUITY]
+            if prev_equity == 0:
+                ret_invalid = True
+            else:
+                daily_return = (state[S_DAY_EQUITY] - prev_equity) / prev_equity
+                ret_count += 1
+                delta = daily_return - ret_mean
+                ret_mean += delta / ret_count
+                ret_m2 += delta * (daily_return - ret_mean)
+
+        sharpe_ratio = np.nan
+        if ret_count > 0 and not ret_invalid:
+            ret_std = np.sqrt(ret_m2 / ret_count)
+            if ret_std > 0:
+                sharpe_ratio = ret_mean / ret_std * np.sqrt(252)
+
+        return {
+            'rows': state[S_ROWS],
+            'first_ts': state[S_FIRST_TS],
+            'last_ts': state[S_LAST_TS],
+            'first_equity': state[S_FIRST_EQUITY],
+            'last_equity': state[S_LAST_EQUITY],
+            'total_pnl_with_fees': state[S_LAST_EQUITY] - state[S_FIRST_EQUITY],
+            'total_pnl_no_fees': state[S_LAST_EQUITY_NO_FEE] - state[S_FIRST_EQUITY_NO_FEE],
+            'total_trade_value': state[S_TRADE_VALUE],
+            'max_drawdown': abs(state[S_MIN_DRAWDOWN]),
+            'sharpe_ratio': sharpe_ratio,
+            'maker_pnl_no_fee': state[S_MAKER_PNL],
+            'maker_volume': state[S_MAKER_VOLUME],
+            'taker_pnl_no_fee': state[S_TAKER_PNL],
+            'taker_volume': state[S_TAKER_VOLUME],
+            'total_funding_fee': state[S_FUNDING_FEE],
+            'funding_count': state[S_FUNDING_COUNT],
+            'final_position': state[S_LAST_POS],
+            'final_price': state[S_LAST_PRICE],
+            'final_avg_cost_price': state[S_LAST_AVG_COST],
+            'final_taker_fee': state[S_LAST_TAKER_FEE],
+            'final_maker_fee': state[S_LAST_MAKER_FEE],
+        }
+
+    def order_summary(self) -> Optional[Dict[str, Any]]:
+        """订单行为指标；没有订单日志时返回 None"""
+        if not self._order_chunks:
+            return None
+        sums = self.order_sums
+        filled = (np.concatenate(self._filled_chunks) if self._filled_chunks
+                  else np.empty((0, 3), dtype=np.float64))
+
+        def _group_stats(group: int, mask: Optional[np.ndarray]) -> Dict[str, Any]:
+            count = sums[group, O_COUNT]
+            lifecycle = filled[:, 0] if mask is None else filled[mask, 0]
+            slippage = filled[:, 2] if mask is None else filled[mask, 2]
+            return {
+                'order_count': int(count),
+                'avg_fill_time_sec': sums[group, O_LIFECYCLE_SUM] / count / 1000,
+                'median_fill_time_sec': np.median(lifecycle) / 1000,
+                'avg_fill_rate': sums[group, O_FILL_PCT_SUM] / count,
+                'avg_slippage_pct': sums[group, O_SLIPPAGE_PCT_SUM] / count,
+                'median_slippage_pct': np.median(slippage),
+                'total_slippage_value': sums[group, O_SLIPPAGE_VALUE_SUM],
+                'finish_all_pct': sums[group, O_FINISH_ALL] / count,
+                'finish_hit_pct': sums[group, O_FINISH_HIT] / count,
+            }
+
+        summary = {
+            'all': _group_stats(O_ALL, None) if sums[O_ALL, O_COUNT] > 0 else {},
+            'buy': _group_stats(O_BUY, filled[:, 1] == 1) if sums[O_BUY, O_COUNT] > 0 else {},
+            'sell': _group_stats(O_SELL, filled[:, 1] == -1) if sums[O_SELL, O_COUNT] > 0 else {},
+        }
+
+        # 每分钟API调用统计：[init_ts, side, revoke, adj_price, desc_volume, asc_volume]
+        api = np.concatenate(self._order_chunks)
+        summary['api_all'] = _per_minute_api_counts(api)
+        summary['api_buy'] = _per_minute_api_counts(api[api[:, 1] == 1])
+        summary['api_sell'] = _per_minute_api_counts(api[api[:, 1] == -1])
+        return summary
+
+
+def _per_minute_api_counts(api: np.ndarray) -> Optional[np.ndarray]:
+    """
+    按 init_ts 所在分钟聚合API调用次数
+
+    Returns:
+        (分钟数, 5) 数组 [revoke, adj_price, desc_volume, asc_volume, order_count]；无数据时返回 None
+    """
+    if api.shape[0] == 0:
+        return None
+    minute_ts = api[:, 0] // MINUTE_MS
+    _, inverse = np.unique(minute_ts, return_inverse=True)
+    n_minutes = inverse.max() + 1
+    counts = np.empty((n_minutes, 5), dtype=np.int64)
+    for k, col in enumerate((2, 3, 4, 5)):
+        counts[:, k] = np.bincount(inverse, weights=api[:, col].astype(np.int64), minlength=n_minutes).astype(np.int64)
+    counts[:, 4] = np.bincount(inverse, minlength=n_minutes)
+    return counts
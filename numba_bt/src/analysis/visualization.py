@@ -6,11 +6,42 @@ from matplotlib.patches import Rectangle
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+try:
+    from ..core.kernel_registry import import_kernel_module
+except ImportError:
+    import sys
+    from pathlib import Path
+    project_root = Path(__file__).parent.parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    try:
+        from src.core.kernel_registry import import_kernel_module
+    except ImportError:
+        import importlib.util
+        kernel_registry_path = project_root / "src" / "core" / "kernel_registry.py"
+        spec = importlib.util.spec_from_file_location("kernel_registry", kernel_registry_path)
+        kernel_registry_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(kernel_registry_module)
+        import_kernel_module = kernel_registry_module.import_kernel_module
+
+# 曲线图默认最多绘制的点数（每条序列），超过时按段保留首尾和极值点
+DEFAULT_MAX_PLOT_POINTS = 5000
+
+
+def downsample_indices(max_points: int, *series: np.ndarray) -> np.ndarray:
+    """延迟导入指标模块的降采样内核，保证其缓存到注册表的缓存目录"""
+    return import_kernel_module("analysis.metrics_engine").downsample_indices(max_points, *series)
+
+
+def _to_dates(timestamps: np.ndarray):
+    return [datetime.fromtimestamp(ts / 1000) for ts in timestamps]
+
 
 def plot_equity_curve(
     accounts: np.ndarray,
     title: str = "Equity Curve",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    max_points: int = DEFAULT_MAX_PLOT_POINTS
 ):
     """
     绘制净值曲线
@@ -19,6 +50,7 @@ def plot_equity_curve(
         accounts: 账户数据数组，格式 [timestamp, cash, pos, avg_cost, price, qty, side, taker_fee, maker_fee, type]
         title: 图表标题
         save_path: 保存路径，如果为None则显示图表
+        max_points: 每条曲线最多绘制的点数（保留极值的降采样），<=0 表示不降采样
     """
     timestamps = accounts[:, 0]
     cash = accounts[:, 1]
@@ -32,20 +64,21 @@ def plot_equity_curve(
     total_fee_cum = taker_fee + maker_fee
     equity = cash + pos_value + total_fee_cum
     
-    # 转换为datetime
-    dates = [datetime.fromtimestamp(ts / 1000) for ts in timestamps]
+    # 降采样后转换为datetime
+    idx = downsample_indices(max_points, equity, pos)
+    dates = _to_dates(timestamps[idx])
     
     fig, axes = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
     
     # 净值曲线
-    axes[0].plot(dates, equity, label='Equity', linewidth=1.5)
+    axes[0].plot(dates, equity[idx], label='Equity', linewidth=1.5)
     axes[0].set_ylabel('Equity')
     axes[0].set_title(title)
     axes[0].legend()
     axes[0].grid(True, alpha=0.3)
     
     # 持仓曲线
-    axes[1].plot(dates, pos, label='Position', linewidth=1.5, color='orange')
+    axes[1].plot(dates, pos[idx], label='Position', linewidth=1.5, color='orange')
     axes[1].axhline(y=0, color='black', linestyle='--', alpha=0.3)
     axes[1].set_ylabel('Position')
     axes[1].set_xlabel('Time')
@@ -69,7 +102,8 @@ def plot_equity_curve(
 def plot_drawdown(
     accounts: np.ndarray,
     title: str = "Drawdown",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    max_points: int = DEFAULT_MAX_PLOT_POINTS
 ):
     """
     绘制回撤曲线
@@ -78,6 +112,7 @@ def plot_drawdown(
         accounts: 账户数据数组
         title: 图表标题
         save_path: 保存路径
+        max_points: 最多绘制的点数（保留极值的降采样），<=0 表示不降采样
     """
     timestamps = accounts[:, 0]
     cash = accounts[:, 1]
@@ -95,8 +130,10 @@ def plot_drawdown(
     peak_equity = np.maximum.accumulate(equity)
     drawdown = (equity - peak_equity) / peak_equity * 100
     
-    # 转换为datetime
-    dates = [datetime.fromtimestamp(ts / 1000) for ts in timestamps]
+    # 降采样后转换为datetime
+    idx = downsample_indices(max_points, drawdown)
+    dates = _to_dates(timestamps[idx])
+    drawdown = drawdown[idx]
     
     fig, ax = plt.subplots(figsize=(12, 6))
     ax.fill_between(dates, drawdown, 0, alpha=0.3, color='red', label='Drawdown')
@@ -178,7 +215,8 @@ def plot_comprehensive_analysis(
     place_orders_stats: Optional[np.ndarray] = None,
     performance: Optional[Dict[str, Any]] = None,
     title: str = "Comprehensive Backtest Analysis",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    max_points: int = DEFAULT_MAX_PLOT_POINTS
 ):
     """
     绘制综合回测分析图表
@@ -195,6 +233,7 @@ def plot_comprehensive_analysis(
         performance: 性能指标字典（可选）
         title: 图表标题
         save_path: 保存路径
+        max_points: 曲线和成交点图最多绘制的点数（保留极值的降采样），<=0 表示不降采样
     """
     if accounts.size == 0:
         print("⚠️  账户数据为空，无法绘制图表")
@@ -211,9 +250,6 @@ def plot_comprehensive_analysis(
     maker_fee = accounts[:, 8]
     order_role = accounts[:, 9]
     
-    # 转换为datetime
-    dates = [datetime.fromtimestamp(ts / 1000) for ts in timestamps]
-    
     # 计算净值
     pos_value = pos * trade_price
     total_fee_cum = taker_fee + maker_fee
@@ -235,6 +271,15 @@ def plot_comprehensive_analysis(
     cumulative_maker_volume = np.cumsum(maker_trade_value)
     cumulative_taker_volume = np.cumsum(taker_trade_value)
     
+    # 计算不含手续费的盈亏
+    equity_no_fee = cash + pos_value
+    pnl_no_fee = np.diff(equity_no_fee, prepend=equity_no_fee[0])
+    cumulative_pnl_no_fee = np.cumsum(pnl_no_fee)
+    
+    # 曲线降采样：按段保留首尾和各序列极值点，只对保留的点转换datetime
+    idx = downsample_indices(max_points, trade_price, cumulative_pnl, cumulative_pnl_no_fee, pos)
+    dates = _to_dates(timestamps[idx])
+    
     # 创建图表布局 - 增加高度，特别是表格部分，增加资金费图表
     fig = plt.figure(figsize=(20, 28))  # 增加整体高度以容纳4列表格
     gs = fig.add_gridspec(6, 2, height_ratios=[2.5, 2.5, 2.5, 2.5, 2, 5], hspace=0.4, wspace=0.3)  # 增加表格高度比例到5
@@ -243,14 +288,9 @@ def plot_comprehensive_analysis(
     ax1 = fig.add_subplot(gs[0, :])
     ax1_twin = ax1.twinx()
     
-    # 计算不含手续费的盈亏
-    equity_no_fee = cash + pos_value
-    pnl_no_fee = np.diff(equity_no_fee, prepend=equity_no_fee[0])
-    cumulative_pnl_no_fee = np.cumsum(pnl_no_fee)
-    
-    line1 = ax1.plot(dates, trade_price, label='Price', color='blue', linewidth=1, alpha=0.7)
-    line2 = ax1_twin.plot(dates, cumulative_pnl, label='Cumulative PnL (with fees)', color='orange', linewidth=1.5)
-    line3 = ax1_twin.plot(dates, cumulative_pnl_no_fee, label='Cumulative PnL (no fees)', color='green', linewidth=1.5, linestyle='--', alpha=0.8)
+    line1 = ax1.plot(dates, trade_price[idx], label='Price', color='blue', linewidth=1, alpha=0.7)
+    line2 = ax1_twin.plot(dates, cumulative_pnl[idx], label='Cumulative PnL (with fees)', color='orange', linewidth=1.5)
+    line3 = ax1_twin.plot(dates, cumulative_pnl_no_fee[idx], label='Cumulative PnL (no fees)', color='green', linewidth=1.5, linestyle='--', alpha=0.8)
     
     ax1.set_ylabel('Price', color='blue', fontsize=10)
     ax1_twin.set_ylabel('Cumulative PnL', color='orange', fontsize=10)
@@ -268,11 +308,11 @@ def plot_comprehensive_analysis(
     ax2 = fig.add_subplot(gs[1, :])
     ax2_twin = ax2.twinx()
     
-    ax2.plot(dates, pos, label='Position', color='purple', linewidth=1.5)
+    ax2.plot(dates, pos[idx], label='Position', color='purple', linewidth=1.5)
     ax2.axhline(y=0, color='black', linestyle='--', alpha=0.3, linewidth=0.5)
     
-    line3 = ax2_twin.plot(dates, cumulative_maker_volume, label='Cumulative Maker Volume', color='green', linewidth=1, alpha=0.7)
-    line4 = ax2_twin.plot(dates, cumulative_taker_volume, label='Cumulative Taker Volume', color='red', linewidth=1, alpha=0.7)
+    line3 = ax2_twin.plot(dates, cumulative_maker_volume[idx], label='Cumulative Maker Volume', color='green', linewidth=1, alpha=0.7)
+    line4 = ax2_twin.plot(dates, cumulative_taker_volume[idx], label='Cumulative Taker Volume', color='red', linewidth=1, alpha=0.7)
     
     ax2.set_ylabel('Position', color='purple', fontsize=10)
     ax2_twin.set_ylabel('Cumulative Volume', color='green', fontsize=10)
@@ -289,9 +329,13 @@ def plot_comprehensive_analysis(
     ax3 = fig.add_subplot(gs[2, :])
     
     if accounts.size > 0:
-        # 提取有交易的记录
+        # 提取有交易的记录；成交数超过 max_points 时按价格降采样（保留价格极值处的成交）
         trade_mask = trade_quantity > 0
-        trade_dates = [dates[i] for i in range(len(dates)) if trade_mask[i]]
+        trade_indices = np.flatnonzero(trade_mask)
+        trade_indices = trade_indices[downsample_indices(max_points, trade_price[trade_indices])]
+        trade_mask = np.zeros(len(trade_price), dtype=bool)
+        trade_mask[trade_indices] = True
+        trade_dates = _to_dates(timestamps[trade_mask])
         trade_prices_plot = trade_price[trade_mask]
         trade_sides = order_side[trade_mask]
         trade_roles = order_role[trade_mask]
@@ -380,7 +424,7 @@ def plot_comprehensive_analysis(
     funding_mask = order_role == 6
     if np.any(funding_mask):
         funding_timestamps = timestamps[funding_mask]
-        funding_dates = [datetime.fromtimestamp(ts / 1000) for ts in funding_timestamps]
+        funding_dates = _to_dates(funding_timestamps)
         
         # 计算每次资金费支付（通过现金变化）
         funding_fees = np.zeros(np.sum(funding_mask))
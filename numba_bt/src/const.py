@@ -12,6 +12,10 @@ RESULTS_TEST = RESULTS_ROOT / "test"  # 测试结果
 # 输出目录（临时输出，如图表等）
 OUTPUT_DIR = PROJECT_ROOT / "output"
 
+# 缓存目录（预计算特征等，可随时删除）
+CACHE_ROOT = PROJECT_ROOT / "cache"
+FEATURE_CACHE_DIR = CACHE_ROOT / "features"
+
 # mm_flag 设计规则（硬编码）
 MM_FLAG_BLOFIN_TRADES = 0      # blofin trades (真实成交，Taker Trade)
 MM_FLAG_BINANCE_TRADES = 1     # binance trades (市场数据)
@@ -12,7 +12,7 @@ from numba import njit
 # 只有当 mm_flag == 0 时，才会处理为交易所的真实成交 (Taker Trade)
 
 
-@njit
+@njit(cache=True)
 def _run_backtest_numba(
     # ---- 数据 ----
     data_feed,
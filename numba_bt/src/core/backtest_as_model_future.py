@@ -3,7 +3,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def _calculate_30min_return_median(data_feed, current_idx, window_minutes=30):
     """
     计算过去30分钟的30s return序列中位值
@@ -63,7 +63,7 @@ def _calculate_30min_return_median(data_feed, current_idx, window_minutes=30):
     return np.median(returns_array)
 
 
-@njit
+@njit(cache=True)
 def _calculate_future_30s_returns(data_feed):
     """预先计算所有时刻的未来30秒return"""
     future_returns = np.zeros(len(data_feed))
@@ -101,7 +101,7 @@ def _calculate_future_30s_returns(data_feed):
     return future_returns
 
 
-@njit
+@njit(cache=True)
 def _calculate_return_percentiles(returns_array, percentiles):
     """计算return序列的分位数"""
     if len(returns_array) == 0:
@@ -121,7 +121,7 @@ def _calculate_return_percentiles(returns_array, percentiles):
     return result
 
 
-@njit
+@njit(cache=True)
 def _get_return_percentile_rank(return_value, returns_array):
     """获取return值在序列中的分位数排名（0-1）"""
     if len(returns_array) == 0:
@@ -135,7 +135,7 @@ def _get_return_percentile_rank(return_value, returns_array):
     return count_below / len(returns_array)
 
 
-@njit
+@njit(cache=True)
 def _run_backtest_as_model_future_numba(
     # ---- 数据 ----
     data_feed,
@@ -159,7 +159,10 @@ def _run_backtest_as_model_future_numba(
     accounts_log,
     place_orders_stats_log,
     # ---- 扩展点：资金费率数据 ----
-    funding_rate_data
+    funding_rate_data,
+    # ---- 扩展点：预计算特征（长度与data_feed一致时使用，空数组表示在循环内计算） ----
+    return_median_series,
+    return_rank_series
 ):
     """
     基于AS_MODEL不对等挂单的未来数据策略回测函数
@@ -173,6 +176,9 @@ def _run_backtest_as_model_future_numba(
        - return 10-90%: 中性，根据仓位决定不对称性
        - return 90-95%: 看多偏买，long上限2*exposure
        - return > 95%: 看多偏买，long上限3*exposure
+
+    return_median_series / return_rank_series 来自 FeatureStore（30分钟return绝对值中位数、
+    未来return分位数排名），提供时跳过循环内的return序列重建。
     """
     # 内部状态变量
     cash = initial_cash
@@ -225,6 +231,11 @@ def _run_backtest_as_model_future_numba(
     return_history_30min = np.zeros(max_return_history_size)
     return_history_size = 0
     
+    use_precomputed_features = (
+        return_median_series.shape[0] == data_feed.shape[0]
+        and return_rank_series.shape[0] == data_feed.shape[0]
+    )
+
     for i in range(data_feed.shape[0]):
         line = data_feed[i]
         now_ts, order_side, trade_price, trade_quantity, mm_flag = line[0], line[1], line[2], line[3], line[4]
@@ -360,82 +371,89 @@ def _run_backtest_as_model_future_numba(
         if mm_flag != 0 and (now_ts - last_decision_ts >= decision_interval_ms or last_decision_ts < 0):
             last_decision_ts = now_ts
             
-            # 3.1 更新过去30分钟30s return序列
-            if price_history_size >= 2:
-                # 计算过去30分钟的return序列
-                window_ms = 30 * 60 * 1000
-                target_ts = now_ts - window_ms
+            if use_precomputed_features:
+                # 3.1-3.3 使用预计算特征
+                base_spread_pct = return_median_series[i]
+                if base_spread_pct <= 0:
+                    base_spread_pct = 0.000419  # 默认spread
+                return_percentile_rank = return_rank_series[i]
+            else:
+                # 3.1 更新过去30分钟30s return序列
+                if price_history_size >= 2:
+                    # 计算过去30分钟的return序列
+                    window_ms = 30 * 60 * 1000
+                    target_ts = now_ts - window_ms
                 
-                recent_returns = np.zeros(max_return_history_size)
-                recent_returns_size = 0
+                    recent_returns = np.zeros(max_return_history_size)
+                    recent_returns_size = 0
                 
-                # 从最新价格开始向前查找
-                if price_history_size < max_history_size:
-                    # 未满，直接使用
-                    start_idx = price_history_size - 1
-                    for j in range(start_idx, 0, -1):
-                        if timestamp_history[j] < target_ts:
-                            break
-                        
-                        # 查找30秒前的价格
-                        target_ts_30s = timestamp_history[j] - 30 * 1000
-                        current_price = price_history[j]
-                        
-                        for k in range(j - 1, -1, -1):
-                            if timestamp_history[k] <= target_ts_30s:
-                                if price_history[k] > 0 and current_price > 0:
-                                    ret = (current_price - price_history[k]) / price_history[k]
-                                    if recent_returns_size < max_return_history_size:
-                                        recent_returns[recent_returns_size] = ret
-                                        recent_returns_size += 1
+                    # 从最新价格开始向前查找
+                    if price_history_size < max_history_size:
+                        # 未满，直接使用
+                        start_idx = price_history_size - 1
+                        for j in range(start_idx, 0, -1):
+                            if timestamp_history[j] < target_ts:
                                 break
-                else:
-                    # 已满，使用循环索引
-                    start_idx = (price_history_idx - 1 + max_history_size) % max_history_size
-                    for j_offset in range(price_history_size - 1):
-                        j = (start_idx - j_offset + max_history_size) % max_history_size
                         
-                        if timestamp_history[j] < target_ts:
-                            break
+                            # 查找30秒前的价格
+                            target_ts_30s = timestamp_history[j] - 30 * 1000
+                            current_price = price_history[j]
                         
-                        # 查找30秒前的价格
-                        target_ts_30s = timestamp_history[j] - 30 * 1000
-                        current_price = price_history[j]
+                            for k in range(j - 1, -1, -1):
+                                if timestamp_history[k] <= target_ts_30s:
+                                    if price_history[k] > 0 and current_price > 0:
+                                        ret = (current_price - price_history[k]) / price_history[k]
+                                        if recent_returns_size < max_return_history_size:
+                                            recent_returns[recent_returns_size] = ret
+                                            recent_returns_size += 1
+                                    break
+                    else:
+                        # 已满，使用循环索引
+                        start_idx = (price_history_idx - 1 + max_history_size) % max_history_size
+                        for j_offset in range(price_history_size - 1):
+                            j = (start_idx - j_offset + max_history_size) % max_history_size
                         
-                        for k_offset in range(1, j_offset + 1):
-                            k = (start_idx - k_offset + max_history_size) % max_history_size
-                            if timestamp_history[k] <= target_ts_30s:
-                                if price_history[k] > 0 and current_price > 0:
-                                    ret = (current_price - price_history[k]) / price_history[k]
-                                    if recent_returns_size < max_return_history_size:
-                                        recent_returns[recent_returns_size] = ret
-                                        recent_returns_size += 1
+                            if timestamp_history[j] < target_ts:
                                 break
+
+                            # 查找30秒前的价格
+                            target_ts_30s = timestamp_history[j] - 30 * 1000
+                            current_price = price_history[j]
+
+                            for k_offset in range(1, j_offset + 1):
+                                k = (start_idx - k_offset + max_history_size) % max_history_size
+                                if timestamp_history[k] <= target_ts_30s:
+                                    if price_history[k] > 0 and current_price > 0:
+                                        ret = (current_price - price_history[k]) / price_history[k]
+                                        if recent_returns_size < max_return_history_size:
+                                            recent_returns[recent_returns_size] = ret
+                                            recent_returns_size += 1
+                                    break
                 
-                # 更新return历史
-                for idx in range(recent_returns_size):
-                    if idx < max_return_history_size:
-                        return_history_30min[idx] = recent_returns[idx]
-                return_history_size = recent_returns_size if recent_returns_size < max_return_history_size else max_return_history_size
+                    # 更新return历史
+                    for idx in range(recent_returns_size):
+                        if idx < max_return_history_size:
+                            return_history_30min[idx] = recent_returns[idx]
+                    return_history_size = recent_returns_size if recent_returns_size < max_return_history_size else max_return_history_size
             
-            # 3.2 计算基础挂单距离（过去30分钟30s return序列中位值）
-            base_spread_pct = 0.0
-            if return_history_size > 0:
-                abs_returns = np.abs(return_history_30min[:return_history_size])
-                base_spread_pct = np.median(abs_returns)
+                # 3.2 计算基础挂单距离（过去30分钟30s return序列中位值）
+                base_spread_pct = 0.0
+                if return_history_size > 0:
+                    abs_returns = np.abs(return_history_30min[:return_history_size])
+                    base_spread_pct = np.median(abs_returns)
             
-            # 如果中位值为0，使用默认值
-            if base_spread_pct <= 0:
-                base_spread_pct = 0.000419  # 默认spread
+                # 如果中位值为0，使用默认值
+                if base_spread_pct <= 0:
+                    base_spread_pct = 0.000419  # 默认spread
             
-            # 3.3 获取未来30s return和分位数排名
-            future_30s_return = future_30s_returns[i] if i < len(future_30s_returns) else 0.0
+                # 3.3 获取未来30s return和分位数排名
+                future_30s_return = future_30s_returns[i] if i < len(future_30s_returns) else 0.0
             
-            # 计算分位数排名
-            return_percentile_rank = 0.5
-            if return_history_size > 0:
-                returns_array = return_history_30min[:return_history_size]
-                return_percentile_rank = _get_return_percentile_rank(future_30s_return, returns_array)
+                # 计算分位数排名
+                return_percentile_rank = 0.5
+                if return_history_size > 0:
+                    returns_array = return_history_30min[:return_history_size]
+                    return_percentile_rank = _get_return_percentile_rank(future_30s_return, returns_array)
             
             # 3.4 根据分位数决定策略
             # 恢复初始exposure和target_pct
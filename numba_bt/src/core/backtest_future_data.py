@@ -3,7 +3,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def _calculate_future_30s_returns(data_feed):
     """
     预先计算所有时刻的未来30秒return
@@ -52,7 +52,7 @@ def _calculate_future_30s_returns(data_feed):
     return future_returns
 
 
-@njit
+@njit(cache=True)
 def _run_backtest_future_data_numba(
     # ---- 数据 ----
     data_feed,
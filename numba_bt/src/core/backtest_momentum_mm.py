@@ -3,7 +3,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def _calculate_30s_return_numba(prices: np.ndarray, timestamps: np.ndarray, current_idx: int) -> float:
     """
     计算当前时刻的30秒收益率（Numba加速版本）
@@ -35,7 +35,7 @@ def _calculate_30s_return_numba(prices: np.ndarray, timestamps: np.ndarray, curr
     return 0.0
 
 
-@njit
+@njit(cache=True)
 def _run_backtest_momentum_mm_numba(
     # ---- 数据 ----
     data_feed,
@@ -59,7 +59,9 @@ def _run_backtest_momentum_mm_numba(
     accounts_log,
     place_orders_stats_log,
     # ---- 扩展点：资金费率数据 ----
-    funding_rate_data
+    funding_rate_data,
+    # ---- 扩展点：预计算的过去30s return（长度与data_feed一致时使用，NaN表示无基准价格） ----
+    past_30s_returns
 ):
     """
     基于30s return动量的做市策略回测函数
@@ -114,6 +116,8 @@ def _run_backtest_momentum_mm_numba(
             funding_enabled = False
     last_funding_ts = -1
     
+    use_precomputed_returns = past_30s_returns.shape[0] == data_feed.shape[0]
+
     for i in range(data_feed.shape[0]):
         line = data_feed[i]
         now_ts, order_side, trade_price, trade_quantity, mm_flag = line[0], line[1], line[2], line[3], line[4]
@@ -204,7 +208,10 @@ def _run_backtest_momentum_mm_numba(
         
         # 3. 计算30s return
         current_30s_return = 0.0
-        if price_history_size > 1 and mm_flag != 0:
+        if use_precomputed_returns:
+            if mm_flag != 0 and past_30s_returns[i] == past_30s_returns[i]:
+                current_30s_return = past_30s_returns[i]
+        elif price_history_size > 1 and mm_flag != 0:
             # 使用价格历史计算30s return
             current_30s_return = _calculate_30s_return_numba(
                 price_history[:price_history_size],
@@ -0,0 +1,456 @@
+"""统一的回测事件循环：共享撮合/手续费/资金费/对冲逻辑，挂单决策由可插拔的报价内核提供
+
+各策略内核（backtest_future_data、backtest_momentum_mm 等）各自复制了一份撮合和账户循环，
+参数多达30个位置参数。这里把执行语义收敛到一个循环中：
+
+- 执行参数打包为结构化记录 ``records.EXEC_PARAMS_DTYPE``（由 ``records.make_exec_params`` 生成）
+- 策略只实现报价内核 ``quote_fn``（一个 njit 函数），在每个市场数据事件、撮合之后调用，
+  为买/卖两侧给出 是否撤单 / 是否挂单 / 目标价格 / 数量
+- ``run_event_loop`` 以 ``inline='always'`` 编译，策略入口（见 quote_kernels.py）是一个
+  ``@njit(cache=True)`` 的薄包装，报价内核被内联进循环，编译结果可持久化缓存
+
+每个事件的处理顺序与原策略内核一致：
+标记价格 -> 资金费 -> 自有taker成交(mm_flag=0) -> 止损 -> 仓位对冲 -> 挂单撮合 -> 报价决策
+
+挂单成交模型（exec_params.fill_model）：
+- FILL_MODEL_CROSS：市场成交价穿过或等于挂单价即按成交量成交（原策略内核的语义）
+- FILL_MODEL_QUEUE：订单簿事件（mm_flag=-1，行格式 [timestamp, side(1=bid,-1=ask), price, 该价位总量, -1]，
+  总量为0表示价位清空）维护各价位挂单量；挂单/改价时以所在价位的挂单量作为前方排队量，
+  同价位的市场成交先消耗排队量，价位数量减少时排队量随之下调（取较小值），排队量清空后才成交我方挂单；
+  成交价穿过挂单价位视为整档吃穿，直接成交。订单簿事件只更新排队状态，不作为成交或标记价格。
+  收到第一条订单簿事件之前前方排队量恒为0，与穿价模型等价，按穿价模型撮合（纯成交数据上两种模型耗时相同）。
+"""
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+try:
+    from .records import FILL_MODEL_QUEUE
+except ImportError:
+    import sys
+    from pathlib import Path
+    project_root = Path(__file__).parent.parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    from src.core.records import FILL_MODEL_QUEUE
+
+
+# 挂单状态列：[更新时间, 价格, 方向, 剩余数量, 初始价格, 已成交量, 成交均价, 初始时间, 前方排队量, 挂单时排队量]
+ORDER_TS = 0
+ORDER_PRICE = 1
+ORDER_SIDE = 2
+ORDER_QTY = 3
+ORDER_INIT_PRICE = 4
+ORDER_FILLED = 5
+ORDER_AVG_PRICE = 6
+ORDER_INIT_TS = 7
+ORDER_QUEUE = 8
+ORDER_INIT_QUEUE = 9
+ORDER_LEVEL = 10       # 挂单价位键（排队成交模型收到订单簿事件后，挂单/改价时计算）
+N_ORDER_FIELDS = 11
+
+# 订单簿事件
+MM_FLAG_ORDERBOOK = -1
+
+# 挂单行：买/卖
+BUY = 0
+SELL = 1
+
+# 报价决策列
+QUOTE_CANCEL = 0   # 1: 撤掉当前挂单
+QUOTE_PLACE = 1    # 1: 无挂单时按目标价格挂单
+QUOTE_PRICE = 2    # 目标价格（新挂单价格，也是改价目标）
+QUOTE_QTY = 3      # 新挂单数量
+N_QUOTE_FIELDS = 4
+
+# 账户状态
+ACCOUNT_CASH = 0
+ACCOUNT_POS = 1
+ACCOUNT_AVG_COST = 2
+ACCOUNT_TAKER_FEE = 3
+ACCOUNT_MAKER_FEE = 4
+N_ACCOUNT_FIELDS = 5
+
+# accounts_log 类型列
+ACCOUNT_TYPE_TAKER = 0
+ACCOUNT_TYPE_HEDGE = 1
+ACCOUNT_TYPE_MAKER = 2
+ACCOUNT_TYPE_FUNDING = 6
+ACCOUNT_TYPE_STOP_LOSS = 7
+
+# place_orders_stats_log info 列
+ORDER_INFO_FILLED = 0
+ORDER_INFO_REVOKE = 3
+ORDER_INFO_RISK_REVOKE = 4
+
+
+@njit(cache=True)
+def _log_account(accounts_log, accounts_idx, now_ts, account, price, quantity, side, account_type):
+    if accounts_idx >= accounts_log.shape[0]:
+        return accounts_idx
+    row = accounts_log[accounts_idx]
+    row[0] = now_ts
+    row[1] = account[ACCOUNT_CASH]
+    row[2] = account[ACCOUNT_POS]
+    row[3] = account[ACCOUNT_AVG_COST]
+    row[4] = price
+    row[5] = quantity
+    row[6] = side
+    row[7] = account[ACCOUNT_TAKER_FEE]
+    row[8] = account[ACCOUNT_MAKER_FEE]
+    row[9] = account_type
+    return accounts_idx + 1
+
+
+@njit(cache=True)
+def _log_order(place_orders_stats_log, stats_idx, order, now_ts, info, revoke_cnt):
+    """记录挂单生命周期结束（成交完成或撤单）；日志已满时丢弃，不越界写入"""
+    if stats_idx >= place_orders_stats_log.shape[0]:
+        return stats_idx
+    row = place_orders_stats_log[stats_idx]
+    row[0] = order[ORDER_INIT_TS]
+    row[1] = now_ts - order[ORDER_INIT_TS]
+    row[2] = order[ORDER_PRICE]
+    row[3] = order[ORDER_SIDE]
+    row[4] = order[ORDER_FILLED] + order[ORDER_QTY]
+    row[5] = order[ORDER_FILLED]
+    row[6] = order[ORDER_AVG_PRICE]
+    row[7] = order[ORDER_INIT_PRICE]
+    row[8] = info
+    row[9] = revoke_cnt
+    row[10] = order[ORDER_INIT_QUEUE]
+    row[11] = 0.0
+    row[12] = 0.0
+    return stats_idx + 1
+
+
+@njit(cache=True)
+def _revoke_all(orders, active, place_orders_stats_log, stats_idx, now_ts, info):
+    for k in range(2):
+        if active[k]:
+            stats_idx = _log_order(place_orders_stats_log, stats_idx, orders[k], now_ts, info, 1)
+            active[k] = False
+    return stats_idx
+
+
+@njit(cache=True)
+def _level_key(price, tick_size):
+    """价格 -> 价位键（按最小价格步长取整）"""
+    return np.int64(np.floor(price / tick_size + 0.5))
+
+
+@njit(cache=True)
+def _cross_fill_volume(order, k, trade_price, trade_quantity):
+    """穿价成交模型：成交价穿过或等于挂单价时全部成交量可用"""
+    if k == BUY:
+        cross_price = order[ORDER_PRICE] - trade_price
+    else:
+        cross_price = trade_price - order[ORDER_PRICE]
+    return trade_quantity if cross_price >= 0 else 0.0
+
+
+@njit(cache=True)
+def _queue_fill_volume(order, k, trade_price, trade_quantity, tick_size):
+    """
+    排队成交模型：成交价穿过挂单价位时整档吃穿，全部成交量可用；
+    位于挂单价位时先消耗前方排队量，剩余部分才可成交我方挂单
+    """
+    order_key = order[ORDER_LEVEL]
+    trade_key = _level_key(trade_price, tick_size)
+    if (k == BUY and trade_key < order_key) or (k == SELL and trade_key > order_key):
+        order[ORDER_QUEUE] = 0.0
+        return trade_quantity
+    if trade_key != order_key:
+        return 0.0
+    queue = order[ORDER_QUEUE]
+    if trade_quantity <= queue:
+        order[ORDER_QUEUE] = queue - trade_quantity
+        return 0.0
+    order[ORDER_QUEUE] = 0.0
+    return trade_quantity - queue
+
+
+@njit(cache=True)
+def _maker_fill(orders, active, k, available_volume, now_ts, account, maker_fee_rate,
+                accounts_log, accounts_idx, place_orders_stats_log, stats_idx):
+    """
+    挂单撮合：按 min(剩余量, 可成交量) 以挂单价成交，可成交量由成交模型给出
+
+    Returns:
+        (accounts_idx, stats_idx)
+    """
+    order = orders[k]
+    order_price = order[ORDER_PRICE]
+    trade_volume = min(order[ORDER_QTY], available_volume)
+    if trade_volume <= 0:
+        return accounts_idx, stats_idx
+
+    finish_volume = order[ORDER_FILLED] + trade_volume
+    avg_match_price = ((order[ORDER_AVG_PRICE] * order[ORDER_FILLED] + order_price * trade_volume) / finish_volume
+                       if finish_volume > 0 else order_price)
+    fully_filled = trade_volume == order[ORDER_QTY]
+    order[ORDER_QTY] -= trade_volume
+    order[ORDER_FILLED] = finish_volume
+    order[ORDER_AVG_PRICE] = avg_match_price
+    if fully_filled:
+        order[ORDER_QTY] = 0.0
+        stats_idx = _log_order(place_orders_stats_log, stats_idx, order, now_ts, ORDER_INFO_FILLED, 0)
+        active[k] = False
+
+    pos = account[ACCOUNT_POS]
+    avg_cost_price = account[ACCOUNT_AVG_COST]
+    order_value = trade_volume * order_price
+    if k == BUY:
+        if pos >= 0:
+            if (pos + trade_volume) != 0:
+                avg_cost_price = (avg_cost_price * pos + trade_volume * order_price) / (pos + trade_volume)
+        else:
+            if trade_volume > abs(pos):
+                avg_cost_price = order_price
+        account[ACCOUNT_POS] = pos + trade_volume
+        account[ACCOUNT_CASH] -= order_value
+        side = 1.0
+    else:
+        if pos * (-1) >= 0:
+            if (pos - trade_volume) != 0:
+                avg_cost_price = (avg_cost_price * abs(pos) + trade_volume * order_price) / abs(pos - trade_volume)
+        else:
+            if trade_volume > pos:
+                avg_cost_price = order_price
+        account[ACCOUNT_POS] = pos - trade_volume
+        account[ACCOUNT_CASH] += order_value
+        side = -1.0
+    account[ACCOUNT_AVG_COST] = avg_cost_price
+    account[ACCOUNT_MAKER_FEE] -= maker_fee_rate * order_value
+    accounts_idx = _log_account(accounts_log, accounts_idx, now_ts, account, order_price, trade_volume, side,
+                                ACCOUNT_TYPE_MAKER)
+    return accounts_idx, stats_idx
+
+
+@njit(cache=True)
+def _taker_execute(account, side, volume, price, taker_fee_rate):
+    """以taker方式成交（对冲/止损），更新仓位、现金和taker手续费"""
+    account[ACCOUNT_POS] += side * volume
+    order_value = volume * price
+    account[ACCOUNT_CASH] -= side * order_value
+    account[ACCOUNT_TAKER_FEE] -= taker_fee_rate * order_value
+
+
+@njit(inline='always')
+def run_event_loop(data_feed, signals, exec_params, strategy_params, quote_state, quote_fn,
+                   accounts_log, place_orders_stats_log, funding_rate_data):
+    """
+    统一事件循环
+
+    Args:
+        data_feed: 数据数组 [timestamp, order_side, price, quantity, mm_flag]
+        signals: 与 data_feed 等长的预计算信号（二维，列含义由报价内核约定）
+        exec_params: 执行参数记录数组（EXEC_PARAMS_DTYPE，长度1）
+        strategy_params: 策略参数记录数组（由报价内核约定，长度1）
+        quote_state: 报价内核的可变状态（一维 float64，跨事件保持）
+        quote_fn: 报价内核，签名
+            quote_fn(i, now_ts, mark_price, pos, signals, exec_params, strategy_params,
+                     quote_state, orders, active, quotes)
+            只需写 quotes[BUY/SELL, QUOTE_*]
+        accounts_log: 预分配的账户日志 (m, 10)，写满后丢弃后续记录
+        place_orders_stats_log: 预分配的订单统计日志 (m, 13)，写满后丢弃后续记录；第10列为挂单时前方排队量
+        funding_rate_data: 资金费率 [timestamp, rate]，空数组表示不计资金费
+
+    Returns:
+        (accounts_idx, stats_idx)
+    """
+    p = exec_params[0]
+    exposure = p.exposure
+    target_pct = p.target_pct
+    hedge_threshold = exposure * p.hedge_threshold_pct
+    hedge_price_offset = p.mini_price_step * p.hedge_price_ticks
+    mini_price_step = p.mini_price_step
+    taker_fee_rate = p.taker_fee_rate
+    maker_fee_rate = p.maker_fee_rate
+    price_update_threshold = p.price_update_threshold
+    enable_stop_loss = p.enable_stop_loss
+    stop_loss_value = exposure * p.stop_loss_pct
+    queue_model = p.fill_model == FILL_MODEL_QUEUE
+    tick_size = mini_price_step if mini_price_step > 0 else 1e-12
+
+    account = np.zeros(N_ACCOUNT_FIELDS)
+    account[ACCOUNT_CASH] = p.initial_cash
+    account[ACCOUNT_POS] = p.initial_pos
+
+    orders = np.zeros((2, N_ORDER_FIELDS))
+    active = np.zeros(2, dtype=np.bool_)
+    quotes = np.zeros((2, N_QUOTE_FIELDS))
+    # 订单簿各价位挂单量（仅排队成交模型使用）
+    bid_book = Dict.empty(key_type=types.int64, value_type=types.float64)
+    ask_book = Dict.empty(key_type=types.int64, value_type=types.float64)
+    # 收到第一条订单簿事件前前方排队量恒为0，排队模型与穿价模型等价，走穿价模型的快速路径
+    queue_active = False
+
+    accounts_idx = 0
+    stats_idx = 0
+
+    last_mark_price = data_feed[0, 2] if len(data_feed) > 0 else 0.0
+
+    funding_idx = 0
+    funding_enabled = funding_rate_data.shape[0] > 0
+    last_funding_ts = -1.0
+
+    max_equity = p.initial_cash + p.initial_pos * last_mark_price
+    stop_loss_triggered = False
+
+    for i in range(data_feed.shape[0]):
+        now_ts = data_feed[i, 0]
+        order_side = data_feed[i, 1]
+        trade_price = data_feed[i, 2]
+        trade_quantity = data_feed[i, 3]
+        mm_flag = data_feed[i, 4]
+
+        # 订单簿事件：更新价位挂单量，价位数量减少时同步下调我方前方排队量
+        if queue_model and mm_flag == MM_FLAG_ORDERBOOK:
+            if not queue_active:
+                queue_active = True
+                for j in range(2):
+                    if active[j]:
+                        orders[j, ORDER_LEVEL] = _level_key(orders[j, ORDER_PRICE], tick_size)
+            level_key = _level_key(trade_price, tick_size)
+            k = BUY if order_side > 0 else SELL
+            if k == BUY:
+                bid_book[level_key] = trade_quantity
+            else:
+                ask_book[level_key] = trade_quantity
+            if active[k] and orders[k, ORDER_QUEUE] > trade_quantity and orders[k, ORDER_LEVEL] == level_key:
+                orders[k, ORDER_QUEUE] = trade_quantity
+            continue
+
+        if mm_flag != 0:
+            last_mark_price = trade_price
+
+        # 资金费
+        if funding_enabled and funding_idx < funding_rate_data.shape[0]:
+            funding_ts = funding_rate_data[funding_idx, 0]
+            if now_ts >= funding_ts and funding_ts > last_funding_ts:
+                funding_fee = account[ACCOUNT_POS] * last_mark_price * funding_rate_data[funding_idx, 1]
+                account[ACCOUNT_CASH] -= funding_fee
+                accounts_idx = _log_account(accounts_log, accounts_idx, now_ts, account, last_mark_price,
+                                            0.0, 0.0, ACCOUNT_TYPE_FUNDING)
+                last_funding_ts = funding_ts
+                funding_idx += 1
+                if funding_idx >= funding_rate_data.shape[0]:
+                    funding_enabled = False
+
+        # 1. 自有taker成交
+        if mm_flag == 0:
+            pos = account[ACCOUNT_POS]
+            if pos * order_side < 0 and trade_quantity > abs(pos):
+                account[ACCOUNT_AVG_COST] = trade_price
+            elif pos * order_side >= 0:
+                if (pos + order_side * trade_quantity) != 0:
+                    account[ACCOUNT_AVG_COST] = ((account[ACCOUNT_AVG_COST] * pos + order_side * trade_quantity * trade_price)
+                                                 / (pos + order_side * trade_quantity))
+            account[ACCOUNT_POS] = pos + order_side * trade_quantity
+            account[ACCOUNT_CASH] -= order_side * trade_quantity * trade_price
+            accounts_idx = _log_account(accounts_log, accounts_idx, now_ts, account, trade_price,
+                                        trade_quantity, order_side, ACCOUNT_TYPE_TAKER)
+
+        pos = account[ACCOUNT_POS]
+        pos_value = pos * last_mark_price
+
+        # 2. 止损（仅触发一次）
+        if enable_stop_loss:
+            current_equity = account[ACCOUNT_CASH] + pos_value
+            if current_equity > max_equity:
+                max_equity = current_equity
+            if max_equity - current_equity > stop_loss_value and not stop_loss_triggered:
+                if abs(pos) > 1e-8:
+                    hedge_side = -np.sign(pos)
+                    hedge_volume = abs(pos)
+                    hedge_price = last_mark_price + hedge_side * mini_price_step
+                    _taker_execute(account, hedge_side, hedge_volume, hedge_price, taker_fee_rate)
+                    if abs(account[ACCOUNT_POS]) < 1e-8:
+                        account[ACCOUNT_AVG_COST] = 0.0
+                    else:
+                        account[ACCOUNT_AVG_COST] = hedge_price
+                    accounts_idx = _log_account(accounts_log, accounts_idx, now_ts, account, hedge_price,
+                                                hedge_volume, hedge_side, ACCOUNT_TYPE_STOP_LOSS)
+                    stats_idx = _revoke_all(orders, active, place_orders_stats_log, stats_idx, now_ts,
+                                            ORDER_INFO_RISK_REVOKE)
+                    stop_loss_triggered = True
+                    continue
+
+        # 3. 仓位对冲：撤掉挂单后以taker方式回到 exposure * target_pct
+        if abs(pos_value) > hedge_threshold:
+            target_pos_value = exposure * target_pct * np.sign(pos) if pos != 0 else 0.0
+            hedge_volume = abs(pos - target_pos_value / last_mark_price) if last_mark_price > 0 else 0.0
+            if hedge_volume > 1e-8:
+                hedge_side = -np.sign(pos - target_pos_value / last_mark_price)
+                hedge_price = last_mark_price + hedge_side * hedge_price_offset
+                stats_idx = _revoke_all(orders, active, place_orders_stats_log, stats_idx, now_ts,
+                                        ORDER_INFO_RISK_REVOKE)
+                _taker_execute(account, hedge_side, hedge_volume, hedge_price, taker_fee_rate)
+                if abs(account[ACCOUNT_POS]) < 1e-8:
+                    account[ACCOUNT_AVG_COST] = 0.0
+                elif abs(hedge_volume) > abs(account[ACCOUNT_POS]) * 0.9:
+                    account[ACCOUNT_AVG_COST] = hedge_price
+                accounts_idx = _log_account(accounts_log, accounts_idx, now_ts, account, hedge_price,
+                                            hedge_volume, hedge_side, ACCOUNT_TYPE_HEDGE)
+                continue
+
+        if mm_flag == 0:
+            continue
+
+        # 4. 挂单撮合：市场卖单可能成交我方买单，市场买单可能成交我方卖单
+        for k in range(2):
+            if not active[k] or (k == BUY and order_side >= 0) or (k == SELL and order_side <= 0):
+                continue
+            if queue_active:
+                available_volume = _queue_fill_volume(orders[k], k, trade_price, trade_quantity, tick_size)
+            else:
+                available_volume = _cross_fill_volume(orders[k], k, trade_price, trade_quantity)
+            accounts_idx, stats_idx = _maker_fill(orders, active, k, available_volume, now_ts, account,
+                                                  maker_fee_rate, accounts_log, accounts_idx,
+                                                  place_orders_stats_log, stats_idx)
+
+        # 5. 报价决策
+        quote_fn(i, now_ts, last_mark_price, account[ACCOUNT_POS], signals, exec_params, strategy_params,
+                 quote_state, orders, active, quotes)
+
+        for k in range(2):
+            if active[k] and quotes[k, QUOTE_CANCEL] != 0:
+                stats_idx = _log_order(place_orders_stats_log, stats_idx, orders[k], now_ts, ORDER_INFO_REVOKE, 1)
+                active[k] = False
+
+        for k in range(2):
+            target_price = quotes[k, QUOTE_PRICE]
+            if not active[k]:
+                if quotes[k, QUOTE_PLACE] == 0:
+                    continue
+                order = orders[k]
+                order[ORDER_TS] = now_ts
+                order[ORDER_PRICE] = target_price
+                order[ORDER_SIDE] = 1.0 if k == BUY else -1.0
+                order[ORDER_QTY] = quotes[k, QUOTE_QTY]
+                order[ORDER_INIT_PRICE] = target_price
+                order[ORDER_FILLED] = 0.0
+                order[ORDER_AVG_PRICE] = 0.0
+                order[ORDER_INIT_TS] = now_ts
+                queue = 0.0
+                if queue_active:
+                    order[ORDER_LEVEL] = _level_key(target_price, tick_size)
+                    queue = (bid_book if k == BUY else ask_book).get(np.int64(order[ORDER_LEVEL]), 0.0)
+                order[ORDER_QUEUE] = queue
+                order[ORDER_INIT_QUEUE] = queue
+                active[k] = True
+
+            # 改价：挂单价偏离标记价格超过阈值时移动到目标价格
+            price_diff_pct = (abs(orders[k, ORDER_PRICE] - last_mark_price) / last_mark_price
+                              if last_mark_price > 0 else 0.0)
+            if price_diff_pct > price_update_threshold:
+                orders[k, ORDER_PRICE] = target_price
+                orders[k, ORDER_TS] = now_ts
+                if queue_active:
+                    # 改价后在新价位重新排队
+                    orders[k, ORDER_LEVEL] = _level_key(target_price, tick_size)
+                    orders[k, ORDER_QUEUE] = (bid_book if k == BUY else ask_book).get(
+                        np.int64(orders[k, ORDER_LEVEL]), 0.0)
+
+    return accounts_idx, stats_idx
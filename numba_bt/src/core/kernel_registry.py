@@ -0,0 +1,394 @@
+"""Numba内核注册表：显式签名、按源码哈希的持久化编译缓存、预热和编译/运行耗时统计
+
+所有回测内核都使用 ``@njit(cache=True)``。注册表负责：
+1. 首次获取内核（get_kernel/call/warmup）时把 Numba 缓存目录指向 ``<缓存根目录>/<源码哈希>``，
+   源码变化即换目录，不依赖文件时间戳；环境变量同步设置，joblib 子进程继承同一缓存。
+   缓存根目录默认为用户缓存目录下的 ``numba_bt/numba``（可用 NUMBA_BT_CACHE_DIR 指定），不写入源码树；
+   仅导入本模块不会修改进程的 Numba 配置。
+2. 以规范的包路径导入内核模块（而不是 spec_from_file_location），保证所有脚本命中同一份缓存；
+   其它模块需要内核模块中的对象时通过 import_kernel_module 延迟导入，不在模块顶层导入内核模块。
+3. 按声明的签名显式编译（warmup），调用时把标量/数组参数转换为声明类型，避免因
+   int/float 或内存布局不同而在子进程中重新编译。
+4. 记录每个内核的编译耗时和运行耗时。
+"""
+import hashlib
+import importlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, List, Iterable
+
+import numpy as np
+import numba
+from numba import types
+from numba.np.numpy_support import as_dtype, from_dtype
+
+try:
+    from .records import EXEC_PARAMS_DTYPE, FUTURE_DATA_PARAMS_DTYPE, MOMENTUM_MM_PARAMS_DTYPE
+except ImportError:
+    project_root = Path(__file__).parent.parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    try:
+        from src.core.records import EXEC_PARAMS_DTYPE, FUTURE_DATA_PARAMS_DTYPE, MOMENTUM_MM_PARAMS_DTYPE
+    except ImportError:
+        import importlib.util
+        records_path = project_root / "src" / "core" / "records.py"
+        spec = importlib.util.spec_from_file_location("records", records_path)
+        records_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(records_module)
+        EXEC_PARAMS_DTYPE = records_module.EXEC_PARAMS_DTYPE
+        FUTURE_DATA_PARAMS_DTYPE = records_module.FUTURE_DATA_PARAMS_DTYPE
+        MOMENTUM_MM_PARAMS_DTYPE = records_module.MOMENTUM_MM_PARAMS_DTYPE
+
+
+SRC_ROOT = Path(__file__).parent.parent
+
+
+def default_numba_cache_root() -> Path:
+    """默认的 Numba 缓存根目录：NUMBA_BT_CACHE_DIR，否则为用户缓存目录（XDG_CACHE_HOME 或 ~/.cache）下的 numba_bt/numba"""
+    configured = os.environ.get("NUMBA_BT_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "numba_bt" / "numba"
+
+
+NUMBA_CACHE_ROOT = default_numba_cache_root()
+
+# 常用类型简写
+_F8 = types.float64
+_I8 = types.int64
+_B1 = types.boolean
+_F8_1D = types.Array(types.float64, 1, "C")
+_F8_1D_ANY = types.Array(types.float64, 1, "A")
+_F8_2D = types.Array(types.float64, 2, "C")
+_I8_1D = types.Array(types.int64, 1, "C")
+_B1_1D = types.Array(types.boolean, 1, "C")
+_EXEC_PARAMS = types.Array(from_dtype(EXEC_PARAMS_DTYPE), 1, "C")
+
+
+class KernelSpec:
+    """内核声明：模块（相对 src 的路径）、函数名和显式签名"""
+
+    def __init__(self, name: str, module: str, function: str, signatures: List[Tuple[Any, ...]]):
+        """
+        Args:
+            name: 注册名
+            module: 相对 src 的模块路径，如 'core.backtest'
+            function: 模块内的 njit 函数名
+            signatures: 参数类型元组列表（第一个为调用时参数转换所用的主签名）
+        """
+        self.name = name
+        self.module = module
+        self.function = function
+        self.signatures = signatures
+
+    @property
+    def source_path(self) -> Path:
+        return SRC_ROOT.joinpath(*self.module.split(".")).with_suffix(".py")
+
+
+KERNEL_SPECS: Dict[str, KernelSpec] = {}
+
+# 被内联进内核的共享模块：Numba 只按入口模块文件判断缓存是否过期，这些模块的改动需计入源码哈希
+SHARED_KERNEL_MODULES = ("core.event_loop", "core.records")
+
+
+def register_kernel(name: str, module: str, function: str, signatures: List[Tuple[Any, ...]]) -> KernelSpec:
+    """注册内核（新增策略内核时调用）"""
+    kernel_spec = KernelSpec(name, module, function, signatures)
+    KERNEL_SPECS[name] = kernel_spec
+    return kernel_spec
+
+
+register_kernel("backtest", "core.backtest", "_run_backtest_numba", [(
+    _F8_2D,
+    _F8, _F8, _F8, _F8, _F8, _F8, _F8, _F8,  # exposure .. sell_revoke_grid_step_value_pct
+    _F8, _F8, _F8,                           # sp_taker_value_thred_pct, sp_taker_pct, const_taker_step_size
+    _B1, _B1, _I8, _I8, _I8, _B1, _F8,       # enable_price_step_maker .. adj_price_step_thred
+    _F8, _F8, _F8,                           # sp_pct, sp_pct_grid_step, mini_price_step
+    _F8, _F8, _F8, _B1,                      # taker_fee_rate, maker_fee_rate, open_ratio, enable_spl_taker
+    _F8, _F8,                                # initial_cash, initial_pos
+    _F8_2D, _F8_2D,                          # accounts_log, place_orders_stats_log
+    _I8_1D, _F8_1D, _F8_2D,                  # hedge_timestamps, hedge_target_ratios, funding_rate_data
+)])
+register_kernel("momentum_mm", "core.backtest_momentum_mm", "_run_backtest_momentum_mm_numba", [(
+    _F8_2D,
+    _F8, _F8, _F8, _F8, _F8, _F8,
+    _F8, _F8, _F8, _F8, _F8,
+    _F8, _F8,
+    _F8_2D, _F8_2D, _F8_2D, _F8_1D,
+)])
+register_kernel("momentum_mm_optimized", "core.backtest_momentum_mm_optimized",
+                "_run_backtest_momentum_mm_optimized_numba", [(
+                    _F8_2D,
+                    _F8, _F8, _F8, _F8, _F8, _F8,
+                    _F8, _F8, _F8, _F8, _F8,
+                    _F8, _F8, _F8,
+                    _F8, _F8,
+                    _F8_2D, _F8_2D, _F8_2D, _F8_1D,
+                )])
+register_kernel("future_data", "core.backtest_future_data", "_run_backtest_future_data_numba", [(
+    _F8_2D, _F8_1D,
+    _F8, _F8, _F8, _F8, _F8, _F8,
+    _F8, _F8, _F8, _F8, _F8, _F8, _F8, _F8,
+    _F8, _F8,
+    _F8_2D, _F8_2D, _F8_2D,
+)])
+register_kernel("future_data_returns", "core.backtest_future_data", "_calculate_future_30s_returns", [(_F8_2D,)])
+register_kernel("as_model_future", "core.backtest_as_model_future", "_run_backtest_as_model_future_numba", [(
+    _F8_2D, _F8_1D,
+    _F8, _F8, _F8, _F8, _F8, _F8,
+    _F8, _F8, _F8, _F8,
+    _F8, _F8,
+    _F8_2D, _F8_2D, _F8_2D,
+    _F8_1D, _F8_1D,
+)])
+register_kernel("as_model_future_returns", "core.backtest_as_model_future", "_calculate_future_30s_returns",
+                [(_F8_2D,)])
+register_kernel("return_statistics_30s", "utils.return_statistics", "calculate_30s_returns",
+                [(_F8_1D_ANY, _F8_1D_ANY)])
+register_kernel("feature_future_returns", "data.feature_store", "_compute_future_returns",
+                [(_F8_1D, _F8_1D, _B1_1D, _F8)])
+register_kernel("feature_past_returns", "data.feature_store", "_compute_past_returns",
+                [(_F8_1D, _F8_1D, _B1_1D, _F8)])
+register_kernel("feature_rolling_median_rank", "data.feature_store", "_compute_rolling_median_and_rank",
+                [(_F8_1D, _B1_1D, _F8_1D, _F8_1D, _F8, _I8)])
+# 统一事件循环上的策略：(data_feed, signals, exec_params, strategy_params, quote_state,
+#                        accounts_log, place_orders_stats_log, funding_rate_data)
+register_kernel("event_loop_future_data", "core.quote_kernels", "run_future_data_loop", [(
+    _F8_2D, _F8_2D, _EXEC_PARAMS, types.Array(from_dtype(FUTURE_DATA_PARAMS_DTYPE), 1, "C"), _F8_1D,
+    _F8_2D, _F8_2D, _F8_2D,
+)])
+register_kernel("event_loop_momentum_mm", "core.quote_kernels", "run_momentum_mm_loop", [(
+    _F8_2D, _F8_2D, _EXEC_PARAMS, types.Array(from_dtype(MOMENTUM_MM_PARAMS_DTYPE), 1, "C"), _F8_1D,
+    _F8_2D, _F8_2D, _F8_2D,
+)])
+register_kernel("metrics_accounts_pass", "analysis.metrics_engine", "_accounts_pass",
+                [(_F8_2D, _F8_1D, _F8, _F8_1D, _F8_2D)])
+register_kernel("metrics_orders_pass", "analysis.metrics_engine", "_orders_pass", [(_F8_2D, _F8_2D)])
+register_kernel("metrics_minmax_indices", "analysis.metrics_engine", "_minmax_indices", [(_F8_1D, _I8, _I8_1D)])
+
+
+class KernelStats:
+    """单个内核的编译/运行统计"""
+
+    def __init__(self):
+        self.compile_seconds = 0.0
+        self.compile_count = 0
+        self.run_seconds = 0.0
+        self.run_count = 0
+        # 调用时因签名不匹配触发的编译（计入 compile_seconds，包含该次运行时间）
+        self.lazy_compile_count = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "compile_seconds": self.compile_seconds,
+            "compile_count": self.compile_count,
+            "lazy_compile_count": self.lazy_compile_count,
+            "run_seconds": self.run_seconds,
+            "run_count": self.run_count,
+        }
+
+
+def _src_package() -> str:
+    """src 包的规范导入名（'src' 或 'numba_bt.src'）"""
+    package = __package__ or ""
+    if package.endswith(".core"):
+        return package[:-len(".core")]
+    project_root = str(SRC_ROOT.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    return "src"
+
+
+def source_hash(kernel_names: Optional[Iterable[str]] = None) -> str:
+    """内核源码哈希（所有内核模块源码 + Numba/NumPy 版本）"""
+    names = list(kernel_names) if kernel_names is not None else sorted(KERNEL_SPECS)
+    paths = {KERNEL_SPECS[name].source_path for name in names}
+    paths.update(SRC_ROOT.joinpath(*module.split(".")).with_suffix(".py") for module in SHARED_KERNEL_MODULES)
+    paths = sorted(paths)
+    hasher = hashlib.sha1()
+    hasher.update(numba.__version__.encode("utf-8"))
+    hasher.update(np.__version__.encode("utf-8"))
+    for path in paths:
+        hasher.update(path.name.encode("utf-8"))
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()[:16]
+
+
+class KernelRegistry:
+    """内核注册表"""
+
+    def __init__(self, cache_root: Optional[Path] = NUMBA_CACHE_ROOT):
+        """
+        Args:
+            cache_root: 持久化编译缓存根目录，None 表示使用 Numba 默认位置（源码旁的 __pycache__）
+        """
+        self.cache_root = Path(cache_root) if cache_root is not None else None
+        self.cache_dir: Optional[Path] = None
+        self.stats: Dict[str, KernelStats] = {name: KernelStats() for name in KERNEL_SPECS}
+        self._dispatchers: Dict[str, Any] = {}
+
+    def configure_cache(self) -> Optional[Path]:
+        """
+        设置 Numba 缓存目录为 cache_root/<源码哈希>
+
+        必须在内核模块首次导入前调用才能生效（Numba 在装饰时确定缓存位置）；
+        get_kernel/warmup 会自动调用。
+        """
+        if self.cache_root is None or self.cache_dir is not None:
+            return self.cache_dir
+
+        self.cache_dir = self.cache_root / source_hash()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        numba.config.CACHE_DIR = str(self.cache_dir)
+        os.environ["NUMBA_CACHE_DIR"] = str(self.cache_dir)
+
+        package = _src_package()
+        already_imported = [spec.module for spec in KERNEL_SPECS.values()
+                            if f"{package}.{spec.module}" in sys.modules]
+        if already_imported:
+            print(f"  ⚠️  内核模块已在缓存目录设置前导入，将使用默认缓存位置: {sorted(set(already_imported))}")
+        return self.cache_dir
+
+    def import_kernel_module(self, module: str):
+        """
+        先设置缓存目录再以规范包路径导入内核模块（相对 src 的路径，如 'data.feature_store'）
+
+        需要模块内其它对象（如 FeatureStore）的调用方也应经此导入，避免内核在缓存目录设置前被装饰。
+        """
+        self.configure_cache()
+        return importlib.import_module(f"{_src_package()}.{module}")
+
+    def get_kernel(self, name: str):
+        """获取内核的 Numba dispatcher"""
+        dispatcher = self._dispatchers.get(name)
+        if dispatcher is None:
+            kernel_spec = KERNEL_SPECS[name]
+            module = self.import_kernel_module(kernel_spec.module)
+            dispatcher = getattr(module, kernel_spec.function)
+            self._dispatchers[name] = dispatcher
+            self.stats.setdefault(name, KernelStats())
+        return dispatcher
+
+    def warmup(self, names: Optional[Iterable[str]] = None, verbose: bool = False) -> Dict[str, float]:
+        """
+        按声明签名显式编译内核（命中磁盘缓存时只需加载）
+
+        Args:
+            names: 内核名列表，None 表示全部
+            verbose: 是否打印每个内核的耗时
+
+        Returns:
+            内核名 -> 编译（或缓存加载）耗时（秒）
+        """
+        timings = {}
+        for name in (names if names is not None else KERNEL_SPECS):
+            dispatcher = self.get_kernel(name)
+            start = time.perf_counter()
+            for signature in KERNEL_SPECS[name].signatures:
+                dispatcher.compile(signature)
+            elapsed = time.perf_counter() - start
+            stats = self.stats[name]
+            stats.compile_seconds += elapsed
+            stats.compile_count += 1
+            timings[name] = elapsed
+            if verbose:
+                print(f"  内核 {name}: {elapsed * 1000:.1f}ms")
+        return timings
+
+    @staticmethod
+    def _coerce(arg, numba_type):
+        """把参数转换为声明的 Numba 类型，避免额外的特化编译"""
+        if isinstance(numba_type, types.Array):
+            dtype = as_dtype(numba_type.dtype)
+            if numba_type.layout == "C":
+                return np.ascontiguousarray(arg, dtype=dtype)
+            return np.asarray(arg, dtype=dtype)
+        if isinstance(numba_type, types.Boolean):
+            return bool(arg)
+        if isinstance(numba_type, types.Integer):
+            return int(arg)
+        if isinstance(numba_type, types.Float):
+            return float(arg)
+        return arg
+
+    def call(self, name: str, *args):
+        """
+        以声明的主签名调用内核并统计运行耗时
+
+        注意：作为输出的预分配数组（accounts_log 等）必须已是声明的 dtype 和内存布局，
+        否则转换会产生副本，内核写入不会反映到调用方数组。
+        """
+        dispatcher = self.get_kernel(name)
+        signature = KERNEL_SPECS[name].signatures[0]
+        if len(args) != len(signature):
+            raise TypeError(f"内核 {name} 需要 {len(signature)} 个参数，实际 {len(args)} 个")
+        coerced = tuple(self._coerce(arg, numba_type) for arg, numba_type in zip(args, signature))
+
+        n_overloads = len(dispatcher.overloads)
+        start = time.perf_counter()
+        result = dispatcher(*coerced)
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats[name]
+        if len(dispatcher.overloads) > n_overloads:
+            stats.compile_seconds += elapsed
+            stats.compile_count += 1
+            stats.lazy_compile_count += 1
+        else:
+            stats.run_seconds += elapsed
+            stats.run_count += 1
+        return result
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """每个内核的编译/运行耗时和 Numba 磁盘缓存命中情况"""
+        result = {}
+        for name, stats in self.stats.items():
+            entry = stats.to_dict()
+            dispatcher = self._dispatchers.get(name)
+            if dispatcher is not None:
+                entry["cache_hits"] = sum(dispatcher.stats.cache_hits.values())
+                entry["cache_misses"] = sum(dispatcher.stats.cache_misses.values())
+            result[name] = entry
+        return result
+
+    def format_report(self) -> str:
+        """格式化的耗时报告"""
+        lines = [f"{'内核':<30}{'编译(s)':>10}{'次数':>6}{'运行(s)':>10}{'次数':>6}{'缓存命中':>10}"]
+        for name, entry in self.report().items():
+            if entry["compile_count"] == 0 and entry["run_count"] == 0:
+                continue
+            lines.append(
+                f"{name:<30}{entry['compile_seconds']:>10.3f}{entry['compile_count']:>6}"
+                f"{entry['run_seconds']:>10.3f}{entry['run_count']:>6}{entry.get('cache_hits', 0):>10}"
+            )
+        return "\n".join(lines)
+
+
+_default_registry: Optional[KernelRegistry] = None
+
+
+def get_kernel_registry() -> KernelRegistry:
+    """进程级共享的内核注册表"""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = KernelRegistry()
+    return _default_registry
+
+
+def import_kernel_module(module: str):
+    """通过共享注册表导入内核模块"""
+    return get_kernel_registry().import_kernel_module(module)
+
+
+def run_kernel(name: str, *args):
+    """通过共享注册表调用内核"""
+    return get_kernel_registry().call(name, *args)
+
+
+def warmup(names: Optional[Iterable[str]] = None, verbose: bool = False) -> Dict[str, float]:
+    """通过共享注册表预热内核"""
+    return get_kernel_registry().warmup(names, verbose=verbose)
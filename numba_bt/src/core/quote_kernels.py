@@ -0,0 +1,113 @@
+"""报价内核：在统一事件循环（event_loop.run_event_loop）上实现的策略
+
+新增策略只需：
+1. 在 records.py 中定义策略参数记录 dtype 和 ``make_*_params``
+2. 实现报价内核 ``_xxx_quote(i, now_ts, mark_price, pos, signals, exec_params, strategy_params,
+   quote_state, orders, active, quotes)``，写入 quotes[BUY/SELL, QUOTE_*]
+3. 定义 ``@njit(cache=True)`` 入口，调用 ``run_event_loop(..., _xxx_quote, ...)``，
+   并在 kernel_registry 中注册
+撮合、手续费、资金费、对冲和止损的语义由事件循环统一提供。
+"""
+from numba import njit
+
+try:
+    from .event_loop import (
+        run_event_loop, BUY, SELL, QUOTE_CANCEL, QUOTE_PLACE, QUOTE_PRICE, QUOTE_QTY,
+    )
+except ImportError:
+    import sys
+    from pathlib import Path
+    project_root = Path(__file__).parent.parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    from src.core.event_loop import (
+        run_event_loop, BUY, SELL, QUOTE_CANCEL, QUOTE_PLACE, QUOTE_PRICE, QUOTE_QTY,
+    )
+
+
+@njit(cache=True)
+def _set_quote(quotes, k, cancel, price, quantity):
+    quotes[k, QUOTE_CANCEL] = 1.0 if cancel else 0.0
+    quotes[k, QUOTE_PLACE] = 1.0
+    quotes[k, QUOTE_PRICE] = price
+    quotes[k, QUOTE_QTY] = quantity
+
+
+# ---- 未来数据策略（backtest_future_data 的报价逻辑） ----
+
+@njit(cache=True)
+def _future_data_quote(i, now_ts, mark_price, pos, signals, exec_params, strategy_params,
+                       quote_state, orders, active, quotes):
+    """
+    未来30s return 高于80分位：买单挂远（一个return处）、卖单挂近；低于20分位反之；
+    其余中性等距挂单。return 反向穿越分位数时撤掉对应一侧。
+
+    signals[:, 0] 为未来30s return。
+    """
+    sp = strategy_params[0]
+    mini_price_step = exec_params[0].mini_price_step
+    future_return = signals[i, 0] if i < signals.shape[0] else 0.0
+    order_quantity = sp.order_size / mark_price if mark_price > 0 else 0.0
+    optimized_spread = max(sp.spread_median * 3, sp.min_spread_pct)
+
+    if future_return > sp.return_percentile_80:
+        buy_price = mark_price * (1 - abs(future_return))
+        sell_price = mark_price + mini_price_step
+    elif future_return < sp.return_percentile_20:
+        buy_price = mark_price - mini_price_step
+        sell_price = mark_price * (1 + abs(future_return))
+    else:
+        buy_price = mark_price * (1 - optimized_spread / 2)
+        sell_price = mark_price * (1 + optimized_spread / 2)
+
+    _set_quote(quotes, BUY, future_return > sp.return_percentile_80, buy_price, order_quantity)
+    _set_quote(quotes, SELL, future_return < sp.return_percentile_20, sell_price, order_quantity)
+
+
+@njit(cache=True)
+def run_future_data_loop(data_feed, signals, exec_params, strategy_params, quote_state,
+                         accounts_log, place_orders_stats_log, funding_rate_data):
+    """未来数据策略入口"""
+    return run_event_loop(data_feed, signals, exec_params, strategy_params, quote_state, _future_data_quote,
+                          accounts_log, place_orders_stats_log, funding_rate_data)
+
+
+# ---- 30s return 动量做市策略（backtest_momentum_mm 的报价逻辑） ----
+
+@njit(cache=True)
+def _momentum_mm_quote(i, now_ts, mark_price, pos, signals, exec_params, strategy_params,
+                       quote_state, orders, active, quotes):
+    """
+    过去30s return 高于80分位：买单挂近（盘口下方一档）、卖单挂远（一个return处）；
+    低于20分位反之；其余中性等距挂单。出现反转信号时撤掉逆势一侧。
+
+    signals[:, 0] 为过去30s return（NaN 表示无基准价格，视为0）。
+    """
+    sp = strategy_params[0]
+    mini_price_step = exec_params[0].mini_price_step
+    current_return = signals[i, 0]
+    if current_return != current_return:
+        current_return = 0.0
+    order_quantity = sp.order_size / mark_price if mark_price > 0 else 0.0
+    neutral_spread = max(sp.spread_median, 0.001)
+
+    if current_return > sp.return_percentile_80:
+        buy_price = mark_price - mini_price_step
+        sell_price = mark_price * (1 + abs(current_return))
+    elif current_return < sp.return_percentile_20:
+        buy_price = mark_price * (1 - abs(current_return))
+        sell_price = mark_price + mini_price_step
+    else:
+        buy_price = mark_price * (1 - neutral_spread / 2)
+        sell_price = mark_price * (1 + neutral_spread / 2)
+
+    _set_quote(quotes, BUY, current_return < sp.return_percentile_20, buy_price, order_quantity)
+    _set_quote(quotes, SELL, current_return > sp.return_percentile_80, sell_price, order_quantity)
+
+
+@njit(cache=True)
+def run_momentum_mm_loop(data_feed, signals, exec_params, strategy_params, quote_state,
+                         accounts_log, place_orders_stats_log, funding_rate_data):
+    """动量做市策略入口"""
+    return run_event_loop(data_feed, signals, exec_params, strategy_params, quote_state, _momentum_mm_quote,
+                          accounts_log, place_orders_stats_log, funding_rate_data)
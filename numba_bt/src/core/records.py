@@ -0,0 +1,113 @@
+"""回测内核的打包参数记录（结构化 dtype）
+
+执行参数和各策略参数以长度为1的结构化数组传入 Numba 内核，替代数十个位置参数；
+内核中以 ``params[0].field`` 读取。本模块不含 njit 函数，内核注册表可在设置编译缓存
+目录之前导入它来声明签名。
+"""
+import numpy as np
+
+
+# 挂单成交模型
+FILL_MODEL_CROSS = 0   # 成交价穿过或等于挂单价即成交（忽略排队）
+FILL_MODEL_QUEUE = 1   # 按订单簿估计排队位置，同价位成交量先消耗前方排队量
+
+# 执行参数记录
+EXEC_PARAMS_DTYPE = np.dtype([
+    ("exposure", np.float64),             # 最大敞口（计价货币）
+    ("target_pct", np.float64),           # 对冲后的目标仓位比例
+    ("hedge_threshold_pct", np.float64),  # 仓位价值超过 exposure * hedge_threshold_pct 时对冲
+    ("hedge_price_ticks", np.float64),    # 对冲价格偏离标记价格的最小价格步长数
+    ("mini_price_step", np.float64),
+    ("taker_fee_rate", np.float64),
+    ("maker_fee_rate", np.float64),
+    ("price_update_threshold", np.float64),  # 挂单价格偏离标记价格超过该比例时改价
+    ("enable_stop_loss", np.bool_),
+    ("stop_loss_pct", np.float64),        # 净值回撤超过 exposure * stop_loss_pct 时全部平仓（仅触发一次）
+    ("initial_cash", np.float64),
+    ("initial_pos", np.float64),
+    ("fill_model", np.int64),             # FILL_MODEL_CROSS / FILL_MODEL_QUEUE
+], align=True)
+
+
+def make_exec_params(
+    exposure: float = 10000.0,
+    target_pct: float = 0.5,
+    hedge_threshold_pct: float = 1.0,
+    hedge_price_ticks: float = 1.0,
+    mini_price_step: float = 0.0001,
+    taker_fee_rate: float = 0.00015,
+    maker_fee_rate: float = -0.00005,
+    price_update_threshold: float = 0.002,
+    enable_stop_loss: bool = False,
+    stop_loss_pct: float = 0.1,
+    initial_cash: float = 10000.0,
+    initial_pos: float = 0.0,
+    fill_model: int = FILL_MODEL_CROSS,
+) -> np.ndarray:
+    """生成执行参数记录（长度为1的结构化数组）"""
+    params = np.zeros(1, dtype=EXEC_PARAMS_DTYPE)
+    params["exposure"] = exposure
+    params["target_pct"] = target_pct
+    params["hedge_threshold_pct"] = hedge_threshold_pct
+    params["hedge_price_ticks"] = hedge_price_ticks
+    params["mini_price_step"] = mini_price_step
+    params["taker_fee_rate"] = taker_fee_rate
+    params["maker_fee_rate"] = maker_fee_rate
+    params["price_update_threshold"] = price_update_threshold
+    params["enable_stop_loss"] = enable_stop_loss
+    params["stop_loss_pct"] = stop_loss_pct
+    params["initial_cash"] = initial_cash
+    params["initial_pos"] = initial_pos
+    params["fill_model"] = fill_model
+    return params
+
+
+# 未来数据策略（quote_kernels._future_data_quote）
+FUTURE_DATA_PARAMS_DTYPE = np.dtype([
+    ("return_percentile_20", np.float64),
+    ("return_percentile_80", np.float64),
+    ("spread_median", np.float64),
+    ("order_size", np.float64),
+    ("min_spread_pct", np.float64),
+], align=True)
+
+
+def make_future_data_params(
+    return_percentile_20: float = 0.0,
+    return_percentile_80: float = 0.0,
+    spread_median: float = 0.0,
+    order_size: float = 100.0,
+    min_spread_pct: float = 0.002,
+) -> np.ndarray:
+    """生成未来数据策略参数记录（长度为1的结构化数组）"""
+    params = np.zeros(1, dtype=FUTURE_DATA_PARAMS_DTYPE)
+    params["return_percentile_20"] = return_percentile_20
+    params["return_percentile_80"] = return_percentile_80
+    params["spread_median"] = spread_median
+    params["order_size"] = order_size
+    params["min_spread_pct"] = min_spread_pct
+    return params
+
+
+# 30s return 动量做市策略（quote_kernels._momentum_mm_quote）
+MOMENTUM_MM_PARAMS_DTYPE = np.dtype([
+    ("return_percentile_20", np.float64),
+    ("return_percentile_80", np.float64),
+    ("spread_median", np.float64),
+    ("order_size", np.float64),
+], align=True)
+
+
+def make_momentum_mm_params(
+    return_percentile_20: float = 0.0,
+    return_percentile_80: float = 0.0,
+    spread_median: float = 0.0,
+    order_size: float = 100.0,
+) -> np.ndarray:
+    """生成动量做市策略参数记录（长度为1的结构化数组）"""
+    params = np.zeros(1, dtype=MOMENTUM_MM_PARAMS_DTYPE)
+    params["return_percentile_20"] = return_percentile_20
+    params["return_percentile_80"] = return_percentile_80
+    params["spread_median"] = spread_median
+    params["order_size"] = order_size
+    return params
@@ -0,0 +1,382 @@
+"""特征存储模块：按数据集一次性预计算派生特征列，并按 (数据集哈希, 特征规格) 缓存
+
+回测内核（未来30s return、过去30s return、30分钟return中位值、分位数排名）原本在每次回测、
+每个网格搜索进程中重复计算。这里用 O(n) 的双指针 Numba 实现计算一次，结果以 .npy 文件
+持久化到缓存目录，后续运行以 mmap 方式加载，多进程共享同一份页缓存。
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+from numba import njit
+
+try:
+    from ..const import FEATURE_CACHE_DIR
+except ImportError:
+    import sys
+    project_root = Path(__file__).parent.parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    try:
+        from src.const import FEATURE_CACHE_DIR
+    except ImportError:
+        import importlib.util
+        const_path = project_root / "src" / "const.py"
+        spec = importlib.util.spec_from_file_location("const", const_path)
+        const_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(const_module)
+        FEATURE_CACHE_DIR = const_module.FEATURE_CACHE_DIR
+
+
+# 特征列名称
+FEATURE_FUTURE_RETURN = "future_return"          # 未来窗口return（与 _calculate_future_30s_returns 一致）
+FEATURE_PAST_RETURN = "past_return"              # 过去窗口return（无基准价格时为NaN）
+FEATURE_RETURN_MEDIAN = "return_abs_median"      # 回看窗口内过去return绝对值中位数（AS_MODEL基础挂单距离）
+FEATURE_FUTURE_RETURN_RANK = "future_return_rank"  # 未来return在回看窗口return序列中的分位数排名
+
+FEATURE_NAMES = (
+    FEATURE_FUTURE_RETURN,
+    FEATURE_PAST_RETURN,
+    FEATURE_RETURN_MEDIAN,
+    FEATURE_FUTURE_RETURN_RANK,
+)
+
+# 缓存格式版本，特征计算语义变化时递增
+FEATURE_STORE_VERSION = 1
+
+
+@njit(cache=True)
+def _compute_future_returns(timestamps, prices, market_mask, window_ms):
+    """
+    计算每个市场数据时刻的未来窗口return（双指针，O(n)）
+
+    语义与 backtest_as_model_future._calculate_future_30s_returns 相同：
+    取第一个时间戳 >= ts + window 的市场数据价格；找不到时使用之后最后一个市场数据价格。
+    taker trades（market_mask 为 False）的位置为 0。
+    """
+    n = len(timestamps)
+    future_returns = np.zeros(n)
+
+    last_market_idx = -1
+    for j in range(n - 1, -1, -1):
+        if market_mask[j]:
+            last_market_idx = j
+            break
+
+    j = 0
+    for i in range(n):
+        if not market_mask[i]:
+            continue
+
+        current_price = prices[i]
+        target_ts = timestamps[i] + window_ms
+
+        if j <= i:
+            j = i + 1
+        while j < n and (not market_mask[j] or timestamps[j] < target_ts):
+            j += 1
+
+        if j < n:
+            future_price = prices[j]
+        elif last_market_idx > i:
+            future_price = prices[last_market_idx]
+        else:
+            future_price = current_price
+
+        if current_price > 0:
+            future_returns[i] = (future_price - current_price) / current_price
+
+    return future_returns
+
+
+@njit(cache=True)
+def _compute_past_returns(timestamps, prices, market_mask, window_ms):
+    """
+    计算每个市场数据时刻的过去窗口return（双指针，O(n)）
+
+    基准价格为时间戳 <= ts - window 的最近一个市场数据价格；不存在时为NaN。
+    """
+    n = len(timestamps)
+    past_returns = np.full(n, np.nan)
+
+    base_idx = -1
+    k = 0
+    for i in range(n):
+        if not market_mask[i]:
+            continue
+
+        target_ts = timestamps[i] - window_ms
+        while k < i and timestamps[k] <= target_ts:
+            if market_mask[k]:
+                base_idx = k
+            k += 1
+
+        if base_idx >= 0 and prices[base_idx] > 0 and prices[i] > 0:
+            past_returns[i] = (prices[i] - prices[base_idx]) / prices[base_idx]
+
+    return past_returns
+
+
+@njit(cache=True)
+def _compute_rolling_median_and_rank(timestamps, market_mask, past_returns, future_returns,
+                                     lookback_ms, max_count):
+    """
+    计算回看窗口内（最多 max_count 个最近有效过去return）的绝对值中位数，以及未来return的分位数排名
+
+    与 AS_MODEL 内核中的30分钟return序列语义一致：窗口包含当前时刻，
+    窗口为空时中位数为0、排名为0.5。
+    """
+    n = len(timestamps)
+    medians = np.zeros(n)
+    ranks = np.full(n, 0.5)
+
+    # 有效过去return的环形缓冲区
+    ring_values = np.zeros(max_count)
+    ring_ts = np.zeros(max_count)
+    ring_head = 0
+    ring_size = 0
+    window = np.zeros(max_count)
+
+    for i in range(n):
+        if not market_mask[i]:
+            continue
+
+        r = past_returns[i]
+        if r == r:
+            ring_values[ring_head] = r
+            ring_ts[ring_head] = timestamps[i]
+            ring_head = (ring_head + 1) % max_count
+            if ring_size < max_count:
+                ring_size += 1
+
+        target_ts = timestamps[i] - lookback_ms
+        count = 0
+        for offset in range(ring_size):
+            idx = (ring_head - 1 - offset + max_count) % max_count
+            if ring_ts[idx] < target_ts:
+                break
+            window[count] = ring_values[idx]
+            count += 1
+
+        if count == 0:
+            continue
+
+        below = 0
+        future_r = future_returns[i]
+        for c in range(count):
+            if window[c] < future_r:
+                below += 1
+        ranks[i] = below / count
+        medians[i] = np.median(np.abs(window[:count]))
+
+    return medians, ranks
+
+
+class FeatureSpec:
+    """特征规格：决定派生特征的窗口参数，参与缓存键计算"""
+
+    def __init__(
+        self,
+        future_window_ms: int = 30 * 1000,
+        past_window_ms: int = 30 * 1000,
+        lookback_ms: int = 30 * 60 * 1000,
+        lookback_max_count: int = 60
+    ):
+        """
+        初始化特征规格
+
+        Args:
+            future_window_ms: 未来return窗口（毫秒）
+            past_window_ms: 过去return窗口（毫秒）
+            lookback_ms: return序列回看窗口（毫秒），用于中位数和分位数排名
+            lookback_max_count: 回看窗口内最多使用的return个数
+        """
+        self.future_window_ms = int(future_window_ms)
+        self.past_window_ms = int(past_window_ms)
+        self.lookback_ms = int(lookback_ms)
+        self.lookback_max_count = int(lookback_max_count)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            "version": FEATURE_STORE_VERSION,
+            "future_window_ms": self.future_window_ms,
+            "past_window_ms": self.past_window_ms,
+            "lookback_ms": self.lookback_ms,
+            "lookback_max_count": self.lookback_max_count,
+        }
+
+    def key(self) -> str:
+        """特征规格哈希"""
+        payload = json.dumps(self.to_dict(), sort_keys=True).encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()[:16]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FeatureSpec) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        return f"FeatureSpec({self.to_dict()})"
+
+
+def compute_features(data: np.ndarray, spec: Optional[FeatureSpec] = None) -> Dict[str, np.ndarray]:
+    """
+    计算派生特征列（不读写缓存）
+
+    Args:
+        data: 市场数据数组 [timestamp, order_side, price, quantity, mm_flag]，需按时间排序
+        spec: 特征规格，默认30s/30s/30min
+
+    Returns:
+        特征名 -> 与 data 等长的 float64 数组
+    """
+    spec = spec or FeatureSpec()
+    timestamps = np.ascontiguousarray(data[:, 0], dtype=np.float64)
+    prices = np.ascontiguousarray(data[:, 2], dtype=np.float64)
+    market_mask = np.ascontiguousarray(data[:, 4] != 0)
+
+    future_returns = _compute_future_returns(timestamps, prices, market_mask, float(spec.future_window_ms))
+    past_returns = _compute_past_returns(timestamps, prices, market_mask, float(spec.past_window_ms))
+    medians, ranks = _compute_rolling_median_and_rank(
+        timestamps, market_mask, past_returns, future_returns,
+        float(spec.lookback_ms), spec.lookback_max_count
+    )
+
+    return {
+        FEATURE_FUTURE_RETURN: future_returns,
+        FEATURE_PAST_RETURN: past_returns,
+        FEATURE_RETURN_MEDIAN: medians,
+        FEATURE_FUTURE_RETURN_RANK: ranks,
+    }
+
+
+class FeatureStore:
+    """
+    派生特征存储
+
+    特征按 (数据集哈希, 特征规格) 缓存：进程内保留最近若干份结果；
+    指定 cache_dir 时同时持久化到磁盘（每个键一个目录，每列一个 .npy 文件），
+    其他进程以 copy-on-write mmap 方式加载。
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_memory_entries: int = 4):
+        """
+        初始化特征存储
+
+        Args:
+            cache_dir: 磁盘缓存目录，None 表示只使用进程内缓存
+            max_memory_entries: 进程内缓存的最大条目数
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[Tuple[str, str], Dict[str, np.ndarray]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def dataset_hash(data: np.ndarray) -> str:
+        """计算数据集哈希（形状、类型和内容）"""
+        contiguous = np.ascontiguousarray(data)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(str(contiguous.shape).encode("utf-8"))
+        hasher.update(str(contiguous.dtype).encode("utf-8"))
+        hasher.update(memoryview(contiguous).cast("B"))
+        return hasher.hexdigest()
+
+    def _entry_dir(self, dataset_key: str, spec: FeatureSpec) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / dataset_key / spec.key()
+
+    def _remember(self, key: Tuple[str, str], features: Dict[str, np.ndarray]):
+        self._memory[key] = features
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, entry_dir: Path, n_rows: int) -> Optional[Dict[str, np.ndarray]]:
+        if not (entry_dir / "spec.json").exists():
+            return None
+        features = {}
+        for name in FEATURE_NAMES:
+            path = entry_dir / f"{name}.npy"
+            if not path.exists():
+                return None
+            # copy-on-write 映射：与其他进程共享页缓存，同时保持可写类型，与内核声明签名一致
+            array = np.load(path, mmap_mode="c")
+            if array.shape[0] != n_rows:
+                return None
+            features[name] = array
+        return features
+
+    def _save(self, entry_dir: Path, spec: FeatureSpec, features: Dict[str, np.ndarray], n_rows: int):
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        for name, array in features.items():
+            # 先写临时文件再替换，避免并发进程读到半截文件
+            tmp_path = entry_dir / f"{name}.tmp.npy"
+            np.save(tmp_path, array)
+            tmp_path.replace(entry_dir / f"{name}.npy")
+        with open(entry_dir / "spec.json", "w", encoding="utf-8") as f:
+            json.dump({"spec": spec.to_dict(), "rows": n_rows}, f, indent=2)
+
+    def get_features(
+        self,
+        data: np.ndarray,
+        spec: Optional[FeatureSpec] = None,
+        dataset_key: Optional[str] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        获取数据集的派生特征（命中缓存则直接返回，否则计算并写入缓存）
+
+        Args:
+            data: 市场数据数组 [timestamp, order_side, price, quantity, mm_flag]，需按时间排序
+            spec: 特征规格，默认30s/30s/30min
+            dataset_key: 数据集标识，None 时根据内容计算哈希
+
+        Returns:
+            特征名 -> 与 data 等长的数组
+        """
+        spec = spec or FeatureSpec()
+        dataset_key = dataset_key or self.dataset_hash(data)
+        key = (dataset_key, spec.key())
+
+        features = self._memory.get(key)
+        if features is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return features
+
+        entry_dir = self._entry_dir(dataset_key, spec)
+        if entry_dir is not None:
+            features = self._load(entry_dir, len(data))
+            if features is not None:
+                self.hits += 1
+                self._remember(key, features)
+                return features
+
+        self.misses += 1
+        features = compute_features(data, spec)
+        if entry_dir is not None:
+            self._save(entry_dir, spec, features, len(data))
+        self._remember(key, features)
+        return features
+
+    def clear_memory(self):
+        """清空进程内缓存"""
+        self._memory.clear()
+
+
+_default_store: Optional[FeatureStore] = None
+
+
+def get_default_feature_store() -> FeatureStore:
+    """获取进程级共享的特征存储（仅进程内缓存，不写磁盘）"""
+    global _default_store
+    if _default_store is None:
+        _default_store = FeatureStore()
+    return _default_store
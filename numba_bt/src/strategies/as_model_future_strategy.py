@@ -21,18 +21,21 @@ except ImportError:
         spec.loader.exec_module(base_strategy_module)
         BaseStrategy = base_strategy_module.BaseStrategy
 
+# 内核通过注册表调用（规范导入路径 + 持久化编译缓存）
 try:
-    from ..core.backtest_as_model_future import _run_backtest_as_model_future_numba, _calculate_future_30s_returns
+    from ..core.kernel_registry import run_kernel
 except ImportError:
     try:
-        from src.core.backtest_as_model_future import _run_backtest_as_model_future_numba, _calculate_future_30s_returns
+        from src.core.kernel_registry import run_kernel
     except ImportError:
-        backtest_path = Path(__file__).parent.parent / "core" / "backtest_as_model_future.py"
-        spec = importlib.util.spec_from_file_location("backtest_as_model_future", backtest_path)
-        backtest_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(backtest_module)
-        _run_backtest_as_model_future_numba = backtest_module._run_backtest_as_model_future_numba
-        _calculate_future_30s_returns = backtest_module._calculate_future_30s_returns
+        import importlib.util
+        from pathlib import Path
+        project_root = Path(__file__).parent.parent.parent
+        kernel_registry_path = project_root / "src" / "core" / "kernel_registry.py"
+        spec = importlib.util.spec_from_file_location("kernel_registry", kernel_registry_path)
+        kernel_registry_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(kernel_registry_module)
+        run_kernel = kernel_registry_module.run_kernel
 
 
 class ASModelFutureStrategy(BaseStrategy):
@@ -116,10 +119,11 @@ class ASModelFutureStrategy(BaseStrategy):
         if len(processed_data) == 0:
             raise ValueError("输入数据为空")
         
-        # 预先计算所有未来30秒的return
-        print("正在计算未来30秒return...")
-        future_30s_returns = _calculate_future_30s_returns(processed_data)
-        print(f"✅ 未来30秒return计算完成，共 {len(future_30s_returns)} 个值")
+        # 获取预计算特征（未来30秒return、30分钟return中位值、分位数排名）
+        print("正在获取预计算特征...")
+        features = self.get_features(processed_data)
+        future_30s_returns = features["future_return"]
+        print(f"✅ 特征获取完成，共 {len(future_30s_returns)} 个值")
         
         # 准备资金费率数据
         funding_rate_data_raw = self.full_params.get("funding_rate_data", [])
@@ -157,7 +161,8 @@ class ASModelFutureStrategy(BaseStrategy):
         place_orders_stats_log = np.zeros((len(processed_data), 13), dtype=np.float64)
         
         print("开始执行AS_MODEL未来数据策略回测（模拟完美预测）...")
-        accounts_count, stats_count = _run_backtest_as_model_future_numba(
+        accounts_count, stats_count = run_kernel(
+            "as_model_future",
             processed_data,
             future_30s_returns,
             base_exposure,
@@ -174,7 +179,9 @@ class ASModelFutureStrategy(BaseStrategy):
             initial_pos,
             accounts_log,
             place_orders_stats_log,
-            funding_rate_data
+            funding_rate_data,
+            features["return_abs_median"],
+            features["future_return_rank"]
         )
         print(f"回测完成。共记录 {accounts_count} 条账户变动，{stats_count} 条订单生命周期。")
         
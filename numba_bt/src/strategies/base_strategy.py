@@ -1,6 +1,6 @@
 """策略基类"""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 import numpy as np
 from pathlib import Path
 import sys
@@ -9,6 +9,7 @@ import sys
 try:
     from ..wrapper.backtester import MarketMakerBacktester
     from ..utils.params_manager import ParamsManager
+    from ..core.kernel_registry import import_kernel_module
 except ImportError:
     # 如果相对导入失败，尝试绝对导入
     from pathlib import Path
@@ -18,6 +19,7 @@ except ImportError:
     try:
         from src.wrapper.backtester import MarketMakerBacktester
         from src.utils.params_manager import ParamsManager
+        from src.core.kernel_registry import import_kernel_module
     except ImportError:
         # 如果绝对导入也失败，使用importlib
         import importlib.util
@@ -33,6 +35,20 @@ except ImportError:
         spec.loader.exec_module(params_manager_module)
         ParamsManager = params_manager_module.ParamsManager
 
+        kernel_registry_path = project_root / "src" / "core" / "kernel_registry.py"
+        spec = importlib.util.spec_from_file_location("kernel_registry", kernel_registry_path)
+        kernel_registry_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(kernel_registry_module)
+        import_kernel_module = kernel_registry_module.import_kernel_module
+
+if TYPE_CHECKING:
+    from ..data.feature_store import FeatureStore, FeatureSpec
+
+
+def _feature_store_module():
+    """特征模块含 Numba 内核，经注册表延迟导入，保证内核缓存到注册表的缓存目录"""
+    return import_kernel_module("data.feature_store")
+
 
 class BaseStrategy(ABC):
     """策略基类，所有策略都应继承此类"""
@@ -70,6 +86,11 @@ class BaseStrategy(ABC):
         
         # 策略特定的状态
         self.strategy_state = {}
+
+        # 派生特征存储（默认进程内共享，网格搜索时可替换为磁盘缓存）
+        feature_store_module = _feature_store_module()
+        self.feature_store = feature_store_module.get_default_feature_store()
+        self.feature_spec = feature_store_module.FeatureSpec()
     
     def _create_backtester(self) -> MarketMakerBacktester:
         """创建回测器实例"""
@@ -101,6 +122,31 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def set_feature_store(self, feature_store: "FeatureStore", feature_spec: Optional["FeatureSpec"] = None):
+        """
+        设置派生特征存储
+
+        Args:
+            feature_store: 特征存储（如指定了cache_dir的磁盘缓存）
+            feature_spec: 特征规格，None 表示保持当前规格
+        """
+        self.feature_store = feature_store
+        if feature_spec is not None:
+            self.feature_spec = feature_spec
+
+    def get_features(self, data: np.ndarray, dataset_key: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        获取预处理后数据的派生特征（future_return / past_return / return_abs_median / future_return_rank）
+
+        Args:
+            data: 预处理后的市场数据数组
+            dataset_key: 数据集标识，None 时根据内容计算哈希
+
+        Returns:
+            特征名 -> 与 data 等长的数组
+        """
+        return self.feature_store.get_features(data, spec=self.feature_spec, dataset_key=dataset_key)
+
     def save_params(self, filepath: Path, metadata: Optional[Dict[str, Any]] = None):
         """
         保存策略参数
@@ -21,18 +21,30 @@ except ImportError:
         spec.loader.exec_module(base_strategy_module)
         BaseStrategy = base_strategy_module.BaseStrategy
 
+# 内核通过注册表调用（规范导入路径 + 持久化编译缓存）
 try:
-    from ..core.backtest_future_data import _run_backtest_future_data_numba, _calculate_future_30s_returns
+    from ..core.kernel_registry import run_kernel
+    from ..core.records import make_exec_params, make_future_data_params, FILL_MODEL_CROSS
 except ImportError:
     try:
-        from src.core.backtest_future_data import _run_backtest_future_data_numba, _calculate_future_30s_returns
+        from src.core.kernel_registry import run_kernel
+        from src.core.records import make_exec_params, make_future_data_params, FILL_MODEL_CROSS
     except ImportError:
-        backtest_path = Path(__file__).parent.parent / "core" / "backtest_future_data.py"
-        spec = importlib.util.spec_from_file_location("backtest_future_data", backtest_path)
-        backtest_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(backtest_module)
-        _run_backtest_future_data_numba = backtest_module._run_backtest_future_data_numba
-        _calculate_future_30s_returns = backtest_module._calculate_future_30s_returns
+        import importlib.util
+        from pathlib import Path
+        project_root = Path(__file__).parent.parent.parent
+        kernel_registry_path = project_root / "src" / "core" / "kernel_registry.py"
+        spec = importlib.util.spec_from_file_location("kernel_registry", kernel_registry_path)
+        kernel_registry_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(kernel_registry_module)
+        run_kernel = kernel_registry_module.run_kernel
+        records_path = project_root / "src" / "core" / "records.py"
+        spec = importlib.util.spec_from_file_location("records", records_path)
+        records_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(records_module)
+        make_exec_params = records_module.make_exec_params
+        make_future_data_params = records_module.make_future_data_params
+        FILL_MODEL_CROSS = records_module.FILL_MODEL_CROSS
 
 
 class FutureDataStrategy(BaseStrategy):
@@ -129,10 +141,10 @@ class FutureDataStrategy(BaseStrategy):
         if len(processed_data) == 0:
             raise ValueError("输入数据为空")
         
-        # 预先计算所有未来30秒的return
-        print("正在计算未来30秒return...")
-        future_30s_returns = _calculate_future_30s_returns(processed_data)
-        print(f"✅ 未来30秒return计算完成，共 {len(future_30s_returns)} 个值")
+        # 获取预计算的未来30秒return
+        print("正在获取未来30秒return...")
+        future_30s_returns = self.get_features(processed_data)["future_return"]
+        print(f"✅ 未来30秒return获取完成，共 {len(future_30s_returns)} 个值")
         
         # 准备资金费率数据
         funding_rate_data_raw = self.full_params.get("funding_rate_data", [])
@@ -161,34 +173,46 @@ class FutureDataStrategy(BaseStrategy):
         mini_price_step = self.params.get("mini_price_step", 0.0001)
         taker_fee_rate = self.params.get("taker_fee_rate", 0.00015)
         maker_fee_rate = self.params.get("maker_fee_rate", -0.00005)
-        open_ratio = self.params.get("open_ratio", 0.5)
         initial_cash = self.params.get("initial_cash", 10000.0)
         initial_pos = self.params.get("initial_pos", 0.0)
+        # 挂单成交模型：FILL_MODEL_CROSS（穿价成交）或 FILL_MODEL_QUEUE（按订单簿排队位置成交）
+        fill_model = self.params.get("fill_model", FILL_MODEL_CROSS)
         
         # 预分配结果数组
         accounts_log = np.zeros((len(processed_data) * 2, 10), dtype=np.float64)
-        place_orders_stats_log = np.zeros((len(processed_data), 13), dtype=np.float64)
+        place_orders_stats_log = np.zeros((len(processed_data) * 2, 13), dtype=np.float64)
         
         print("开始执行未来数据策略回测（模拟完美预测）...")
-        accounts_count, stats_count = _run_backtest_future_data_numba(
+        # 统一事件循环：执行参数和策略参数以打包记录传入
+        exec_params = make_exec_params(
+            exposure=exposure,
+            target_pct=target_pct,
+            hedge_threshold_pct=self.hedge_threshold_pct,
+            hedge_price_ticks=2,
+            mini_price_step=mini_price_step,
+            taker_fee_rate=taker_fee_rate,
+            maker_fee_rate=maker_fee_rate,
+            price_update_threshold=self.price_update_threshold,
+            enable_stop_loss=True,
+            stop_loss_pct=self.stop_loss_pct,
+            initial_cash=initial_cash,
+            initial_pos=initial_pos,
+            fill_model=fill_model
+        )
+        strategy_params = make_future_data_params(
+            return_percentile_20=self.return_percentile_20,
+            return_percentile_80=self.return_percentile_80,
+            spread_median=self.spread_median,
+            order_size=self.order_size,
+            min_spread_pct=self.min_spread_pct
+        )
+        accounts_count, stats_count = run_kernel(
+            "event_loop_future_data",
             processed_data,
-            future_30s_returns,
-            exposure,
-            target_pct,
-            mini_price_step,
-            taker_fee_rate,
-            maker_fee_rate,
-            open_ratio,
-            self.return_percentile_20,
-            self.return_percentile_80,
-            self.spread_median,
-            self.order_size,
-            self.price_update_threshold,
-            self.min_spread_pct,
-            self.hedge_threshold_pct,
-            self.stop_loss_pct,
-            initial_cash,
-            initial_pos,
+            future_30s_returns.reshape(-1, 1),
+            exec_params,
+            strategy_params,
+            np.empty(0, dtype=np.float64),
             accounts_log,
             place_orders_stats_log,
             funding_rate_data
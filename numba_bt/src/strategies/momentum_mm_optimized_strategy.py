@@ -23,20 +23,21 @@ except ImportError:
         spec.loader.exec_module(base_strategy_module)
         BaseStrategy = base_strategy_module.BaseStrategy
 
+# 内核通过注册表调用（规范导入路径 + 持久化编译缓存）
 try:
-    from ..core.backtest_momentum_mm_optimized import _run_backtest_momentum_mm_optimized_numba
+    from ..core.kernel_registry import run_kernel
 except ImportError:
     try:
-        from src.core.backtest_momentum_mm_optimized import _run_backtest_momentum_mm_optimized_numba
+        from src.core.kernel_registry import run_kernel
     except ImportError:
         import importlib.util
         from pathlib import Path
         project_root = Path(__file__).parent.parent.parent
-        backtest_path = project_root / "src" / "core" / "backtest_momentum_mm_optimized.py"
-        spec = importlib.util.spec_from_file_location("backtest_momentum_mm_optimized", backtest_path)
-        backtest_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(backtest_module)
-        _run_backtest_momentum_mm_optimized_numba = backtest_module._run_backtest_momentum_mm_optimized_numba
+        kernel_registry_path = project_root / "src" / "core" / "kernel_registry.py"
+        spec = importlib.util.spec_from_file_location("kernel_registry", kernel_registry_path)
+        kernel_registry_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(kernel_registry_module)
+        run_kernel = kernel_registry_module.run_kernel
 
 try:
     from ..analysis.statistics import analyze_performance
@@ -182,12 +183,16 @@ class MomentumMMOptimizedStrategy(BaseStrategy):
         initial_cash = self.params.get("initial_cash", 10000.0)
         initial_pos = self.params.get("initial_pos", 0.0)
         
+        # 预计算的过去30s return
+        past_30s_returns = self.get_features(processed_data)["past_return"]
+
         # 预分配结果数组
         accounts_log = np.zeros((len(processed_data) * 2, 10), dtype=np.float64)
         place_orders_stats_log = np.zeros((len(processed_data), 13), dtype=np.float64)
         
         print("开始执行优化版本的动量做市策略回测...")
-        accounts_count, stats_count = _run_backtest_momentum_mm_optimized_numba(
+        accounts_count, stats_count = run_kernel(
+            "momentum_mm_optimized",
             processed_data,
             exposure,
             target_pct,
@@ -207,7 +212,8 @@ class MomentumMMOptimizedStrategy(BaseStrategy):
             initial_pos,
             accounts_log,
             place_orders_stats_log,
-            funding_rate_data
+            funding_rate_data,
+            past_30s_returns
         )
         print(f"回测完成。共记录 {accounts_count} 条账户变动，{stats_count} 条订单生命周期。")
         
@@ -5,7 +5,7 @@ from pathlib import Path
 from datetime import datetime, timezone, timedelta
 
 from .base_strategy import BaseStrategy
-from ..core.backtest import _run_backtest_numba
+from ..core.kernel_registry import run_kernel
 from ..analysis.statistics import analyze_performance
 
 
@@ -198,7 +198,8 @@ class TimedHedgeStrategy(BaseStrategy):
             funding_rate_data = np.array([]).reshape(0, 2)
         
         # 调用带扩展点的回测函数
-        accounts_count, stats_count = _run_backtest_numba(
+        accounts_count, stats_count = run_kernel(
+            "backtest",
             processed_data,
             params["exposure"], params["target_pct"],
             params["buy_place_grid_step_value"], params["sell_place_grid_step_value"],
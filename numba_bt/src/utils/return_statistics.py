@@ -1,10 +1,10 @@
 """30s return和spread统计工具"""
 import numpy as np
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def calculate_30s_returns(prices: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
     """
     计算30秒收益率
@@ -35,12 +35,13 @@ def calculate_30s_returns(prices: np.ndarray, timestamps: np.ndarray) -> np.ndar
     return returns
 
 
-def calculate_return_statistics(data: np.ndarray) -> Dict[str, Any]:
+def calculate_return_statistics(data: np.ndarray, past_returns: Optional[np.ndarray] = None) -> Dict[str, Any]:
     """
     计算30s return统计信息
     
     Args:
         data: 市场数据数组 [timestamp, order_side, price, quantity, mm_flag]
+        past_returns: FeatureStore 预计算的过去30s return（与data等长），提供时不再重新计算
     
     Returns:
         统计信息字典
@@ -56,12 +57,15 @@ def calculate_return_statistics(data: np.ndarray) -> Dict[str, Any]:
             "return_median": 0.0
         }
     
-    market_data = data[market_mask]
-    prices = market_data[:, 2]
-    timestamps = market_data[:, 0]
-    
-    # 计算30s return
-    returns = calculate_30s_returns(prices, timestamps)
+    if past_returns is not None and len(past_returns) == len(data):
+        returns = np.nan_to_num(past_returns[market_mask], nan=0.0)
+    else:
+        market_data = data[market_mask]
+        prices = market_data[:, 2]
+        timestamps = market_data[:, 0]
+        
+        # 计算30s return
+        returns = calculate_30s_returns(prices, timestamps)
     
     # 过滤掉0值（第一个值）
     valid_returns = returns[returns != 0]
@@ -6,22 +6,22 @@ from pathlib import Path
 
 # 支持相对导入和绝对导入
 try:
-    from ..core.backtest import _run_backtest_numba
+    from ..core.kernel_registry import run_kernel
 except ImportError:
     # 如果相对导入失败，尝试绝对导入
     project_root = Path(__file__).parent.parent.parent
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
     try:
-        from src.core.backtest import _run_backtest_numba
+        from src.core.kernel_registry import run_kernel
     except ImportError:
         # 如果绝对导入也失败，使用importlib
         import importlib.util
-        backtest_path = project_root / "src" / "core" / "backtest.py"
-        spec = importlib.util.spec_from_file_location("backtest", backtest_path)
-        backtest_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(backtest_module)
-        _run_backtest_numba = backtest_module._run_backtest_numba
+        kernel_registry_path = project_root / "src" / "core" / "kernel_registry.py"
+        spec = importlib.util.spec_from_file_location("kernel_registry", kernel_registry_path)
+        kernel_registry_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(kernel_registry_module)
+        run_kernel = kernel_registry_module.run_kernel
 
 
 class MarketMakerBacktester:
@@ -143,7 +143,8 @@ class MarketMakerBacktester:
         
         print("开始执行Numba加速的回测循环...")
         # 调用Numba JIT函数
-        accounts_count, stats_count = _run_backtest_numba(
+        accounts_count, stats_count = run_kernel(
+            "backtest",
             data_feed,
             self.exposure, self.target_pct, self.buy_place_grid_step_value, self.sell_place_grid_step_value,
             self.buy_maker_place_thred_pct, self.sell_maker_place_thred_pct,
@@ -8,7 +8,6 @@ import glob
 import zipfile
 import duckdb
 import tempfile
-import importlib.util
 from itertools import product
 from joblib import Parallel, delayed
 from tqdm import tqdm
@@ -22,33 +21,17 @@ os.chdir(project_root)
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, '/home/wilson/bigdata_plan')
 
-# 导入策略
-strategy_path = project_root / "src" / "strategies" / "as_model_future_strategy.py"
-spec = importlib.util.spec_from_file_location("as_model_future_strategy", strategy_path)
-strategy_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(strategy_module)
-ASModelFutureStrategy = strategy_module.ASModelFutureStrategy
+# 以规范包路径导入，与注册表和子进程导入的是同一份模块
+from src.data.preparer import DataPreparer
+from src.analysis.statistics import analyze_performance
 
-# 导入其他模块
-preparer_path = project_root / "src" / "data" / "preparer.py"
-spec = importlib.util.spec_from_file_location("preparer", preparer_path)
-preparer_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(preparer_module)
-DataPreparer = preparer_module.DataPreparer
+# 内核通过注册表以规范包路径导入，编译结果持久化缓存，子进程直接加载
+from src.core.kernel_registry import get_kernel_registry, import_kernel_module, run_kernel
 
-statistics_path = project_root / "src" / "analysis" / "statistics.py"
-spec = importlib.util.spec_from_file_location("statistics", statistics_path)
-statistics_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(statistics_module)
-analyze_performance = statistics_module.analyze_performance
-
-core_path = project_root / "src" / "core" / "backtest_as_model_future.py"
-spec = importlib.util.spec_from_file_location("backtest_as_model_future", core_path)
-core_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(core_module)
-_calculate_future_30s_returns = core_module._calculate_future_30s_returns
-_run_backtest_as_model_future_numba = core_module._run_backtest_as_model_future_numba
-_run_backtest_as_model_future_numba = core_module._run_backtest_as_model_future_numba
+# 特征模块含内核，经注册表导入，先设置缓存目录再装饰内核
+feature_store_module = import_kernel_module("data.feature_store")
+FeatureStore = feature_store_module.FeatureStore
+FEATURE_CACHE_DIR = feature_store_module.FEATURE_CACHE_DIR
 
 
 def load_data(symbol, start_date, end_date):
@@ -135,17 +118,18 @@ def load_data(symbol, start_date, end_date):
         end_date=end_date
     )
     
-    # 预先计算未来30秒return
-    print(f"正在计算未来30秒return...")
-    future_30s_returns = _calculate_future_30s_returns(merged_data)
-    print(f"✅ 数据加载完成")
+    # 预先计算派生特征（按数据集哈希缓存到磁盘，重复运行时直接加载）
+    print("正在获取预计算特征...")
+    store = FeatureStore(cache_dir=FEATURE_CACHE_DIR)
+    features = store.get_features(merged_data)
+    print(f"✅ 数据加载完成（特征缓存命中: {store.hits}，计算: {store.misses}）")
     
-    return merged_data, funding_data, future_30s_returns
+    return merged_data, funding_data, features
 
 
 def run_single_backtest(params, data_tuple):
     """运行单个回测（用于多进程，直接调用核心函数避免重复计算）"""
-    merged_data, funding_data, future_30s_returns = data_tuple
+    merged_data, funding_data, features = data_tuple
     
     try:
         # 直接调用核心函数，避免通过策略类（减少开销和重复计算future_30s_returns）
@@ -169,10 +153,11 @@ def run_single_backtest(params, data_tuple):
         accounts_log = np.zeros((len(merged_data) * 2, 10), dtype=np.float64)
         place_orders_stats_log = np.zeros((len(merged_data), 13), dtype=np.float64)
         
-        # 执行回测（直接调用核心函数，使用预计算的future_30s_returns）
-        accounts_count, stats_count = _run_backtest_as_model_future_numba(
+        # 执行回测（直接调用核心函数，使用预计算特征）
+        accounts_count, stats_count = run_kernel(
+            "as_model_future",
             merged_data,
-            future_30s_returns,  # 使用预计算的结果，避免重复计算
+            features["future_return"],  # 使用预计算的结果，避免重复计算
             base_exposure,
             base_target_pct,
             mini_price_step,
@@ -187,7 +172,9 @@ def run_single_backtest(params, data_tuple):
             initial_pos,
             accounts_log,
             place_orders_stats_log,
-            funding_rate_data
+            funding_rate_data,
+            features["return_abs_median"],
+            features["future_return_rank"]
         )
         
         # 分析结果
@@ -358,9 +345,13 @@ def main():
     
     # 1. 加载数据（只执行一次）
     print(f"\n步骤1: 加载数据")
-    merged_data, funding_data, future_30s_returns = load_data(symbol, start_date, end_date)
-    data_tuple = (merged_data, funding_data, future_30s_returns)
+    merged_data, funding_data, features = load_data(symbol, start_date, end_date)
+    data_tuple = (merged_data, funding_data, features)
     
+    # 预热内核：在主进程中编译（或从磁盘缓存加载），并行进程不再重复编译
+    print("\n预热Numba内核...")
+    get_kernel_registry().warmup(["as_model_future"], verbose=True)
+
     # 2. 生成参数网格
     print(f"\n步骤2: 生成参数网格")
     param_combinations = generate_parameter_grid()
@@ -392,6 +383,9 @@ def main():
             results.extend(batch_results)
             pbar.update(len(batch))
     
+    print("\n主进程内核耗时:")
+    print(get_kernel_registry().format_report())
+
     # 4. 分析结果
     print(f"\n步骤4: 分析结果")
     valid_results = [r for r in results if "error" not in r]
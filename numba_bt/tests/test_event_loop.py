@@ -0,0 +1,221 @@
+"""测试统一事件循环：报价内核在事件循环上的结果与原专用内核逐位一致，注册表预热后不再编译"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from numba import njit
+
+# 添加项目根目录到路径（使用绝对路径）
+project_root = Path(__file__).parent.parent.absolute()
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.core.backtest_future_data import _run_backtest_future_data_numba
+from src.core.backtest_momentum_mm import _run_backtest_momentum_mm_numba
+from src.core.event_loop import run_event_loop, BUY, SELL, QUOTE_PLACE, QUOTE_PRICE, QUOTE_QTY
+from src.core.kernel_registry import get_kernel_registry
+from src.core.quote_kernels import run_future_data_loop, run_momentum_mm_loop
+from src.core.records import (
+    make_exec_params, make_future_data_params, make_momentum_mm_params, FILL_MODEL_CROSS, FILL_MODEL_QUEUE,
+)
+from src.data.feature_store import compute_features
+
+P20, P80, SPREAD_MEDIAN, ORDER_SIZE = -0.0003, 0.0003, 0.0005, 100.0
+PRICE_UPDATE_THRESHOLD, MIN_SPREAD_PCT, HEDGE_THRESHOLD_PCT, STOP_LOSS_PCT = 0.002, 0.002, 0.8, 0.1
+COMMON = dict(exposure=5000.0, target_pct=0.5, mini_price_step=0.0001,
+              taker_fee_rate=0.00015, maker_fee_rate=-0.00005)
+
+
+def _make_data(n: int = 30000, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    timestamps = np.cumsum(rng.integers(1, 400, size=n)).astype(np.float64) + 1_700_000_000_000
+    prices = 10.0 * np.exp(np.cumsum(rng.normal(0, 2e-4, size=n)))
+    sides = np.where(rng.random(n) < 0.5, -1.0, 1.0)
+    quantities = rng.random(n) * 10 + 0.1
+    mm_flags = np.where(rng.random(n) < 0.02, 0.0, 1.0)
+    quantities = np.where(mm_flags == 0, quantities * 0.1, quantities)
+    return np.column_stack([timestamps, sides, prices, quantities, mm_flags])
+
+
+def _funding(data: np.ndarray) -> np.ndarray:
+    n = len(data)
+    return np.array([[data[n // 3, 0], 0.0001], [data[2 * n // 3, 0], -0.0002]])
+
+
+def _logs(n: int):
+    return np.zeros((n * 2, 10), dtype=np.float64), np.zeros((n * 2, 13), dtype=np.float64)
+
+
+def test_future_data_quote_matches_legacy_kernel():
+    """未来数据策略：事件循环（含对冲、止损、资金费）与原内核日志逐位一致"""
+    data = _make_data()
+    future_return = compute_features(data)["future_return"]
+    funding = _funding(data)
+
+    accounts_old, stats_old = _logs(len(data))
+    count_old = _run_backtest_future_data_numba(
+        data, future_return, 5000.0, 0.5, 0.0001, 0.00015, -0.00005, 0.5,
+        P20, P80, SPREAD_MEDIAN, ORDER_SIZE, PRICE_UPDATE_THRESHOLD, MIN_SPREAD_PCT,
+        HEDGE_THRESHOLD_PCT, STOP_LOSS_PCT, 10000.0, 0.0,
+        accounts_old, stats_old, funding
+    )
+
+    accounts_new, stats_new = _logs(len(data))
+    exec_params = make_exec_params(
+        hedge_threshold_pct=HEDGE_THRESHOLD_PCT, hedge_price_ticks=2,
+        price_update_threshold=PRICE_UPDATE_THRESHOLD,
+        enable_stop_loss=True, stop_loss_pct=STOP_LOSS_PCT, **COMMON
+    )
+    count_new = run_future_data_loop(
+        data, future_return.reshape(-1, 1), exec_params,
+        make_future_data_params(P20, P80, SPREAD_MEDIAN, ORDER_SIZE, MIN_SPREAD_PCT),
+        np.empty(0, dtype=np.float64), accounts_new, stats_new, funding
+    )
+
+    assert tuple(count_old) == tuple(count_new)
+    assert count_new[0] > 0 and count_new[1] > 0
+    assert np.array_equal(accounts_old[:count_old[0]], accounts_new[:count_new[0]])
+    assert np.array_equal(stats_old[:count_old[1]], stats_new[:count_new[1]])
+
+
+def test_momentum_mm_quote_matches_legacy_kernel():
+    """动量做市策略：事件循环与原内核日志逐位一致"""
+    data = _make_data()
+    past_return = compute_features(data)["past_return"]
+    funding = _funding(data)
+
+    accounts_old, stats_old = _logs(len(data))
+    count_old = _run_backtest_momentum_mm_numba(
+        data, 5000.0, 0.5, 0.0001, 0.00015, -0.00005, 0.5,
+        P20, P80, SPREAD_MEDIAN, ORDER_SIZE, PRICE_UPDATE_THRESHOLD, 10000.0, 0.0,
+        accounts_old, stats_old, funding, past_return
+    )
+
+    accounts_new, stats_new = _logs(len(data))
+    count_new = run_momentum_mm_loop(
+        data, past_return.reshape(-1, 1),
+        make_exec_params(price_update_threshold=PRICE_UPDATE_THRESHOLD, **COMMON),
+        make_momentum_mm_params(P20, P80, SPREAD_MEDIAN, ORDER_SIZE),
+        np.empty(0, dtype=np.float64), accounts_new, stats_new, funding
+    )
+
+    assert tuple(count_old) == tuple(count_new)
+    assert np.array_equal(accounts_old[:count_old[0]], accounts_new[:count_new[0]])
+    assert np.array_equal(stats_old[:count_old[1]], stats_new[:count_new[1]])
+
+
+def test_registry_event_loop_kernels_do_not_recompile():
+    """预热后通过注册表调用事件循环内核不会触发额外编译"""
+    registry = get_kernel_registry()
+    registry.warmup(["event_loop_momentum_mm"])
+
+    data = _make_data(2000)
+    accounts_log, stats_log = _logs(len(data))
+    registry.call(
+        "event_loop_momentum_mm",
+        data, compute_features(data)["past_return"].reshape(-1, 1),
+        make_exec_params(**COMMON),
+        make_momentum_mm_params(P20, P80, SPREAD_MEDIAN, ORDER_SIZE),
+        np.empty(0, dtype=np.float64), accounts_log, stats_log,
+        np.empty((0, 2), dtype=np.float64)
+    )
+    assert registry.report()["event_loop_momentum_mm"]["lazy_compile_count"] == 0
+
+
+@njit
+def _fixed_quote(i, now_ts, mark_price, pos, signals, exec_params, strategy_params,
+                 quote_state, orders, active, quotes):
+    """固定价格报价：quote_state = [买价, 卖价, 数量]"""
+    for k in range(2):
+        quotes[k, QUOTE_PLACE] = 1.0
+        quotes[k, QUOTE_QTY] = quote_state[2]
+    quotes[BUY, QUOTE_PRICE] = quote_state[0]
+    quotes[SELL, QUOTE_PRICE] = quote_state[1]
+
+
+@njit
+def _run_fixed_quote(data_feed, exec_params, quote_state, accounts_log, place_orders_stats_log):
+    return run_event_loop(data_feed, np.zeros((data_feed.shape[0], 1)), exec_params, exec_params, quote_state,
+                          _fixed_quote, accounts_log, place_orders_stats_log, np.empty((0, 2)))
+
+
+def _run_fixed(data, fill_model):
+    exec_params = make_exec_params(exposure=1e9, hedge_threshold_pct=1.0, mini_price_step=0.01,
+                                   price_update_threshold=1.0, fill_model=fill_model)
+    accounts_log, stats_log = _logs(len(data))
+    accounts_count, stats_count = _run_fixed_quote(data, exec_params, np.array([9.99, 10.05, 1.0]),
+                                                   accounts_log, stats_log)
+    return accounts_log[:accounts_count], stats_log[:stats_count]
+
+
+def test_queue_fill_model():
+    """排队成交：同价位成交先消耗前方排队量，价位数量减少时排队量下调，穿价成交直接成交"""
+    data = np.array([
+        [1.0, 1.0, 9.99, 3.0, -1.0],    # 订单簿：买一 9.99 共 3
+        [2.0, 1.0, 10.00, 1.0, 1.0],    # 市场成交，挂买单 9.99（前方排队 3）
+        [3.0, -1.0, 9.99, 2.0, 1.0],    # 9.99 成交 2：排队 3 -> 1，不成交
+        [4.0, 1.0, 9.99, 0.5, -1.0],    # 价位数量降为 0.5：排队 1 -> 0.5
+        [5.0, -1.0, 9.99, 0.8, 1.0],    # 9.99 成交 0.8：消耗排队 0.5，我方成交 0.3
+        [6.0, -1.0, 9.98, 5.0, 1.0],    # 穿价成交：剩余 0.7 全部成交
+    ])
+    accounts, stats = _run_fixed(data, FILL_MODEL_QUEUE)
+    maker = accounts[accounts[:, 9] == 2]
+    assert np.array_equal(maker[:, 0], [5.0, 6.0])
+    assert np.allclose(maker[:, 5], [0.3, 0.7])
+    assert np.allclose(maker[:, 2], [0.3, 1.0])
+    filled = stats[stats[:, 8] == 0]
+    assert len(filled) == 1
+    assert filled[0, 0] == 2.0 and filled[0, 5] == 1.0 and filled[0, 10] == 3.0
+
+    # 穿价模型：订单簿行也视为市场数据，9.99 的第一笔成交即成交
+    accounts, stats = _run_fixed(data, FILL_MODEL_CROSS)
+    maker = accounts[accounts[:, 9] == 2]
+    assert maker[0, 0] == 3.0 and maker[0, 5] == 1.0
+    assert np.all(stats[:, 10] == 0.0)
+
+
+def test_queue_fill_model_throughput():
+    """排队成交模型吞吐：同一份纯成交数据上与穿价模型比较耗时"""
+    rng = np.random.default_rng(7)
+    n, tick = 300000, 0.0001
+    mid_ticks = np.round(10.0 * np.exp(np.cumsum(rng.normal(0, 1e-4, size=n))) / tick)
+    sides = np.where(rng.random(n) < 0.5, -1.0, 1.0)
+    data = np.column_stack([
+        np.cumsum(rng.integers(1, 200, size=n)).astype(np.float64) + 1_700_000_000_000,
+        sides,
+        (mid_ticks + sides * rng.integers(0, 3, size=n)) * tick,
+        rng.random(n) * 20 + 0.1,
+        np.ones(n),
+    ])
+    signals = compute_features(data)["past_return"].reshape(-1, 1)
+    strategy_params = make_momentum_mm_params(P20, P80, SPREAD_MEDIAN, ORDER_SIZE)
+
+    def run(fill_model):
+        exec_params = make_exec_params(price_update_threshold=0.001, fill_model=fill_model, **COMMON)
+        accounts_log, stats_log = _logs(n)
+        start = time.perf_counter()
+        counts = run_momentum_mm_loop(data, signals, exec_params, strategy_params, np.empty(0, dtype=np.float64),
+                                      accounts_log, stats_log, np.empty((0, 2), dtype=np.float64))
+        return time.perf_counter() - start, counts
+
+    timings = {}
+    for fill_model in (FILL_MODEL_CROSS, FILL_MODEL_QUEUE):
+        run(fill_model)
+        timings[fill_model] = min(run(fill_model)[0] for _ in range(5))
+    _, (_, stats_count) = run(FILL_MODEL_QUEUE)
+
+    ratio = timings[FILL_MODEL_QUEUE] / timings[FILL_MODEL_CROSS]
+    print(f"  穿价模型: {timings[FILL_MODEL_CROSS] * 1000:.1f}ms，排队模型: {timings[FILL_MODEL_QUEUE] * 1000:.1f}ms，"
+          f"耗时比: {ratio:.2f}")
+    assert stats_count > 0
+    assert ratio < 1.2
+
+
+if __name__ == "__main__":
+    test_future_data_quote_matches_legacy_kernel()
+    test_momentum_mm_quote_matches_legacy_kernel()
+    test_registry_event_loop_kernels_do_not_recompile()
+    test_queue_fill_model()
+    test_queue_fill_model_throughput()
+    print("✅ 统一事件循环测试通过")
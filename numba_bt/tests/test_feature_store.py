@@ -0,0 +1,122 @@
+"""测试特征存储：预计算特征与回测内核原有计算结果一致，并验证缓存命中"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 添加项目根目录到路径（使用绝对路径）
+project_root = Path(__file__).parent.parent.absolute()
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.core.backtest_as_model_future import _calculate_future_30s_returns
+from src.data.feature_store import FeatureStore, FeatureSpec, compute_features
+from src.utils.return_statistics import calculate_30s_returns
+
+
+def _make_data(n: int = 20000, seed: int = 7) -> np.ndarray:
+    """生成模拟数据：[timestamp, order_side, price, quantity, mm_flag]，约20%为taker trades"""
+    rng = np.random.default_rng(seed)
+    timestamps = np.cumsum(rng.integers(1, 400, size=n)).astype(np.float64) + 1_700_000_000_000
+    prices = 10.0 * np.exp(np.cumsum(rng.normal(0, 2e-4, size=n)))
+    sides = np.where(rng.random(n) < 0.5, -1.0, 1.0)
+    quantities = rng.random(n) * 10 + 0.1
+    mm_flags = np.where(rng.random(n) < 0.2, 0.0, 1.0)
+    return np.column_stack([timestamps, sides, prices, quantities, mm_flags])
+
+
+def test_future_returns_parity():
+    """未来30s return与 _calculate_future_30s_returns 一致"""
+    data = _make_data()
+    features = compute_features(data)
+    expected = _calculate_future_30s_returns(data)
+    assert np.allclose(features["future_return"], expected)
+
+
+def test_past_returns_parity():
+    """过去30s return与 calculate_30s_returns（市场数据子序列）一致"""
+    data = _make_data()
+    features = compute_features(data)
+    market_mask = data[:, 4] != 0
+    expected = calculate_30s_returns(data[market_mask, 2], data[market_mask, 0])
+    actual = np.nan_to_num(features["past_return"][market_mask], nan=0.0)
+    assert np.allclose(actual, expected)
+
+
+def test_rolling_median_and_rank():
+    """30分钟return中位值和分位数排名与朴素实现一致"""
+    data = _make_data(n=3000)
+    spec = FeatureSpec()
+    features = compute_features(data, spec)
+    past = features["past_return"]
+    future = features["future_return"]
+
+    market_idx = np.where(data[:, 4] != 0)[0]
+    for i in market_idx[::97]:
+        ts = data[i, 0]
+        window = [past[j] for j in market_idx[market_idx <= i]
+                  if not np.isnan(past[j]) and data[j, 0] >= ts - spec.lookback_ms]
+        window = window[-spec.lookback_max_count:]
+        if not window:
+            assert features["return_abs_median"][i] == 0.0
+            assert features["future_return_rank"][i] == 0.5
+            continue
+        window = np.array(window)
+        assert np.isclose(features["return_abs_median"][i], np.median(np.abs(window)))
+        assert np.isclose(features["future_return_rank"][i], np.sum(window < future[i]) / len(window))
+
+
+def test_rolling_median_matches_pandas():
+    """有效过去return处的中位值与 pandas rolling median 一致：默认规格按个数截断，短回看窗口按时间截断（含左端点）"""
+    data = _make_data(n=5000)
+    market_idx = np.where(data[:, 4] != 0)[0]
+    for spec, window in ((FeatureSpec(), None),
+                         (FeatureSpec(lookback_ms=20 * 1000, lookback_max_count=100000), "20000ms")):
+        features = compute_features(data, spec)
+        past = features["past_return"][market_idx]
+        valid_idx = market_idx[~np.isnan(past)]
+        returns = pd.Series(np.abs(features["past_return"][valid_idx]),
+                            index=pd.to_datetime(data[valid_idx, 0], unit="ms"))
+        if window is None:
+            expected = returns.rolling(spec.lookback_max_count, min_periods=1).median()
+        else:
+            expected = returns.rolling(window, min_periods=1, closed="both").median()
+        assert np.allclose(features["return_abs_median"][valid_idx], expected.to_numpy())
+
+
+def test_feature_store_disk_cache():
+    """磁盘缓存：第二个存储实例直接命中缓存"""
+    data = _make_data()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = FeatureStore(cache_dir=Path(tmp_dir))
+        start = time.perf_counter()
+        first = store.get_features(data)
+        compute_time = time.perf_counter() - start
+        assert store.misses == 1
+
+        other_store = FeatureStore(cache_dir=Path(tmp_dir))
+        start = time.perf_counter()
+        second = other_store.get_features(data)
+        load_time = time.perf_counter() - start
+        assert other_store.hits == 1 and other_store.misses == 0
+
+        for name, array in first.items():
+            assert np.array_equal(np.asarray(second[name]), array, equal_nan=True)
+
+        # 不同特征规格使用不同缓存键
+        other_store.get_features(data, spec=FeatureSpec(future_window_ms=60 * 1000))
+        assert other_store.misses == 1
+
+        print(f"  计算耗时: {compute_time * 1000:.1f}ms，缓存加载耗时: {load_time * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    test_future_returns_parity()
+    test_past_returns_parity()
+    test_rolling_median_and_rank()
+    test_rolling_median_matches_pandas()
+    test_feature_store_disk_cache()
+    print("✅ 特征存储测试通过")
@@ -0,0 +1,109 @@
+"""测试内核注册表：显式签名预热、参数类型转换、编译/运行耗时统计"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 添加项目根目录到路径（使用绝对路径）
+project_root = Path(__file__).parent.parent.absolute()
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.core.kernel_registry import KERNEL_SPECS, get_kernel_registry, source_hash
+
+
+def _make_data(n: int = 5000, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    timestamps = np.cumsum(rng.integers(1, 400, size=n)).astype(np.float64) + 1_700_000_000_000
+    prices = 10.0 * np.exp(np.cumsum(rng.normal(0, 2e-4, size=n)))
+    sides = np.where(rng.random(n) < 0.5, -1.0, 1.0)
+    quantities = rng.random(n) * 10 + 0.1
+    mm_flags = np.where(rng.random(n) < 0.2, 0.0, 1.0)
+    return np.column_stack([timestamps, sides, prices, quantities, mm_flags])
+
+
+def test_source_hash_is_stable():
+    """源码哈希稳定且覆盖所有注册内核"""
+    assert source_hash() == source_hash()
+    assert len(KERNEL_SPECS) >= 6
+
+
+def test_import_does_not_configure_numba_cache(tmp_path):
+    """仅导入注册表不修改 Numba 缓存配置；缓存目录在首次获取内核时设置，且位于指定的缓存根目录下"""
+    env = {key: value for key, value in os.environ.items() if key != "NUMBA_CACHE_DIR"}
+    env["NUMBA_BT_CACHE_DIR"] = str(tmp_path)
+    script = (
+        "import os, numba\n"
+        "from src.core.kernel_registry import get_kernel_registry\n"
+        "print(os.environ.get('NUMBA_CACHE_DIR'), numba.config.CACHE_DIR)\n"
+        "get_kernel_registry().get_kernel('return_statistics_30s')\n"
+        "print(os.environ.get('NUMBA_CACHE_DIR'))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=project_root, env=env,
+                            capture_output=True, text=True, check=True)
+    before, after = result.stdout.strip().splitlines()[-2:]
+    assert before.split()[0] == "None"
+    assert str(tmp_path) not in before
+    assert Path(after).parent == tmp_path
+
+
+def test_strategy_feature_kernels_cache_in_registry_dir(tmp_path):
+    """新进程中导入策略并计算特征：特征内核缓存到注册表的缓存目录，而不是源码树的 __pycache__"""
+    env = {key: value for key, value in os.environ.items() if key != "NUMBA_CACHE_DIR"}
+    env["NUMBA_BT_CACHE_DIR"] = str(tmp_path)
+    script = (
+        "import numpy as np\n"
+        "from src.strategies.as_model_future_strategy import ASModelFutureStrategy\n"
+        "from src.core.kernel_registry import get_kernel_registry\n"
+        "n = 2000\n"
+        "data = np.zeros((n, 5))\n"
+        "data[:, 0] = 1_700_000_000_000 + np.arange(n) * 100.0\n"
+        "data[:, 2] = 10.0 + np.sin(np.arange(n) / 50.0)\n"
+        "ASModelFutureStrategy().get_features(data, dataset_key='cache-dir-test')\n"
+        "print(get_kernel_registry().cache_dir)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=project_root, env=env,
+                            capture_output=True, text=True, check=True)
+    assert "已在缓存目录设置前导入" not in result.stdout
+    cache_dir = Path(result.stdout.strip().splitlines()[-1])
+    assert cache_dir.parent == tmp_path
+    cached = [path.name for path in cache_dir.rglob("feature_store.*.nbi")]
+    for function in ("_compute_future_returns", "_compute_past_returns", "_compute_rolling_median_and_rank"):
+        assert any(name.startswith(f"feature_store.{function}-") for name in cached), function
+
+
+def test_warmup_then_call_does_not_recompile():
+    """预热后以 int 标量调用不会触发额外编译"""
+    registry = get_kernel_registry()
+    timings = registry.warmup(["as_model_future"], verbose=True)
+    assert "as_model_future" in timings
+
+    data = _make_data()
+    accounts_log = np.zeros((len(data) * 2, 10), dtype=np.float64)
+    place_orders_stats_log = np.zeros((len(data), 13), dtype=np.float64)
+    empty = np.empty(0, dtype=np.float64)
+
+    accounts_count, stats_count = registry.call(
+        "as_model_future",
+        data, np.zeros(len(data)),
+        10000, 0.5, 0.0001, 0.00015, -0.00005, 0.5,
+        1.0, 1.0, 0.05, 0.10,
+        10000, 0,
+        accounts_log, place_orders_stats_log,
+        np.empty((0, 2), dtype=np.float64),
+        empty, empty
+    )
+    assert accounts_count >= 0 and stats_count >= 0
+
+    report = registry.report()["as_model_future"]
+    assert report["lazy_compile_count"] == 0
+    assert report["run_count"] == 1
+    print(registry.format_report())
+
+
+if __name__ == "__main__":
+    test_source_hash_is_stable()
+    test_warmup_then_call_does_not_recompile()
+    print("✅ 内核注册表测试通过")
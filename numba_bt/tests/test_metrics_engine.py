@@ -0,0 +1,145 @@
+"""测试指标引擎：单次遍历结果与逐数组计算一致，分块累积与整体计算一致，时间桶和降采样正确"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 添加项目根目录到路径（使用绝对路径）
+project_root = Path(__file__).parent.parent.absolute()
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.analysis.metrics_engine import (
+    StreamingMetrics, downsample_indices, resample_buckets,
+    HOUR_MS, DAY_MS, B_TS, B_EQUITY_CLOSE, B_EQUITY_LOW, B_MAKER_VOLUME, B_ROWS,
+)
+from src.analysis.statistics import analyze_performance, performance_from_metrics
+
+
+def _make_logs(n: int = 50000, seed: int = 11):
+    """生成模拟账户日志（10列）和订单统计日志（13列），覆盖约20天"""
+    rng = np.random.default_rng(seed)
+    timestamps = 1_700_000_000_000 + np.cumsum(rng.integers(1, 70000, size=n)).astype(np.float64)
+    prices = 10.0 * np.exp(np.cumsum(rng.normal(0, 1e-3, size=n)))
+    sides = rng.choice([-1.0, 1.0, 0.0], size=n, p=[0.45, 0.45, 0.1])
+    quantities = np.where(sides != 0, rng.random(n) * 5, 0.0)
+    pos = np.cumsum(sides * quantities)
+    cash = 10000 - np.cumsum(sides * quantities * prices)
+    avg_cost = prices + rng.normal(0, 0.01, size=n)
+    roles = rng.choice([0.0, 1.0, 2.0, 6.0], size=n, p=[0.1, 0.3, 0.55, 0.05])
+    taker_fee = -np.cumsum(rng.random(n) * 0.01)
+    maker_fee = np.cumsum(rng.random(n) * 0.005)
+    accounts = np.column_stack([timestamps, cash, pos, avg_cost, prices, quantities, sides,
+                                taker_fee, maker_fee, roles])
+
+    m = n // 3
+    orders = np.zeros((m, 13), dtype=np.float64)
+    orders[:, 0] = np.sort(rng.choice(timestamps, size=m))
+    orders[:, 1] = rng.random(m) * 60000
+    orders[:, 3] = rng.choice([-1.0, 1.0], size=m)
+    orders[:, 4] = rng.random(m) * 10 + 0.1
+    orders[:, 5] = np.where(rng.random(m) < 0.6, orders[:, 4] * rng.random(m), 0.0)
+    orders[:, 6] = np.where(orders[:, 5] > 0, 10 + rng.normal(0, 0.05, size=m), 0.0)
+    orders[:, 7] = 10 + rng.normal(0, 0.05, size=m)
+    orders[:, 9:13] = rng.integers(0, 5, size=(m, 4))
+    return accounts, orders
+
+
+def _assert_close(expected, actual, path=""):
+    if isinstance(expected, dict):
+        assert set(expected) == set(actual), path
+        for key in expected:
+            _assert_close(expected[key], actual[key], f"{path}.{key}")
+        return
+    expected = float(expected)
+    actual = float(actual)
+    if np.isnan(expected):
+        assert np.isnan(actual), path
+    else:
+        assert np.isclose(expected, actual, rtol=1e-9, atol=1e-9), (path, expected, actual)
+
+
+def test_account_metrics_match_array_computation():
+    """净值、回撤、虚拟平仓PnL、夏普、资金费与逐数组计算一致"""
+    accounts, orders = _make_logs()
+    overall = analyze_performance(accounts, orders)['overall_performance']
+
+    cash, pos, avg_cost, price = accounts[:, 1], accounts[:, 2], accounts[:, 3], accounts[:, 4]
+    side, qty, role = accounts[:, 6], accounts[:, 5], accounts[:, 9]
+    equity = cash + pos * price + accounts[:, 7] + accounts[:, 8]
+    peak = np.maximum.accumulate(equity)
+    assert np.isclose(overall['max_drawdown'], abs(np.min((equity - peak) / peak)))
+    assert np.isclose(overall['total_pnl_with_fees'], equity[-1] - equity[0])
+
+    prev_pos = np.r_[0.0, pos[:-1]]
+    prev_avg_cost = np.r_[avg_cost[0], avg_cost[:-1]]
+    close_pnl = np.where((prev_pos * side < 0) & (side != 0), -(price - prev_avg_cost) * side * qty, 0.0)
+    realized = np.sum(close_pnl[role == 2]) + np.sum(close_pnl[role == 1])
+    assert np.isclose(overall['realized_pnl_no_fees'], realized)
+
+    days = accounts[:, 0] // DAY_MS
+    last_of_day = np.r_[days[1:] != days[:-1], True]
+    daily_equity = equity[last_of_day]
+    daily_returns = np.diff(daily_equity) / daily_equity[:-1]
+    assert np.isclose(overall['sharpe_ratio'], np.mean(daily_returns) / np.std(daily_returns) * np.sqrt(252))
+
+
+def test_streaming_chunks_match_single_pass():
+    """分块累积与一次性计算结果一致（块边界落在时间桶和日内部）"""
+    accounts, orders = _make_logs()
+    expected = analyze_performance(accounts, orders)
+
+    metrics = StreamingMetrics(bucket_ms=HOUR_MS)
+    for start in range(0, len(accounts), 7777):
+        metrics.update_accounts(accounts[start:start + 7777])
+    for start in range(0, len(orders), 5000):
+        metrics.update_orders(orders[start:start + 5000])
+    _assert_close(expected, performance_from_metrics(metrics))
+
+    single = StreamingMetrics(bucket_ms=HOUR_MS)
+    single.update_accounts(accounts)
+    assert np.array_equal(metrics.buckets(), single.buckets())
+
+
+def test_time_buckets_and_resample():
+    """时间桶：收盘净值、最低净值、成交量与逐桶计算一致；小时桶合并为日桶与直接按日分桶一致"""
+    accounts, _ = _make_logs()
+    metrics = StreamingMetrics(bucket_ms=HOUR_MS)
+    metrics.update_accounts(accounts)
+    buckets = metrics.buckets()
+
+    equity = accounts[:, 1] + accounts[:, 2] * accounts[:, 4] + accounts[:, 7] + accounts[:, 8]
+    bucket_ids = accounts[:, 0] // HOUR_MS
+    unique_ids, first_index = np.unique(bucket_ids, return_index=True)
+    assert np.array_equal(buckets[:, B_TS], unique_ids * HOUR_MS)
+    assert np.allclose(buckets[:, B_EQUITY_LOW], np.minimum.reduceat(equity, first_index))
+    assert np.allclose(buckets[:, B_EQUITY_CLOSE], equity[np.r_[first_index[1:] - 1, len(equity) - 1]])
+    maker_value = np.where(accounts[:, 9] == 2, accounts[:, 5] * accounts[:, 4], 0.0)
+    assert np.allclose(buckets[:, B_MAKER_VOLUME], np.add.reduceat(maker_value, first_index))
+    assert buckets[:, B_ROWS].sum() == len(accounts)
+
+    daily = StreamingMetrics(bucket_ms=DAY_MS)
+    daily.update_accounts(accounts)
+    assert np.allclose(resample_buckets(buckets, DAY_MS), daily.buckets())
+
+
+def test_downsample_keeps_extremes():
+    """降采样保留首尾点和全局极值点，点数受限"""
+    rng = np.random.default_rng(5)
+    values = np.cumsum(rng.normal(size=1_000_000))
+    other = rng.normal(size=1_000_000)
+    indices = downsample_indices(4000, values, other)
+
+    assert len(indices) <= 8000
+    assert np.all(np.diff(indices) > 0)
+    for required in (0, len(values) - 1, np.argmin(values), np.argmax(values), np.argmax(other)):
+        assert required in indices
+    assert np.array_equal(downsample_indices(4000, values[:100]), np.arange(100))
+
+
+if __name__ == "__main__":
+    test_account_metrics_match_array_computation()
+    test_streaming_chunks_match_single_pass()
+    test_time_buckets_and_resample()
+    test_downsample_keeps_extremes()
+    print("✅ 指标引擎测试通过")
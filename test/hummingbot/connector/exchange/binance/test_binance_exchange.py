@@ -15,6 +15,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -845,7 +846,7 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
         self.exchange._set_current_timestamp(1640780000)
         self.exchange._last_poll_timestamp = (self.exchange.current_timestamp -
                                               self.exchange.UPDATE_ORDER_STATUS_MIN_INTERVAL - 1)
-        self.exchange._last_trades_poll_binance_timestamp = 10
+        self.exchange._last_trades_poll_binance_timestamps[self.trading_pair] = 10
         self.async_run_with_timeout(self.exchange._update_order_fills_from_trades())
 
         request = self._all_executed_requests(mock_api, url)[1]
@@ -854,6 +855,83 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
         self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset), request_params["symbol"])
         self.assertEqual(10 * 1e3, request_params["startTime"])
 
+    @aioresponses()
+    def test_update_order_fills_reports_the_polling_cycle_weight(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+
+        url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps([]))
+
+        with self.exchange.reconciliation_scheduler.cycle():
+            self.async_run_with_timeout(self.exchange._update_order_fills_from_trades())
+
+        self.assertEqual(20, self.exchange.reconciliation_scheduler.last_cycle_weights[CONSTANTS.REQUEST_WEIGHT])
+        self.assertEqual(1, self.exchange.reconciliation_scheduler.last_cycle_weights[CONSTANTS.MY_TRADES_PATH_URL])
+
+        # The trading pair has no orders: it is not polled again before the long poll interval
+        self.exchange._set_current_timestamp(1640780000 + self.exchange.UPDATE_ORDER_STATUS_MIN_INTERVAL)
+        with self.exchange.reconciliation_scheduler.cycle():
+            self.async_run_with_timeout(self.exchange._update_order_fills_from_trades())
+
+        self.assertEqual({}, self.exchange.reconciliation_scheduler.last_cycle_weights)
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, url)))
+
+    @aioresponses()
+    def test_update_order_status_uses_open_orders_request_for_many_orders(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.ACCOUNT_WIDE_ORDER_STATUS_MIN_ORDERS = 2
+
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?"))
+        open_orders_response = [{
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "orderId": 100234,
+            "clientOrderId": "OID1",
+            "status": "PARTIALLY_FILLED",
+            "updateTime": 1640780000000,
+        }, {
+            "symbol": "OTHERPAIR",
+            "orderId": 999,
+            "clientOrderId": "not-tracked",
+            "status": "NEW",
+            "updateTime": 1640780000000,
+        }]
+        mock_api.get(regex_url, body=json.dumps(open_orders_response))
+
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        regex_url = re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?"))
+        order_response = {
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "orderId": 100235,
+            "clientOrderId": "OID2",
+            "status": "CANCELED",
+            "updateTime": 1640780000000,
+        }
+        mock_api.get(regex_url, body=json.dumps(order_response))
+
+        with self.exchange.reconciliation_scheduler.cycle():
+            self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, open_orders_url)))
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual("OID2", order_requests[0].kwargs["params"]["origClientOrderId"])
+        self.assertEqual(OrderState.PARTIALLY_FILLED, self.exchange.in_flight_orders["OID1"].current_state)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(84, self.exchange.reconciliation_scheduler.last_cycle_weights[CONSTANTS.REQUEST_WEIGHT])
+
     @aioresponses()
     def test_update_order_fills_from_trades_with_repeated_fill_triggers_only_one_event(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -1153,6 +1231,57 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 price=Decimal("2"),
             ))
 
+    @aioresponses()
+    async def test_batch_order_create_without_batch_endpoint_places_single_orders(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        regex_url = re.compile(f"^{self.order_creation_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.post(regex_url, body=json.dumps(self.order_creation_request_successful_mock_response), repeat=True)
+
+        self.assertEqual(0, self.exchange.batch_order_create_max_size)
+        orders = self.exchange.batch_order_create(orders_to_create=[
+            LimitOrder(client_order_id="",
+                       trading_pair=self.trading_pair,
+                       is_buy=True,
+                       base_currency=self.base_asset,
+                       quote_currency=self.quote_asset,
+                       price=Decimal(price),
+                       quantity=Decimal("1"))
+            for price in ("5.1", "5")
+        ])
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        self.assertTrue(all(self.exchange.in_flight_orders[order.client_order_id].is_open for order in orders))
+        self.assertEqual(2, len(self.buy_order_created_logger.event_log))
+
+    @aioresponses()
+    async def test_batch_order_cancel_without_batch_endpoint_cancels_single_orders(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for index in range(2):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{index}",
+                exchange_order_id=f"EOID{index}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [self.exchange.in_flight_orders[f"OID{index}"] for index in range(2)]
+        url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        for order in orders:
+            mock_api.delete(regex_url, body=json.dumps(self._order_cancelation_request_successful_mock_response(order)))
+
+        self.assertEqual(0, self.exchange.batch_order_cancel_max_size)
+        self.exchange.batch_order_cancel(orders_to_cancel=[order.to_limit_order() for order in orders])
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, url)))
+        self.assertEqual({"OID0", "OID1"}, {event.order_id for event in self.order_cancelled_logger.event_log})
+        self.assertTrue(all(order.is_cancelled for order in orders))
+
     def test_format_trading_rules__min_notional_present(self):
         trading_rules = [{
             "symbol": "COINALPHAHBOT",
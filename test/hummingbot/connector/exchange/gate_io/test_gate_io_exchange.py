@@ -4,9 +4,9 @@ import re
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import Any, Awaitable, Dict, List
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from bidict import bidict
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import TokenAmount
@@ -810,6 +811,151 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
             )
         )
 
+    def _batch_limit_orders(self, prices: List[str]) -> List[LimitOrder]:
+        return [
+            LimitOrder(
+                client_order_id="",
+                trading_pair=self.trading_pair,
+                is_buy=True,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal(price),
+                quantity=Decimal("1"),
+            )
+            for price in prices
+        ]
+
+    @aioresponses()
+    async def test_batch_order_create_uses_batch_endpoint(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDERS_PATH_URL}"
+        request_sent_event = asyncio.Event()
+
+        def callback(url, **kwargs):
+            request_sent_event.set()
+            orders = json.loads(kwargs["data"])
+            return CallbackResult(status=200, payload=[
+                {"text": orders[0]["text"], "id": "exch1", "succeeded": True, "status": "open"},
+                {"text": orders[1]["text"], "succeeded": False, "label": "BALANCE_NOT_ENOUGH",
+                 "message": "Not enough balance"},
+            ])
+
+        mock_api.post(url, callback=callback)
+
+        orders = self.exchange.batch_order_create(orders_to_create=self._batch_limit_orders(["5.1", "5"]))
+        await request_sent_event.wait()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(1, len(mock_api.requests))
+        request_data = json.loads(list(mock_api.requests.values())[0][0].kwargs["data"])
+        self.assertEqual([order.client_order_id for order in orders], [order["text"] for order in request_data])
+        self.assertEqual([Decimal("5.1"), Decimal("5")], [Decimal(order["price"]) for order in request_data])
+
+        self.assertEqual(OrderState.OPEN, self.exchange.in_flight_orders[orders[0].client_order_id].current_state)
+        self.assertEqual("exch1", self.exchange.in_flight_orders[orders[0].client_order_id].exchange_order_id)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(orders[1].client_order_id, self.order_failure_logger.event_log[0].order_id)
+
+        # The batch request counts as one call per order for the rate limits
+        weights = [task.weight for task in self.exchange._throttler._task_logs
+                   if task.rate_limit.limit_id == CONSTANTS.PRIVATE_URL_POINTS_LIMIT_ID]
+        self.assertEqual([2], weights)
+
+    @aioresponses()
+    async def test_batch_order_create_splits_orders_in_chunks(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDERS_PATH_URL}"
+
+        def callback(url, **kwargs):
+            return CallbackResult(status=200, payload=[
+                {"text": order["text"], "id": f"exch{order['price']}", "succeeded": True, "status": "open"}
+                for order in json.loads(kwargs["data"])
+            ])
+
+        mock_api.post(url, callback=callback, repeat=True)
+
+        prices = [str(5 + i / 10) for i in range(25)]
+        orders = self.exchange.batch_order_create(orders_to_create=self._batch_limit_orders(prices))
+        await asyncio.sleep(0.1)
+
+        requests = list(mock_api.requests.values())[0]
+        self.assertEqual([10, 10, 5], [len(json.loads(request.kwargs["data"])) for request in requests])
+        self.assertTrue(all(self.exchange.in_flight_orders[order.client_order_id].is_open for order in orders))
+        self.assertEqual(25, len(self.buy_order_created_logger.event_log))
+
+    async def test_batch_order_create_fails_orders_missing_from_the_results(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        with patch.object(GateIoExchange, "_place_batch_orders", new_callable=AsyncMock,
+                          return_value=[("exch1", 1640780000)]):
+            orders = self.exchange.batch_order_create(orders_to_create=self._batch_limit_orders(["5.1", "5"]))
+            await asyncio.sleep(0.01)
+
+        self.assertEqual("exch1", self.exchange.in_flight_orders[orders[0].client_order_id].exchange_order_id)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(orders[1].client_order_id, self.order_failure_logger.event_log[0].order_id)
+        self.assertTrue(
+            self._is_logged("ERROR", "Gate_io returned 1 results for a batch of 2 orders. "
+                                     "The orders without a result are considered failed."))
+
+    @aioresponses()
+    async def test_batch_order_create_without_batch_endpoint_places_single_orders(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_CREATE_PATH_URL}"
+        mock_api.post(url, body=json.dumps(self.get_order_create_response_mock()), repeat=True)
+
+        with patch.object(GateIoExchange, "batch_order_create_max_size", new_callable=PropertyMock, return_value=0):
+            orders = self.exchange.batch_order_create(orders_to_create=self._batch_limit_orders(["5.1", "5"]))
+            await asyncio.sleep(0.1)
+
+        self.assertEqual(2, len(list(mock_api.requests.values())[0]))
+        self.assertTrue(all(self.exchange.in_flight_orders[order.client_order_id].is_open for order in orders))
+        self.assertEqual(2, len(self.buy_order_created_logger.event_log))
+
+    @aioresponses()
+    async def test_batch_order_cancel_uses_batch_endpoint(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        for index in range(3):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{index}",
+                exchange_order_id=f"EOID{index}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL}"
+        mock_api.post(url, body=json.dumps([
+            {"currency_pair": self.ex_trading_pair, "id": "EOID0", "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": "EOID1", "succeeded": False,
+             "label": CONSTANTS.ERR_LABEL_ORDER_NOT_FOUND, "message": "Order not found"},
+            {"currency_pair": self.ex_trading_pair, "id": "EOID2", "succeeded": False,
+             "label": "INVALID_PARAM_VALUE", "message": "Invalid"},
+        ]))
+
+        orders_to_cancel = [order.to_limit_order() for order in self.exchange.in_flight_orders.values()]
+        results = await self.exchange._execute_batch_cancel(orders_to_cancel=orders_to_cancel)
+
+        request_data = json.loads(list(mock_api.requests.values())[0][0].kwargs["data"])
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": f"EOID{index}"} for index in range(3)], request_data)
+        self.assertEqual([CancellationResult("OID0", True), CancellationResult("OID1", False),
+                          CancellationResult("OID2", False)], results)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual("OID0", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records["OID1"])
+        self.assertTrue(self.exchange.in_flight_orders["OID2"].is_open)
+
     @aioresponses()
     async def test_cancel_order_raises_failure_event_when_request_fails(self, mock_api):
         request_sent_event = asyncio.Event()
@@ -1,6 +1,9 @@
 import asyncio
+import logging
+import time
 import unittest
 from decimal import Decimal
+from itertools import chain
 from typing import Awaitable, Dict
 from unittest.mock import patch
 
@@ -1130,3 +1133,153 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        # The exchange order id is assigned directly, without an order update
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertIsNone(self.tracker.fetch_lost_order(exchange_order_id="someExchangeOrderId"))
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id.get("someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+    def test_active_orders_for_trading_pair(self):
+        orders = []
+        for i, trading_pair in enumerate([self.trading_pair, "OTHER-HBOT", self.trading_pair]):
+            order: InFlightOrder = InFlightOrder(
+                client_order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            orders.append(order)
+            self.tracker.start_tracking_order(order)
+
+        self.assertEqual([orders[0], orders[2]], self.tracker.active_orders_for_trading_pair(self.trading_pair))
+        self.assertEqual([orders[1]], self.tracker.active_orders_for_trading_pair("OTHER-HBOT"))
+
+        self.tracker.stop_tracking_order("OID1")
+
+        self.assertEqual([], self.tracker.active_orders_for_trading_pair("OTHER-HBOT"))
+        self.assertEqual([], self.tracker.active_orders_for_trading_pair("UNKNOWN-HBOT"))
+
+    def test_order_collections_are_snapshots_and_views_are_live(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            for i in range(3)
+        ]
+        all_fillable_orders_view = self.tracker.all_fillable_orders_view
+        for order in orders[:2]:
+            self.tracker.start_tracking_order(order)
+        self.tracker._lost_orders[orders[1].client_order_id] = self.tracker._in_flight_orders.pop(
+            orders[1].client_order_id)
+
+        self.assertIs(orders[0], all_fillable_orders_view["OID0"])
+        self.assertIs(orders[1], self.tracker.all_fillable_orders_by_exchange_order_id_view["EOID1"])
+        with self.assertRaises(TypeError):
+            self.tracker.active_orders["OID9"] = orders[0]
+        with self.assertRaises(TypeError):
+            self.tracker.all_updatable_orders_view["OID9"] = orders[0]
+
+        # The snapshots can be iterated while the tracked orders change
+        for client_order_id in self.tracker.all_fillable_orders:
+            self.tracker.start_tracking_order(orders[2])
+            self.tracker.stop_tracking_order(client_order_id)
+        lost_orders = self.tracker.lost_orders.copy()
+        self.assertIs(dict, type(lost_orders))
+        self.tracker._lost_orders.clear()
+        self.assertEqual({"OID1": orders[1]}, lost_orders)
+        self.assertEqual({"OID0", "OID2"}, set(self.tracker.all_orders))
+        self.assertEqual({"EOID0": orders[0], "EOID2": orders[2]},
+                         self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertEqual(2, len(all_fillable_orders_view))
+
+    def test_fill_processing_throughput_with_one_thousand_tracked_orders(self):
+        self.tracker.logger().setLevel(logging.WARNING)
+        orders = []
+        for i in range(1000):
+            order = InFlightOrder(
+                client_order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+                initial_state=OrderState.OPEN,
+            )
+            orders.append(order)
+            self.tracker.start_tracking_order(order)
+
+        fee = AddedToCostTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("0"))])
+        fills = [
+            TradeUpdate(
+                trade_id=str(n),
+                client_order_id=None,
+                exchange_order_id=f"EOID{n % 1000}",
+                trading_pair=self.trading_pair,
+                fill_price=Decimal("1"),
+                fill_base_amount=Decimal("1"),
+                fill_quote_amount=Decimal("1"),
+                fee=fee,
+                fill_timestamp=1,
+            )
+            for n in range(5000)
+        ]
+
+        def scan_lookup(exchange_order_id: str) -> InFlightOrder:
+            # The lookup cost before the exchange order id index: a full map built for every event
+            return {
+                order.exchange_order_id: order
+                for order in chain(self.tracker.active_orders.values(), self.tracker.cached_orders.values(),
+                                   self.tracker.lost_orders.values())
+            }[exchange_order_id]
+
+        def indexed_lookup(exchange_order_id: str) -> InFlightOrder:
+            return self.tracker.all_fillable_orders_by_exchange_order_id_view[exchange_order_id]
+
+        timings = {}
+        for name, lookup in (("scan", scan_lookup), ("indexed", indexed_lookup)):
+            start = time.perf_counter()
+            for fill in fills[:500] if name == "scan" else fills:
+                tracked_order = lookup(fill.exchange_order_id)
+                self.tracker.process_trade_update(
+                    fill._replace(client_order_id=tracked_order.client_order_id, trade_id=f"{name}{fill.trade_id}"))
+            timings[name] = (500 if name == "scan" else len(fills)) / (time.perf_counter() - start)
+
+        self.assertEqual(Decimal("6"), orders[0].executed_amount_base)
+        self.assertEqual(5500, len(self.order_filled_logger.event_log))
+        self.assertGreater(
+            timings["indexed"], timings["scan"],
+            msg=f"Fills/s with 1000 tracked orders: scan {timings['scan']:.0f}, indexed {timings['indexed']:.0f}")
@@ -28,6 +28,7 @@ from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_rollup import TradeFillRollup
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -289,6 +290,14 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+        with self.manager.get_new_session() as session:
+            rollups = session.query(TradeFillRollup).all()
+
+        self.assertEqual(1, len(rollups))
+        self.assertEqual(1, rollups[0].num_buys)
+        self.assertEqual(Decimal("1"), rollups[0].b_vol_base)
+        self.assertEqual(Decimal("-1010"), rollups[0].b_vol_quote)
+
     def test_trade_fee_in_quote_not_available(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -0,0 +1,91 @@
+import asyncio
+from typing import Awaitable
+from unittest import TestCase
+
+from hummingbot.connector.reconciliation_scheduler import ReconciliationScheduler
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.utils.async_utils import safe_gather
+
+
+class ReconciliationSchedulerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id="WEIGHT", limit=1000, time_interval=60),
+            RateLimit(limit_id="/trades", limit=1000, time_interval=60,
+                      linked_limits=[LinkedLimitWeightPair("WEIGHT", 20)]),
+            RateLimit(limit_id="/order", limit=1000, time_interval=60,
+                      linked_limits=[LinkedLimitWeightPair("WEIGHT", 4)]),
+        ])
+        self.scheduler = ReconciliationScheduler(
+            throttler=self.throttler, recent_activity_window=60, max_idle_pairs_per_cycle=2)
+        self.trading_pairs = [f"COIN{i}-HBOT" for i in range(6)]
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def pairs_to_poll(self, timestamp: float, active_trading_pairs=()):
+        return self.scheduler.trading_pairs_to_poll(
+            trading_pairs=self.trading_pairs,
+            active_trading_pairs=active_trading_pairs,
+            timestamp=timestamp,
+            active_interval=10,
+            idle_interval=120,
+        )
+
+    def test_active_pairs_are_polled_first_and_idle_pairs_are_capped(self):
+        pairs = self.pairs_to_poll(timestamp=1000, active_trading_pairs=["COIN3-HBOT"])
+
+        self.assertEqual(["COIN3-HBOT", "COIN0-HBOT", "COIN1-HBOT"], pairs)
+
+    def test_idle_pairs_are_polled_round_robin(self):
+        polled = []
+        for timestamp in (1000, 1005, 1010):
+            pairs = self.pairs_to_poll(timestamp=timestamp)
+            self.scheduler.mark_polled(trading_pairs=pairs, timestamp=timestamp)
+            polled.extend(pairs)
+
+        self.assertEqual(self.trading_pairs, polled)
+        # All the idle pairs were polled less than the idle interval ago
+        self.assertEqual([], self.pairs_to_poll(timestamp=1100))
+        self.assertEqual(["COIN0-HBOT", "COIN1-HBOT"], self.pairs_to_poll(timestamp=1120))
+
+    def test_active_pairs_respect_the_active_interval(self):
+        self.scheduler.mark_polled(trading_pairs=self.trading_pairs, timestamp=1000)
+
+        self.assertEqual([], self.pairs_to_poll(timestamp=1005, active_trading_pairs=["COIN1-HBOT"]))
+        self.assertEqual(["COIN1-HBOT"], self.pairs_to_poll(timestamp=1010, active_trading_pairs=["COIN1-HBOT"]))
+
+    def test_recent_activity_makes_a_pair_active(self):
+        self.scheduler.mark_polled(trading_pairs=self.trading_pairs, timestamp=1000)
+        self.scheduler.record_activity(trading_pair="COIN4-HBOT", timestamp=1001)
+
+        self.assertTrue(self.scheduler.has_recent_activity(trading_pair="COIN4-HBOT", timestamp=1020))
+        self.assertEqual(["COIN4-HBOT"], self.pairs_to_poll(timestamp=1020))
+        self.assertFalse(self.scheduler.has_recent_activity(trading_pair="COIN4-HBOT", timestamp=1062))
+        self.assertEqual([], self.pairs_to_poll(timestamp=1062))
+
+    def test_cycle_reports_the_weight_of_the_requests(self):
+        async def request(limit_id: str):
+            self.scheduler.record_request(limit_id=limit_id)
+
+        # Requests outside a cycle are not accounted
+        self.scheduler.record_request(limit_id="/order")
+
+        with self.scheduler.cycle() as cycle_weights:
+            self.async_run_with_timeout(safe_gather(request("/trades"), request("/trades"), request("/order")))
+            self.scheduler.record_request(limit_id="/order", weight_multiplier=3)
+            self.assertEqual(56, cycle_weights["WEIGHT"])
+
+        self.assertEqual({"/trades": 2, "/order": 4, "WEIGHT": 56}, self.scheduler.last_cycle_weights)
+        self.assertEqual(1, self.scheduler.cycles_count)
+
+        with self.scheduler.cycle():
+            self.scheduler.record_request(limit_id="/trades")
+
+        self.assertEqual({"/trades": 1, "WEIGHT": 20}, self.scheduler.last_cycle_weights)
+        self.assertEqual({"/trades": 3, "/order": 4, "WEIGHT": 76}, self.scheduler.total_weights)
+        self.assertEqual(2, self.scheduler.cycles_count)
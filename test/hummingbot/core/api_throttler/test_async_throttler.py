@@ -225,6 +225,17 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
                 asyncio.wait_for(context.acquire(), 1.0)
             )
 
+    def test_weight_multiplier_scales_the_logged_weights(self):
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID, weight_multiplier=4)
+        self.ev_loop.run_until_complete(context.acquire())
+
+        weights = {task.rate_limit.limit_id: task.weight for task in self.throttler._task_logs}
+        self.assertEqual({TEST_WEIGHTED_TASK_2_ID: 4, TEST_WEIGHTED_POOL_ID: 4}, weights)
+
+        # 4 of the 10 units of the pool are used: a batch of 6 still fits, a batch of 7 does not
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, weight_multiplier=6).within_capacity())
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, weight_multiplier=7).within_capacity())
+
     def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
         throttler = AsyncThrottler(rate_limits=[])
         context = throttler.execute_task(limit_id="test_limit_id")
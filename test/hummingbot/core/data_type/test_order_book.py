@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 
 import logging
+import time
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+from collections import deque
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook, OrderBookDiffWindow
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +54,306 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_price_subscription_threshold(self):
+        order_book = OrderBook()
+        notified = []
+        subscription = order_book.add_price_subscription(lambda s: notified.append((s.bid, s.ask)), threshold_pct=0.01)
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1]], dtype=np.float64))
+        self.assertEqual([(99., 101.)], notified)
+
+        # 0.5% move: below the threshold
+        order_book.apply_numpy_diffs(np.array([[99.5, 1, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(1, len(notified))
+        # 1.5% move since the last notification (99): notified
+        order_book.apply_numpy_diffs(np.array([[100.5, 1, 3]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual((100.5, 101.), notified[-1])
+
+        order_book.remove_price_subscription(subscription)
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[110, 1, 4], [101, 0, 4]], dtype=np.float64))
+        self.assertEqual(2, len(notified))
+        self.assertEqual([], order_book.price_subscriptions)
+
+    def test_price_subscription_vwap(self):
+        order_book = OrderBook()
+        notified = []
+        order_book.add_price_subscription(lambda s: notified.append(s.ask), threshold_pct=0.001, vwap_volume=2)
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                        np.array([[100, 1, 1], [102, 5, 1]], dtype=np.float64))
+        self.assertEqual([101.], notified)
+
+        # The level beyond the VWAP volume changes: no notification
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[104, 3, 2]], dtype=np.float64))
+        self.assertEqual(1, len(notified))
+        # The best ask is taken: VWAP for 2 moves to 102
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[100, 0, 3]], dtype=np.float64))
+        self.assertEqual([101., 102.], notified)
+
+    @staticmethod
+    def random_book_arrays(rng, levels: int, update_id: int):
+        bids = np.column_stack([100 - np.arange(1, levels + 1) * 0.01, rng.uniform(0.1, 5, levels),
+                                np.full(levels, update_id)])
+        asks = np.column_stack([100 + np.arange(1, levels + 1) * 0.01, rng.uniform(0.1, 5, levels),
+                                np.full(levels, update_id)])
+        return bids.astype(np.float64), asks.astype(np.float64)
+
+    @staticmethod
+    def depth_message(message_type: OrderBookMessageType, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(message_type, {"trading_pair": "BTC-USDT", "update_id": update_id,
+                                               "bids": bids, "asks": asks}, timestamp=update_id)
+
+    def assert_same_depth_queries(self, order_book: OrderBook, reference_book: OrderBook):
+        # The composite order book walks the entries iterators, without the cumulative volumes cache
+        for is_buy in (True, False):
+            for volume in (0.05, 1, 7.5, 30, 120, 10_000):
+                for query in ("get_price_for_volume", "get_vwap_for_volume", "get_quote_volume_for_base_amount"):
+                    result = getattr(order_book, query)(is_buy, volume)
+                    expected = getattr(reference_book, query)(is_buy, volume)
+                    np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                               [result.result_price, result.result_volume], rtol=1e-12,
+                                               err_msg=f"{query} {is_buy} {volume}")
+                result = order_book.get_price_for_quote_volume(is_buy, volume * 100)
+                expected = reference_book.get_price_for_quote_volume(is_buy, volume * 100)
+                np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                           [result.result_price, result.result_volume], rtol=1e-12)
+            for price in (98.5, 99.9, 99.99, 100.0, 100.01, 100.3, 102.0):
+                for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                    result = getattr(order_book, query)(is_buy, price)
+                    expected = getattr(reference_book, query)(is_buy, price)
+                    np.testing.assert_allclose([expected.result_price, expected.result_volume],
+                                               [result.result_price, result.result_volume], rtol=1e-12,
+                                               err_msg=f"{query} {is_buy} {price}")
+
+    def test_depth_queries_match_iterated_entries_after_diffs(self):
+        rng = np.random.default_rng(7)
+        order_book = OrderBook()
+        reference_book = CompositeOrderBook()
+        bids, asks = self.random_book_arrays(rng, 100, 1)
+        order_book.apply_numpy_snapshot(bids, asks)
+        reference_book.apply_numpy_snapshot(bids, asks)
+        self.assert_same_depth_queries(order_book, reference_book)
+
+        for update_id in range(2, 30):
+            bid_prices = 100 - rng.integers(1, 150, 5) * 0.01
+            ask_prices = 100 + rng.integers(1, 150, 5) * 0.01
+            amounts = np.where(rng.random(10) < 0.3, 0, rng.uniform(0.1, 5, 10))
+            bid_diffs = np.column_stack([bid_prices, amounts[:5], np.full(5, update_id)]).astype(np.float64)
+            ask_diffs = np.column_stack([ask_prices, amounts[5:], np.full(5, update_id)]).astype(np.float64)
+            order_book.apply_numpy_diffs(bid_diffs, ask_diffs)
+            reference_book.apply_numpy_diffs(bid_diffs, ask_diffs)
+            self.assert_same_depth_queries(order_book, reference_book)
+
+        # A crossing bid truncates the top asks
+        crossing_bid = np.array([[100.05, 1, 40]], dtype=np.float64)
+        order_book.apply_numpy_diffs(crossing_bid, np.empty((0, 3)))
+        reference_book.apply_numpy_diffs(crossing_bid, np.empty((0, 3)))
+        self.assert_same_depth_queries(order_book, reference_book)
+
+    def test_query_many(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                        np.array([[100, 1, 1], [102, 5, 1]], dtype=np.float64))
+
+        prices, vwaps = order_book.query_many(True, [0.5, 2, 6, 7])
+
+        np.testing.assert_array_equal([100, 102, 102, np.nan], prices)
+        np.testing.assert_allclose([100, 101, (100 + 102 * 5) / 6, np.nan], vwaps)
+        prices, vwaps = order_book.query_many(False, np.array([3]))
+        np.testing.assert_array_equal([98], prices)
+        np.testing.assert_allclose([(99 + 98 * 2) / 3], vwaps)
+
+    def test_depth_queries_benchmark(self):
+        rng = np.random.default_rng(11)
+        order_book = OrderBook()
+        reference_book = CompositeOrderBook()
+        bids, asks = self.random_book_arrays(rng, 1000, 1)
+        order_book.apply_numpy_snapshot(bids, asks)
+        reference_book.apply_numpy_snapshot(bids, asks)
+        volumes = rng.uniform(1, 1000, 200)
+        top_bid = np.array([[99.995, 1, 2]], dtype=np.float64)
+
+        def run_queries(book: OrderBook) -> float:
+            start = time.perf_counter()
+            for volume in volumes:
+                # A diff at the top invalidates the cached levels for every query
+                book.apply_numpy_diffs(top_bid, np.empty((0, 3)))
+                book.get_vwap_for_volume(True, volume)
+                book.get_price_for_volume(True, volume)
+                book.get_vwap_for_volume(False, volume)
+            return time.perf_counter() - start
+
+        iterated_time = run_queries(reference_book)
+        cached_time = run_queries(order_book)
+        start = time.perf_counter()
+        order_book.query_many(True, volumes)
+        query_many_time = time.perf_counter() - start
+        logging.getLogger(__name__).info(f"200 depth query rounds: iterators {iterated_time:.4f}s, "
+                                         f"cumulative volumes {cached_time:.4f}s, query_many {query_many_time:.6f}s")
+        self.assertLess(cached_time, iterated_time)
+
+    def test_top_snapshot_cache(self):
+        order_book = OrderBook()
+        bids_array = np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        version = order_book.version
+
+        bids, asks = order_book.top_snapshot(2)
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], bids.tolist())
+        self.assertEqual([[101, 1, 1], [102, 2, 1]], asks.tolist())
+        self.assertFalse(bids.flags.writeable)
+        # Shared until the book changes
+        self.assertIs(bids, order_book.top_snapshot(2)[0])
+        self.assertEqual(3, len(order_book.top_snapshot()[0]))
+        self.assertEqual(3, len(order_book.top_snapshot(10)[1]))
+
+        order_book.apply_numpy_diffs(np.array([[98, 0, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.assertGreater(order_book.version, version)
+        new_bids, _ = order_book.top_snapshot(2)
+        self.assertIsNot(bids, new_bids)
+        self.assertEqual([[99, 1, 1], [97, 3, 1]], new_bids.tolist())
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], bids.tolist())
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([99, 97], bids_df["price"].tolist())
+        self.assertEqual([101, 102, 103], asks_df["price"].tolist())
+
+    def test_top_snapshot_of_composite_order_book(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        self.assertFalse(order_book.snapshot_cache_enabled)
+        bids, asks = order_book.top_snapshot(1)
+        self.assertEqual([[99, 1, 1]], bids.tolist())
+        self.assertEqual([[101, 1, 1]], asks.tolist())
+        self.assertEqual((0, 3), OrderBook().top_snapshot()[0].shape)
+
+    def test_apply_numpy_diffs_from_read_only_arrays(self):
+        order_book = OrderBook()
+        bids_array = np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1]], dtype=np.float64)
+        bids_array.setflags(write=False)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        # Non contiguous views are supported too
+        diffs = np.array([[98, 0, 2, 0], [97, 3, 2, 0]], dtype=np.float64)[:, :3]
+        diffs.setflags(write=False)
+        order_book.apply_numpy_diffs(diffs, np.empty((0, 3)), 2)
+
+        self.assertEqual([[99, 1, 1], [97, 3, 2]], order_book.top_snapshot()[0].tolist())
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_diff_window_eviction(self):
+        diff_window = OrderBookDiffWindow(3)
+        self.assertEqual(0, len(diff_window))
+        for update_id in range(1, 9):
+            diff_window.append(update_id, np.array([[100 - update_id, 1, update_id]], dtype=np.float64),
+                               np.array([[100 + update_id, 1, update_id]] * (update_id % 3),
+                                        dtype=np.float64).reshape(-1, 3))
+            self.assertEqual(list(range(max(1, update_id - 2), update_id + 1)), diff_window.update_ids)
+        self.assertEqual(3, diff_window.max_diffs)
+        self.assertGreater(diff_window.nbytes, 0)
+
+        order_book = OrderBook()
+        order_book.restore_from_snapshot_and_diff_window(
+            self.depth_message(OrderBookMessageType.SNAPSHOT, 5, [], []), diff_window)
+        self.assertEqual([[94, 1, 6], [93, 1, 7], [92, 1, 8]], order_book.top_snapshot()[0].tolist())
+        self.assertEqual([[107, 1, 7], [108, 1, 8]], order_book.top_snapshot()[1].tolist())
+
+        diff_window.clear()
+        self.assertEqual([], diff_window.update_ids)
+        with self.assertRaises(ValueError):
+            OrderBookDiffWindow(0)
+
+    def test_restore_from_snapshot_and_diff_window(self):
+        diffs = [self.depth_message(OrderBookMessageType.DIFF, 1, [["99", "0"]], [["101", "2"]]),
+                 self.depth_message(OrderBookMessageType.DIFF, 2, [["98", "5"]], []),
+                 self.depth_message(OrderBookMessageType.DIFF, 3, [["98", "0"], ["97.5", "1"]], [["101.5", "1"]])]
+        snapshot = self.depth_message(OrderBookMessageType.SNAPSHOT, 2, [["99", "1"], ["98", "5"]],
+                                      [["101", "2"], ["102", "1"]])
+        diff_window = OrderBookDiffWindow(32)
+        for diff in diffs:
+            diff_window.append_message(diff)
+
+        order_book = OrderBook()
+        order_book.restore_from_snapshot_and_diff_window(snapshot, diff_window)
+
+        # Only the diff more recent than the snapshot is replayed
+        self.assertEqual([[99, 1, 2], [97.5, 1, 3]], order_book.top_snapshot()[0].tolist())
+        self.assertEqual([[101, 2, 2], [101.5, 1, 3], [102, 1, 2]], order_book.top_snapshot()[1].tolist())
+        self.assertEqual(2, order_book.snapshot_uid)
+        self.assertEqual(3, order_book.last_diff_uid)
+
+    def test_update_ids_above_float64_precision_are_kept_exact(self):
+        # Nanosecond timestamps used as update IDs are not exact as float64
+        base_id = 1_700_000_000_123_456_789
+        self.assertNotEqual(base_id, int(float(base_id)))
+        diffs = [self.depth_message(OrderBookMessageType.DIFF, base_id + 1, [["99", "2"]], []),
+                 self.depth_message(OrderBookMessageType.DIFF, base_id + 2, [], [["101", "3"]])]
+        snapshot = self.depth_message(OrderBookMessageType.SNAPSHOT, base_id, [["99", "1"]], [["101", "1"]])
+
+        order_book = OrderBook()
+        order_book.apply_numpy_diffs(diffs[0].bids_array, diffs[0].asks_array, diffs[0].update_id)
+        self.assertEqual(base_id + 1, order_book.last_diff_uid)
+        self.assertEqual([base_id + 1], [row.update_id for row in order_book.bid_entries()])
+
+        diff_window = OrderBookDiffWindow(32)
+        for diff in diffs:
+            diff_window.append_message(diff)
+        self.assertEqual([base_id + 1, base_id + 2], diff_window.update_ids)
+
+        order_book = OrderBook()
+        order_book.restore_from_snapshot_and_diff_window(snapshot, diff_window)
+        self.assertEqual(base_id, order_book.snapshot_uid)
+        self.assertEqual(base_id + 2, order_book.last_diff_uid)
+        self.assertEqual([(99, 2, base_id + 1)], [(row.price, row.amount, row.update_id)
+                                                  for row in order_book.bid_entries()])
+        self.assertEqual([(101, 3, base_id + 2)], [(row.price, row.amount, row.update_id)
+                                                   for row in order_book.ask_entries()])
+
+    def test_diff_window_benchmark(self):
+        """Diffs/sec per trading pair: row lists with a window of messages vs typed buffers with a diff window"""
+        rng = np.random.default_rng(5)
+        messages = []
+        for update_id in range(1, 5001):
+            levels = [[[f"{100 + side * 0.01 * level:.2f}", f"{amount:.4f}"]
+                       for level, amount in zip(rng.integers(1, 300, 10), rng.uniform(0, 5, 10))]
+                      for side in (-1, 1)]
+            messages.append(self.depth_message(OrderBookMessageType.DIFF, update_id, levels[0], levels[1]))
+        bids, asks = self.random_book_arrays(rng, 300, 0)
+        snapshot = self.depth_message(OrderBookMessageType.SNAPSHOT, 4990, bids.tolist(), asks.tolist())
+
+        def replay_rows():
+            order_book = OrderBook()
+            past_diffs = deque(maxlen=32)
+            start = time.perf_counter()
+            for message in messages:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                past_diffs.append(message)
+            order_book.restore_from_snapshot_and_diffs(snapshot, [diff for diff in past_diffs
+                                                                  if diff.update_id > snapshot.update_id])
+            return order_book, time.perf_counter() - start
+
+        def replay_typed_buffers():
+            order_book = OrderBook()
+            diff_window = OrderBookDiffWindow(32)
+            start = time.perf_counter()
+            for message in messages:
+                bids_array, asks_array = message.bids_array, message.asks_array
+                order_book.apply_numpy_diffs(bids_array, asks_array, message.update_id)
+                diff_window.append(message.update_id, bids_array, asks_array)
+            order_book.restore_from_snapshot_and_diff_window(snapshot, diff_window)
+            return order_book, time.perf_counter() - start
+
+        rows_book, rows_time = replay_rows()
+        buffers_book, buffers_time = replay_typed_buffers()
+
+        self.assertEqual(list(rows_book.bid_entries()), list(buffers_book.bid_entries()))
+        self.assertEqual(list(rows_book.ask_entries()), list(buffers_book.ask_entries()))
+        self.assertEqual(rows_book.last_diff_uid, buffers_book.last_diff_uid)
+        logging.getLogger(__name__).info(f"Diffs/sec per pair: row lists {len(messages) / rows_time:.0f}, "
+                                         f"typed buffers {len(messages) / buffers_time:.0f}")
+        self.assertLess(buffers_time, rows_time)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
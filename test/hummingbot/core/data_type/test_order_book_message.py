@@ -1,9 +1,37 @@
+import json
+import random
 import time
+import tracemalloc
 import unittest
+from collections import namedtuple
+from typing import List
 
+import numpy as np
+
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
-    OrderBookMessageType
+    OrderBookMessageType, depth_levels_to_array
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.web_assistant.connections.json_codec import fastest_json_codec
+
+DictOrderBookRow = namedtuple("DictOrderBookRow", "price, amount, update_id")
+
+
+class UncachedOrderBookMessage(OrderBookMessage):
+    # The rows parsing before the parsed rows were cached, rows rebuilt on every access
+
+    @property
+    def asks(self) -> List[DictOrderBookRow]:
+        return [
+            DictOrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
+        ]
+
+    @property
+    def bids(self) -> List[DictOrderBookRow]:
+        return [
+            DictOrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
+        ]
 
 
 class OrderBookMessageTest(unittest.TestCase):
@@ -248,3 +276,105 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_depth_arrays_match_rows(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 7, "bids": [["0.0024", "10"], ["0.0023", "0"]], "asks": [["0.0026", "100", "x"]]},
+            timestamp=time.time(),
+        )
+        self.assertTrue(np.array_equal(np.array(msg.bids, dtype=np.float64), msg.bids_array))
+        self.assertTrue(np.array_equal(np.array(msg.asks, dtype=np.float64), msg.asks_array))
+        self.assertEqual((0, 3), depth_levels_to_array([], 7).shape)
+
+    def test_depth_parse_throughput(self):
+        """Raw Binance depthUpdate payloads to order book: stdlib json + OrderBookRow lists vs codec + float64 arrays"""
+        rng = random.Random(42)
+        raw_messages = []
+        for update_id in range(1, 2001):
+            levels = [[[f"{price:.2f}", f"{rng.random() * 5:.5f}" if rng.random() < 0.8 else "0.00000"]
+                       for price in (30000 + side * (0.01 * rng.randint(1, 500)) for _ in range(rng.randint(5, 30)))]
+                      for side in (-1, 1)]
+            raw_messages.append(json.dumps({"e": "depthUpdate", "E": 1700000000000 + update_id, "s": "BTCUSDT",
+                                            "U": update_id, "u": update_id, "b": levels[0], "a": levels[1]}))
+        codec = fastest_json_codec()
+
+        def replay_rows():
+            order_book = OrderBook()
+            for raw in raw_messages:
+                msg = BinanceOrderBook.diff_message_from_exchange(json.loads(raw), metadata={"trading_pair": "BTC-USDT"})
+                order_book.apply_diffs(msg.bids, msg.asks, msg.update_id)
+            return order_book
+
+        def replay_arrays():
+            order_book = OrderBook()
+            for raw in raw_messages:
+                msg = BinanceOrderBook.diff_message_from_exchange(codec.loads(raw), metadata={"trading_pair": "BTC-USDT"})
+                order_book.apply_numpy_diffs(msg.bids_array, msg.asks_array, msg.update_id)
+            return order_book
+
+        timings = {}
+        for name, replay in (("rows", replay_rows), ("arrays", replay_arrays)):
+            start = time.perf_counter()
+            order_book = replay()
+            timings[name] = time.perf_counter() - start
+            self.assertEqual(2000, order_book.last_diff_uid)
+            self.assertEqual(list(replay_rows().bid_entries()), list(order_book.bid_entries()))
+            self.assertEqual(list(replay_rows().ask_entries()), list(order_book.ask_entries()))
+
+        print(f"Depth messages/s: stdlib json + rows {len(raw_messages) / timings['rows']:.0f}, "
+              f"{codec.name} + arrays {len(raw_messages) / timings['arrays']:.0f}")
+        self.assertLess(timings["arrays"], timings["rows"])
+
+    def test_parsed_rows_and_arrays_are_cached(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 7, "bids": [["0.0024", "10"]], "asks": [["0.0026", "100"]]},
+            timestamp=time.time(),
+        )
+        self.assertIs(msg.bids, msg.bids)
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.bids_array, msg.bids_array)
+        self.assertIs(msg.asks_array, msg.asks_array)
+        self.assertEqual([OrderBookRow(0.0024, 10.0, 7)], msg.bids)
+        self.assertFalse(hasattr(msg.bids[0], "__dict__"))
+
+    def test_diff_allocation_benchmark(self):
+        """Objects and bytes allocated by a replayed Binance depth stream (10k diffs, rows read by the tracker and by a
+        consumer), uncached dict rows vs cached slotted rows. The rows read are kept so every allocation is counted."""
+        rng = random.Random(7)
+        payloads = []
+        for update_id in range(1, 10001):
+            levels = [[[f"{30000 + side * 0.01 * rng.randint(1, 500):.2f}", f"{rng.random() * 5:.5f}"]
+                       for _ in range(rng.randint(1, 20))] for side in (-1, 1)]
+            payloads.append({"e": "depthUpdate", "E": 1700000000000 + update_id, "s": "BTCUSDT",
+                             "U": update_id, "u": update_id, "b": levels[0], "a": levels[1]})
+
+        def replay(message_class):
+            order_book = OrderBook()
+            rows_read = []
+            tracemalloc.start()
+            for payload in payloads:
+                msg = message_class(OrderBookMessageType.DIFF, {
+                    "trading_pair": "BTC-USDT",
+                    "first_update_id": payload["U"],
+                    "update_id": payload["u"],
+                    "bids": payload["b"],
+                    "asks": payload["a"]}, timestamp=payload["E"] * 1e-3)
+                rows_read.append((msg, msg.bids, msg.asks, msg.bids, msg.asks))
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            for msg, bids, asks, *_ in rows_read:
+                order_book.apply_diffs(bids, asks, msg.update_id)
+            statistics = snapshot.statistics("filename")
+            return order_book, sum(stat.count for stat in statistics), sum(stat.size for stat in statistics)
+
+        uncached_order_book, uncached_objects, uncached_bytes = replay(UncachedOrderBookMessage)
+        order_book, cached_objects, cached_bytes = replay(OrderBookMessage)
+        self.assertEqual(list(uncached_order_book.bid_entries()), list(order_book.bid_entries()))
+        self.assertEqual(list(uncached_order_book.ask_entries()), list(order_book.ask_entries()))
+
+        print(f"10k diffs: uncached dict rows {uncached_objects} objects / {uncached_bytes} bytes, "
+              f"cached slotted rows {cached_objects} objects / {cached_bytes} bytes")
+        self.assertLess(cached_objects, uncached_objects)
+        self.assertLess(cached_bytes, uncached_bytes)
@@ -1,7 +1,10 @@
+import tracemalloc
+from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import List, Optional
 from unittest import TestCase
 
-from hummingbot.core.data_type.common import TradeType, PositionAction
+from hummingbot.core.data_type.common import OrderType, TradeType, PositionAction
 from hummingbot.core.data_type.in_flight_order import TradeUpdate
 from hummingbot.core.data_type.trade_fee import (
     AddedToCostTradeFee,
@@ -10,6 +13,21 @@ from hummingbot.core.data_type.trade_fee import (
     TradeFeeBase,
     TradeFeeSchema,
 )
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+@dataclass
+class DictTokenAmount:
+    token: str
+    amount: Decimal
+
+
+@dataclass
+class DictTradeFee:
+    # The fee and token amount layout before the fee classes were slotted
+    percent: Decimal = Decimal(0)
+    percent_token: Optional[str] = None
+    flat_fees: List[DictTokenAmount] = field(default_factory=list)
 
 
 class TradeFeeTests(TestCase):
@@ -318,3 +336,42 @@ class TradeUpdateTests(TestCase):
         )
 
         self.assertEqual(trade_update, TradeUpdate.from_json(trade_update.to_json()))
+
+    def test_fee_objects_have_no_instance_dict(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0.1"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))])
+        self.assertFalse(hasattr(fee, "__dict__"))
+        self.assertFalse(hasattr(fee.flat_fees[0], "__dict__"))
+        self.assertFalse(hasattr(DeductedFromReturnsTradeFee(), "__dict__"))
+        with self.assertRaises(AttributeError):
+            fee.unknown_attribute = 1
+
+    def test_fill_allocation_benchmark(self):
+        """Objects and bytes kept by 10k fills (trade update, fee with a flat fee and fill event), slotted vs dict fees"""
+        def replay_fills(fee_class, token_amount_class):
+            fills = []
+            for index in range(10000):
+                fee = fee_class(percent=Decimal("0.001"),
+                                flat_fees=[token_amount_class("BNB", Decimal("0.00001") * (index % 7 + 1))])
+                price = Decimal("30000.01") + index % 100
+                amount = Decimal("0.001") * (index % 13 + 1)
+                trade_update = TradeUpdate(str(index), "OID1", "EOID1", "BTC-USDT", 1640001112 + index, price, amount,
+                                           price * amount, fee)
+                fills.append((trade_update, OrderFilledEvent(1640001112 + index, "OID1", "BTC-USDT", TradeType.BUY,
+                                                             OrderType.LIMIT, price, amount, fee)))
+            return fills
+
+        allocations = {}
+        for name, fee_class, token_amount_class in (("dict", DictTradeFee, DictTokenAmount),
+                                                    ("slots", AddedToCostTradeFee, TokenAmount)):
+            tracemalloc.start()
+            fills = replay_fills(fee_class, token_amount_class)
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            statistics = snapshot.statistics("filename")
+            allocations[name] = (sum(stat.count for stat in statistics), sum(stat.size for stat in statistics))
+            self.assertEqual(10000, len(fills))
+
+        print(f"10k fills: dict fees {allocations['dict'][0]} objects / {allocations['dict'][1]} bytes, "
+              f"slotted fees {allocations['slots'][0]} objects / {allocations['slots'][1]} bytes")
+        self.assertLess(allocations["slots"][0], allocations["dict"][0])
+        self.assertLess(allocations["slots"][1], allocations["dict"][1])
@@ -0,0 +1,86 @@
+import time
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.core.rate_oracle.rate_graph import RateGraph, RatePrices
+from hummingbot.core.rate_oracle.utils import find_rate
+
+
+class RateGraphTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        self.graph = RateGraph()
+        self.graph.update(self.prices)
+
+    def test_rates_match_find_rate(self):
+        for pair in ("HBOT-USDT", "ZBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "USDT-USDT",
+                     "WETH-ETH"):
+            self.assertEqual(find_rate(self.prices, pair), self.graph.get_rate(pair), pair)
+
+    def test_rates_find_rate_can_not_resolve(self):
+        self.graph.update({**self.prices, "ZBOT-HBOT": Decimal("3")})
+
+        # GBP -> USDT -> AAVE
+        self.assertIsNone(find_rate(self.prices, "GBP-AAVE"))
+        self.assertEqual(Decimal("1") / Decimal("0.75") / Decimal("50"), self.graph.get_rate("GBP-AAVE"))
+        # ZBOT -> HBOT -> USDT -> GBP
+        self.assertEqual(Decimal("3") * Decimal("100") * Decimal("0.75"), self.graph.get_rate("ZBOT-GBP"))
+
+    def test_update_recalculates_the_cached_rates(self):
+        self.assertEqual(Decimal("2"), self.graph.get_rate("HBOT-AAVE"))
+        self.assertEqual(["HBOT-AAVE"], self.graph.cached_pairs)
+
+        self.graph.update({**self.prices, "AAVE-USDT": Decimal("25")}, {"HBOT-USDT": 1000, "AAVE-USDT": 1005})
+
+        self.assertEqual(["HBOT-AAVE"], self.graph.cached_pairs)
+        self.assertEqual((Decimal("4"), 1000), self.graph.get_rate_with_timestamp("HBOT-AAVE"))
+
+    def test_update_with_new_pairs_recalculates_the_paths(self):
+        self.assertIsNone(self.graph.get_rate("ZBOT-USDT"))
+
+        self.graph.update({**self.prices, "ZBOT-HBOT": Decimal("3")})
+
+        self.assertEqual(Decimal("300"), self.graph.get_rate("ZBOT-USDT"))
+
+    def test_zero_price_is_not_inverted(self):
+        self.graph.update({"HBOT-USDT": Decimal("0")})
+
+        self.assertEqual(Decimal("0"), self.graph.get_rate("HBOT-USDT"))
+        self.assertIsNone(self.graph.get_rate("USDT-HBOT"))
+
+    def test_rate_prices_count_modifications(self):
+        prices = RatePrices(self.prices)
+        self.assertEqual(0, prices.version)
+
+        prices["HBOT-USDT"] = Decimal("101")
+        prices.update({"AAVE-USDT": Decimal("51")})
+        prices.pop("USDT-GBP")
+        prices.setdefault("HBOT-USDT", Decimal("1"))
+
+        self.assertEqual(3, prices.version)
+        self.assertEqual({"HBOT-USDT": Decimal("101"), "AAVE-USDT": Decimal("51")}, prices.copy())
+
+    def test_conversions_per_tick_benchmark(self):
+        prices = {f"TOKEN{i}-USDT": Decimal(i + 1) for i in range(200)}
+        prices.update({f"USDT-FIAT{i}": Decimal(i + 1) / Decimal(10) for i in range(20)})
+        pairs = [f"TOKEN{i % 200}-FIAT{i % 20}" if i % 2 else f"FIAT{i % 20}-TOKEN{(i * 7) % 200}"
+                 for i in range(500)]
+        graph = RateGraph()
+        graph.update(prices)
+
+        start = time.perf_counter()
+        expected_rates = [find_rate(prices, pair) for pair in pairs]
+        find_rate_time = time.perf_counter() - start
+
+        # The first tick resolves the paths, the next ones only look up the cached rates
+        self.assertEqual(expected_rates[1::2], [graph.get_rate(pair) for pair in pairs][1::2])
+        start = time.perf_counter()
+        for _ in range(10):
+            rates = [graph.get_rate(pair) for pair in pairs]
+        graph_time = (time.perf_counter() - start) / 10
+
+        self.assertEqual(expected_rates[1::2], rates[1::2])
+        self.assertTrue(all(rate is not None for rate in rates))
+        self.assertLess(graph_time, find_rate_time)
@@ -1,3 +1,4 @@
+import asyncio
 from copy import deepcopy
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -99,3 +100,57 @@ class RateOracleTest(IsolatedAsyncioWrapperTestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_get_pair_rate_uses_the_updated_prices(self):
+        rate_oracle = RateOracle()
+        rate_oracle.set_prices({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")})
+
+        self.assertEqual(Decimal("2"), rate_oracle.get_pair_rate("HBOT-AAVE"))
+
+        rate_oracle.set_price("AAVE-USDT", Decimal("25"))
+        self.assertEqual(Decimal("4"), rate_oracle.get_pair_rate("HBOT-AAVE"))
+
+        rate_oracle._prices["HBOT-USDT"] = Decimal("50")
+        self.assertEqual(Decimal("2"), rate_oracle.get_pair_rate("HBOT-AAVE"))
+
+        rate_oracle._prices = {"HBOT-USDT": Decimal("10"), "AAVE-USDT": Decimal("20")}
+        self.assertEqual(Decimal("0.5"), rate_oracle.get_pair_rate("HBOT-AAVE"))
+
+    def test_get_pair_rate_with_timestamp_reports_the_oldest_price_used(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["HBOT-USDT"] = Decimal("100")
+        rate_oracle._price_timestamps["HBOT-USDT"] = 1000
+        rate_oracle._prices["AAVE-USDT"] = Decimal("50")
+        rate_oracle._price_timestamps["AAVE-USDT"] = 1010
+
+        self.assertEqual((Decimal("100"), 1000), rate_oracle.get_pair_rate_with_timestamp("HBOT-USDT"))
+        self.assertEqual((Decimal("0.5"), 1000), rate_oracle.get_pair_rate_with_timestamp("AAVE-HBOT"))
+        self.assertEqual((None, None), rate_oracle.get_pair_rate_with_timestamp("ZBOT-USDT"))
+
+    def test_concurrent_live_rate_requests_share_a_single_source_request(self):
+        source = DummyRateSource(price_dict={self.trading_pair: Decimal("10"), "HBOT-USDT": Decimal("2")})
+        requests_count = 0
+        get_prices = source.get_prices
+
+        async def counted_get_prices(quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+            nonlocal requests_count
+            requests_count += 1
+            return await get_prices(quote_token=quote_token)
+
+        source.get_prices = counted_get_prices
+        rate_oracle = RateOracle(source=source)
+
+        async def request_rates():
+            return await asyncio.gather(
+                rate_oracle.stored_or_live_rate(self.trading_pair),
+                rate_oracle.rate_async("COINALPHA-USDT"),
+                rate_oracle.get_rate("HBOT"),
+            )
+
+        rates = self.run_async_with_timeout(request_rates())
+
+        self.assertEqual([Decimal("10"), Decimal("20"), None], rates)
+        self.assertEqual(1, requests_count)
+
+        self.run_async_with_timeout(rate_oracle.rate_async(self.trading_pair))
+        self.assertEqual(2, requests_count)
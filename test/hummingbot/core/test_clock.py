@@ -5,9 +5,23 @@ import unittest
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class MockPyTimeIterator(PyTimeIterator):
+
+    def __init__(self, tick_duration: float = 0):
+        super().__init__()
+        self.tick_duration = tick_duration
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+        if self.tick_duration > 0:
+            time.sleep(self.tick_duration)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -122,3 +136,75 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_tick_durations_and_overruns(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1, tick_budget=0.05)
+        fast_iterator = MockPyTimeIterator()
+        slow_iterator = MockPyTimeIterator(tick_duration=0.07)
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.55))
+
+        fast_stats = clock.get_iterator_stats(fast_iterator)
+        slow_stats = clock.get_iterator_stats(slow_iterator)
+        self.assertGreaterEqual(slow_stats.ticks, 4)
+        self.assertEqual(slow_stats.ticks, fast_stats.ticks)
+        self.assertEqual(slow_stats.ticks, slow_stats.overruns)
+        self.assertEqual(0, fast_stats.overruns)
+        self.assertEqual(slow_stats.ticks, clock.overrun_ticks)
+        self.assertGreaterEqual(slow_stats.max_duration, 0.07)
+        self.assertLess(fast_stats.max_duration, 0.01)
+        self.assertEqual(slow_stats.ticks, dict(slow_stats.latency_histogram)[0.1])
+        self.assertEqual(fast_stats.ticks, dict(fast_stats.latency_histogram)[0.001]
+                         + dict(fast_stats.latency_histogram)[0.005] + dict(fast_stats.latency_histogram)[0.01])
+        self.assertIs(slow_iterator, clock.slowest_iterators(1)[0][0])
+
+    def test_skipped_ticks(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        clock.add_iterator(MockPyTimeIterator(tick_duration=0.12))
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        self.assertGreaterEqual(clock.skipped_ticks, 2)
+
+    def test_low_priority_iterators_are_deferred(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1, tick_budget=0.03, max_deferred_ticks=2)
+        slow_iterator = MockPyTimeIterator(tick_duration=0.04)
+        low_priority_iterator = MockPyTimeIterator()
+        clock.add_iterator(slow_iterator)
+        clock.add_iterator(low_priority_iterator, low_priority=True)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.75))
+
+        low_priority_stats = clock.get_iterator_stats(low_priority_iterator)
+        self.assertTrue(low_priority_stats.low_priority)
+        self.assertGreaterEqual(len(slow_iterator.ticks), 6)
+        # Deferred twice, then forced to tick
+        self.assertEqual(slow_iterator.ticks[2::3], low_priority_iterator.ticks)
+        self.assertEqual(len(slow_iterator.ticks) - len(low_priority_iterator.ticks), low_priority_stats.deferred)
+
+        clock.remove_iterator(low_priority_iterator)
+        self.assertNotIn(low_priority_iterator, clock.iterator_stats)
+
+    def test_backtest_replay_timestamps(self):
+        replay_timestamps = [self.backtest_start_timestamp - 10,
+                             self.backtest_start_timestamp + 0.5,
+                             self.backtest_start_timestamp + 7,
+                             self.backtest_start_timestamp + 7,
+                             self.backtest_start_timestamp + 3600]
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, float("nan"),
+                      replay_timestamps=replay_timestamps)
+        iterator = MockPyTimeIterator()
+        clock.add_iterator(iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 10)
+        self.assertEqual([self.backtest_start_timestamp + 0.5, self.backtest_start_timestamp + 7], iterator.ticks)
+        self.assertEqual(self.backtest_start_timestamp + 7, clock.current_timestamp)
+
+        clock.backtest()
+        self.assertEqual(self.backtest_start_timestamp + 3600, iterator.ticks[-1])
+        self.assertEqual(3, len(iterator.ticks))
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallPriority, AsyncCallScheduler
+
+
+class AsyncCallSchedulerTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency_per_key=1)
+        self.executed = []
+
+    async def asyncTearDown(self):
+        self.scheduler.stop()
+        await super().asyncTearDown()
+
+    async def call(self, name: str, duration: float = 0, result=None):
+        self.executed.append(name)
+        await asyncio.sleep(duration)
+        return result if result is not None else name
+
+    async def test_schedule_async_call_returns_result_and_raises_errors(self):
+        self.assertEqual(3, await self.scheduler.schedule_async_call(self.call("first", result=3), 1))
+
+        async def failing_call():
+            raise ValueError("Failed call")
+
+        with self.assertRaises(ValueError):
+            await self.scheduler.schedule_async_call(failing_call(), 1)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.scheduler.schedule_async_call(self.call("slow", 1), 0.05)
+
+        stats = self.scheduler.stats[AsyncCallScheduler.DEFAULT_KEY]
+        self.assertEqual(3, stats.scheduled)
+        self.assertEqual(3, stats.executed)
+        self.assertEqual(2, stats.failed)
+
+    async def test_slow_call_does_not_block_other_keys(self):
+        slow_call = asyncio.ensure_future(
+            self.scheduler.schedule_async_call(self.call("balance", 1), 2, key="binance"))
+        await asyncio.sleep(0.01)
+
+        start = time.monotonic()
+        result = await self.scheduler.schedule_async_call(self.call("order"), 1, key="kucoin")
+        self.assertEqual("order", result)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertFalse(slow_call.done())
+        slow_call.cancel()
+
+    async def test_bounded_concurrency_per_key(self):
+        self.scheduler.set_max_concurrency("binance", 2)
+        running = []
+        max_running = []
+
+        async def tracked_call():
+            running.append(1)
+            max_running.append(len(running))
+            await asyncio.sleep(0.02)
+            running.pop()
+
+        await asyncio.gather(*[self.scheduler.schedule_async_call(tracked_call(), 1, key="binance")
+                               for _ in range(6)])
+        self.assertEqual(2, max(max_running))
+
+    async def test_calls_of_a_key_run_one_at_a_time_by_default(self):
+        self.scheduler.stop()
+        self.scheduler = AsyncCallScheduler(call_interval=0)
+        running = []
+        max_running = []
+
+        async def tracked_call():
+            running.append(1)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        await asyncio.gather(*[self.scheduler.schedule_async_call(tracked_call(), 1, key="binance")
+                               for _ in range(3)])
+        self.assertEqual(1, max(max_running))
+
+    async def test_calls_are_started_by_priority(self):
+        blocking_call = asyncio.ensure_future(self.scheduler.schedule_async_call(self.call("blocking", 0.05), 1))
+        await asyncio.sleep(0.01)
+        calls = [
+            self.scheduler.schedule_async_call(self.call("status"), 1, priority=AsyncCallPriority.LOW),
+            self.scheduler.schedule_async_call(self.call("ticker"), 1),
+            self.scheduler.schedule_async_call(self.call("order"), 1, priority=AsyncCallPriority.HIGH),
+            self.scheduler.schedule_async_call(self.call("balance"), 1, priority=AsyncCallPriority.LOW),
+            self.scheduler.schedule_async_call(self.call("cancel"), 1, priority=AsyncCallPriority.HIGH),
+        ]
+        await asyncio.gather(blocking_call, *calls)
+        self.assertEqual(["blocking", "order", "cancel", "ticker", "status", "balance"], self.executed)
+
+    async def test_expired_calls_are_not_started(self):
+        blocking_call = asyncio.ensure_future(self.scheduler.schedule_async_call(self.call("blocking", 0.1), 1))
+        await asyncio.sleep(0.01)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.scheduler.schedule_async_call(self.call("expired"), 1, deadline_seconds=0.02)
+        await blocking_call
+
+        # The deadline also limits the execution time
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.scheduler.schedule_async_call(self.call("slow", 1), 5, deadline_seconds=0.05)
+
+        self.assertEqual(["blocking", "slow"], self.executed)
+        stats = self.scheduler.stats[AsyncCallScheduler.DEFAULT_KEY]
+        self.assertEqual(1, stats.expired)
+        self.assertEqual(2, stats.executed)
+        self.assertGreaterEqual(stats.max_queue_wait, 0)
+
+    async def test_calls_cancelled_by_the_caller_are_not_started(self):
+        blocking_call = asyncio.ensure_future(self.scheduler.schedule_async_call(self.call("blocking", 0.05), 1))
+        await asyncio.sleep(0.01)
+        cancelled_call = asyncio.ensure_future(self.scheduler.schedule_async_call(self.call("cancelled"), 1))
+        await asyncio.sleep(0.01)
+        cancelled_call.cancel()
+        await blocking_call
+        await self.scheduler.schedule_async_call(self.call("next"), 1)
+
+        self.assertEqual(["blocking", "next"], self.executed)
+        self.assertEqual(1, self.scheduler.stats[AsyncCallScheduler.DEFAULT_KEY].cancelled)
+
+    async def test_queue_wait_stats(self):
+        await asyncio.gather(*[self.scheduler.schedule_async_call(self.call(str(index), 0.02), 1)
+                               for index in range(3)])
+        stats = self.scheduler.stats[AsyncCallScheduler.DEFAULT_KEY]
+        self.assertEqual(3, stats.executed)
+        self.assertGreaterEqual(stats.max_queue_wait, 0.04)
+        self.assertAlmostEqual(stats.total_queue_wait / 3, stats.average_queue_wait)
+
+    async def test_call_async_runs_in_executor(self):
+        result = await self.scheduler.call_async(lambda value: value * 2, 21, key="binance",
+                                                 priority=AsyncCallPriority.HIGH)
+        self.assertEqual(42, result)
+        self.assertEqual(1, self.scheduler.stats["binance"].executed)
@@ -0,0 +1,34 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant.connections.json_codec import (
+    JSON_CODECS,
+    JSONCodec,
+    fastest_json_codec,
+    get_json_codec,
+)
+
+
+class JSONCodecTest(unittest.TestCase):
+    def test_codecs_round_trip(self):
+        payload = {"method": "SUBSCRIBE", "params": ["btcusdt@depth@100ms"], "id": 1, "price": 0.5}
+        for name in JSON_CODECS:
+            codec = get_json_codec(name)
+            encoded = codec.dumps(payload)
+            self.assertIsInstance(encoded, str)
+            self.assertEqual(payload, json.loads(encoded))
+            self.assertEqual(payload, codec.loads(encoded))
+            self.assertEqual(payload, codec.loads(encoded.encode()))
+            with self.assertRaises(ValueError):
+                codec.loads("not json")
+
+    def test_default_codec_matches_stdlib_payloads(self):
+        payload = {"a": [1, 2], "b": "c"}
+        self.assertEqual(json.dumps(payload), JSONCodec().dumps(payload))
+
+    def test_get_unknown_codec_raises(self):
+        with self.assertRaises(ValueError):
+            get_json_codec("simdjson")
+
+    def test_fastest_json_codec(self):
+        self.assertIn(fastest_json_codec().name, ("orjson", "ujson"))
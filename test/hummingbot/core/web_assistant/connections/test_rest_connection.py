@@ -6,6 +6,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.json_codec import UJSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 
 
@@ -35,3 +36,18 @@ class RESTConnectionTest(IsolatedAsyncioWrapperTestCase):
 
         self.assertEqual(resp, j)
         await (client_session.close())
+
+    @aioresponses()
+    async def test_rest_connection_call_with_json_codec(self, mocked_api):
+        url = "https://www.test.com/url"
+        resp = {"one": 1, "levels": [["0.1", "2"]]}
+        mocked_api.get(url, body=json.dumps(resp).encode(), content_type="text/plain")
+
+        client_session = aiohttp.ClientSession()
+        connection = RESTConnection(client_session, json_codec=UJSONCodec())
+        request = RESTRequest(method=RESTMethod.GET, url=url)
+
+        ret = await (connection.call(request))
+
+        self.assertEqual(resp, await (ret.json()))
+        await (client_session.close())
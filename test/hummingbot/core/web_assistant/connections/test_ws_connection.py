@@ -9,6 +9,7 @@ from aiohttp import WebSocketError
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import UJSONCodec
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -83,6 +84,21 @@ class WSConnectionTest(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(1, len(json_msgs))
         self.assertEqual(request.payload, json_msgs[0])
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_send_and_receive_with_json_codec(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        ws_connection = WSConnection(self.client_session, json_codec=UJSONCodec())
+        await ws_connection.connect(self.ws_url)
+
+        await ws_connection.send(WSJSONRequest(payload={"one": 1}))
+        ws_connect_mock.return_value.send_json.assert_called_once_with({"one": 1}, dumps=ws_connection._json_codec.dumps)
+
+        data = {"b": [["0.0024", "10"]]}
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=json.dumps(data))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+        self.assertEqual(data, (await ws_connection.receive()).data)
+        self.assertEqual("pong", (await ws_connection.receive()).data)
+
     async def test_receive_when_disconnected_raises(self):
         with self.assertRaises(RuntimeError) as e:
             await self.ws_connection.receive()
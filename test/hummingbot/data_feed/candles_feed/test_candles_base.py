@@ -416,3 +416,38 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
             result = await self.data_feed.get_historical_candles(config)
             self.assertIsInstance(result, pd.DataFrame)
             mock_fetch_candles.assert_called_once()
+
+    async def test_get_historical_candles_fetches_the_planned_pages_and_reports_gaps(self):
+        from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+        interval = self.data_feed.interval_in_seconds
+        page_size = self.data_feed.candles_max_result_per_rest_request
+        start_time = 1622505600 - 1622505600 % interval
+        end_time = start_time + (page_size * 3 + page_size // 2) * interval
+        missing_timestamps = {start_time + 10 * interval, start_time + 11 * interval}
+        requested_windows = []
+
+        async def fetch_candles(start_time=None, end_time=None, limit=None):
+            requested_windows.append((end_time - limit * interval, end_time))
+            # Pages overlapping by one candle, as returned by some exchanges
+            timestamps = [ts for ts in range(end_time - limit * interval - interval, end_time + interval, interval)
+                          if ts not in missing_timestamps]
+            return np.array([[ts, 1, 1, 1, 1, 1, 0, 0, 0, 0] for ts in timestamps], dtype=float)
+
+        with patch.object(self.data_feed, 'initialize_exchange_data', new_callable=AsyncMock), \
+                patch.object(self.data_feed, 'fetch_candles', side_effect=fetch_candles):
+            config = HistoricalCandlesConfig(connector_name="test", trading_pair="BTC-USDT",
+                                             interval=self.data_feed.interval, start_time=start_time,
+                                             end_time=end_time)
+            result = await self.data_feed.get_historical_candles(config)
+
+        self.assertEqual(4, len(requested_windows))
+        self.assertEqual(start_time, min(window[0] for window in requested_windows))
+        self.assertEqual(end_time, max(window[1] for window in requested_windows))
+        expected_timestamps = [ts for ts in range(start_time, end_time + interval, interval)
+                               if ts not in missing_timestamps]
+        self.assertEqual(expected_timestamps, result["timestamp"].tolist())
+        report = self.data_feed.last_historical_candles_report
+        self.assertEqual(4, report.pages)
+        self.assertEqual(len(expected_timestamps), report.candles)
+        self.assertEqual([(start_time + 10 * interval, start_time + 11 * interval)], report.gaps)
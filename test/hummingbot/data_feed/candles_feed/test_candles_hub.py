@@ -0,0 +1,197 @@
+import asyncio
+import json
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+from aiohttp import WSMsgType, web
+
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+
+
+class CandlesWSStubServer:
+    """
+    Local websocket server standing for the exchange: it records the requests of each connection and pushes candles.
+    """
+
+    def __init__(self):
+        self.connections = []
+        self.requests = []
+        self._runner = None
+        self.url = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/ws", self._handle_connection)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"ws://127.0.0.1:{port}/ws"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    async def _handle_connection(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connection_requests = []
+        self.connections.append((ws, connection_requests))
+        async for message in ws:
+            if message.type == WSMsgType.TEXT:
+                payload = json.loads(message.data)
+                connection_requests.append(payload)
+                self.requests.append(payload)
+                await ws.send_json({"result": None, "id": payload["id"]})
+        return ws
+
+    def subscribed_streams(self, connection_index: int):
+        streams = set()
+        for payload in self.connections[connection_index][1]:
+            if payload["method"] == "SUBSCRIBE":
+                streams.update(payload["params"])
+            else:
+                streams.difference_update(payload["params"])
+        return streams
+
+    @staticmethod
+    def kline_message(symbol: str, interval: str, timestamp: int, close: str):
+        return {
+            "e": "kline",
+            "E": timestamp + 1000,
+            "s": symbol,
+            "k": {"t": timestamp, "T": timestamp + 59999, "s": symbol, "i": interval, "f": 1, "L": 2,
+                  "o": "100", "c": close, "h": "110", "l": "90", "v": "10", "n": 5, "x": False,
+                  "q": "1000", "V": "4", "Q": "400", "B": "0"}
+        }
+
+
+class CandlesHubTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        # The websockets are opened with the shared client session, that must belong to the test event loop
+        await ConnectionsFactory().close()
+        self.server = CandlesWSStubServer()
+        await self.server.start()
+        wss_url_patch = patch.object(BinanceSpotCandles, "wss_url", new_callable=PropertyMock,
+                                     return_value=self.server.url)
+        wss_url_patch.start()
+        self.addCleanup(wss_url_patch.stop)
+        # The historical candles are requested through REST once the first candle arrives
+        fill_patch = patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+        fill_patch.start()
+        self.addCleanup(fill_patch.stop)
+        self.hub = CandlesHub(BinanceSpotCandles, max_streams_per_connection=2)
+
+    async def asyncTearDown(self):
+        for connection in self.hub.connections:
+            await connection.stop()
+        await ConnectionsFactory().close()
+        await self.server.stop()
+        await super().asyncTearDown()
+
+    async def wait_for(self, condition, timeout: float = 5):
+        async def poll():
+            while not condition():
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(poll(), timeout)
+
+    def create_feed(self, trading_pair: str, interval: str = "1m") -> BinanceSpotCandles:
+        feed = BinanceSpotCandles(trading_pair, interval, max_records=10)
+        feed.set_candles_hub(self.hub)
+        return feed
+
+    async def test_feeds_share_connections_and_receive_their_own_candles(self):
+        btc_feed = self.create_feed("BTC-USDT")
+        eth_feed = self.create_feed("ETH-USDT")
+        sol_feed = self.create_feed("SOL-USDT")
+        for feed in (btc_feed, eth_feed, sol_feed):
+            await feed.start_network()
+
+        await self.wait_for(lambda: len(self.server.connections) == 2
+                            and len(self.server.subscribed_streams(0)) == 2
+                            and len(self.server.subscribed_streams(1)) == 1)
+        self.assertEqual(2, len(self.hub.connections))
+        self.assertEqual({"btcusdt@kline_1m", "ethusdt@kline_1m"}, self.server.subscribed_streams(0))
+        self.assertEqual({"solusdt@kline_1m"}, self.server.subscribed_streams(1))
+
+        first_connection = self.server.connections[0][0]
+        await first_connection.send_json(self.server.kline_message("ETHUSDT", "1m", 1700000000000, "101"))
+        await first_connection.send_json(self.server.kline_message("ETHUSDT", "1m", 1700000000000, "102"))
+        await first_connection.send_json(self.server.kline_message("BTCUSDT", "1m", 1700000000000, "103"))
+        await first_connection.send_json(self.server.kline_message("ETHUSDT", "1m", 1700000060000, "104"))
+        await self.wait_for(lambda: len(eth_feed._candles) == 2 and len(btc_feed._candles) == 1)
+
+        self.assertEqual([102., 104.], eth_feed.candles_df["close"].tolist())
+        self.assertEqual([103.], btc_feed.candles_df["close"].tolist())
+        self.assertEqual(0, len(sol_feed._candles))
+
+    async def test_dynamic_subscribe_and_unsubscribe(self):
+        btc_feed = self.create_feed("BTC-USDT")
+        eth_feed = self.create_feed("ETH-USDT")
+        await btc_feed.start_network()
+        await eth_feed.start_network()
+        await self.wait_for(lambda: len(self.server.connections) == 1
+                            and len(self.server.subscribed_streams(0)) == 2
+                            and self.hub.connections[0].is_connected)
+
+        await eth_feed.stop_network()
+        await self.wait_for(lambda: self.server.subscribed_streams(0) == {"btcusdt@kline_1m"})
+        self.assertEqual({"method": "UNSUBSCRIBE", "params": ["ethusdt@kline_1m"], "id": 1},
+                         self.server.requests[-1])
+
+        # The new feed is subscribed on the live connection
+        ada_feed = self.create_feed("ADA-USDT", "5m")
+        await ada_feed.start_network()
+        await self.wait_for(lambda: self.server.subscribed_streams(0) == {"btcusdt@kline_1m", "adausdt@kline_5m"})
+        self.assertEqual(1, len(self.server.connections))
+
+        await btc_feed.stop_network()
+        await ada_feed.stop_network()
+        self.assertEqual([], self.hub.connections)
+        await self.wait_for(lambda: self.server.connections[0][0].closed)
+
+    async def test_feeds_of_the_same_stream_share_the_subscription(self):
+        first_feed = self.create_feed("BTC-USDT")
+        second_feed = self.create_feed("BTC-USDT")
+        await first_feed.start_network()
+        await second_feed.start_network()
+        await self.wait_for(lambda: len(self.server.connections) == 1
+                            and len(self.server.subscribed_streams(0)) == 1)
+        self.assertEqual(1, len(self.hub.connections))
+
+        await self.server.connections[0][0].send_json(
+            self.server.kline_message("BTCUSDT", "1m", 1700000000000, "101"))
+        await self.wait_for(lambda: len(first_feed._candles) == 1 and len(second_feed._candles) == 1)
+
+        await first_feed.stop_network()
+        self.assertEqual({"btcusdt@kline_1m"}, self.server.subscribed_streams(0))
+        self.assertEqual([second_feed], self.hub.feeds)
+
+    async def test_connection_lost_clears_candles_and_resubscribes(self):
+        feed = self.create_feed("BTC-USDT")
+        await feed.start_network()
+        await self.wait_for(lambda: len(self.server.connections) == 1
+                            and len(self.server.subscribed_streams(0)) == 1)
+        await self.server.connections[0][0].send_json(
+            self.server.kline_message("BTCUSDT", "1m", 1700000000000, "101"))
+        await self.wait_for(lambda: len(feed._candles) == 1)
+
+        await self.server.connections[0][0].close()
+        await self.wait_for(lambda: len(self.server.connections) == 2
+                            and len(self.server.subscribed_streams(1)) == 1)
+        self.assertEqual(0, len(feed._candles))
+
+    def test_factory_attaches_the_exchange_hub(self):
+        candles = CandlesFactory.get_candle(CandlesConfig(connector="binance", trading_pair="BTC-USDT"))
+        self.assertIs(CandlesHub.get_hub(BinanceSpotCandles), candles.candles_hub)
+
+        candles = CandlesFactory.get_candle(CandlesConfig(connector="kucoin", trading_pair="BTC-USDT"))
+        self.assertIsNone(candles.candles_hub)
+        with self.assertRaises(ValueError):
+            candles.set_candles_hub(self.hub)
@@ -0,0 +1,160 @@
+import logging
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.liquidations_feed.binance import BinancePerpetualLiquidations
+from hummingbot.data_feed.liquidations_feed.liquidations_base import Liquidation, LiquidationsBuffer, LiquidationSide
+
+
+class LiquidationsBufferTests(unittest.TestCase):
+
+    def test_append_evict_and_frame(self):
+        buffer = LiquidationsBuffer("BTC-USDT", initial_capacity=4)
+        buffer.append(1000, 1.0, 100.0, LiquidationSide.LONG)
+        buffer.append(2000, 2.0, 101.0, LiquidationSide.SHORT)
+        buffer.append(3000, 3.0, 102.0, LiquidationSide.LONG)
+
+        frame = buffer.frame()
+        self.assertEqual(["timestamp", "trading_pair", "quantity", "price", "side"], list(frame.columns))
+        self.assertEqual([1000, 2000, 3000], frame["timestamp"].tolist())
+        self.assertEqual(["BTC-USDT"] * 3, frame["trading_pair"].tolist())
+        self.assertEqual([LiquidationSide.LONG, LiquidationSide.SHORT, LiquidationSide.LONG], frame["side"].tolist())
+        self.assertTrue(np.shares_memory(frame["quantity"].to_numpy(), buffer.quantities))
+
+        buffer.evict(2000)
+        self.assertEqual(1, len(buffer))
+        self.assertEqual([3000], buffer.timestamps.tolist())
+        # The frames already built are not modified by the later updates
+        for index in range(4):
+            buffer.append(4000 + index, 1.0, 1.0, LiquidationSide.SHORT)
+        self.assertEqual([1000, 2000, 3000], frame["timestamp"].tolist())
+        self.assertEqual([3000, 4000, 4001, 4002, 4003], buffer.timestamps.tolist())
+
+    def test_reallocation_drops_evicted_liquidations(self):
+        buffer = LiquidationsBuffer("BTC-USDT", initial_capacity=4)
+        for index in range(4):
+            buffer.append(index, 1.0, 10.0, LiquidationSide.LONG)
+        buffer.evict(2)
+        buffer.append(4, 1.0, 10.0, LiquidationSide.SHORT)
+        self.assertEqual(4, buffer.capacity)
+        self.assertEqual([3, 4], buffer.timestamps.tolist())
+        self.assertEqual(20.0, buffer.notional(0))
+
+        for index in range(5, 8):
+            buffer.append(index, 1.0, 10.0, LiquidationSide.SHORT)
+        self.assertEqual(8, buffer.capacity)
+        self.assertEqual(list(range(3, 8)), buffer.timestamps.tolist())
+        self.assertEqual(10.0, buffer.notional(0, LiquidationSide.LONG))
+        self.assertEqual(40.0, buffer.notional(0, LiquidationSide.SHORT))
+
+    def test_notional_windows(self):
+        rng = np.random.default_rng(1)
+        timestamps = np.sort(rng.integers(0, 60000, 2000))
+        quantities = rng.uniform(0.1, 5, 2000)
+        prices = rng.uniform(90, 110, 2000)
+        sides = rng.integers(0, 2, 2000)
+        buffer = LiquidationsBuffer("BTC-USDT", initial_capacity=16)
+
+        for index in range(2000):
+            side = LiquidationSide.LONG if sides[index] else LiquidationSide.SHORT
+            buffer.append(int(timestamps[index]), quantities[index], prices[index], side)
+            if index % 100 == 99:
+                buffer.evict(int(timestamps[index]) - 30000)
+                now = int(timestamps[index])
+                for window in (1000, 5000, 20000):
+                    in_window = (timestamps[:index + 1] >= now - window)
+                    expected_long = np.sum((quantities * prices)[:index + 1][in_window & (sides[:index + 1] == 1)])
+                    expected = np.sum((quantities * prices)[:index + 1][in_window])
+                    self.assertAlmostEqual(expected_long, buffer.notional(now - window, LiquidationSide.LONG,
+                                                                          window_key=window), places=6)
+                    self.assertAlmostEqual(expected, buffer.notional(now - window, window_key=window), places=6)
+
+
+class LiquidationsBaseTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.liquidations_feed = BinancePerpetualLiquidations(trading_pairs={"BTC-USDT", "ETH-USDT"},
+                                                              max_retention_seconds=60)
+
+    def test_liquidations_df_and_notional(self):
+        now = time.time()
+        now_ms = int(now * 1000)
+        self.liquidations_feed._add_liquidation(Liquidation(now_ms - 30000, "BTC-USDT", 1.0, 100.0, LiquidationSide.LONG))
+        self.liquidations_feed._add_liquidation(Liquidation(now_ms - 2000, "ETH-USDT", 2.0, 10.0, LiquidationSide.SHORT))
+        self.liquidations_feed._add_liquidation(Liquidation(now_ms - 1000, "BTC-USDT", 3.0, 100.0, LiquidationSide.SHORT))
+
+        all_liquidations_df = self.liquidations_feed.liquidations_df()
+        self.assertEqual(3, len(all_liquidations_df))
+        self.assertEqual(["BTC-USDT", "BTC-USDT", "ETH-USDT"], all_liquidations_df["trading_pair"].tolist())
+        self.assertEqual(2, len(self.liquidations_feed.liquidations_df("BTC-USDT")))
+        self.assertTrue(self.liquidations_feed.liquidations_df("SOL-USDT").empty)
+
+        self.assertEqual(400.0, self.liquidations_feed.liquidations_notional("BTC-USDT", 60, timestamp=now))
+        self.assertEqual(300.0, self.liquidations_feed.liquidations_notional("BTC-USDT", 10, timestamp=now))
+        self.assertEqual(0.0, self.liquidations_feed.liquidations_notional("BTC-USDT", 10, LiquidationSide.LONG,
+                                                                           timestamp=now))
+        self.assertEqual(0.0, self.liquidations_feed.liquidations_notional("SOL-USDT", 10))
+
+        self.liquidations_feed._max_retention_seconds = 10
+        self.liquidations_feed._cleanup_old_liquidations()
+        self.assertEqual([3.0], self.liquidations_feed.liquidations_df("BTC-USDT")["quantity"].tolist())
+
+    def test_cascade_replay_benchmark(self):
+        # Replays a liquidation cascade (3000 liquidations per second on three trading pairs for 20 seconds), querying
+        # the notional liquidated over the last 5 seconds every 100 liquidations and cleaning up every second
+        rng = np.random.default_rng(7)
+        count = 60000
+        start_ms = int(time.time() * 1000) - 20000
+        timestamps = start_ms + np.sort(rng.integers(0, 20000, count))
+        trading_pairs = rng.choice(["BTC-USDT", "ETH-USDT", "SOL-USDT"], count)
+        quantities = rng.uniform(0.01, 2, count)
+        prices = rng.uniform(90, 110, count)
+        sides = np.where(rng.random(count) < 0.8, LiquidationSide.LONG, LiquidationSide.SHORT)
+        liquidations = [Liquidation(int(timestamp), str(trading_pair), float(quantity), float(price), side)
+                        for timestamp, trading_pair, quantity, price, side
+                        in zip(timestamps, trading_pairs, quantities, prices, sides)]
+
+        def replay_with_lists():
+            stored = {}
+            notional = 0
+            for index, liquidation in enumerate(liquidations):
+                stored.setdefault(liquidation.trading_pair, []).append(liquidation)
+                if index % 3000 == 2999:
+                    for trading_pair, pair_liquidations in list(stored.items()):
+                        stored[trading_pair] = [liq for liq in pair_liquidations
+                                                if liquidation.timestamp - liq.timestamp < 10000]
+                if index % 100 == 99:
+                    notional = sum(liq.quantity * liq.price for liq in stored["BTC-USDT"]
+                                   if liq.side == LiquidationSide.LONG and liq.timestamp >= liquidation.timestamp - 5000)
+            return notional, pd.DataFrame([liq.__dict__ for liq in stored["BTC-USDT"]])
+
+        def replay_with_buffers():
+            feed = BinancePerpetualLiquidations(trading_pairs=set(), max_retention_seconds=10)
+            notional = 0
+            for index, liquidation in enumerate(liquidations):
+                feed._add_liquidation(liquidation)
+                if index % 3000 == 2999:
+                    for pair_liquidations in feed._liquidations.values():
+                        pair_liquidations.evict(liquidation.timestamp - 10000)
+                if index % 100 == 99:
+                    notional = feed.liquidations_notional("BTC-USDT", 5, LiquidationSide.LONG,
+                                                          timestamp=liquidation.timestamp / 1000)
+            return notional, feed.liquidations_df("BTC-USDT")
+
+        start = time.perf_counter()
+        expected_notional, expected_df = replay_with_lists()
+        lists_time = time.perf_counter() - start
+        start = time.perf_counter()
+        notional, liquidations_df = replay_with_buffers()
+        buffers_time = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(f"Replay of {count} liquidations: lists {lists_time:.3f}s, "
+                                         f"buffers {buffers_time:.3f}s")
+        self.assertAlmostEqual(expected_notional, notional, places=6)
+        self.assertEqual(expected_df["timestamp"].tolist(), liquidations_df["timestamp"].tolist())
+        self.assertEqual(expected_df["quantity"].tolist(), liquidations_df["quantity"].tolist())
+        self.assertLess(buffers_time, lists_time)
@@ -3,11 +3,13 @@ from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
@@ -83,13 +85,32 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(result, OrderBookQueryResult)
 
     def test_get_order_book_snapshot(self):
-        mock_order_book = MagicMock()
-        mock_order_book.snapshot = (pd.DataFrame(), pd.DataFrame())
-        self.mock_connector.get_order_book.return_value = mock_order_book
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        self.mock_connector.get_order_book.return_value = order_book
         snapshot = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT")
         self.assertIsInstance(snapshot, tuple)
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
+        self.assertEqual([99., 98.], snapshot[0]["price"].tolist())
+
+        # The frames are shared until the order book changes
+        self.assertIs(snapshot, self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT"))
+        top_snapshot = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT", depth=1)
+        self.assertEqual([101.], top_snapshot[1]["price"].tolist())
+        order_book.apply_numpy_diffs(np.array([[100, 1, 2]], dtype=np.float64), np.empty((0, 3)))
+        snapshot = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT")
+        self.assertEqual([100., 99., 98.], snapshot[0]["price"].tolist())
+
+    def test_get_order_book_top_snapshot(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        self.mock_connector.get_order_book.return_value = order_book
+        bids, asks = self.provider.get_order_book_top_snapshot("mock_connector", "BTC-USDT", depth=1)
+        self.assertEqual([[99., 1., 1.]], bids.tolist())
+        self.assertEqual([[101., 1., 1.]], asks.tolist())
 
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
@@ -0,0 +1,190 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_rollup import DAY_MS, ROLLUP_BACKFILL_KEY, TradeFillRollup, TradesSummary
+
+
+class TradeFillRollupTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.config_file_path = "test_config.yml"
+        self.trading_pair = "COINALPHA-HBOT"
+        self.day_start = 1640995200000  # 2022-01-01 UTC
+
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self, index: int, timestamp: int, trade_type: str, price: str, amount: str,
+                   market: str = "binance", trade_fee=None) -> TradeFill:
+        trade_fee = trade_fee or AddedToCostTradeFee(percent=Decimal("0.001"))
+        return TradeFill(
+            config_file_path=self.config_file_path,
+            strategy="pure_market_making",
+            market=market,
+            symbol=self.trading_pair,
+            base_asset="COINALPHA",
+            quote_asset="HBOT",
+            timestamp=timestamp,
+            order_id=f"OID{index}",
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"TID{index}",
+            position=PositionAction.NIL.value,
+        )
+
+    def trade_fills(self) -> List[TradeFill]:
+        deducted_fee = DeductedFromReturnsTradeFee(percent=Decimal("0.002"),
+                                                   flat_fees=[TokenAmount("BNB", Decimal("0.01"))])
+        return [
+            self.trade_fill(1, self.day_start + 1000, "BUY", "100", "2"),
+            self.trade_fill(2, self.day_start + 2000, "SELL", "101.5", "1", trade_fee=deducted_fee),
+            self.trade_fill(3, self.day_start + DAY_MS + 500, "BUY", "99", "0.5"),
+            self.trade_fill(4, self.day_start + 2 * DAY_MS + 10, "SELL", "102", "1.5"),
+            self.trade_fill(5, self.day_start + 2 * DAY_MS + 20, "BUY", "10", "3", market="kucoin"),
+        ]
+
+    def test_add_trade_fill_updates_the_daily_rollups(self):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for trade in self.trade_fills():
+                    session.add(trade)
+                    TradeFillRollup.add_trade_fill(session, trade)
+
+        with self.manager.get_new_session() as session:
+            rollups = session.query(TradeFillRollup).order_by(TradeFillRollup.day_start, TradeFillRollup.market).all()
+
+            self.assertEqual([self.day_start, self.day_start + DAY_MS, self.day_start + 2 * DAY_MS,
+                              self.day_start + 2 * DAY_MS],
+                             [rollup.day_start for rollup in rollups])
+            first_day = rollups[0]
+            self.assertEqual(2, first_day.num_trades)
+            self.assertEqual(1, first_day.num_buys)
+            self.assertEqual(1, first_day.num_sells)
+            self.assertEqual(Decimal("2"), first_day.b_vol_base)
+            self.assertEqual(Decimal("-200"), first_day.b_vol_quote)
+            self.assertEqual(Decimal("-1"), first_day.s_vol_base)
+            self.assertEqual(Decimal("101.5") - Decimal("101.5") * Decimal("0.002"), first_day.s_vol_quote)
+            self.assertEqual({"HBOT": Decimal("0.2") + Decimal("0.203"), "BNB": Decimal("0.01")},
+                             first_day.to_summary().fees)
+            self.assertEqual(Decimal("100"), first_day.first_price)
+            self.assertEqual(Decimal("101.5"), first_day.last_price)
+            self.assertEqual(Decimal("100"), first_day.to_summary().avg_b_price)
+
+    def test_summaries_combine_first_day_fills_and_rollups(self):
+        trades = self.trade_fills()
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for trade in trades:
+                    session.add(trade)
+                    TradeFillRollup.add_trade_fill(session, trade)
+
+        with self.manager.get_new_session() as session:
+            summaries = TradeFillRollup.get_trades_summaries(
+                session, start_timestamp=self.day_start + 1500, config_file_path=self.config_file_path)
+
+        expected = TradesSummary()
+        for trade in self.trade_fills()[1:4]:
+            expected.add_trade(trade)
+        summary = summaries[("binance", self.trading_pair)]
+        self.assertEqual({("binance", self.trading_pair), ("kucoin", self.trading_pair)}, set(summaries))
+        self.assertEqual(3, summary.num_trades)
+        self.assertEqual(expected.b_vol_base, summary.b_vol_base)
+        self.assertEqual(expected.b_vol_quote, summary.b_vol_quote)
+        self.assertEqual(expected.s_vol_base, summary.s_vol_base)
+        self.assertEqual(expected.s_vol_quote, summary.s_vol_quote)
+        self.assertEqual(expected.fees, summary.fees)
+        self.assertEqual(Decimal("101.5"), summary.first_price)
+        self.assertEqual(Decimal("102"), summary.last_price)
+
+    def test_backfill_builds_rollups_of_fills_recorded_without_them_once(self):
+        trades = self.trade_fills()
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                TradeFillRollup.add_trade_fill(session, trades[0])
+                for trade in trades:
+                    session.add(trade)
+
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                # The backfill already ran when the database was opened
+                self.assertFalse(TradeFillRollup.backfill(session))
+                session.query(Metadata).filter(Metadata.key == ROLLUP_BACKFILL_KEY).delete()
+                self.assertTrue(TradeFillRollup.backfill(session))
+                self.assertFalse(TradeFillRollup.backfill(session))
+
+        with self.manager.get_new_session() as session:
+            rollups = session.query(TradeFillRollup).all()
+            self.assertEqual(4, len(rollups))
+            self.assertEqual(5, sum(rollup.num_trades for rollup in rollups))
+
+    def test_summaries_include_fills_after_last_rolled_up_day_without_writing(self):
+        trades = self.trade_fills()
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for trade in trades[:2]:
+                    session.add(trade)
+                    TradeFillRollup.add_trade_fill(session, trade)
+                for trade in trades[2:]:
+                    session.add(trade)
+
+        with self.manager.get_new_session() as session:
+            with patch.object(session, "commit") as commit_mock:
+                summaries = TradeFillRollup.get_trades_summaries(
+                    session, start_timestamp=self.day_start, config_file_path=self.config_file_path)
+                commit_mock.assert_not_called()
+            self.assertFalse(session.new or session.dirty or session.deleted)
+            self.assertEqual(4, summaries[("binance", self.trading_pair)].num_trades)
+            self.assertEqual(1, summaries[("kucoin", self.trading_pair)].num_trades)
+            self.assertEqual(1, session.query(TradeFillRollup).count())
+
+    def test_performance_metrics_from_summary_match_metrics_from_fills(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[self.trading_pair] = Decimal("101")
+        rate_oracle._prices["BNB-HBOT"] = Decimal("500")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = self.trade_fills()[:4]
+        summary = TradesSummary()
+        for trade in trades:
+            summary.add_trade(trade)
+        balances = {"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")}
+
+        from_fills = self.async_run_with_timeout(PerformanceMetrics.create(self.trading_pair, trades, balances))
+        from_summary = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_summary(self.trading_pair, summary, balances))
+
+        for attribute in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                          "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price",
+                          "avg_tot_price", "start_base_bal", "start_quote_bal", "start_price", "cur_price",
+                          "hold_value", "cur_value", "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertEqual(getattr(from_fills, attribute), getattr(from_summary, attribute), attribute)
+        self.assertEqual(dict(from_fills.fees), dict(from_summary.fees))
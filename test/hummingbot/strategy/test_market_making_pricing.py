@@ -0,0 +1,159 @@
+import logging
+import random
+import time
+import unittest
+from decimal import ROUND_DOWN, Decimal
+
+from hummingbot.strategy.market_making_pricing import (
+    avellaneda_optimal_quotes,
+    budget_constrained_amounts,
+    level_amounts,
+    spread_level_prices,
+    to_decimal,
+    to_decimal_round_down,
+)
+
+s_decimal_zero = Decimal(0)
+
+
+def quantize(value: Decimal, step: str) -> Decimal:
+    return (value / Decimal(step)).quantize(Decimal(1), rounding=ROUND_DOWN) * Decimal(step)
+
+
+def decimal_avellaneda_optimal_quotes(price: Decimal, q: Decimal, gamma: Decimal, kappa: Decimal, vol: Decimal,
+                                      time_left_fraction: Decimal, min_spread_pct: Decimal):
+    # The Decimal calculation previously done by the Avellaneda strategy
+    reservation_price = price - (q * gamma * vol * time_left_fraction)
+    optimal_spread = gamma * vol * time_left_fraction
+    optimal_spread += 2 * Decimal(1 + gamma / kappa).ln() / gamma
+    min_spread = price / 100 * min_spread_pct
+    optimal_ask = max(reservation_price + optimal_spread / 2, price + min_spread / 2)
+    optimal_bid = min(reservation_price - optimal_spread / 2, price - min_spread / 2)
+    return reservation_price, optimal_spread, optimal_bid, optimal_ask
+
+
+def decimal_budget_constrained_amounts(balance: Decimal, amounts, unit_costs):
+    # The Decimal calculation previously done by the market making strategies budget constraint
+    result = []
+    for amount, unit_cost in zip(amounts, unit_costs):
+        cost = amount * unit_cost
+        if balance < cost:
+            result.append(balance / unit_cost)
+            balance = s_decimal_zero
+        elif balance == s_decimal_zero:
+            result.append(s_decimal_zero)
+        else:
+            result.append(amount)
+            balance -= cost
+    return result
+
+
+class MarketMakingPricingTest(unittest.TestCase):
+    level = logging.INFO
+
+    def test_to_decimal(self):
+        self.assertEqual(Decimal("99"), to_decimal(100 * (1 - 0.01)))
+        self.assertEqual(Decimal("1.3"), to_decimal(1 + 0.1 * 3))
+        self.assertEqual(Decimal("0.000123"), to_decimal(0.000123))
+        self.assertTrue(to_decimal(float("nan")).is_nan())
+
+    def test_to_decimal_round_down_does_not_exceed_the_value(self):
+        self.assertEqual(Decimal("0.2"), to_decimal(0.1999999999999999))
+        self.assertEqual(Decimal("0.199999999999999"), to_decimal_round_down(0.1999999999999999))
+        self.assertEqual(Decimal("0.2"), to_decimal_round_down(0.2))
+        self.assertEqual(Decimal("1.5"), to_decimal_round_down(1.5))
+        self.assertTrue(to_decimal_round_down(float("nan")).is_nan())
+
+        rng = random.Random(3)
+        for _ in range(1000):
+            value = rng.uniform(0, 1000)
+            self.assertLessEqual(to_decimal_round_down(value), Decimal(value))
+
+    def test_budget_constrained_amount_does_not_exceed_the_balance(self):
+        balance = 0.1999999999999999
+        result = budget_constrained_amounts(balance, [1.0], [1.0])
+        self.assertLessEqual(quantize(to_decimal_round_down(result[0]), "0.000000000000001"), Decimal(balance))
+
+    def test_avellaneda_quotes_match_decimal_calculation(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            price = Decimal(str(round(rng.uniform(0.5, 60000), 4)))
+            q = Decimal(str(rng.uniform(-1, 1)))
+            gamma = Decimal(str(rng.uniform(0.01, 10)))
+            kappa = Decimal(str(rng.uniform(0.01, 100)))
+            vol = Decimal(str(float(price) * rng.uniform(0.0001, 0.01)))
+            time_left_fraction = Decimal(str(rng.uniform(0, 1)))
+            min_spread = Decimal(str(rng.choice([0, 0.1, 0.5])))
+
+            expected = decimal_avellaneda_optimal_quotes(price, q, gamma, kappa, vol, time_left_fraction, min_spread)
+            result = avellaneda_optimal_quotes(float(price), float(q), float(gamma), float(kappa), float(vol),
+                                               float(time_left_fraction), float(min_spread))
+
+            for expected_value, value in zip(expected, result):
+                self.assertAlmostEqual(float(expected_value), value, delta=abs(float(expected_value)) * 1e-12 + 1e-9)
+            for expected_value, value in zip(expected[2:], result[2:]):
+                self.assertEqual(quantize(expected_value, "0.0001"), quantize(to_decimal(value), "0.0001"))
+
+    def test_spread_level_prices_match_decimal_calculation(self):
+        reference_price = Decimal("100")
+        bid_spread, ask_spread, level_spread = Decimal("0.01"), Decimal("0.015"), Decimal("0.005")
+        buys = spread_level_prices(float(reference_price), float(bid_spread), float(level_spread), 4, True)
+        sells = spread_level_prices(float(reference_price), float(ask_spread), float(level_spread), 4, False)
+        self.assertEqual([Decimal("99"), Decimal("98.5"), Decimal("98"), Decimal("97.5")],
+                         [quantize(to_decimal(price), "0.01") for price in buys])
+        self.assertEqual([Decimal("101.5"), Decimal("102"), Decimal("102.5"), Decimal("103")],
+                         [quantize(to_decimal(price), "0.01") for price in sells])
+
+        rng = random.Random(2)
+        for _ in range(500):
+            reference_price = Decimal(str(round(rng.uniform(0.01, 60000), 5)))
+            spread = Decimal(str(round(rng.uniform(0, 0.05), 4)))
+            level_spread = Decimal(str(round(rng.uniform(0, 0.01), 4)))
+            is_buy = rng.random() < 0.5
+            prices = spread_level_prices(float(reference_price), float(spread), float(level_spread), 5, is_buy)
+            for level, price in enumerate(prices):
+                sign = -1 if is_buy else 1
+                expected = reference_price * (Decimal("1") + sign * (spread + level * level_spread))
+                self.assertEqual(quantize(expected, "0.00001"), quantize(to_decimal(price), "0.00001"))
+
+    def test_level_amounts(self):
+        self.assertEqual([Decimal("1"), Decimal("1.1"), Decimal("1.2"), Decimal("1.3")],
+                         [to_decimal(amount) for amount in level_amounts(1, 0.1, 4)])
+
+    def test_budget_constrained_amounts_match_decimal_calculation(self):
+        amounts = [Decimal("1"), Decimal("1.5"), Decimal("2")]
+        unit_costs = [Decimal("100.1"), Decimal("99.2"), Decimal("98.3")]
+        # The balance covers exactly the first two orders, then part of the first one, then nothing
+        for balance in (Decimal("248.9"), Decimal("50"), s_decimal_zero, Decimal("1000")):
+            expected = decimal_budget_constrained_amounts(balance, amounts, unit_costs)
+            result = budget_constrained_amounts(float(balance), [float(amount) for amount in amounts],
+                                                [float(unit_cost) for unit_cost in unit_costs])
+            result = [amount if value is None else quantize(to_decimal(value), "0.001")
+                      for amount, value in zip(amounts, result)]
+            self.assertEqual([quantize(amount, "0.001") for amount in expected], result)
+
+    def test_pricing_benchmark(self):
+        rng = random.Random(3)
+        inputs = [(rng.uniform(100, 200), rng.uniform(-1, 1), rng.uniform(0.1, 1), rng.uniform(1, 10),
+                   rng.uniform(0.01, 0.1), rng.uniform(0, 1)) for _ in range(2000)]
+        bid_spread, level_spread = Decimal("0.001"), Decimal("0.0005")
+
+        start = time.perf_counter()
+        for price, q, gamma, kappa, vol, time_left_fraction in inputs:
+            decimal_avellaneda_optimal_quotes(
+                Decimal(str(price)), Decimal(str(q)), Decimal(str(gamma)), Decimal(str(kappa)), Decimal(str(vol)),
+                Decimal(str(time_left_fraction)), Decimal("0.1"))
+            reference_price = Decimal(str(price))
+            [reference_price * (Decimal("1") - bid_spread - level * level_spread) for level in range(5)]
+        decimal_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for price, q, gamma, kappa, vol, time_left_fraction in inputs:
+            quotes = avellaneda_optimal_quotes(price, q, gamma, kappa, vol, time_left_fraction, 0.1)
+            [to_decimal(value) for value in quotes]
+            spread_level_prices(price, 0.001, 0.0005, 5, True)
+        double_time = time.perf_counter() - start
+
+        logging.getLogger(__name__).info(f"2000 Avellaneda quotes and 5 levels ladders: Decimal {decimal_time:.4f}s, "
+                                         f"double {double_time:.4f}s")
+        self.assertLess(double_time, decimal_time)
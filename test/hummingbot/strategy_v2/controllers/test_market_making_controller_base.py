@@ -436,3 +436,70 @@ class TestMarketMakingControllerBase(IsolatedAsyncioWrapperTestCase):
 
         # Should not include any rebalance actions
         self.assertEqual(len(actions), 0)
+
+    def test_get_price_and_amount_uses_the_levels_plan(self):
+        self.controller.processed_data = {"reference_price": Decimal("100"), "spread_multiplier": Decimal("2")}
+
+        buy_price, buy_amount = self.controller.get_price_and_amount("buy_1")
+        sell_price, sell_amount = self.controller.get_price_and_amount("sell_0")
+
+        expected_buy_price = Decimal("100") * (1 - Decimal(0.02) * Decimal("2"))
+        expected_sell_price = Decimal("100") * (1 + Decimal(0.01) * Decimal("2"))
+        self.assertEqual(expected_buy_price, buy_price)
+        self.assertEqual(Decimal("25") / expected_buy_price, buy_amount)
+        self.assertEqual(expected_sell_price, sell_price)
+        self.assertEqual(Decimal("25") / expected_sell_price, sell_amount)
+        self.assertEqual(["buy_0", "buy_1", "sell_0", "sell_1"], self.controller.levels_plan.level_ids)
+
+    def test_price_ladder_is_recalculated_only_when_its_inputs_change(self):
+        self.controller.processed_data = {"reference_price": Decimal("100"), "spread_multiplier": Decimal("1")}
+        plan = self.controller.levels_plan
+
+        with patch.object(MarketMakingControllerConfigBase, "get_spreads_and_amounts_in_quote") as spreads_mock:
+            ladder = self.controller.get_price_ladder(plan)
+            for level_id in plan.level_ids:
+                self.controller.get_price_and_amount(level_id)
+            self.assertIs(ladder, self.controller.get_price_ladder(self.controller.levels_plan))
+            spreads_mock.assert_not_called()
+
+        self.controller.processed_data["reference_price"] = Decimal("200")
+        self.assertEqual(Decimal("200") * (1 - Decimal(0.01)), self.controller.get_price_and_amount("buy_0")[0])
+
+        self.mock_controller_config.buy_spreads = [0.01, 0.02, 0.03]
+        self.mock_controller_config.buy_amounts_pct = [Decimal(50), Decimal(50), Decimal(50)]
+        self.assertIsNot(plan, self.controller.levels_plan)
+        self.assertEqual(["buy_0", "buy_1", "buy_2", "sell_0", "sell_1"], self.controller.levels_plan.level_ids)
+        self.assertEqual(Decimal("200") * (1 - Decimal(0.03)), self.controller.get_price_and_amount("buy_2")[0])
+
+    def test_get_price_and_amount_uses_mid_price_when_reference_price_is_zero(self):
+        self.controller.processed_data = {"reference_price": Decimal("0"), "spread_multiplier": Decimal("1")}
+        self.mock_market_data_provider.get_price_by_type.return_value = Decimal("50")
+
+        self.assertEqual(Decimal("50") * (1 + Decimal(0.01)), self.controller.get_price_and_amount("sell_0")[0])
+
+        self.mock_market_data_provider.get_price_by_type.return_value = Decimal("0")
+        with self.assertRaises(ValueError):
+            self.controller.get_price_and_amount("sell_0")
+
+    def test_zero_order_price_error_reports_the_fallback_reference_price(self):
+        self.mock_controller_config.buy_spreads = [0.5, 0.02]
+        self.controller.processed_data = {"reference_price": Decimal("0"), "spread_multiplier": Decimal("2")}
+        self.mock_market_data_provider.get_price_by_type.return_value = Decimal("50")
+
+        with self.assertRaises(ValueError) as context:
+            self.controller.get_price_and_amount("buy_0")
+        self.assertEqual("Order price is 0 for buy_0, reference_price=50, spread_in_pct=1.0", str(context.exception))
+
+    def test_levels_plan_uses_the_controller_level_ids(self):
+        with patch.object(MarketMakingControllerBase, "get_level_id_from_side",
+                          lambda controller, trade_type, level: f"{trade_type.name}-{level}"):
+            self.assertEqual(["BUY-0", "BUY-1", "SELL-0", "SELL-1"], self.controller.levels_plan.level_ids)
+
+    def test_get_levels_to_execute_skips_working_levels(self):
+        self.mock_market_data_provider.time.return_value = 1000
+        active_executor = MagicMock(spec=ExecutorInfo)
+        active_executor.is_active = True
+        active_executor.custom_info = {"level_id": "buy_1"}
+        self.controller.executors_info = [active_executor]
+
+        self.assertEqual(["buy_0", "sell_0", "sell_1"], self.controller.get_levels_to_execute())
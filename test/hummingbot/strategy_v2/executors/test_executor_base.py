@@ -1,12 +1,14 @@
+import asyncio
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -18,6 +20,7 @@ from hummingbot.core.event.events import (
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_orchestrator import ControllerReportAggregate
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
 
@@ -123,6 +126,12 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.process_order_failed_event(event_tag, market, event)
         self.assertIsNone(self.component.process_order_failed_event(event_tag, market, event))
 
+    def test_forwarded_order_events_bump_state_version(self):
+        version = self.component.state_version
+        event = OrderCancelledEvent(timestamp=1234567890, order_id="OID-BUY-1")
+        self.component._cancel_order_forwarder(event)
+        self.assertEqual(version + 1, self.component.state_version)
+
     def test_place_buy_order(self):
         buy_order_id = self.component.place_order(
             connector_name="connector1",
@@ -147,10 +156,43 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
 
     async def test_executor_starts_and_stops(self):
         self.assertEqual(RunnableStatus.NOT_STARTED, self.component.status)
+        version = self.component.state_version
         self.component.start()
         self.assertEqual(RunnableStatus.RUNNING, self.component.status)
+        self.assertGreater(self.component.state_version, version)
+        version = self.component.state_version
         self.component.stop()
         self.assertEqual(RunnableStatus.TERMINATED, self.component.status)
+        self.assertGreater(self.component.state_version, version)
+
+    async def test_control_loop_bumps_state_version_only_on_changes(self):
+        self.component.update_interval = 0.01
+        self.component.validate_sufficient_balance = AsyncMock()
+        self.component.get_net_pnl_quote = MagicMock(return_value=Decimal("1"))
+        self.component.get_net_pnl_pct = MagicMock(return_value=Decimal("0.01"))
+        self.component.get_cum_fees_quote = MagicMock(return_value=Decimal("0.1"))
+        aggregate = ControllerReportAggregate()
+        executor_info = MagicMock(is_done=False, net_pnl_quote=Decimal("1"), filled_amount_quote=Decimal("0"))
+
+        with patch.object(ExecutorBase, "executor_info", new_callable=PropertyMock,
+                          return_value=executor_info) as info_property:
+            self.component.start()
+            await asyncio.sleep(0.05)
+            aggregate.update_executors([self.component])
+            version = self.component.state_version
+
+            # Control task iterations that leave the state unchanged keep the executor info cached
+            await asyncio.sleep(0.05)
+            self.assertEqual(version, self.component.state_version)
+            self.assertEqual([], aggregate.update_executors([self.component]))
+            info_property.assert_called_once()
+
+            self.component.get_net_pnl_quote.return_value = Decimal("2")
+            await asyncio.sleep(0.05)
+            self.assertEqual(version + 1, self.component.state_version)
+            self.assertEqual(1, len(aggregate.update_executors([self.component])))
+            self.assertEqual(2, info_property.call_count)
+            self.component.stop()
 
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
@@ -169,3 +211,29 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
     def test_get_in_flight_order(self):
         in_flight_orders = self.component.get_in_flight_order("connector1", "OID-BUY-1")
         self.assertEqual(in_flight_orders, None)
+
+    def test_subscribe_to_price_updates_before_the_order_book_exists(self):
+        connector = self.strategy.connectors["connector1"]
+        connector.get_order_book.side_effect = ValueError("No order book exists for 'ETH-USDT'.")
+        connector.order_book_tracker = MagicMock(spec=OrderBookTracker)
+        subscription = connector.order_book_tracker.subscribe_price_updates.return_value
+
+        self.component.subscribe_to_price_updates("connector1", "ETH-USDT", Decimal("0.001"))
+
+        connector.order_book_tracker.subscribe_price_updates.assert_called_once_with(
+            "ETH-USDT", self.component._on_price_update, 0.001, 0.0)
+        self.component.unregister_price_triggers()
+        connector.order_book_tracker.unsubscribe_price_updates.assert_called_once_with("ETH-USDT", subscription)
+
+    def test_subscribe_to_price_updates_skips_pairs_without_order_book(self):
+        self.set_loggers(loggers=[self.component.logger()])
+        connector = self.strategy.connectors["connector1"]
+        connector.get_order_book.side_effect = ValueError("No order book exists for 'ETH-USDT'.")
+
+        self.component.subscribe_to_price_updates("connector1", "ETH-USDT", Decimal("0.001"))
+
+        self.assertEqual([], self.component._price_subscriptions)
+        self.assertTrue(self.is_logged(
+            "WARNING",
+            "No order book for ETH-USDT on connector1 yet. The price updates of ETH-USDT will not trigger the control "
+            "task."))
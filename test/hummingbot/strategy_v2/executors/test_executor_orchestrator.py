@@ -700,3 +700,80 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(len(result["controller2"]["executors"]), 0)
         self.assertEqual(len(result["controller3"]["executors"]), 0)
         self.assertEqual(len(result["controller3"]["positions"]), 0)
+
+    def test_get_all_reports_refreshes_only_changed_executors(self):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(net_pnl_quote: Decimal, status=RunnableStatus.RUNNING, close_type=None):
+            return ExecutorInfo(
+                id="123", timestamp=1234, type="position_executor", status=status, close_type=close_type,
+                config=config, filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote, net_pnl_pct=Decimal(1),
+                cum_fees_quote=Decimal(1), is_trading=True, is_active=status == RunnableStatus.RUNNING,
+                custom_info={"side": TradeType.BUY}
+            )
+
+        executors = []
+        info_properties = []
+        for net_pnl_quote in (Decimal(1), Decimal(2)):
+            executor = MagicMock(spec=PositionExecutor)
+            executor.state_version = 1
+            info_property = PropertyMock(return_value=executor_info(net_pnl_quote))
+            type(executor).executor_info = info_property
+            executors.append(executor)
+            info_properties.append(info_property)
+        self.orchestrator.active_executors["test"] = list(executors)
+        self.orchestrator.positions_held["test"] = []
+        self.orchestrator.cached_performance["test"] = PerformanceReport(realized_pnl_quote=Decimal(7))
+
+        first = self.orchestrator.get_all_reports()["test"]
+        self.assertEqual(Decimal(3), first["performance"].unrealized_pnl_quote)
+        self.assertEqual(Decimal(7), first["performance"].realized_pnl_quote)
+
+        # Nothing changed: no executor info is rebuilt and the same report objects are reused
+        second = self.orchestrator.get_all_reports()["test"]
+        for info_property in info_properties:
+            info_property.assert_called_once()
+        self.assertIs(first["executors"], second["executors"])
+        self.assertIs(first["performance"], second["performance"])
+
+        # Only the executor whose state version changed is refreshed
+        info_properties[1].return_value = executor_info(Decimal(5), RunnableStatus.TERMINATED, CloseType.TAKE_PROFIT)
+        executors[1].state_version = 2
+        third = self.orchestrator.get_all_reports()["test"]
+        self.assertEqual(1, info_properties[0].call_count)
+        self.assertEqual(2, info_properties[1].call_count)
+        expected = self.orchestrator.generate_performance_report("test")
+        for field in ("realized_pnl_quote", "unrealized_pnl_quote", "volume_traded", "global_pnl_quote",
+                      "global_pnl_pct", "close_type_counts"):
+            self.assertEqual(getattr(expected, field), getattr(third["performance"], field))
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, third["performance"].close_type_counts)
+
+        # Removed executors no longer contribute
+        self.orchestrator.active_executors["test"] = [executors[0]]
+        fourth = self.orchestrator.get_all_reports()["test"]
+        self.assertEqual(1, len(fourth["executors"]))
+        self.assertEqual(Decimal(1), fourth["performance"].unrealized_pnl_quote)
+        self.assertEqual(Decimal(7), fourth["performance"].realized_pnl_quote)
+        self.assertEqual({}, fourth["performance"].close_type_counts)
+
+    def test_get_all_reports_reuses_position_summaries(self):
+        position = PositionHold("binance", "ETH-USDT", TradeType.BUY)
+        position.buy_amount_base = Decimal("2")
+        position.buy_amount_quote = Decimal("400")
+        self.orchestrator.positions_held["test"] = [position]
+        self.orchestrator.cached_performance["test"] = PerformanceReport()
+
+        with patch.object(PositionHold, "get_position_summary", wraps=position.get_position_summary) as summary_mock:
+            first = self.orchestrator.get_all_reports()["test"]
+            second = self.orchestrator.get_all_reports()["test"]
+            self.assertEqual(1, summary_mock.call_count)
+            self.assertIs(first["performance"], second["performance"])
+
+            self.mock_strategy.market_data_provider.get_price_by_type.return_value = Decimal(250)
+            third = self.orchestrator.get_all_reports()["test"]
+            self.assertEqual(2, summary_mock.call_count)
+        self.assertEqual(Decimal(100), third["positions"][0].unrealized_pnl_quote)
+        self.assertEqual(Decimal(100), third["performance"].unrealized_pnl_quote)
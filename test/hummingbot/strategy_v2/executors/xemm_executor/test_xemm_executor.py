@@ -1,12 +1,16 @@
+import asyncio
+import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
 
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.events import BuyOrderCompletedEvent, BuyOrderCreatedEvent, MarketOrderFailureEvent
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -331,3 +335,41 @@ class TestXEMMExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.executor.quote_conversion_pair = "USDC-USDT"
         with self.assertRaises(Exception):
             await self.executor.get_quote_asset_conversion_rate()
+
+    @patch.object(XEMMExecutor, "get_quote_asset_conversion_rate", new_callable=AsyncMock, return_value=Decimal("1"))
+    @patch.object(XEMMExecutor, "update_tx_costs", new_callable=AsyncMock)
+    @patch.object(XEMMExecutor, "validate_sufficient_balance", new_callable=AsyncMock)
+    async def test_price_trigger_latency_from_diff_to_order_replace(self, *_):
+        taker_exchange = MockPaperExchange()
+        taker_exchange.set_balanced_order_book("ETH-USDT", 100, 90, 110, 0.1, 1)
+        self.strategy.connectors["kucoin"] = taker_exchange
+        config = self.base_config_long.model_copy(update={"order_amount": Decimal("1"),
+                                                          "price_trigger_pct": Decimal("0.0001"),
+                                                          "min_trigger_interval": 0.0})
+        executor = XEMMExecutor(self.strategy, config, update_interval=1.0)
+        executor._tx_cost_pct = Decimal("0")
+        executor.maker_order = MagicMock()
+        executor.maker_order.order.is_open = True
+        executor.maker_order.order.price = Decimal("99.95") / Decimal("1.015")
+        cancel_timestamps = []
+        self.strategy.cancel.side_effect = lambda *args: cancel_timestamps.append(time.perf_counter())
+
+        executor.start()
+        await asyncio.sleep(0.05)
+        self.assertEqual([], cancel_timestamps)
+
+        # Take the best bids of the hedge venue: the maker order is no longer profitable enough
+        order_book = taker_exchange.get_order_book("ETH-USDT")
+        taken_bids = [OrderBookRow(row.price, 0, 2) for row in list(order_book.bid_entries())[:10]]
+        diff_timestamp = time.perf_counter()
+        order_book.apply_diffs(taken_bids, [], 2)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, len(cancel_timestamps))
+        latency = cancel_timestamps[0] - diff_timestamp
+        print(f"Diff to order replace latency: {latency * 1e3:.2f}ms (update interval {executor.update_interval}s)")
+        self.assertLess(latency, 0.05)
+        self.assertEqual(1, executor.triggered_runs)
+
+        executor.stop()
+        self.assertEqual([], order_book.price_subscriptions)
@@ -25,3 +25,43 @@ class TestRunnableBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.start()
         await asyncio.sleep(0.05)
         self.is_logged("Test", "error")
+
+    async def test_trigger_runs_control_task_before_update_interval(self):
+        component = RunnableBase(update_interval=10)
+        runs = []
+
+        async def control_task():
+            runs.append(component.triggered_runs)
+
+        component.control_task = control_task
+        component.trigger_control_task()  # Ignored until triggers are enabled
+        component.enable_triggers(min_trigger_interval=0.0)
+        component.start()
+        await asyncio.sleep(0.01)
+        self.assertEqual([0], runs)
+
+        # Several triggers before the loop wakes up are coalesced into a single run
+        component.trigger_control_task()
+        component.trigger_control_task()
+        await asyncio.sleep(0.01)
+        self.assertEqual([0, 1], runs)
+        component.stop()
+
+    async def test_trigger_respects_min_trigger_interval(self):
+        component = RunnableBase(update_interval=10)
+        runs = []
+
+        async def control_task():
+            runs.append(asyncio.get_event_loop().time())
+
+        component.control_task = control_task
+        component.enable_triggers(min_trigger_interval=0.1)
+        component.start()
+        await asyncio.sleep(0.01)
+        component.trigger_control_task()
+        await asyncio.sleep(0.05)
+        self.assertEqual(1, len(runs))
+        await asyncio.sleep(0.1)
+        self.assertEqual(2, len(runs))
+        self.assertGreaterEqual(runs[1] - runs[0], 0.09)
+        component.stop()
@@ -0,0 +1,30 @@
+import unittest
+
+from hummingbot.strategy_v2.utils.latency_tracker import LatencyTracker
+
+
+class TestLatencyTracker(unittest.TestCase):
+
+    def test_record(self):
+        tracker = LatencyTracker(window_size=3)
+        for elapsed in (0.004, 0.001, 0.002, 0.003):
+            tracker.record(elapsed)
+        self.assertEqual(4, tracker.count)
+        self.assertEqual(0.003, tracker.last)
+        self.assertEqual(0.004, tracker.max)
+        self.assertAlmostEqual(0.002, tracker.mean)
+        self.assertEqual(0.003, tracker.percentile(99))
+        self.assertEqual(0.001, tracker.percentile(0))
+        self.assertAlmostEqual(3.0, tracker.to_dict()["last_ms"])
+
+    def test_start_stop(self):
+        tracker = LatencyTracker()
+        elapsed = tracker.stop(tracker.start())
+        self.assertGreaterEqual(elapsed, 0)
+        self.assertEqual(1, tracker.count)
+        self.assertIn("p99", tracker.format())
+
+    def test_empty(self):
+        tracker = LatencyTracker()
+        self.assertEqual(0.0, tracker.mean)
+        self.assertEqual(0.0, tracker.percentile(50))